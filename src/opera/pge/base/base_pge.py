@@ -9,8 +9,15 @@ Module defining the Base PGE interfaces from which all other PGEs are derived.
 
 """
 
+import copy
+import hashlib
+import json
 import os
+import re
+import sqlite3
+import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from fnmatch import fnmatch
 from functools import lru_cache
@@ -24,16 +31,34 @@ from yamale import YamaleError
 import yaml
 
 import opera
+from opera.util.checksum_cache import ChecksumCache
 from opera.util.error_codes import ErrorCode
+from opera.util.logger import DeferredCriticalError
 from opera.util.logger import PgeLogger
 from opera.util.logger import default_log_file_name
+from opera.util.logger import defer_critical
 from opera.util.metfile import MetFile
+from opera.util.metrics_export import METRICS_EXPORT_FORMATS
+from opera.util.metrics_export import get_metrics_filename
+from opera.util.resource_limits import GDAL_CACHEMAX_ENV_VAR
+from opera.util.resource_limits import THREAD_COUNT_ENV_VARS
+from opera.util.resource_limits import get_sas_environment
+from opera.util.result_cache import SasResultCache
+from opera.util.result_cache import compute_cache_key
 from opera.util.run_utils import create_qa_command_line
 from opera.util.run_utils import create_sas_command_line
-from opera.util.run_utils import get_checksum
+from opera.util.run_utils import get_checksum_workers
+from opera.util.run_utils import get_checksums
+from opera.util.run_utils import get_iso_render_workers
+from opera.util.run_utils import get_metadata_workers
+from opera.util.run_utils import stage_file
 from opera.util.run_utils import time_and_execute
+from opera.util.schema_cache import get_schema
+from opera.util.stage_timing import StageTimer
+from opera.util.stage_timing import timed_stage
 from opera.util.time import get_catalog_metadata_datetime_str
 from opera.util.time import get_time_for_filename
+from opera.util.usage_metrics import ResourceSampler
 
 from .runconfig import RunConfig
 
@@ -85,6 +110,7 @@ class PreProcessorMixin:
             self.logger.info(self.name, ErrorCode.LOG_FILE_CREATED,
                              f'New QA Log file initialized to {self.qa_logger.get_file_name()}')
 
+    @timed_stage()
     def _load_runconfig(self):
         """
         Loads the RunConfig file provided to the PGE into an in-memory
@@ -93,8 +119,12 @@ class PreProcessorMixin:
         self.logger.info(self.name, ErrorCode.LOADING_RUN_CONFIG_FILE,
                          f'Loading RunConfig file {self.runconfig_path}')
 
-        self.runconfig = RunConfig(self.runconfig_path)
+        # A RunConfig already parsed from the same file (by pge_main, for example)
+        # is used as-is, rather than parsing the file a second time
+        if self.runconfig is None or abspath(self.runconfig.filename) != abspath(self.runconfig_path):
+            self.runconfig = RunConfig(self.runconfig_path)
 
+    @timed_stage()
     def _validate_runconfig(self):
         """
         Validates the parsed RunConfig against the appropriate schema(s).
@@ -122,6 +152,7 @@ class PreProcessorMixin:
                 self.name, ErrorCode.RUN_CONFIG_VALIDATION_FAILED, error_msg
             )
 
+    @timed_stage()
     def _setup_directories(self):
         """
         Creates the output/scratch directory locations referenced by the
@@ -170,15 +201,45 @@ class PreProcessorMixin:
         # can access output_product_path from the parsed RunConfig
         self.logger.move(join(self.runconfig.output_product_path, default_log_file_name()))
 
+        self._configure_metrics_export(self.logger)
+
         self.logger.info(self.name, ErrorCode.LOG_FILE_INIT_COMPLETE,
                          'Log file configuration complete')
 
         if self.runconfig.qa_enabled:
             self.qa_logger.move(join(self.runconfig.output_product_path, default_log_file_name()))
+            self._configure_metrics_export(self.qa_logger)
 
             self.qa_logger.info(self.name, ErrorCode.LOG_FILE_INIT_COMPLETE,
                                 'Log file configuration complete')
 
+    def _configure_metrics_export(self, logger):
+        """
+        Configures the export of metrics from the provided logger, as requested
+        by the RunConfig. Exported metrics are labelled with the name and version
+        of the PGE, and the type of product it creates.
+
+        Parameters
+        ----------
+        logger : PgeLogger
+            The PgeLogger instance to configure.
+
+        """
+        logger.metrics_export_formats = self.runconfig.metrics_export_formats
+        logger.metrics_export_dir = self.runconfig.metrics_export_path
+
+        try:
+            product_type = self.runconfig.product_identifier
+        except KeyError:
+            product_type = "unknown"
+
+        logger.metrics_labels = {
+            'pge_name': self.runconfig.pge_name,
+            'pge_version': self.PGE_VERSION,
+            'product_type': product_type
+        }
+
+    @timed_stage()
     def _validate_iso_descriptions(self):
         """If given, check if the run-config description file exists and is valid"""
         description_file = self.runconfig.iso_measured_parameter_descriptions
@@ -191,7 +252,7 @@ class PreProcessorMixin:
                 self.logger.critical(self.name, ErrorCode.ISO_METADATA_DESCRIPTIONS_CONFIG_NOT_FOUND, msg)
 
             schema_file = str(files('opera').joinpath('pge/base/schema/iso_metadata_measured_parameters_config_schema.yaml'))
-            schema = yamale.make_schema(schema_file)
+            schema = get_schema(schema_file)
             data = yamale.make_data(description_file)
 
             try:
@@ -203,6 +264,7 @@ class PreProcessorMixin:
             msg = 'Measured parameters descriptions were not provided'
             self.logger.warning(self.name, ErrorCode.ISO_METADATA_NO_DESCRIPTIONS, msg)
 
+    @timed_stage('preprocessor')
     def run_preprocessor(self, **kwargs):  # pylint: disable=unused-argument
         """
         Executes the pre-processing steps for PGE initialization.
@@ -245,6 +307,7 @@ class PostProcessorMixin:
 
     _post_mixin_name = "PostProcessorMixin"
 
+    @timed_stage('qa')
     def _run_sas_qa_executable(self):
         """
         Executes an optional Quality Assurance (QA) application which may be bundled
@@ -283,6 +346,7 @@ class PostProcessorMixin:
             self.logger.info(self.name, ErrorCode.QA_SAS_PROGRAM_DISABLED,
                              'SAS QA is disabled, skipping')
 
+    @timed_stage('checksum')
     def _checksum_output_products(self):
         """
         Generates a dictionary mapping output product file names to the
@@ -309,14 +373,228 @@ class PostProcessorMixin:
         )
 
         # Generate checksums on the filtered product list
-        checksums = {
-            basename(output_product): get_checksum(output_product)
-            for output_product in filtered_output_products
-        }
+        checksums = self._checksum_files(filtered_output_products)
 
         return checksums
 
+    def _get_checksum_workers(self):
+        """
+        Returns the number of threads to use when computing checksums, as
+        determined by the RunConfig, or the OPERA_PGE_CHECKSUM_WORKERS
+        environment variable if not configured.
+        """
+        try:
+            return get_checksum_workers(self.runconfig.checksum_workers)
+        except ValueError as err:
+            self.logger.critical(self.name, ErrorCode.RUN_CONFIG_VALIDATION_FAILED,
+                                 f'Invalid number of checksum workers requested, reason: {str(err)}')
+
+            # critical() raises, so this is only reached should it be overridden not to
+            raise
+
+    def _get_metadata_workers(self):
+        """
+        Returns the number of threads to use when reading product metadata,
+        as determined by the RunConfig, or the OPERA_PGE_METADATA_WORKERS
+        environment variable if not configured.
+        """
+        try:
+            return get_metadata_workers(self.runconfig.metadata_workers)
+        except ValueError as err:
+            self.logger.critical(self.name, ErrorCode.RUN_CONFIG_VALIDATION_FAILED,
+                                 f'Invalid number of metadata workers requested, reason: {str(err)}')
+
+            # critical() raises, so this is only reached should it be overridden not to
+            raise
+
+    def _get_iso_render_workers(self):
+        """
+        Returns the number of threads to use when rendering ISO metadata, as
+        determined by the OPERA_PGE_ISO_RENDER_WORKERS environment variable
+        (defaults to a single thread).
+        """
+        try:
+            return get_iso_render_workers()
+        except ValueError as err:
+            self.logger.critical(self.name, ErrorCode.RUN_CONFIG_VALIDATION_FAILED,
+                                 f'Invalid number of ISO metadata render workers requested, reason: {str(err)}')
+
+            # critical() raises, so this is only reached should it be overridden not to
+            raise
+
+    @timed_stage('prefetch_product_metadata')
+    def _prefetch_product_metadata(self, metadata_sources, collect_metadata, metadata_cache):
+        """
+        Collects the metadata of several output products using a pool of
+        threads, and fills the provided metadata cache with the results.
+
+        PGEs which produce multiple products (such as one per burst or tile)
+        otherwise collect the metadata of each product lazily as the products
+        are renamed, one product at a time. Prefetching the metadata before
+        staging the output files allows the reads (which release the GIL for
+        I/O within h5py and GDAL) to overlap.
+
+        Parameters
+        ----------
+        metadata_sources : dict
+            Mapping of metadata cache keys (such as burst or tile IDs) to the
+            path of the output product to collect the metadata for each from.
+            Keys already present within the cache are skipped.
+        collect_metadata : callable
+            Method taking the path of an output product, and returning the
+            metadata collected from it.
+        metadata_cache : dict
+            The cache to fill with the collected metadata, in the order of
+            metadata_sources.
+
+        """
+        pending_sources = {key: source for key, source in metadata_sources.items()
+                           if key not in metadata_cache}
+
+        if not pending_sources:
+            return
+
+        metadata_workers = min(self._get_metadata_workers(), len(pending_sources))
+
+        # Workers only raise on a critical error, which is logged once here,
+        # so the shared log is never closed while other workers write to it
+        def _collect_metadata(metadata_source):
+            with defer_critical():
+                return collect_metadata(metadata_source)
+
+        with ThreadPoolExecutor(max_workers=metadata_workers, thread_name_prefix='metadata') as executor:
+            futures = [executor.submit(_collect_metadata, metadata_source)
+                       for metadata_source in pending_sources.values()]
+
+            try:
+                for key, future in zip(pending_sources.keys(), futures):
+                    metadata_cache[key] = future.result()
+            except DeferredCriticalError as err:
+                executor.shutdown(cancel_futures=True)
+
+                self.logger.critical(err.module, err.error_code_offset, err.description)
+            except Exception:
+                executor.shutdown(cancel_futures=True)
+                raise
+
+        self.logger.debug(self.name, ErrorCode.PROCESSING_DETAILS,
+                          f'Prefetched metadata for {len(pending_sources)} output product(s) '
+                          f'using {metadata_workers} thread(s)')
+
+    @timed_stage('write_iso_metadata')
+    def _write_iso_metadata_files(self, iso_metadata_renderers, stream_to_file=False):
+        """
+        Renders the ISO metadata for each of several output products, and
+        writes each rendered template to the output product location.
+
+        Templates are rendered by a single thread unless more are requested
+        via the OPERA_PGE_ISO_RENDER_WORKERS environment variable. Files are
+        written (and logged) in the order of the provided renderers as each
+        rendering completes, so the contents of the log do not depend on the
+        number of threads used. The time taken to render each template is
+        logged as a debug message, also in product order, and the total time
+        taken to render all templates is logged as a single metric.
+
+        Parameters
+        ----------
+        iso_metadata_renderers : dict
+            Mapping of the file name to assign to each ISO xml file to a
+            callable, taking no arguments, which returns the rendered ISO
+            metadata for the corresponding output product.
+        stream_to_file : bool, optional
+            If True, each callable is instead provided the path to the ISO xml
+            file as its only argument, and is responsible for rendering the
+            ISO metadata directly to that file (see render_jinja2_to_file).
+            This avoids holding each rendered template in memory.
+
+        """
+        if not iso_metadata_renderers:
+            return
+
+        render_workers = min(self._get_iso_render_workers(), len(iso_metadata_renderers))
+        render_seconds_by_filename = {}
+
+        def _render_iso_metadata(iso_meta_filename):
+            iso_metadata_renderer = iso_metadata_renderers[iso_meta_filename]
+            start_time = time.monotonic()
+
+            if stream_to_file:
+                iso_metadata = iso_metadata_renderer(join(self.runconfig.output_product_path, iso_meta_filename))
+            else:
+                iso_metadata = iso_metadata_renderer()
+
+            return iso_metadata, time.monotonic() - start_time
+
+        with ThreadPoolExecutor(max_workers=render_workers, thread_name_prefix='iso_metadata') as executor:
+            rendered_templates = executor.map(_render_iso_metadata, iso_metadata_renderers.keys())
+
+            for iso_meta_filename, (iso_metadata, render_seconds) in zip(iso_metadata_renderers.keys(),
+                                                                         rendered_templates):
+                render_seconds_by_filename[iso_meta_filename] = render_seconds
+
+                iso_meta_filepath = join(self.runconfig.output_product_path, iso_meta_filename)
+
+                if iso_metadata:
+                    self.logger.info(self.name, ErrorCode.RENDERING_ISO_METADATA,
+                                     f"Writing ISO Metadata to {iso_meta_filepath}")
+
+                    if not stream_to_file:
+                        with open(iso_meta_filepath, 'w', encoding='utf-8') as outfile:
+                            outfile.write(iso_metadata)
+
+        for iso_meta_filename, render_seconds in render_seconds_by_filename.items():
+            self.logger.debug(self.name, ErrorCode.PROCESSING_DETAILS,
+                              f'Rendered ISO Metadata for {iso_meta_filename} in {render_seconds:.6f} seconds')
+
+        self.logger.log_one_metric(self.name, 'iso_metadata.render_seconds',
+                                   sum(render_seconds_by_filename.values()))
+
+    @timed_stage('checksum')
+    def _checksum_files(self, file_paths):
+        """
+        Generates the MD5 checksums of the provided files using a pool of
+        threads. The number of threads used is determined by the RunConfig,
+        or the OPERA_PGE_CHECKSUM_WORKERS environment variable if not configured.
+
+        If enabled by the RunConfig, a persistent checksum cache is consulted
+        before each file is read, so files left unchanged since a previous run
+        of the PGE are not hashed again.
+
+        Parameters
+        ----------
+        file_paths : Iterable[str]
+            Paths to the files to generate checksums for.
+
+        Returns
+        -------
+        checksums : dict
+            Mapping of the base file names of the provided files to their MD5
+            checksums, in the same order as the provided paths.
+
+        """
+        checksum_workers = self._get_checksum_workers()
+        checksum_cache = None
+
+        if self.runconfig.checksum_cache_enabled:
+            checksum_cache_path = self.runconfig.checksum_cache_path
+
+            try:
+                checksum_cache = ChecksumCache(checksum_cache_path, self.runconfig.checksum_cache_max_entries)
+            except (OSError, sqlite3.Error) as err:
+                self.logger.warning(self.name, ErrorCode.CHECKSUM_CACHE_UNAVAILABLE,
+                                    f'Could not open checksum cache {checksum_cache_path}, '
+                                    f'reason: {str(err)}')
+
+        try:
+            checksums = get_checksums(file_paths, max_workers=checksum_workers, checksum_cache=checksum_cache)
+        finally:
+            if checksum_cache is not None:
+                checksum_cache.close()
+
+        return {basename(file_path): checksum for file_path, checksum in checksums.items()}
+
     @lru_cache
+    @timed_stage('catalog_metadata')
     def _create_catalog_metadata(self):
         """
         Returns the catalog metadata as a MetFile instance. Once generated, the
@@ -334,6 +612,7 @@ class PostProcessorMixin:
 
         return MetFile(catalog_metadata)
 
+    @timed_stage('iso_metadata')
     def _create_iso_metadata(self):  # pylint: disable=no-self-use
         """
         Creates the ISO metadata utilized by the DAAC's for indexing output
@@ -372,10 +651,39 @@ class PostProcessorMixin:
             The PgeLogger instance to finalize.
 
         """
+        if logger is self.logger:
+            self._log_stage_timings()
+
         logger.info(self.name, ErrorCode.CLOSING_LOG_FILE,
                     f"Closing log file {logger.get_file_name()}")
         logger.close_log_stream()
 
+    def _log_stage_timings(self):
+        """
+        Logs the elapsed and CPU time spent within each stage of PGE execution
+        timed thus far, and writes the full set of stage timings to a JSON file
+        within the scratch directory.
+
+        """
+        stage_timer = getattr(self, 'stage_timer', None)
+
+        if stage_timer is None:
+            return
+
+        stage_timings = stage_timer.get_summary()
+
+        for stage in stage_timings:
+            for key in ('elapsed_seconds', 'cpu_seconds'):
+                self.logger.log_one_metric(self.name, f"stage.{stage['stage']}.{key}", stage[key])
+
+        output_path = join(self.runconfig.scratch_path, 'pge_stage_timing.json')
+
+        try:
+            stage_timer.write_json(output_path)
+        except OSError as err:
+            self.logger.warning(self.name, ErrorCode.STAGE_TIMING_NOT_WRITTEN,
+                                f'Failed to write PGE stage timings to {output_path}, reason: {str(err)}')
+
     def _core_filename(self, inter_filename=None):  # pylint: disable=unused-argument
         """
         Returns the core file name component for products produced by the
@@ -507,6 +815,7 @@ class PostProcessorMixin:
         """
         return self._core_filename() + ".qa.log"
 
+    @timed_stage('stage_file')
     def _assign_filename(self, input_filepath, output_dir):
         """
         Assigns the appropriate file name which meets the file-naming conventions
@@ -547,11 +856,12 @@ class PostProcessorMixin:
                          f"Renaming output file {input_filepath} to {final_filepath}")
 
         try:
-            os.rename(input_filepath, final_filepath)
+            stage_file(input_filepath, final_filepath)
         except OSError as err:
             msg = f"Failed to rename output file {basename(input_filepath)}, reason: {str(err)}"
             self.logger.critical(self.name, ErrorCode.FILE_MOVE_FAILED, msg)
 
+    @timed_stage()
     def _stage_output_files(self):
         """
         Ensures that all output products produced by both the SAS and this PGE
@@ -630,6 +940,7 @@ class PostProcessorMixin:
             # Log stream might be closed by this point so raise an Exception instead
             raise RuntimeError(msg)
 
+    @timed_stage('postprocessor')
     def run_postprocessor(self, **kwargs):  # pylint: disable=unused-argument
         """
         Executes the post-processing steps for PGE job completion.
@@ -682,6 +993,19 @@ class PgeExecutor(PreProcessorMixin, PostProcessorMixin):
     SAS_VERSION = "0.1"
     """Version of the SAS wrapped by this PGE (dummy value)"""
 
+    SAS_MANIFEST_FILENAME = "sas_completion_manifest.json"
+    """Name of the manifest written to the scratch directory once the SAS completes"""
+
+    ARTIFACT_SUFFIXES = ('.catalog.json', '.iso.xml', '.log', '.prom', '.metrics.json')
+    """
+    Suffixes of the metadata, log and metrics files written to the output
+    directory by post-processing, which are removed when resuming from a
+    previous SAS execution
+    """
+
+    DEFAULT_LOG_FILENAME_PATTERN = re.compile(r'pge_[0-9]{8}T[0-9]{6}(?:\.log|\.prom|\.metrics\.json)')
+    """Matches the default-named logs (and their exported metrics) written by PgeLogger"""
+
     def __init__(self, pge_name, runconfig_path, **kwargs):
         """
         Creates a new instance of PgeExecutor
@@ -697,15 +1021,24 @@ class PgeExecutor(PreProcessorMixin, PostProcessorMixin):
             Supported kwargs include:
                 - logger : An existing instance of PgeLogger for this PgeExecutor
                            to use, rather than creating its own.
+                - runconfig : An existing instance of RunConfig, parsed from
+                              runconfig_path, for this PgeExecutor to use
+                              rather than parsing the file again.
 
         """
         self.name = self.NAME
         self.pge_name = pge_name
         self.runconfig_path = runconfig_path
-        self.runconfig = None
+        self.runconfig = kwargs.get('runconfig')
         self.logger = kwargs.get('logger')
         self.production_datetime = datetime.now()
 
+        # Records the time spent within each stage of PGE execution
+        self.stage_timer = StageTimer()
+
+        # Key of the SAS result cache entry for this execution, once determined
+        self._sas_result_key = None
+
         # Mapping of unix-style file name patterns to function pointers
         # used to rename said file
         self.rename_by_pattern_map = OrderedDict(
@@ -745,12 +1078,16 @@ class PgeExecutor(PreProcessorMixin, PostProcessorMixin):
 
         return sas_runconfig_filepath
 
+    @timed_stage('sas')
     def run_sas_executable(self, **kwargs):  # pylint: disable=unused-argument
         """
         Kicks off a SAS executable as defined by the RunConfig provided to
         the PGE.
 
         Execution time for the SAS is collected and logged by this method.
+        If enabled by the RunConfig, the resource usage of the SAS process tree
+        is also sampled during execution, summarized to the log, and written
+        as a timeline to the scratch directory.
 
         Parameters
         ----------
@@ -776,15 +1113,477 @@ class PgeExecutor(PreProcessorMixin, PostProcessorMixin):
         self.logger.info(self.name, ErrorCode.SAS_PROGRAM_STARTING,
                          'Starting SAS executable')
 
-        elapsed_time = time_and_execute(
-            command_line, self.logger, self.runconfig.execute_via_shell
-        )
+        resource_sampler = None
+
+        if self.runconfig.resource_sampling_enabled:
+            resource_sampler = ResourceSampler(interval=self.runconfig.resource_sampling_interval)
+            resource_sampler.start()
+
+        sas_environment = self._get_sas_environment()
+
+        try:
+            elapsed_time = time_and_execute(
+                command_line, self.logger, self.runconfig.execute_via_shell, env=sas_environment
+            )
+        finally:
+            if resource_sampler is not None:
+                resource_sampler.stop()
 
         self.logger.info(self.name, ErrorCode.SAS_PROGRAM_COMPLETED,
                          'SAS executable complete')
 
         self.logger.log_one_metric(self.name, 'sas.elapsed_seconds', elapsed_time)
 
+        if resource_sampler is not None:
+            self._log_resource_usage(resource_sampler)
+
+    def _get_sas_environment(self):
+        """
+        Determines the thread count and cache size environment variables to
+        execute the SAS with, as requested by the RunConfig. Only when
+        SasEnvironmentAutotuning is enabled are any remaining variables derived
+        from the CPU and memory available to the PGE (including any container
+        cgroup limits). The chosen values are logged.
+
+        Returns
+        -------
+        sas_environment : dict
+            Mapping of environment variable names to the values to set for
+            the SAS.
+
+        """
+        num_threads = self.runconfig.sas_num_threads
+        gdal_cache_max = self.runconfig.sas_gdal_cache_max
+
+        if self.runconfig.sas_environment_autotuning:
+            sas_environment = get_sas_environment(num_threads=num_threads, gdal_cachemax_mb=gdal_cache_max)
+        else:
+            sas_environment = {}
+
+            if num_threads is not None:
+                sas_environment.update(dict.fromkeys(THREAD_COUNT_ENV_VARS, str(num_threads)))
+
+            if gdal_cache_max is not None:
+                sas_environment[GDAL_CACHEMAX_ENV_VAR] = str(gdal_cache_max)
+
+        if sas_environment:
+            env_vars = ", ".join(f'{key}={value}' for key, value in sas_environment.items())
+            self.logger.info(self.name, ErrorCode.SAS_ENVIRONMENT_CONFIGURED,
+                             f'Configured SAS environment: {env_vars}')
+
+        return sas_environment
+
+    def _log_resource_usage(self, resource_sampler):
+        """
+        Logs the summary of the resource usage sampled during SAS execution,
+        and writes the timeline of samples to the scratch directory in the
+        format requested by the RunConfig.
+
+        Parameters
+        ----------
+        resource_sampler : opera.util.usage_metrics.ResourceSampler
+            The sampler used to monitor the SAS process tree.
+
+        """
+        for metric_name, value in resource_sampler.get_summary().items():
+            self.logger.log_one_metric(self.name, f'sas.resources.{metric_name}', value)
+
+        output_format = self.runconfig.resource_sampling_format
+        output_path = join(self.runconfig.scratch_path, f'sas_resource_usage.{output_format}')
+
+        try:
+            if output_format == 'csv':
+                resource_sampler.write_csv(output_path)
+            else:
+                resource_sampler.write_json(output_path)
+        except OSError as err:
+            self.logger.warning(self.name, ErrorCode.RESOURCE_USAGE_NOT_WRITTEN,
+                                f'Failed to write SAS resource usage to {output_path}, reason: {str(err)}')
+            return
+
+        self.logger.debug(self.name, ErrorCode.PROCESSING_DETAILS,
+                          f'SAS resource usage written to {output_path}')
+
+    def _sas_manifest_path(self):
+        """Returns the path to the manifest of the outputs of a completed SAS execution"""
+        return join(self.runconfig.scratch_path, self.SAS_MANIFEST_FILENAME)
+
+    def _runconfig_hash(self):
+        """
+        Returns a hash of the contents of the RunConfig which determine the
+        outputs of the SAS. Settings within the Runtime Group, which only affect
+        the behavior of the PGE itself, are excluded.
+        """
+        runconfig_dict = copy.deepcopy(self.runconfig.asdict())
+        runconfig_dict['Groups']['PGE'].pop('RuntimeGroup', None)
+
+        runconfig_json = json.dumps(runconfig_dict, sort_keys=True, default=str)
+
+        return hashlib.sha256(runconfig_json.encode('utf-8')).hexdigest()
+
+    def _remove_sas_manifest(self):
+        """Removes the manifest of any previous SAS execution, so it cannot be resumed from"""
+        try:
+            os.remove(self._sas_manifest_path())
+        except FileNotFoundError:
+            pass
+
+    def _get_pge_owned_files(self):
+        """
+        Returns the paths to the files within the output directory written by
+        the PGE itself, rather than the SAS, namely the logs of this PGE (and
+        any default-named logs left by a previous execution), along with the
+        metrics exported for each.
+        """
+        pge_owned_files = set()
+
+        for logger in (self.logger, getattr(self, 'qa_logger', None)):
+            if logger is None:
+                continue
+
+            log_filename = abspath(logger.get_file_name())
+            pge_owned_files.add(log_filename)
+
+            for export_format in METRICS_EXPORT_FORMATS:
+                pge_owned_files.add(
+                    abspath(get_metrics_filename(log_filename, export_format, logger.metrics_export_dir))
+                )
+
+        for output_product in self.runconfig.get_output_product_filenames():
+            if self.DEFAULT_LOG_FILENAME_PATTERN.fullmatch(basename(output_product)):
+                pge_owned_files.add(output_product)
+
+        return pge_owned_files
+
+    def _get_sas_output_files(self):
+        """
+        Returns the paths to the files within the output directory written by
+        the SAS, excluding those written by the PGE itself.
+        """
+        pge_owned_files = self._get_pge_owned_files()
+
+        return [output_product for output_product in self.runconfig.get_output_product_filenames()
+                if output_product not in pge_owned_files]
+
+    def _write_sas_manifest(self):
+        """
+        Writes a manifest of the outputs of a completed SAS execution to the
+        scratch directory, so post-processing of the outputs may be resumed
+        by a later execution of the PGE with the same RunConfig.
+
+        Each output is recorded with its size, modification time, and inode,
+        along with the PGE and SAS versions and a hash of the RunConfig. Files
+        written by the PGE itself, such as its log, are not recorded.
+
+        """
+        outputs = []
+
+        for output_product in self._get_sas_output_files():
+            stat_result = os.stat(output_product)
+
+            outputs.append(
+                {
+                    'path': output_product,
+                    'size': stat_result.st_size,
+                    'mtime_ns': stat_result.st_mtime_ns,
+                    'inode': stat_result.st_ino
+                }
+            )
+
+        manifest = {
+            'pge_version': self.PGE_VERSION,
+            'sas_version': self.SAS_VERSION,
+            'runconfig_hash': self._runconfig_hash(),
+            'outputs': outputs
+        }
+
+        manifest_path = self._sas_manifest_path()
+
+        try:
+            with open(manifest_path, 'w', encoding='utf-8') as outfile:
+                json.dump(manifest, outfile, indent=2)
+        except OSError as err:
+            self.logger.warning(self.name, ErrorCode.SAS_MANIFEST_NOT_WRITTEN,
+                                f'Failed to write SAS completion manifest {manifest_path}, '
+                                f'reason: {str(err)}')
+
+    def _validate_sas_manifest(self, manifest):
+        """
+        Validates the manifest of a previous SAS execution against the current
+        RunConfig and the current contents of the output directory.
+
+        Outputs which were renamed by a previous attempt at post-processing are
+        located by their inode, size, and modification time.
+
+        Parameters
+        ----------
+        manifest : dict
+            The manifest written by a previous SAS execution.
+
+        Returns
+        -------
+        renamed_outputs : dict
+            Mapping of the current paths of any renamed outputs to the paths
+            originally written by the SAS.
+
+        Raises
+        ------
+        ValueError
+            If the manifest does not apply to the current RunConfig, PGE, or SAS,
+            or if any of the recorded outputs are missing or have been modified.
+
+        """
+        for key, expected_value in (('pge_version', self.PGE_VERSION),
+                                    ('sas_version', self.SAS_VERSION),
+                                    ('runconfig_hash', self._runconfig_hash())):
+            if manifest.get(key) != expected_value:
+                raise ValueError(f'{key} of {manifest.get(key)} does not match the expected value of '
+                                 f'{expected_value}')
+
+        current_outputs = {}
+
+        for output_product in self.runconfig.get_output_product_filenames():
+            stat_result = os.stat(output_product)
+            current_outputs[output_product] = (stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
+
+        outputs_by_identity = {identity: path for path, identity in current_outputs.items()}
+        renamed_outputs = {}
+
+        for output in manifest['outputs']:
+            identity = (output['inode'], output['size'], output['mtime_ns'])
+
+            if current_outputs.get(output['path']) == identity:
+                continue
+
+            if identity in outputs_by_identity:
+                renamed_outputs[outputs_by_identity[identity]] = output['path']
+            else:
+                raise ValueError(f'SAS output {output["path"]} is missing or has been modified')
+
+        return renamed_outputs
+
+    def _resume_from_sas_manifest(self):
+        """
+        Attempts to resume from the outputs of a previous SAS execution, as
+        recorded by its manifest.
+
+        On success, any outputs renamed by a previous attempt at post-processing
+        are restored to their original names, and the metadata, log and metrics
+        files written by the previous attempt (as identified by the suffixes
+        within ARTIFACT_SUFFIXES) are removed. Any other files absent from the
+        manifest are left in place.
+
+        Returns
+        -------
+        resumed : bool
+            True if the outputs of the previous SAS execution may be
+            post-processed, False if the SAS must be executed.
+
+        """
+        manifest_path = self._sas_manifest_path()
+
+        if not exists(manifest_path):
+            self.logger.info(self.name, ErrorCode.RESUMING_FROM_SAS_MANIFEST,
+                             f'No SAS completion manifest found at {manifest_path}, SAS will be executed')
+            return False
+
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as infile:
+                manifest = json.load(infile)
+
+            renamed_outputs = self._validate_sas_manifest(manifest)
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            self.logger.warning(self.name, ErrorCode.SAS_MANIFEST_INVALID,
+                                f'Cannot resume from SAS completion manifest {manifest_path}, '
+                                f'SAS will be executed. Reason: {str(err)}')
+            return False
+
+        for current_path, original_path in renamed_outputs.items():
+            os.rename(current_path, original_path)
+
+        manifest_outputs = {output['path'] for output in manifest['outputs']}
+        current_log_files = {abspath(logger.get_file_name())
+                             for logger in (self.logger, getattr(self, 'qa_logger', None)) if logger is not None}
+
+        for output_product in self.runconfig.get_output_product_filenames():
+            if output_product in manifest_outputs or output_product in current_log_files:
+                continue
+
+            if output_product.endswith(self.ARTIFACT_SUFFIXES):
+                self.logger.info(self.name, ErrorCode.RESUMING_FROM_SAS_MANIFEST,
+                                 f'Removing {output_product} left by a previous attempt at post-processing')
+                os.remove(output_product)
+            else:
+                self.logger.warning(self.name, ErrorCode.UNRECOGNIZED_OUTPUT_LEFT_IN_PLACE,
+                                    f'Leaving {output_product} in place, as it was neither written by the SAS '
+                                    f'nor a previous attempt at post-processing')
+
+        self.logger.info(self.name, ErrorCode.RESUMING_FROM_SAS_MANIFEST,
+                         f'Resuming from SAS completion manifest {manifest_path}, '
+                         f'skipping SAS execution')
+
+        return True
+
+    def _get_sas_input_files(self):
+        """
+        Returns the paths to all input and ancillary files consumed by the SAS,
+        with any ancillary directories expanded to the files they contain.
+        """
+        sas_input_files = set(self.runconfig.get_input_filenames())
+
+        for ancillary_path in self.runconfig.get_ancillary_filenames():
+            if os.path.isfile(ancillary_path):
+                sas_input_files.add(ancillary_path)
+            elif os.path.isdir(ancillary_path):
+                for dirpath, _, filenames in os.walk(ancillary_path):
+                    sas_input_files.update(join(dirpath, filename) for filename in filenames)
+
+        return sorted(sas_input_files)
+
+    def _sas_result_cache_key(self):
+        """
+        Derives the SAS result cache key for the current execution of the PGE.
+
+        The key is computed from the checksums of all input and ancillary files,
+        the PGE and SAS versions, the SAS program and its options, and the SAS
+        portion of the RunConfig. Within the configuration, references to input files are
+        replaced by the checksums of their contents, and references to other
+        locations on disk (such as the output and scratch directories) are
+        replaced by placeholders, so the key does not depend on where files
+        were staged for a particular execution.
+
+        Returns
+        -------
+        cache_key : str
+            The SAS result cache key.
+
+        """
+        input_checksums = get_checksums(self._get_sas_input_files(), max_workers=self._get_checksum_workers())
+
+        location_placeholders = (
+            (abspath(self.runconfig.output_product_path), '<output_product_path>'),
+            (abspath(self.runconfig.scratch_path), '<scratch_path>')
+        )
+
+        def normalize(value):
+            if isinstance(value, dict):
+                return {key: normalize(item) for key, item in value.items()}
+
+            if isinstance(value, (list, tuple)):
+                return [normalize(item) for item in value]
+
+            if isinstance(value, str) and value:
+                for location, placeholder in location_placeholders:
+                    if abspath(value) == location or abspath(value).startswith(location + os.sep):
+                        return placeholder
+
+                if os.path.isfile(value):
+                    return input_checksums.get(value) or get_checksums([value])[value]
+
+                if os.path.exists(value):
+                    return '<path>'
+
+            return value
+
+        return compute_cache_key(
+            pge=self.NAME,
+            pge_version=self.PGE_VERSION,
+            sas_version=self.SAS_VERSION,
+            sas_program=normalize([self.runconfig.sas_program_path, self.runconfig.sas_program_options]),
+            sas_config=normalize(self.runconfig.sas_config),
+            inputs=sorted(input_checksums.values())
+        )
+
+    def _open_sas_result_cache(self):
+        """
+        Opens the SAS result cache configured by the RunConfig.
+
+        Returns
+        -------
+        result_cache : SasResultCache or None
+            The opened cache, or None if the cache is disabled or could not be
+            opened.
+
+        """
+        if not self.runconfig.sas_result_cache_enabled:
+            return None
+
+        cache_path = self.runconfig.sas_result_cache_path
+
+        try:
+            return SasResultCache(cache_path, self.runconfig.sas_result_cache_max_bytes)
+        except OSError as err:
+            self.logger.warning(self.name, ErrorCode.SAS_RESULT_CACHE_UNAVAILABLE,
+                                f'Could not open SAS result cache {cache_path}, reason: {str(err)}')
+            return None
+
+    @timed_stage('sas_result_cache')
+    def _restore_sas_results(self):
+        """
+        Restores the outputs of a previous SAS execution with identical inputs
+        and configuration from the SAS result cache, if enabled.
+
+        Returns
+        -------
+        restored : bool
+            True if cached outputs were restored into the output directory, in
+            which case the SAS does not need to be executed.
+
+        """
+        result_cache = self._open_sas_result_cache()
+
+        if result_cache is None:
+            return False
+
+        try:
+            self._sas_result_key = self._sas_result_cache_key()
+
+            restored_files = result_cache.restore(
+                self._sas_result_key, self.runconfig.output_product_path,
+                hardlink=self.runconfig.sas_result_cache_hardlink
+            )
+        except (OSError, KeyError) as err:
+            self.logger.warning(self.name, ErrorCode.SAS_RESULT_CACHE_UNAVAILABLE,
+                                f'Failed to restore cached SAS results, SAS will be executed. '
+                                f'Reason: {str(err)}')
+            return False
+
+        if restored_files is None:
+            self.logger.info(self.name, ErrorCode.SAS_RESULT_CACHE_HIT,
+                             f'No cached SAS results found for key {self._sas_result_key}')
+            return False
+
+        self.logger.info(self.name, ErrorCode.SAS_RESULT_CACHE_HIT,
+                         f'Restored {len(restored_files)} SAS output(s) from cache entry '
+                         f'{self._sas_result_key}, skipping SAS execution')
+
+        return True
+
+    @timed_stage('sas_result_cache')
+    def _store_sas_results(self):
+        """
+        Adds the outputs of the completed SAS execution to the SAS result cache,
+        if enabled. Files written to the output directory by the PGE itself,
+        such as logs of previous executions, are never cached.
+        """
+        if self._sas_result_key is None:
+            return
+
+        result_cache = self._open_sas_result_cache()
+
+        if result_cache is None:
+            return
+
+        try:
+            result_cache.store(
+                self._sas_result_key, self.runconfig.output_product_path,
+                self._get_sas_output_files()
+            )
+        except OSError as err:
+            self.logger.warning(self.name, ErrorCode.SAS_RESULT_CACHE_UNAVAILABLE,
+                                f'Failed to store SAS results in cache entry {self._sas_result_key}, '
+                                f'reason: {str(err)}')
+
     def run(self, **kwargs):
         """
         Main entry point for PGE execution.
@@ -793,10 +1592,31 @@ class PgeExecutor(PreProcessorMixin, PostProcessorMixin):
         SAS execution, then completed with the post-processing steps to complete
         the job.
 
+        Once the SAS completes, a manifest of its outputs is written to the
+        scratch directory. If resumption is enabled by the RunConfig, and a
+        valid manifest from a previous execution with the same RunConfig is
+        found, SAS execution is skipped and the PGE proceeds directly to
+        post-processing of the outputs of the previous execution.
+
+        Otherwise, if the SAS result cache is enabled by the RunConfig, outputs
+        cached from a previous SAS execution with identical inputs and
+        configuration are restored in place of executing the SAS, and the
+        outputs of any new SAS execution are added to the cache.
+
         """
         self.run_preprocessor(**kwargs)
 
-        print(f'Starting SAS execution for {self.__class__.__name__}')
-        self.run_sas_executable(**kwargs)
+        if self.runconfig.resume_enabled and self._resume_from_sas_manifest():
+            print(f'Resuming {self.__class__.__name__} from completed SAS execution')
+        else:
+            self._remove_sas_manifest()
+
+            if not self._restore_sas_results():
+                print(f'Starting SAS execution for {self.__class__.__name__}')
+                self.run_sas_executable(**kwargs)
+
+                self._store_sas_results()
+
+            self._write_sas_manifest()
 
         self.run_postprocessor(**kwargs)
@@ -13,6 +13,7 @@ Original Author: David White
 Adapted By: Scott Collins
 
 """
+import copy
 import os
 from os.path import abspath, basename, isabs, isdir, isfile, join
 
@@ -22,6 +23,11 @@ import yamale
 
 import yaml
 
+from opera.util import YAML_SAFE_LOADER
+from opera.util.checksum_cache import CHECKSUM_CACHE_FILENAME, DEFAULT_MAX_CACHE_ENTRIES
+from opera.util.result_cache import DEFAULT_MAX_CACHE_BYTES
+from opera.util.schema_cache import get_schema
+from opera.util.usage_metrics import DEFAULT_SAMPLE_INTERVAL
 
 BASE_PGE_SCHEMA = str(files('opera').joinpath('pge/base/schema/base_pge_schema.yaml'))
 """Path to the Yamale schema applicable to the PGE portion of each RunConfig"""
@@ -39,6 +45,9 @@ class RunConfig:
     ----------
     _filename : str
         Name of the file parsed to create the RunConfig
+    _run_config_document : dict
+        Parsed contents of the entire RunConfig file, retained so that it
+        may be validated without parsing the file again
     _run_config : dict
         Parsed contents of the provided RunConfig file
     _pge_config : dict
@@ -51,23 +60,23 @@ class RunConfig:
     def __init__(self, filename):
         self._filename = filename
 
-        self._run_config = self._parse_run_config_file(filename)
+        self._run_config_document = self._load_yaml_file(filename)
+        self._run_config = self._get_run_config_section(self._run_config_document, filename)
         self._pge_config = self._run_config['Groups']['PGE']
 
         # SAS section may not always be present, during testing for example
         self._sas_config = self._run_config['Groups'].get('SAS')
 
     @staticmethod
-    def _parse_run_config_file(yaml_filename):
-        """
-        Loads a run configuration YAML file.
-        Returns the loaded data as a Python object.
-
-        Parameters
-        ----------
-        yaml_filename : str
-            Path to the RunConfig YAML file to parse.
+    def _load_yaml_file(yaml_filename):
+        """Loads a YAML file, returning the loaded data as a Python object"""
+        with open(yaml_filename, 'r', encoding='utf-8') as stream:
+            return yaml.load(stream, Loader=YAML_SAFE_LOADER)
 
+    @staticmethod
+    def _get_run_config_section(dictionary, yaml_filename):
+        """
+        Returns the top-level "RunConfig" entry of a parsed RunConfig file.
 
         Raises
         ------
@@ -75,9 +84,6 @@ class RunConfig:
             If the parsed config does not define a top-level "RunConfig" entry
 
         """
-        with open(yaml_filename, 'r', encoding='utf-8') as stream:
-            dictionary = yaml.safe_load(stream)
-
         try:
             return dictionary['RunConfig']
         except KeyError as key_error:
@@ -103,8 +109,7 @@ class RunConfig:
             If the parsed config does not define dictionary.
 
         """
-        with open(yaml_filename, 'r', encoding='utf-8') as stream:
-            dictionary = yaml.safe_load(stream)
+        dictionary = RunConfig._load_yaml_file(yaml_filename)
 
         if dictionary:
             if 'runconfig' in dictionary:
@@ -140,8 +145,10 @@ class RunConfig:
 
         """
         # Load the schema for the PGE portion of the RunConfig, which should
-        # be fixed across all PGE-SAS combinations
-        pge_schema = yamale.make_schema(pge_schema_file)
+        # be fixed across all PGE-SAS combinations. Since the compiled schema
+        # is cached, the SAS schema is included within a copy of it.
+        pge_schema = copy.copy(get_schema(pge_schema_file))
+        pge_schema.includes = dict(pge_schema.includes)
 
         # If there was a SAS section included with the parsed config, pull
         # in its schema before validating. Otherwise, only the base PGE schema
@@ -151,7 +158,7 @@ class RunConfig:
             sas_schema_filepath = self.sas_schema_path
 
             if isfile(sas_schema_filepath):
-                sas_schema = yamale.make_schema(sas_schema_filepath)
+                sas_schema = get_schema(sas_schema_filepath)
 
                 # Link the SAS schema to the PGE as an "include"
                 # Note that the key name "sas_configuration" must match the include statement
@@ -163,9 +170,11 @@ class RunConfig:
                     f'schema ({sas_schema_filepath}) cannot be located.'
                 )
 
-        # Yamale expects its own formatting of the parsed config, hence the need
-        # to call "make_data()" here.
-        runconfig_data = yamale.make_data(self.filename)
+        # Yamale expects its own formatting of the parsed config, a list of
+        # (document, path) pairs as returned by "make_data()". The document
+        # parsed when this RunConfig was created is reused, rather than
+        # parsing the file again.
+        runconfig_data = [(self._run_config_document, self.filename)]
 
         # Finally, validate the RunConfig against the combined PGE/SAS schema
         yamale.validate(pge_schema, runconfig_data, strict=strict_mode)
@@ -382,6 +391,107 @@ class RunConfig:
         """Returns a boolean indicating the state of ExecuteViaShell: enabled/disabled"""
         return bool(self._pge_config['DebugLevelGroup'].get('ExecuteViaShell', False))
 
+    # RuntimeGroup
+    @property
+    def runtime_config(self) -> dict:
+        """Returns the optional Runtime Group, or an empty dict if it was not provided"""
+        return self._pge_config.get('RuntimeGroup') or {}
+
+    @property
+    def checksum_workers(self) -> int:
+        """Returns the number of threads to use for output product checksums, if configured"""
+        return self.runtime_config.get('ChecksumWorkers', None)
+
+    @property
+    def metadata_workers(self) -> int:
+        """Returns the number of threads to use for reading product metadata, if configured"""
+        return self.runtime_config.get('MetadataWorkers', None)
+
+    @property
+    def checksum_cache_enabled(self) -> bool:
+        """Returns a boolean indicating whether the persistent checksum cache is enabled"""
+        return bool(self.runtime_config.get('ChecksumCacheEnabled', False))
+
+    @property
+    def checksum_cache_path(self) -> str:
+        """Returns the path to the persistent checksum cache, defaulting to a file within the scratch path"""
+        checksum_cache_path = self.runtime_config.get('ChecksumCachePath', None)
+
+        if checksum_cache_path is None:
+            checksum_cache_path = join(self.scratch_path, CHECKSUM_CACHE_FILENAME)
+
+        return checksum_cache_path
+
+    @property
+    def checksum_cache_max_entries(self) -> int:
+        """Returns the maximum number of entries retained by the persistent checksum cache"""
+        return self.runtime_config.get('ChecksumCacheMaxEntries', DEFAULT_MAX_CACHE_ENTRIES)
+
+    @property
+    def resource_sampling_enabled(self) -> bool:
+        """Returns a boolean indicating whether resource usage of the SAS should be sampled"""
+        return bool(self.runtime_config.get('ResourceSamplingEnabled', False))
+
+    @property
+    def resource_sampling_interval(self) -> float:
+        """Returns the interval, in seconds, between samples of SAS resource usage"""
+        return self.runtime_config.get('ResourceSamplingInterval', DEFAULT_SAMPLE_INTERVAL)
+
+    @property
+    def resource_sampling_format(self) -> str:
+        """Returns the format (json or csv) used to write the timeline of SAS resource usage"""
+        return self.runtime_config.get('ResourceSamplingFormat', 'json')
+
+    @property
+    def sas_environment_autotuning(self) -> bool:
+        """Returns a boolean indicating whether the SAS thread and cache environment should be derived automatically"""
+        return bool(self.runtime_config.get('SasEnvironmentAutotuning', False))
+
+    @property
+    def sas_num_threads(self) -> int:
+        """Returns the number of threads requested for the SAS, if configured"""
+        return self.runtime_config.get('SasNumThreads', None)
+
+    @property
+    def sas_gdal_cache_max(self) -> int:
+        """Returns the size of the GDAL block cache requested for the SAS in megabytes, if configured"""
+        return self.runtime_config.get('SasGdalCacheMax', None)
+
+    @property
+    def resume_enabled(self) -> bool:
+        """Returns a boolean indicating whether post-processing may resume from a previous SAS execution"""
+        return bool(self.runtime_config.get('ResumeEnabled', False))
+
+    @property
+    def sas_result_cache_enabled(self) -> bool:
+        """Returns a boolean indicating whether the SAS result cache is enabled"""
+        return bool(self.runtime_config.get('SasResultCacheEnabled', False))
+
+    @property
+    def sas_result_cache_path(self) -> str:
+        """Returns the path to the SAS result cache, defaulting to a directory within the scratch path"""
+        return self.runtime_config.get('SasResultCachePath', None) or join(self.scratch_path, 'sas_result_cache')
+
+    @property
+    def sas_result_cache_max_bytes(self) -> int:
+        """Returns the maximum total size, in bytes, of the outputs retained by the SAS result cache"""
+        return self.runtime_config.get('SasResultCacheMaxBytes', DEFAULT_MAX_CACHE_BYTES)
+
+    @property
+    def sas_result_cache_hardlink(self) -> bool:
+        """Returns a boolean indicating whether cached SAS outputs should be restored as hard links"""
+        return bool(self.runtime_config.get('SasResultCacheHardlink', False))
+
+    @property
+    def metrics_export_formats(self) -> list:
+        """Returns the list of formats to export logged metrics in, if any"""
+        return self.runtime_config.get('MetricsExportFormats', None) or []
+
+    @property
+    def metrics_export_path(self) -> str:
+        """Returns the directory to export logged metrics to, if configured"""
+        return self.runtime_config.get('MetricsExportPath', None)
+
     @property
     def product_type(self) -> str:
         """Returns the product type as defined in the SAS portion of the RunConfig"""
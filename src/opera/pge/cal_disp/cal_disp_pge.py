@@ -16,7 +16,7 @@ from opera.util.error_codes import ErrorCode
 from opera.util.h5_utils import get_cal_disp_product_metadata
 from opera.util.input_validation import validate_algorithm_parameters_config, validate_cal_inputs
 from opera.util.render_jinja2 import augment_hdf5_measured_parameters, render_jinja2
-from opera.util.run_utils import get_checksum
+from opera.util.stage_timing import timed_stage
 from opera.util.time import get_catalog_metadata_datetime_str
 
 
@@ -34,6 +34,7 @@ class CalDispPreProcessorMixin(PreProcessorMixin):
     _pre_mixin_name = "CalDispPreProcessorMixin"
     _valid_input_extensions = (".nc",)
 
+    @timed_stage('preprocessor')
     def run_preprocessor(self, **kwargs):
         """
         Executes the pre-processing steps for CAL-DISP PGE initialization.
@@ -71,6 +72,7 @@ class CalDispPostProcessorMixin(PostProcessorMixin):
     _cached_core_filename = None
     _cached_product_metadata = None
 
+    @timed_stage()
     def _validate_outputs(self):
         output_product_files = self.runconfig.get_output_product_filenames()
 
@@ -145,6 +147,7 @@ class CalDispPostProcessorMixin(PostProcessorMixin):
         # set _cached_core_filename
         return self._cached_core_filename
 
+    @timed_stage('checksum')
     def _checksum_output_products(self):
         """
         Generates a dictionary mapping output product file names to the
@@ -171,13 +174,11 @@ class CalDispPostProcessorMixin(PostProcessorMixin):
         )
 
         # Generate checksums on the filtered product list
-        checksums = {
-            basename(output_product): get_checksum(output_product)
-            for output_product in filtered_output_products
-        }
+        checksums = self._checksum_files(filtered_output_products)
 
         return checksums
 
+    @timed_stage('collect_product_metadata')
     def _collect_cal_disp_product_metadata(self, cal_disp_product):
         """
         Gathers the available metadata from a sample output CAL-DISP product for
@@ -271,6 +272,7 @@ class CalDispPostProcessorMixin(PostProcessorMixin):
 
         return custom_metadata
 
+    @timed_stage('iso_metadata')
     def _create_iso_metadata(self):
         """
         Creates a rendered version of the ISO metadata template for CAL-DISP
@@ -314,6 +316,7 @@ class CalDispPostProcessorMixin(PostProcessorMixin):
 
         return rendered_template
 
+    @timed_stage('postprocessor')
     def run_postprocessor(self, **kwargs):
         """
         Executes the post-processing steps for the CAL-DISP PGE.
@@ -360,6 +363,7 @@ class CalDispExecutor(CalDispPreProcessorMixin, CalDispPostProcessorMixin, PgeEx
 
         self.rename_by_pattern_map = {}
 
+    @timed_stage('sas')
     def run_sas_executable(self, **kwargs):  # pylint: disable=unused-argument
         """
         Kicks off a SAS executable as defined by the RunConfig provided to
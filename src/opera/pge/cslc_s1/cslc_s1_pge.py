@@ -12,6 +12,7 @@ from Sentinel-1 A/B (S1) PGE.
 import glob
 import os.path
 from datetime import datetime
+from functools import partial
 from os import walk
 from os.path import getsize, join
 from pathlib import Path
@@ -23,7 +24,8 @@ from opera.util.dataset_utils import parse_bounding_polygon_from_wkt
 from opera.util.error_codes import ErrorCode
 from opera.util.h5_utils import get_cslc_s1_product_metadata
 from opera.util.input_validation import validate_slc_s1_inputs
-from opera.util.render_jinja2 import augment_hdf5_measured_parameters, render_jinja2
+from opera.util.render_jinja2 import augment_hdf5_measured_parameters, render_jinja2, render_jinja2_to_file
+from opera.util.stage_timing import timed_stage
 from opera.util.time import get_time_for_filename
 
 
@@ -41,6 +43,7 @@ class CslcS1PreProcessorMixin(PreProcessorMixin):
 
     _pre_mixin_name = "CslcS1PreProcessorMixin"
 
+    @timed_stage('preprocessor')
     def run_preprocessor(self, **kwargs):
         """
         Executes the pre-processing steps for CSLC-S1 PGE initialization.
@@ -77,6 +80,7 @@ class CslcS1PostProcessorMixin(PostProcessorMixin):
     _burst_metadata_cache = {}
     _burst_filename_cache = {}
 
+    @timed_stage()
     def _validate_output(self):
         """
         Evaluates the output file(s) generated from SAS execution to ensure
@@ -256,16 +260,9 @@ class CslcS1PostProcessorMixin(PostProcessorMixin):
             cslc_metadata = self._burst_metadata_cache[burst_id]
         else:
             # Collect the metadata from the HDF5 output product
-            cslc_h5_product_pattern = join(os.path.dirname(inter_filename), f"*{burst_id_dir}*.h5")
-
-            # Find the main .h5 product path based on location of the current file
-            # and burst ID
-            cslc_h5_product_paths = glob.glob(cslc_h5_product_pattern)
-
-            if len(cslc_h5_product_paths) != 1:
-                raise RuntimeError(f'Got unexpected number of CSLC .h5 paths: {cslc_h5_product_paths}')
-
-            cslc_metadata = self._collect_cslc_product_metadata(cslc_h5_product_paths[0])
+            cslc_metadata = self._collect_cslc_product_metadata(
+                self._find_cslc_h5_product(os.path.dirname(inter_filename))
+            )
 
             self._burst_metadata_cache[burst_id] = cslc_metadata
 
@@ -323,6 +320,68 @@ class CslcS1PostProcessorMixin(PostProcessorMixin):
 
         return cslc_filename
 
+    @staticmethod
+    def _find_cslc_h5_product(product_dir):
+        """
+        Returns the path to the main .h5 product within the provided output
+        directory, which is located within a parent directory named for the
+        burst ID.
+
+        Parameters
+        ----------
+        product_dir : str
+            Path to the output directory containing the products for a
+            single burst.
+
+        Returns
+        -------
+        cslc_h5_product_path : str
+            Path to the CSLC .h5 product to collect metadata from.
+
+        Raises
+        ------
+        RuntimeError
+            If other than exactly one .h5 product for the burst is found.
+
+        """
+        burst_id_dir = Path(product_dir).parts[-2]
+
+        cslc_h5_product_pattern = join(product_dir, f"*{burst_id_dir}*.h5")
+
+        # Find the main .h5 product path based on location of the current file
+        # and burst ID
+        cslc_h5_product_paths = glob.glob(cslc_h5_product_pattern)
+
+        if len(cslc_h5_product_paths) != 1:
+            raise RuntimeError(f'Got unexpected number of CSLC .h5 paths: {cslc_h5_product_paths}')
+
+        return cslc_h5_product_paths[0]
+
+    def _prefetch_burst_metadata(self):
+        """
+        Collects the metadata for each burst product created by the SAS
+        concurrently, filling the burst metadata cache before the output
+        products are renamed.
+        """
+        output_dir = os.path.abspath(self.runconfig.output_product_path)
+        metadata_sources = {}
+
+        for output_product in self.runconfig.get_output_product_filenames():
+            # Products are written to <output dir>/<burst ID>/<date>/
+            if (not output_product.endswith('.h5')
+                    or len(Path(output_product).relative_to(output_dir).parts) < 3):
+                continue
+
+            product_dir = os.path.dirname(output_product)
+
+            burst_id = Path(product_dir).parts[-2].upper().replace('_', '-')
+
+            if burst_id not in metadata_sources:
+                metadata_sources[burst_id] = self._find_cslc_h5_product(product_dir)
+
+        self._prefetch_product_metadata(metadata_sources, self._collect_cslc_product_metadata,
+                                        self._burst_metadata_cache)
+
     def _h5_filename(self, inter_filename):
         """
         Returns the file name to use for HDF5 products produced by the CSLC-S1 PGE.
@@ -601,6 +660,7 @@ class CslcS1PostProcessorMixin(PostProcessorMixin):
         """
         return self._ancillary_filename() + ".qa.log"
 
+    @timed_stage('collect_product_metadata')
     def _collect_cslc_product_metadata(self, cslc_product):
         """
         Gathers the available metadata from the HDF5 product created by the
@@ -701,7 +761,8 @@ class CslcS1PostProcessorMixin(PostProcessorMixin):
 
         return custom_metadata
 
-    def _create_iso_metadata(self, burst_metadata):
+    @timed_stage('iso_metadata')
+    def _create_iso_metadata(self, burst_metadata, output_filepath=None):
         """
         Creates a rendered version of the ISO metadata template for CSLC-S1
         output products using metadata from the following locations:
@@ -716,12 +777,16 @@ class CslcS1PostProcessorMixin(PostProcessorMixin):
         burst_metadata : dict
             The product metadata corresponding to a specific burst product to
             be included as the "product_output" metadata in the rendered ISO xml.
+        output_filepath : str, optional
+            If provided, the ISO metadata is streamed directly to this file
+            rather than returned as a string.
 
         Returns
         -------
         rendered_template : str
             The ISO metadata template for CSLC-S1 filled in with values from
-            the sourced metadata dictionaries.
+            the sourced metadata dictionaries. If output_filepath was
+            provided, the path to the rendered file is returned instead.
 
         """
         # Use the base PGE implemenation to validate existence of the template
@@ -744,6 +809,15 @@ class CslcS1PostProcessorMixin(PostProcessorMixin):
 
         iso_template_path = os.path.abspath(self.runconfig.iso_template_path)
 
+        if output_filepath is not None:
+            return render_jinja2_to_file(
+                iso_template_path,
+                iso_metadata,
+                output_filepath,
+                logger=self.logger,
+                output_directory=self.runconfig.output_product_path
+            )
+
         rendered_template = render_jinja2(
             iso_template_path,
             iso_metadata,
@@ -753,6 +827,7 @@ class CslcS1PostProcessorMixin(PostProcessorMixin):
 
         return rendered_template
 
+    @timed_stage()
     def _stage_output_files(self):
         """
         Ensures that all output products produced by both the SAS and this PGE
@@ -795,17 +870,12 @@ class CslcS1PostProcessorMixin(PostProcessorMixin):
 
         # Generate the ISO metadata for use with product submission to DAAC(s)
         # For CSLC-S1, each burst-based product gets its own ISO xml
-        for burst_id, burst_metadata in self._burst_metadata_cache.items():
-            iso_metadata = self._create_iso_metadata(burst_metadata)
-
-            iso_meta_filename = self._iso_metadata_filename(burst_id)
-            iso_meta_filepath = join(self.runconfig.output_product_path, iso_meta_filename)
+        iso_metadata_renderers = {
+            self._iso_metadata_filename(burst_id): partial(self._create_iso_metadata, burst_metadata)
+            for burst_id, burst_metadata in self._burst_metadata_cache.items()
+        }
 
-            if iso_metadata:
-                self.logger.info(self.name, ErrorCode.RENDERING_ISO_METADATA,
-                                 f"Writing ISO Metadata to {iso_meta_filepath}")
-                with open(iso_meta_filepath, 'w', encoding='utf-8') as outfile:
-                    outfile.write(iso_metadata)
+        self._write_iso_metadata_files(iso_metadata_renderers, stream_to_file=True)
 
         # Write the QA application log to disk with the appropriate filename,
         # if necessary
@@ -833,13 +903,15 @@ class CslcS1PostProcessorMixin(PostProcessorMixin):
             # Log stream might be closed by this point so raise an Exception instead
             raise RuntimeError(msg)
 
+    @timed_stage('postprocessor')
     def run_postprocessor(self, **kwargs):
         """
         Executes the post-processing steps for the CSLC-S1 PGE.
 
         The CslcS1PostProcessorMixin version of this method performs the same
         steps as the base PostProcessorMixin, but inserts a step to perform
-        output product validation prior to staging and renaming of the output
+        output product validation, and another to collect the metadata of each
+        burst product concurrently, prior to staging and renaming of the output
         files.
 
         Parameters
@@ -852,6 +924,7 @@ class CslcS1PostProcessorMixin(PostProcessorMixin):
 
         self._run_sas_qa_executable()
         self._validate_output()
+        self._prefetch_burst_metadata()
         self._stage_output_files()
 
 
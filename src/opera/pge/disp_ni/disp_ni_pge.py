@@ -18,6 +18,7 @@ from opera.util.error_codes import ErrorCode
 from opera.util.h5_utils import get_disp_s1_product_metadata as get_disp_product_metadata
 from opera.util.input_validation import validate_algorithm_parameters_config
 from opera.util.render_jinja2 import augment_hdf5_measured_parameters
+from opera.util.stage_timing import timed_stage
 from opera.util.time import get_catalog_metadata_datetime_str, get_time_for_filename
 
 
@@ -34,6 +35,7 @@ class DispNIPreProcessorMixin(DispS1PreProcessorMixin):
     _pre_mixin_name = "DispNIPreProcessorMixin"
     _valid_input_extensions = (".tif",)
 
+    @timed_stage()
     def _validate_runconfig_needed_options(self):
         """
         Bypass this method for NISAR. It may need to be re-implemented if we have a
@@ -41,6 +43,7 @@ class DispNIPreProcessorMixin(DispS1PreProcessorMixin):
         """
         pass
 
+    @timed_stage('preprocessor')
     def run_preprocessor(self, **kwargs):
         """
         Executes the pre-processing steps for DISP-NI PGE initialization.
@@ -307,6 +310,7 @@ class DispNIPostProcessorMixin(DispS1PostProcessorMixin):
 
         return ancillary_filename
 
+    @timed_stage('collect_product_metadata')
     def _collect_disp_ni_product_metadata(self, disp_product):
         """
         Gathers the available metadata from a sample output DISP-NI product for
@@ -396,6 +400,7 @@ class DispNIPostProcessorMixin(DispS1PostProcessorMixin):
 
         return custom_metadata
 
+    @timed_stage('postprocessor')
     def run_postprocessor(self, **kwargs):
         """
         Executes the post-processing steps for the DISP-NI PGE.
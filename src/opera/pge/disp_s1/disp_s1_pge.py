@@ -15,6 +15,8 @@ import os.path
 import re
 import subprocess
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from importlib.resources import files
 from os import listdir
 from os.path import abspath, basename, exists, getsize, join, splitext
@@ -25,12 +27,13 @@ from opera.pge.base.base_pge import PreProcessorMixin
 from opera.util.dataset_utils import parse_bounding_polygon_from_wkt
 from opera.util.error_codes import ErrorCode
 from opera.util.geo_utils import get_gml_polygon_from_frame
-from opera.util.h5_utils import get_cslc_s1_product_metadata
+from opera.util.h5_utils import get_cslc_s1_input_metadata
 from opera.util.h5_utils import get_disp_s1_product_metadata
 from opera.util.input_validation import (validate_algorithm_parameters_config,
                                          validate_disp_inputs,
                                          validate_disp_static_inputs)
 from opera.util.render_jinja2 import augment_hdf5_measured_parameters, augment_measured_parameters, render_jinja2
+from opera.util.stage_timing import timed_stage
 from opera.util.tiff_utils import get_geotiff_dimensions, get_geotiff_metadata
 from opera.util.time import get_catalog_metadata_datetime_str, get_time_for_filename
 
@@ -49,6 +52,7 @@ class DispS1PreProcessorMixin(PreProcessorMixin):
 
     _pre_mixin_name = "DispS1PreProcessorMixin"
 
+    @timed_stage()
     def _validate_runconfig_needed_options(self):
         """
         The SAS schema for the DISP-S1 PGEs validates for both baseline and static workflows.
@@ -85,6 +89,7 @@ class DispS1PreProcessorMixin(PreProcessorMixin):
             msg = f'Unexpected options found in RunConfig: {extra_keys}'
             self.logger.critical(self.name, ErrorCode.RUN_CONFIG_VALIDATION_FAILED, msg)
 
+    @timed_stage('preprocessor')
     def run_preprocessor(self, **kwargs):
         """
         Executes the pre-processing steps for DISP-S1 PGE initialization.
@@ -112,6 +117,36 @@ class DispS1PreProcessorMixin(PreProcessorMixin):
                                              self.runconfig.algorithm_parameters_file_config_path,
                                              self.logger)
 
+        self._index_input_metadata()
+
+    @timed_stage('index_input_metadata')
+    def _index_input_metadata(self):
+        """
+        Reads the metadata needed from each input CSLC product (burst ID,
+        polarization, sensing times and platform) using a pool of threads,
+        and indexes it by the absolute path of each product. Output filenames
+        and metadata are then derived from the index, rather than by reopening
+        the input products for each output product.
+
+        Inputs which cannot be read as CSLC products, such as compressed
+        CSLCs lacking the expected metadata, are indexed with a value of None.
+
+        """
+        input_file_group = self.runconfig.sas_config.get('input_file_group') or {}
+        cslc_paths = [abspath(cslc_file) for cslc_file in input_file_group.get('cslc_file_list') or []]
+
+        def _read_input_metadata(cslc_path):
+            try:
+                return get_cslc_s1_input_metadata(cslc_path)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=self._get_metadata_workers()) as executor:
+            self._input_metadata_index = dict(zip(cslc_paths, executor.map(_read_input_metadata, cslc_paths)))
+
+        self.logger.debug(self.name, ErrorCode.PROCESSING_DETAILS,
+                          f'Indexed metadata of {len(self._input_metadata_index)} input CSLC product(s)')
+
     def convert_troposphere_model_files(self):
         """
         Convert grib (.grb) files to netCDF (.nc)
@@ -183,7 +218,9 @@ class DispS1PostProcessorMixin(PostProcessorMixin):
     _post_mixin_name = "DispS1PostProcessorMixin"
     _product_metadata_cache = {}
     _product_filename_cache = {}
+    _input_metadata_index = None
 
+    @timed_stage()
     def _validate_output(self):
         """
         Evaluates the output files generated from SAS execution to ensure:
@@ -253,6 +290,31 @@ class DispS1PostProcessorMixin(PostProcessorMixin):
                     error_msg = f"Compressed CSLC file '{basename(file_name)}' exists, but is empty"
                     self.logger.critical(self.name, ErrorCode.INVALID_OUTPUT, error_msg)
 
+    def _input_polarization(self):
+        """
+        Returns the polarization of the input bursts, taken from the first
+        input CSLC product within the input metadata index to provide one.
+
+        The index is normally built by the pre-processor, but is built here
+        if it has not been already.
+
+        Raises
+        ------
+        RuntimeError
+            If no input CSLC product contains the polarization.
+
+        """
+        if self._input_metadata_index is None:
+            self._index_input_metadata()
+
+        for input_metadata in self._input_metadata_index.values():
+            if input_metadata and input_metadata.get('polarization'):
+                return input_metadata['polarization']
+
+        raise RuntimeError(
+            'No input CSLC file contains the expected polarization information.'
+        )
+
     def _core_filename(self, inter_filename=None):
         """
         Returns the core file name component for products produced by the
@@ -306,20 +368,7 @@ class DispS1PostProcessorMixin(PostProcessorMixin):
 
         # Polarization: polarization of the input bursts
         # derived from product metadata of the input CSLC files
-        cslc_file_list = self.runconfig.sas_config['input_file_group']['cslc_file_list']
-
-        # Search for a CSLC file containing the metadata we expect
-        for cslc_file in cslc_file_list:
-            try:
-                cslc_metadata = get_cslc_s1_product_metadata(abspath(cslc_file))
-                polarization = cslc_metadata["processing_information"]["input_burst_metadata"]["polarization"]
-                break
-            except Exception:
-                continue
-        else:
-            raise RuntimeError(
-                'No input CSLC file contains the expected polarization information.'
-            )
+        polarization = self._input_polarization()
 
         # ReferenceDateTime: The acquisition sensing start date and time of
         # the input satellite imagery for the first burst in the frame of the
@@ -467,20 +516,7 @@ class DispS1PostProcessorMixin(PostProcessorMixin):
 
         # Polarization: polarization of the input bursts
         # derived from product metadata of the input CSLC files
-        cslc_file_list = self.runconfig.sas_config['input_file_group']['cslc_file_list']
-
-        # Search for a CSLC file containing the metadata we expect
-        for cslc_file in cslc_file_list:
-            try:
-                cslc_metadata = get_cslc_s1_product_metadata(abspath(cslc_file))
-                polarization = cslc_metadata["processing_information"]["input_burst_metadata"]["polarization"]
-                break
-            except Exception:
-                continue
-        else:
-            raise RuntimeError(
-                'No input CSLC file contains the expected polarization information.'
-            )
+        polarization = self._input_polarization()
 
         # Product version hardcoded to 1.0 for now since CCSLCs are not
         # intended for widespread distribution
@@ -633,6 +669,7 @@ class DispS1PostProcessorMixin(PostProcessorMixin):
         """
         return self._ancillary_filename() + ".qa.log"
 
+    @timed_stage('collect_product_metadata')
     def _collect_disp_s1_product_metadata(self, disp_product):
         """
         Gathers the available metadata from a sample output DISP-S1 product for
@@ -729,6 +766,7 @@ class DispS1PostProcessorMixin(PostProcessorMixin):
 
         return custom_metadata
 
+    @timed_stage('iso_metadata')
     def _create_iso_metadata(self, inter_filename, disp_metadata):
         """
         Creates a rendered version of the ISO metadata template for DISP-S1
@@ -781,6 +819,7 @@ class DispS1PostProcessorMixin(PostProcessorMixin):
 
         return rendered_template
 
+    @timed_stage()
     def _stage_output_files(self):
         """
         Ensures that all output products produced by both the SAS and this PGE
@@ -824,17 +863,13 @@ class DispS1PostProcessorMixin(PostProcessorMixin):
 
         # Generate the ISO metadata for use with product submission to DAAC(s)
         # For CSLC-S1, each burst-based product gets its own ISO xml
-        for inter_filename, disp_metadata in self._product_metadata_cache.items():
-            iso_metadata = self._create_iso_metadata(inter_filename, disp_metadata)
-
-            iso_meta_filename = self._iso_metadata_filename(inter_filename)
-            iso_meta_filepath = join(self.runconfig.output_product_path, iso_meta_filename)
+        iso_metadata_renderers = {
+            self._iso_metadata_filename(inter_filename): partial(self._create_iso_metadata,
+                                                                 inter_filename, disp_metadata)
+            for inter_filename, disp_metadata in self._product_metadata_cache.items()
+        }
 
-            if iso_metadata:
-                self.logger.info(self.name, ErrorCode.RENDERING_ISO_METADATA,
-                                 f"Writing ISO Metadata to {iso_meta_filepath}")
-                with open(iso_meta_filepath, 'w', encoding='utf-8') as outfile:
-                    outfile.write(iso_metadata)
+        self._write_iso_metadata_files(iso_metadata_renderers)
 
         # Write the QA application log to disk with the appropriate filename,
         # if necessary
@@ -862,6 +897,7 @@ class DispS1PostProcessorMixin(PostProcessorMixin):
             # Log stream might be closed by this point so raise an Exception instead
             raise RuntimeError(msg)
 
+    @timed_stage('postprocessor')
     def run_postprocessor(self, **kwargs):
         """
         Executes the post-processing steps for the DISP-S1 PGE.
@@ -930,6 +966,7 @@ class DispS1StaticPreProcessorMixin(DispS1PreProcessorMixin):
 
     _pre_mixin_name = "DispS1PreProcessorMixin"
 
+    @timed_stage()
     def _validate_runconfig_needed_options(self):
         """
         The SAS schema for the DISP-S1 PGEs validates for both baseline and static workflows.
@@ -966,6 +1003,7 @@ class DispS1StaticPreProcessorMixin(DispS1PreProcessorMixin):
             msg = f'Unexpected options found in RunConfig: {extra_keys}'
             self.logger.critical(self.name, ErrorCode.RUN_CONFIG_VALIDATION_FAILED, msg)
 
+    @timed_stage('preprocessor')
     def run_preprocessor(self, **kwargs):
         """
         Executes the pre-processing steps for DISP-S1-STATIC PGE initialization.
@@ -1007,6 +1045,7 @@ class DispS1StaticPostProcessorMixin(DispS1PostProcessorMixin):
         'los_enu': 'line_of_sight_enu'
     }
 
+    @timed_stage()
     def _validate_output(self):
         """
         Evaluates the output files generated from SAS execution to ensure:
@@ -1223,6 +1262,7 @@ class DispS1StaticPostProcessorMixin(DispS1PostProcessorMixin):
 
         return custom_metadata
 
+    @timed_stage('collect_product_metadata')
     def _collect_disp_s1_static_product_metadata(self, disp_product):
         """
         Gathers the available metadata from a sample output DISP-S1-STATIC product for
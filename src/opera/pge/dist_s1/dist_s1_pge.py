@@ -10,7 +10,6 @@ Module defining the implementation for the Surface Disturbance (DIST) from Senti
 
 import os
 import re
-import shutil
 from datetime import datetime
 from itertools import chain
 from os.path import abspath, basename, isdir, isfile, join, splitext
@@ -20,7 +19,8 @@ from opera.util.error_codes import ErrorCode
 from opera.util.geo_utils import get_geographic_boundaries_from_mgrs_tile
 from opera.util.input_validation import check_input_list, validate_algorithm_parameters_config
 from opera.util.render_jinja2 import augment_measured_parameters, render_jinja2
-from opera.util.run_utils import get_checksum
+from opera.util.run_utils import copy_and_hash
+from opera.util.stage_timing import timed_stage
 from opera.util.tiff_utils import get_geotiff_metadata
 from opera.util.time import get_iso_time, get_time_for_filename
 
@@ -259,6 +259,7 @@ class DistS1PreProcessorMixin(PreProcessorMixin):
                 msg
             )
 
+    @timed_stage()
     def _validate_rtcs(self):
         """
         Performs the following validations on the input RTCs:
@@ -292,6 +293,7 @@ class DistS1PreProcessorMixin(PreProcessorMixin):
         self.__validate_no_duplicates(baseline_matches + current_matches)
         self.__validate_rtc_burst_parings(all_rtcs)
 
+    @timed_stage()
     def _validate_previous_product(self):
         """
         Run validations for previous product input.
@@ -364,6 +366,7 @@ class DistS1PreProcessorMixin(PreProcessorMixin):
                 msg
             )
 
+    @timed_stage('preprocessor')
     def run_preprocessor(self, **kwargs):
         """
         Executes the pre-processing steps for DIST-S1 PGE initialization.
@@ -430,9 +433,11 @@ class DistS1PostProcessorMixin(PostProcessorMixin):
                           "model_wts_path", "prior_dist_s1_product", "product_dst_dir", "src_water_mask_path",
                           "water_mask_path", "tqdm_enabled"]
 
+    @timed_stage()
     def _validate_outputs(self):
         output_product_path = abspath(self.runconfig.output_product_path)
         output_products = []
+        metadata_sources = {}
 
         for file in os.listdir(output_product_path):
             dir_path = join(output_product_path, file)
@@ -467,9 +472,8 @@ class DistS1PostProcessorMixin(PostProcessorMixin):
                         tile_id = match_dict['tile_id']
                         file_id = match_dict['id']
 
-                        if tile_id not in self._tile_metadata_cache:
-                            dist_metadata = self._collect_dist_s1_product_metadata(granule_path)
-                            self._tile_metadata_cache[tile_id] = dist_metadata
+                        if tile_id not in metadata_sources:
+                            metadata_sources[tile_id] = granule_path
 
                         if file_id not in self._tile_filename_cache:
                             self._tile_filename_cache[tile_id] = file_id
@@ -489,6 +493,9 @@ class DistS1PostProcessorMixin(PostProcessorMixin):
             error_msg = f'Incorrect number of output granules generated: {len(output_products)}'
             self.logger.critical(self.name, ErrorCode.INVALID_OUTPUT, error_msg)
 
+        self._prefetch_product_metadata(metadata_sources, self._collect_dist_s1_product_metadata,
+                                        self._tile_metadata_cache)
+
     def _ancillary_filename(self):
         """
         Helper method to derive the core component of the file names for the
@@ -617,6 +624,7 @@ class DistS1PostProcessorMixin(PostProcessorMixin):
 
         return iso_metadata_filename + ".iso.xml"
 
+    @timed_stage('collect_product_metadata')
     def _collect_dist_s1_product_metadata(self, geotiff_product):
         """
         Gathers the available metadata from an output DIST-S1 product for
@@ -730,6 +738,7 @@ class DistS1PostProcessorMixin(PostProcessorMixin):
 
         return custom_metadata
 
+    @timed_stage('iso_metadata')
     def _create_iso_metadata(self):
         """
         Creates a rendered version of the ISO metadata template for DIST-S1
@@ -789,6 +798,9 @@ class DistS1PostProcessorMixin(PostProcessorMixin):
         """
         Flattens the output directory since PCM expects all output files
         to be in the output root.
+
+        Files are checksummed as they are copied, so the copies do not need
+        to be read again when generating the catalog metadata.
         """
         output_product_path = abspath(self.runconfig.output_product_path)
         scratch_path = abspath(self.runconfig.scratch_path)
@@ -799,8 +811,9 @@ class DistS1PostProcessorMixin(PostProcessorMixin):
                 dst = os.path.join(output_product_path, basename(filename))
 
                 if scratch_path not in src and src != dst:
-                    shutil.copy(str(src), dst)
+                    copy_and_hash(str(src), dst)
 
+    @timed_stage('checksum')
     def _checksum_output_products(self):
         """
         Generates a dictionary mapping output product file names to the
@@ -828,13 +841,11 @@ class DistS1PostProcessorMixin(PostProcessorMixin):
         )
 
         # Generate checksums on the filtered product list
-        checksums = {
-            basename(output_product): get_checksum(output_product)
-            for output_product in filtered_output_products
-        }
+        checksums = self._checksum_files(filtered_output_products)
 
         return checksums
 
+    @timed_stage('postprocessor')
     def run_postprocessor(self, **kwargs):
         """
         Executes the post-processing steps for the DIST-S1 PGE.
@@ -26,6 +26,7 @@ from opera.util.error_codes import ErrorCode
 from opera.util.geo_utils import get_geographic_boundaries_from_mgrs_tile
 from opera.util.input_validation import validate_dswx_inputs
 from opera.util.render_jinja2 import augment_measured_parameters, render_jinja2
+from opera.util.stage_timing import timed_stage
 from opera.util.tiff_utils import get_geotiff_hls_dataset
 from opera.util.tiff_utils import get_geotiff_hls_sensor_product_id
 from opera.util.tiff_utils import get_geotiff_metadata
@@ -49,6 +50,7 @@ class DSWxHLSPreProcessorMixin(PreProcessorMixin):
 
     _pre_mixin_name = "DSWxHLSPreProcessorMixin"
 
+    @timed_stage()
     def _validate_ancillary_inputs(self):
         """
         Evaluates the list of ancillary inputs from the RunConfig to ensure they
@@ -92,6 +94,7 @@ class DSWxHLSPreProcessorMixin(PreProcessorMixin):
                 # actually file paths, so skip them
                 continue
 
+    @timed_stage()
     def _validate_expected_input_platforms(self):
         """
         Scans the input files to make sure that the data comes from expected
@@ -142,6 +145,7 @@ class DSWxHLSPreProcessorMixin(PreProcessorMixin):
                                      f"metadata PRODUCT_URI is {input_tif_metadata['PRODUCT_URI']}.")
                         self.logger.critical(self.name, ErrorCode.INVALID_INPUT, error_msg)
 
+    @timed_stage('preprocessor')
     def run_preprocessor(self, **kwargs):
         """
         Executes the pre-processing steps for DSWx-HLS PGE initialization.
@@ -180,6 +184,7 @@ class DSWxHLSPostProcessorMixin(PostProcessorMixin):
     _post_mixin_name = "DSWxHLSPostProcessorMixin"
     _cached_core_filename = None
 
+    @timed_stage()
     def _validate_output(self):
         """
         Evaluates the output file(s) generated from SAS execution to ensure
@@ -402,6 +407,7 @@ class DSWxHLSPostProcessorMixin(PostProcessorMixin):
 
         return f"{core_filename}_BROWSE{file_extension}"
 
+    @timed_stage('collect_product_metadata')
     def _collect_dswx_hls_product_metadata(self):
         """
         Gathers the available metadata from a sample output DSWx-HLS product for
@@ -531,6 +537,7 @@ class DSWxHLSPostProcessorMixin(PostProcessorMixin):
 
         return custom_metadata
 
+    @timed_stage('iso_metadata')
     def _create_iso_metadata(self):
         """
         Creates a rendered version of the ISO metadata template for DSWx-HLS
@@ -577,6 +584,7 @@ class DSWxHLSPostProcessorMixin(PostProcessorMixin):
 
         return rendered_template
 
+    @timed_stage('postprocessor')
     def run_postprocessor(self, **kwargs):
         """
         Executes the post-processing steps for DSWx-HLS PGE job completion.
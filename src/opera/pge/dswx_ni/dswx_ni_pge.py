@@ -11,6 +11,7 @@ from NISAR (NI) PGE.
 
 import re
 from datetime import datetime
+from functools import partial
 from os.path import basename, join
 
 from opera.pge.base.base_pge import PgeExecutor
@@ -18,6 +19,7 @@ from opera.pge.dswx_s1.dswx_s1_pge import DSWxS1PostProcessorMixin, DSWxS1PrePro
 from opera.util.error_codes import ErrorCode
 from opera.util.geo_utils import get_geographic_boundaries_from_mgrs_tile
 from opera.util.render_jinja2 import augment_measured_parameters
+from opera.util.stage_timing import timed_stage
 from opera.util.tiff_utils import get_geotiff_metadata
 from opera.util.time import get_time_for_filename
 
@@ -36,6 +38,7 @@ class DSWxNIPreProcessorMixin(DSWxS1PreProcessorMixin):
     _pre_mixin_name = "DSWxNIPreProcessorMixin"
     _valid_input_extensions = (".h5",)
 
+    @timed_stage('preprocessor')
     def run_preprocessor(self, **kwargs):
         """
         Executes the pre-processing steps for DSWx-NI PGE initialization.
@@ -77,6 +80,7 @@ class DSWxNIPostProcessorMixin(DSWxS1PostProcessorMixin):
         'BROWSE.tif',
     }
 
+    @timed_stage()
     def _validate_output_product_filenames(self):
         """
         This method validates output product file names assigned by the SAS
@@ -99,6 +103,8 @@ class DSWxNIPostProcessorMixin(DSWxS1PostProcessorMixin):
             r'(?P<band_name>WTR|BWTR|CONF|DIAG)|_BROWSE)?[.](?P<ext>tif|tiff|png)$'
         )
 
+        metadata_sources = {}
+
         for output_file in self.runconfig.get_output_product_filenames():
             match_result = pattern.match(basename(output_file))
             if not match_result:
@@ -109,14 +115,18 @@ class DSWxNIPostProcessorMixin(DSWxS1PostProcessorMixin):
                 tile_id = match_result.groupdict()['tile_id']
                 file_id = match_result.groupdict()['file_id']
 
-                if tile_id not in self._tile_metadata_cache:
-                    # Cache the metadata for this product for use when generating the ISO XML
-                    self._tile_metadata_cache[tile_id] = self._collect_dswx_ni_product_metadata(output_file)
+                if tile_id not in metadata_sources:
+                    metadata_sources[tile_id] = output_file
 
                 if tile_id not in self._tile_filename_cache:
                     # Cache the core filename for use when naming the ISO XML file
                     self._tile_filename_cache[tile_id] = file_id
 
+        # Cache the metadata for each tile for use when generating the ISO XML,
+        # reading the products of each tile concurrently
+        self._prefetch_product_metadata(metadata_sources, self._collect_dswx_ni_product_metadata,
+                                        self._tile_metadata_cache)
+
     def _ancillary_filename(self):
         """
         Helper method to derive the core component of the file names for the
@@ -168,6 +178,7 @@ class DSWxNIPostProcessorMixin(DSWxS1PostProcessorMixin):
 
         return ancillary_filename
 
+    @timed_stage('collect_product_metadata')
     def _collect_dswx_ni_product_metadata(self, geotiff_product):
         """
         Gathers the available metadata from an output DSWx-NI product for
@@ -270,6 +281,7 @@ class DSWxNIPostProcessorMixin(DSWxS1PostProcessorMixin):
 
         return custom_metadata
 
+    @timed_stage()
     def _stage_output_files(self):
         """
         Ensures that all output products produced by both the SAS and this PGE
@@ -304,17 +316,12 @@ class DSWxNIPostProcessorMixin(DSWxS1PostProcessorMixin):
 
         # Generate the ISO metadata for use with product submission to DAAC(s)
         # For DSWX-S1, each tile-set is assigned an ISO xml file
-        for tile_id in self._tile_metadata_cache.keys():
-            iso_metadata = self._create_iso_metadata(tile_id)
-
-            iso_meta_filename = self._iso_metadata_filename(tile_id)
-            iso_meta_filepath = join(self.runconfig.output_product_path, iso_meta_filename)
+        iso_metadata_renderers = {
+            self._iso_metadata_filename(tile_id): partial(self._create_iso_metadata, tile_id)
+            for tile_id in self._tile_metadata_cache.keys()
+        }
 
-            if iso_metadata:
-                self.logger.info(self.name, ErrorCode.RENDERING_ISO_METADATA,
-                                 f"Writing ISO Metadata to {iso_meta_filepath}")
-                with open(iso_meta_filepath, 'w', encoding='utf-8') as outfile:
-                    outfile.write(iso_metadata)
+        self._write_iso_metadata_files(iso_metadata_renderers)
 
         # Write the QA application log to disk with the appropriate filename,
         # if necessary
@@ -342,6 +349,7 @@ class DSWxNIPostProcessorMixin(DSWxS1PostProcessorMixin):
             # Log stream might be closed by this point so raise an Exception instead
             raise RuntimeError(msg)
 
+    @timed_stage('postprocessor')
     def run_postprocessor(self, **kwargs):
         """
         Executes the post-processing steps for the DSWx-NI PGE.
@@ -11,6 +11,7 @@ from Sentinel-1 A/B (S1) PGE.
 
 import re
 from datetime import datetime
+from functools import partial
 from os.path import abspath, basename, exists, getsize, join, splitext
 
 import opera.util.input_validation as input_validation
@@ -22,7 +23,7 @@ from opera.util.geo_utils import get_geographic_boundaries_from_mgrs_tile
 from opera.util.input_validation import validate_algorithm_parameters_config
 from opera.util.input_validation import validate_dswx_inputs
 from opera.util.render_jinja2 import augment_measured_parameters, render_jinja2
-from opera.util.run_utils import get_checksum
+from opera.util.stage_timing import timed_stage
 from opera.util.tiff_utils import get_geotiff_metadata
 from opera.util.time import get_time_for_filename
 
@@ -42,6 +43,7 @@ class DSWxS1PreProcessorMixin(PreProcessorMixin):
     _pre_mixin_name = "DSWxS1PreProcessorMixin"
     _valid_input_extensions = (".tif", ".h5")
 
+    @timed_stage()
     def _validate_dynamic_ancillary_inputs(self):
         """
         Evaluates the list of dynamic ancillary inputs from the RunConfig to
@@ -84,6 +86,7 @@ class DSWxS1PreProcessorMixin(PreProcessorMixin):
                     value, self.logger, self.name, valid_extensions=('.yaml', )
                 )
 
+    @timed_stage()
     def _validate_static_ancillary_inputs(self):
         """
         Evaluates the list of static ancillary inputs from the RunConfig to
@@ -103,6 +106,7 @@ class DSWxS1PreProcessorMixin(PreProcessorMixin):
                 # actually file paths, so skip them
                 continue
 
+    @timed_stage('preprocessor')
     def run_preprocessor(self, **kwargs):
         """
         Executes the pre-processing steps for DSWx-S1 PGE initialization.
@@ -168,6 +172,7 @@ class DSWxS1PostProcessorMixin(PostProcessorMixin):
     }
     _optional_bands = set()
 
+    @timed_stage()
     def _validate_output_product_filenames(self):
         """
         This method validates output product file names assigned by the SAS
@@ -185,6 +190,8 @@ class DSWxS1PostProcessorMixin(PostProcessorMixin):
         """
 
 
+        metadata_sources = {}
+
         for output_file in self.runconfig.get_output_product_filenames():
             match_result = self._file_pattern.match(basename(output_file))
             if not match_result:
@@ -195,16 +202,19 @@ class DSWxS1PostProcessorMixin(PostProcessorMixin):
                 tile_id = match_result.groupdict()['tile_id']
                 file_id = match_result.groupdict()['file_id']
 
-                if tile_id not in self._tile_metadata_cache:
-                    dswx_metadata = self._collect_dswx_s1_product_metadata(output_file)
-
-                    # Cache the metadata for this product for use when generating the ISO XML
-                    self._tile_metadata_cache[tile_id] = dswx_metadata
+                if tile_id not in metadata_sources:
+                    metadata_sources[tile_id] = output_file
 
                 if tile_id not in self._tile_filename_cache:
                     # Cache the core filename for use when naming the ISO XML file
                     self._tile_filename_cache[tile_id] = file_id
 
+        # Cache the metadata for each tile for use when generating the ISO XML,
+        # reading the products of each tile concurrently
+        self._prefetch_product_metadata(metadata_sources, self._collect_dswx_s1_product_metadata,
+                                        self._tile_metadata_cache)
+
+    @timed_stage()
     def _validate_output(self):
         """
         Evaluates the output file(s) generated from SAS execution to ensure:
@@ -267,6 +277,7 @@ class DSWxS1PostProcessorMixin(PostProcessorMixin):
 
             self.logger.critical(self.name, ErrorCode.INVALID_OUTPUT, error_msg)
 
+    @timed_stage('checksum')
     def _checksum_output_products(self):
         """
         Generates a dictionary mapping output product file names to the
@@ -294,10 +305,7 @@ class DSWxS1PostProcessorMixin(PostProcessorMixin):
         )
 
         # Generate checksums on the filtered product list
-        checksums = {
-            basename(output_product): get_checksum(output_product)
-            for output_product in filtered_output_products
-        }
+        checksums = self._checksum_files(filtered_output_products)
 
         return checksums
 
@@ -445,6 +453,7 @@ class DSWxS1PostProcessorMixin(PostProcessorMixin):
         """
         return self._ancillary_filename() + ".qa.log"
 
+    @timed_stage('collect_product_metadata')
     def _collect_dswx_s1_product_metadata(self, geotiff_product):
         """
         Gathers the available metadata from an output DSWx-S1 product for
@@ -541,6 +550,7 @@ class DSWxS1PostProcessorMixin(PostProcessorMixin):
 
         return custom_metadata
 
+    @timed_stage('iso_metadata')
     def _create_iso_metadata(self, tile_id):
         """
         Creates a rendered version of the ISO metadata template for DSWX-S1
@@ -599,6 +609,7 @@ class DSWxS1PostProcessorMixin(PostProcessorMixin):
 
         return rendered_template
 
+    @timed_stage()
     def _stage_output_files(self):
         """
         Ensures that all output products produced by both the SAS and this PGE
@@ -630,17 +641,12 @@ class DSWxS1PostProcessorMixin(PostProcessorMixin):
 
         # Generate the ISO metadata for use with product submission to DAAC(s)
         # For DSWX-S1, each tile-set is assigned an ISO xml file
-        for tile_id in self._tile_metadata_cache.keys():
-            iso_metadata = self._create_iso_metadata(tile_id)
-
-            iso_meta_filename = self._iso_metadata_filename(tile_id)
-            iso_meta_filepath = join(self.runconfig.output_product_path, iso_meta_filename)
+        iso_metadata_renderers = {
+            self._iso_metadata_filename(tile_id): partial(self._create_iso_metadata, tile_id)
+            for tile_id in self._tile_metadata_cache.keys()
+        }
 
-            if iso_metadata:
-                self.logger.info(self.name, ErrorCode.RENDERING_ISO_METADATA,
-                                 f"Writing ISO Metadata to {iso_meta_filepath}")
-                with open(iso_meta_filepath, 'w', encoding='utf-8') as outfile:
-                    outfile.write(iso_metadata)
+        self._write_iso_metadata_files(iso_metadata_renderers)
 
         # Write the QA application log to disk with the appropriate filename,
         # if necessary
@@ -668,6 +674,7 @@ class DSWxS1PostProcessorMixin(PostProcessorMixin):
             # Log stream might be closed by this point so raise an Exception instead
             raise RuntimeError(msg)
 
+    @timed_stage('postprocessor')
     def run_postprocessor(self, **kwargs):
         """
         Executes the post-processing steps for the DSWx-S1 PGE.
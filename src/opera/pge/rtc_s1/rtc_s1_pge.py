@@ -12,6 +12,7 @@ from Sentinel-1 A/B (S1) PGE.
 
 import os.path
 from datetime import datetime
+from functools import partial
 from os import walk
 from os.path import basename, getsize, join
 
@@ -24,7 +25,8 @@ from opera.util.error_codes import ErrorCode
 from opera.util.geo_utils import translate_utm_bbox_to_lat_lon
 from opera.util.h5_utils import get_rtc_s1_product_metadata
 from opera.util.input_validation import validate_slc_s1_inputs
-from opera.util.render_jinja2 import augment_hdf5_measured_parameters, render_jinja2
+from opera.util.render_jinja2 import augment_hdf5_measured_parameters, render_jinja2, render_jinja2_to_file
+from opera.util.stage_timing import timed_stage
 from opera.util.time import get_time_for_filename
 
 
@@ -42,6 +44,7 @@ class RtcS1PreProcessorMixin(PreProcessorMixin):
 
     _pre_mixin_name = "RtcS1PreProcessorMixin"
 
+    @timed_stage('preprocessor')
     def run_preprocessor(self, **kwargs):
         """
         Executes the pre-processing steps for RTC-S1 PGE initialization.
@@ -78,6 +81,7 @@ class RtcS1PostProcessorMixin(PostProcessorMixin):
     _burst_metadata_cache = {}
     _burst_filename_cache = {}
 
+    @timed_stage()
     def _validate_output(self):
         """
         Evaluates the output file(s) generated from SAS execution to ensure
@@ -256,20 +260,8 @@ class RtcS1PostProcessorMixin(PostProcessorMixin):
         if burst_id in self._burst_metadata_cache:
             product_metadata = self._burst_metadata_cache[burst_id]
         else:
-            metadata_product = None
-
-            # Locate the HDF5 product which contains the RTC metadata
-            for output_product in os.listdir(product_dir):
-                if output_product.endswith('.nc') or output_product.endswith('.h5'):
-                    metadata_product = output_product
-                    break
-            else:
-                msg = (f"Could not find a NetCDF format RTC product to extract "
-                       f"metadata from within {self.runconfig.output_product_path}")
-                self.logger.critical(self.name, ErrorCode.FILE_MOVE_FAILED, msg)
-
             product_metadata = self._collect_rtc_product_metadata(
-                os.path.join(product_dir, metadata_product)
+                self._find_metadata_product(product_dir)
             )
 
             self._burst_metadata_cache[burst_id] = product_metadata
@@ -331,6 +323,57 @@ class RtcS1PostProcessorMixin(PostProcessorMixin):
 
         return rtc_filename
 
+    def _find_metadata_product(self, product_dir):
+        """
+        Returns the path to the HDF5 product containing the RTC metadata
+        within the provided burst product directory.
+
+        Parameters
+        ----------
+        product_dir : str
+            Path to the output directory for a single burst.
+
+        Returns
+        -------
+        metadata_product : str
+            Path to the HDF5/NETCDF product to collect metadata from.
+
+        """
+        for output_product in os.listdir(product_dir):
+            if output_product.endswith('.nc') or output_product.endswith('.h5'):
+                return os.path.join(product_dir, output_product)
+
+        msg = (f"Could not find a NetCDF format RTC product to extract "
+               f"metadata from within {self.runconfig.output_product_path}")
+        self.logger.critical(self.name, ErrorCode.FILE_MOVE_FAILED, msg)
+
+        # critical() raises, so this is only reached should it be overridden not to
+        raise RuntimeError(msg)
+
+    def _prefetch_burst_metadata(self):
+        """
+        Collects the metadata for each burst product created by the SAS
+        concurrently, filling the burst metadata cache before the output
+        products are renamed.
+        """
+        output_dir = os.path.abspath(self.runconfig.output_product_path)
+        metadata_sources = {}
+
+        for output_product in self.runconfig.get_output_product_filenames():
+            product_dir = os.path.dirname(output_product)
+
+            # Each RTC product is stored in a directory named for the corresponding burst ID
+            if product_dir == output_dir:
+                continue
+
+            burst_id = os.path.basename(product_dir).upper().replace('_', '-')
+
+            if burst_id not in metadata_sources:
+                metadata_sources[burst_id] = self._find_metadata_product(product_dir)
+
+        self._prefetch_product_metadata(metadata_sources, self._collect_rtc_product_metadata,
+                                        self._burst_metadata_cache)
+
     def _static_layer_filename(self, inter_filename):
         """
         Returns the final file name for the static layer RTC product which
@@ -695,6 +738,7 @@ class RtcS1PostProcessorMixin(PostProcessorMixin):
         """
         return self._ancillary_filename() + ".qa.log"
 
+    @timed_stage('collect_product_metadata')
     def _collect_rtc_product_metadata(self, metadata_product):
         """
         Gathers the available metadata from an HDF5 product created by
@@ -789,7 +833,8 @@ class RtcS1PostProcessorMixin(PostProcessorMixin):
 
         return custom_metadata
 
-    def _create_iso_metadata(self, burst_metadata):
+    @timed_stage('iso_metadata')
+    def _create_iso_metadata(self, burst_metadata, output_filepath=None):
         """
         Creates a rendered version of the ISO metadata template for RTC-S1
         output products using metadata from the following locations:
@@ -804,12 +849,16 @@ class RtcS1PostProcessorMixin(PostProcessorMixin):
         burst_metadata : dict
             The product metadata corresponding to a specific burst product to
             be included as the "product_output" metadata in the rendered ISO xml.
+        output_filepath : str, optional
+            If provided, the ISO metadata is streamed directly to this file
+            rather than returned as a string.
 
         Returns
         -------
         rendered_template : str
             The ISO metadata template for RTC-S1 filled in with values from the
-            sourced metadata dictionaries.
+            sourced metadata dictionaries. If output_filepath was provided,
+            the path to the rendered file is returned instead.
 
         """
         # Use the base PGE implemenation to validate existence of the template
@@ -832,6 +881,15 @@ class RtcS1PostProcessorMixin(PostProcessorMixin):
 
         iso_template_path = os.path.abspath(self.runconfig.iso_template_path)
 
+        if output_filepath is not None:
+            return render_jinja2_to_file(
+                iso_template_path,
+                iso_metadata,
+                output_filepath,
+                logger=self.logger,
+                output_directory=self.runconfig.output_product_path
+            )
+
         rendered_template = render_jinja2(
             iso_template_path,
             iso_metadata,
@@ -841,6 +899,7 @@ class RtcS1PostProcessorMixin(PostProcessorMixin):
 
         return rendered_template
 
+    @timed_stage()
     def _stage_output_files(self):
         """
         Ensures that all output products produced by both the SAS and this PGE
@@ -883,17 +942,12 @@ class RtcS1PostProcessorMixin(PostProcessorMixin):
 
         # Generate the ISO metadata for use with product submission to DAAC(s)
         # For RTC-S1, each burst-based product gets its own ISO xml
-        for burst_id, burst_metadata in self._burst_metadata_cache.items():
-            iso_metadata = self._create_iso_metadata(burst_metadata)
-
-            iso_meta_filename = self._iso_metadata_filename(burst_id)
-            iso_meta_filepath = join(self.runconfig.output_product_path, iso_meta_filename)
+        iso_metadata_renderers = {
+            self._iso_metadata_filename(burst_id): partial(self._create_iso_metadata, burst_metadata)
+            for burst_id, burst_metadata in self._burst_metadata_cache.items()
+        }
 
-            if iso_metadata:
-                self.logger.info(self.name, ErrorCode.RENDERING_ISO_METADATA,
-                                 f"Writing ISO Metadata to {iso_meta_filepath}")
-                with open(iso_meta_filepath, 'w', encoding='utf-8') as outfile:
-                    outfile.write(iso_metadata)
+        self._write_iso_metadata_files(iso_metadata_renderers, stream_to_file=True)
 
         # Write the QA application log to disk with the appropriate filename,
         # if necessary
@@ -921,13 +975,15 @@ class RtcS1PostProcessorMixin(PostProcessorMixin):
             # Log stream might be closed by this point so raise an Exception instead
             raise RuntimeError(msg)
 
+    @timed_stage('postprocessor')
     def run_postprocessor(self, **kwargs):
         """
         Executes the post-processing steps for the RTC-S1 PGE.
 
         The RtcS1PostProcessorMixin version of this method performs the same
         steps as the base PostProcessorMixin, but inserts a step to perform
-        output product validation prior to staging and renaming of the output
+        output product validation, and another to collect the metadata of each
+        burst product concurrently, prior to staging and renaming of the output
         files.
 
         Parameters
@@ -940,6 +996,7 @@ class RtcS1PostProcessorMixin(PostProcessorMixin):
 
         self._run_sas_qa_executable()
         self._validate_output()
+        self._prefetch_burst_metadata()
         self._stage_output_files()
 
 
@@ -10,7 +10,7 @@ Module defining the implementation for the TROPO PGE.
 import re
 from datetime import datetime, timedelta
 from os import listdir
-from os.path import abspath, basename, getsize, join, splitext
+from os.path import abspath, getsize, join, splitext
 
 from opera.pge.base.base_pge import PgeExecutor
 from opera.pge.base.base_pge import PostProcessorMixin
@@ -19,7 +19,7 @@ from opera.util.error_codes import ErrorCode
 from opera.util.h5_utils import get_extent_from_coordinates, get_tropo_product_metadata
 from opera.util.input_validation import check_input
 from opera.util.render_jinja2 import augment_hdf5_measured_parameters, render_jinja2
-from opera.util.run_utils import get_checksum
+from opera.util.stage_timing import timed_stage
 
 
 class TROPOPreProcessorMixin(PreProcessorMixin):
@@ -35,6 +35,7 @@ class TROPOPreProcessorMixin(PreProcessorMixin):
 
     _pre_mixin_name = "TROPOPreProcessorMixin"
 
+    @timed_stage('preprocessor')
     def run_preprocessor(self, **kwargs):
         """
         Executes the pre-processing steps for TROPO PGE initialization.
@@ -74,6 +75,7 @@ class TROPOPostProcessorMixin(PostProcessorMixin):
 
     _expected_extensions = ('.nc', '.png')
 
+    @timed_stage()
     def _validate_outputs(self):
         """
         Confirms that there exists one and only of each expected output type.
@@ -124,6 +126,7 @@ class TROPOPostProcessorMixin(PostProcessorMixin):
                 # Cache the core filename for later use
                 self._cached_core_filename = match.group(0)
 
+    @timed_stage('checksum')
     def _checksum_output_products(self):
         """
         Generates a dictionary mapping output product file names to the
@@ -150,10 +153,7 @@ class TROPOPostProcessorMixin(PostProcessorMixin):
         )
 
         # Generate checksums on the filtered product list
-        checksums = {
-            basename(output_product): get_checksum(output_product)
-            for output_product in filtered_output_products
-        }
+        checksums = self._checksum_files(filtered_output_products)
 
         return checksums
 
@@ -204,6 +204,7 @@ class TROPOPostProcessorMixin(PostProcessorMixin):
         time_delta = timedelta(**{unit_map[unit]: value})
         return time_delta
 
+    @timed_stage('collect_product_metadata')
     def _collect_tropo_product_metadata(self, tropo_product):
         """
         Gathers the available metadata from a sample output TROPO product for
@@ -293,6 +294,7 @@ class TROPOPostProcessorMixin(PostProcessorMixin):
 
         return custom_metadata
 
+    @timed_stage('iso_metadata')
     def _create_iso_metadata(self, tropo_metadata, product_filename):
         """
         Creates a rendered version of the ISO metadata template for TROPO
@@ -377,6 +379,7 @@ class TROPOPostProcessorMixin(PostProcessorMixin):
         # set _cached_core_filename
         return self._cached_core_filename
 
+    @timed_stage()
     def _stage_output_files(self):
         """
         Ensures that all output products produced by both the SAS and this PGE
@@ -463,6 +466,7 @@ class TROPOPostProcessorMixin(PostProcessorMixin):
             # Log stream might be closed by this point so raise an Exception instead
             raise RuntimeError(msg)
 
+    @timed_stage('postprocessor')
     def run_postprocessor(self, **kwargs):
         """
         Executes the post-processing steps for the TROPO PGE.
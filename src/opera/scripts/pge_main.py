@@ -11,11 +11,21 @@ pge_main.py
 Instantiates and runs an OPERA Product Generation Executable (PGE) instance.
 The PGE type instantiated is determined from the provided RunConfig.
 
+Alternatively, a long-lived worker may be started which accepts RunConfig
+paths from a spool directory or a UNIX domain socket, and runs each as a
+separate job within the same (already warmed-up) interpreter.
+
 """
 
 import argparse
 import os
+import signal
+import socket
+import sys
+import threading
+from glob import glob
 from importlib import import_module
+from os.path import abspath, join
 
 from opera.pge.base.runconfig import RunConfig
 from opera.util.error_codes import ErrorCode
@@ -38,6 +48,18 @@ PGE_NAME_MAP = {
 }
 """Mapping of PGE names specified by a RunConfig to the PGE module and class type to instantiate"""
 
+JOB_FILE_EXTENSION = ".job"
+"""File extension for job requests submitted to a worker spool directory"""
+
+RUNNING_JOB_EXTENSION = ".running"
+"""Extension appended to a spooled job request once claimed by a worker"""
+
+DONE_JOB_EXTENSION = ".done"
+"""Extension appended to a spooled job request that completed successfully"""
+
+FAILED_JOB_EXTENSION = ".failed"
+"""Extension appended to a spooled job request that failed"""
+
 
 def get_pge_class(pge_name, logger):
     """
@@ -134,7 +156,7 @@ def load_run_config_file(logger, run_config_filename):
     return run_config
 
 
-def pge_start(run_config_filename):
+def pge_start(run_config_filename, job_name=None):
     """
     Opens a log file, loads the yaml run config file, then instantiates and runs
     the PGE.
@@ -143,6 +165,9 @@ def pge_start(run_config_filename):
     ----------
     run_config_filename : str
         Path and filename to run config yaml file.
+    job_name : str, optional
+        Description of the worker job request being run, if any, which is
+        recorded in the log.
 
     """
     logger = open_log_file()
@@ -151,6 +176,10 @@ def pge_start(run_config_filename):
     # location
     logger.move(f'/tmp/{default_log_file_name()}')
 
+    if job_name:
+        logger.info("pge_main", ErrorCode.RUN_CONFIG_FILENAME,
+                    f'Running {job_name} within PGE worker process {os.getpid()}')
+
     # Load the yaml run config file
     run_config = load_run_config_file(logger, run_config_filename)
 
@@ -159,18 +188,322 @@ def pge_start(run_config_filename):
 
     # Instantiate and run the pge.
     pge = pge_class(
-        pge_name=run_config.pge_name, runconfig_path=run_config_filename, logger=logger
+        pge_name=run_config.pge_name, runconfig_path=run_config_filename, logger=logger, runconfig=run_config
     )
 
     pge.run()
 
 
+def clear_job_state():
+    """
+    Clears any state cached by the OPERA modules loaded into the current
+    interpreter, so that nothing carries over from one job to the next when
+    multiple PGE jobs are run by a single worker process.
+
+    This includes functions (and methods) memoized via functools.lru_cache,
+    as well as any class-level dictionaries used as caches by the PGE mixins
+    (attributes with names ending in "_cache").
+
+    """
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not (module_name == 'opera' or module_name.startswith('opera.')):
+            continue
+
+        # Caches are identified by the type of each member, since checking
+        # the member itself would load any dependencies deferred by a proxy
+        for member in list(vars(module).values()):
+            if hasattr(type(member), 'cache_clear'):
+                member.cache_clear()
+            elif isinstance(member, type) and member.__module__ == module_name:
+                for attr_name, attr_value in vars(member).items():
+                    if hasattr(type(attr_value), 'cache_clear'):
+                        attr_value.cache_clear()
+                    elif attr_name.endswith('_cache') and isinstance(attr_value, dict):
+                        attr_value.clear()
+
+
+def parse_job_request(job_request):
+    """
+    Parses a job request submitted to a PGE worker.
+
+    A job request consists of the path to the RunConfig to execute on the
+    first line, optionally followed by the working directory to run the job
+    from on the second line. Relative RunConfig paths are resolved against
+    the job working directory.
+
+    Parameters
+    ----------
+    job_request : str
+        The text of the job request.
+
+    Returns
+    -------
+    run_config_filename : str
+        The absolute path to the RunConfig to execute.
+    working_dir : str or None
+        The working directory to execute the job from, if one was provided.
+
+    Raises
+    ------
+    ValueError
+        If the job request does not specify a RunConfig path.
+
+    """
+    lines = [line.strip() for line in job_request.strip().splitlines() if line.strip()]
+
+    if not lines:
+        raise ValueError("Job request does not specify a RunConfig path")
+
+    working_dir = abspath(lines[1]) if len(lines) > 1 else None
+    run_config_filename = join(working_dir or os.getcwd(), lines[0])
+
+    return abspath(run_config_filename), working_dir
+
+
+def run_job(run_config_filename, working_dir=None, job_name=None):
+    """
+    Runs a single PGE job on behalf of a worker, isolating it from any other
+    job run within the same process.
+
+    The current working directory is restored, and all cached job state is
+    cleared, once the job has finished regardless of whether it succeeded.
+
+    Parameters
+    ----------
+    run_config_filename : str
+        Path to the RunConfig for the job.
+    working_dir : str, optional
+        The working directory to execute the job from. Defaults to the
+        current working directory of the worker.
+    job_name : str, optional
+        Description of the job request, which is recorded in the job's log.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the RunConfig for the job does not exist.
+
+    """
+    starting_dir = os.getcwd()
+
+    try:
+        if working_dir:
+            os.chdir(working_dir)
+
+        if not os.path.exists(run_config_filename):
+            raise FileNotFoundError(f"Could not find config file: {run_config_filename}")
+
+        pge_start(run_config_filename, job_name)
+    finally:
+        os.chdir(starting_dir)
+        clear_job_state()
+
+
+def _claim_spooled_jobs(spool_dir):
+    """
+    Claims the job requests currently waiting within the provided spool
+    directory, in lexicographic order of their file names.
+
+    A request is claimed by renaming it with the "running" extension, so that
+    multiple workers may safely share a single spool directory.
+
+    Parameters
+    ----------
+    spool_dir : str
+        Path to the spool directory to claim job requests from.
+
+    Yields
+    ------
+    claimed_job_file : str
+        Path to a claimed job request file.
+
+    """
+    for job_file in sorted(glob(join(spool_dir, f'*{JOB_FILE_EXTENSION}'))):
+        claimed_job_file = job_file + RUNNING_JOB_EXTENSION
+
+        try:
+            os.rename(job_file, claimed_job_file)
+        except OSError:
+            # Claimed by another worker in the meantime
+            continue
+
+        yield claimed_job_file
+
+
+def _run_spooled_job(claimed_job_file):
+    """
+    Runs a job request claimed from a spool directory, then renames the
+    request with an extension reflecting the outcome of the job. For failed
+    jobs, the reason for failure is appended to the request file.
+
+    Parameters
+    ----------
+    claimed_job_file : str
+        Path to the claimed job request file.
+
+    Returns
+    -------
+    success : bool
+        True if the job completed successfully, False otherwise.
+
+    """
+    job_file = claimed_job_file[:-len(RUNNING_JOB_EXTENSION)]
+
+    try:
+        with open(claimed_job_file, 'r', encoding='utf-8') as infile:
+            run_config_filename, working_dir = parse_job_request(infile.read())
+
+        run_job(run_config_filename, working_dir, job_name=f'spooled job {job_file}')
+    except Exception as err:  # pylint: disable=broad-except
+        with open(claimed_job_file, 'a', encoding='utf-8') as outfile:
+            outfile.write(f'\n# Job failed, reason: {str(err)}\n')
+
+        os.rename(claimed_job_file, job_file + FAILED_JOB_EXTENSION)
+        return False
+
+    os.rename(claimed_job_file, job_file + DONE_JOB_EXTENSION)
+    return True
+
+
+def _run_socket_job(connection):
+    """
+    Reads a job request from an accepted socket connection, runs it, then
+    replies with the outcome of the job. The reply is "OK" on success,
+    otherwise "FAILED" followed by the reason for failure.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        The accepted connection to the requesting client. The client is
+        expected to shut down its end of the connection for writing once the
+        full job request has been sent.
+
+    Returns
+    -------
+    success : bool
+        True if the job completed successfully, False otherwise.
+
+    """
+    chunks = []
+
+    while chunk := connection.recv(4096):
+        chunks.append(chunk)
+
+    try:
+        run_config_filename, working_dir = parse_job_request(b''.join(chunks).decode('utf-8'))
+
+        run_job(run_config_filename, working_dir, job_name='socket job')
+    except Exception as err:  # pylint: disable=broad-except
+        connection.sendall(f'FAILED: {str(err)}\n'.encode('utf-8'))
+        return False
+
+    connection.sendall(b'OK\n')
+    return True
+
+
+def pge_worker(spool_dir=None, socket_path=None, poll_interval=1.0, max_jobs=None, stop_event=None):
+    """
+    Runs a long-lived PGE worker, which accepts job requests from either a
+    spool directory or a UNIX domain socket, and runs each requested job via
+    pge_start() within the current interpreter. This avoids paying for
+    interpreter start up and the import of the PGE dependencies for each job.
+
+    Jobs are run one at a time. Each job gets its own logger, and the working
+    directory and any cached state are reset between jobs (see run_job()).
+
+    Parameters
+    ----------
+    spool_dir : str, optional
+        Path to a spool directory to poll for job request files, which must
+        have the ".job" extension. Mutually exclusive with socket_path.
+    socket_path : str, optional
+        Path to bind a UNIX domain socket to for receiving job requests.
+        Mutually exclusive with spool_dir.
+    poll_interval : float, optional
+        Time in seconds to wait between polls of the spool directory (or
+        between checks of the stop event while waiting on the socket).
+    max_jobs : int, optional
+        Maximum number of jobs to run before returning. If not provided, the
+        worker runs until the stop event is set.
+    stop_event : threading.Event, optional
+        Event used to signal the worker to stop once the current job (if any)
+        has finished.
+
+    Returns
+    -------
+    num_jobs : int
+        The number of jobs run by the worker, whether successful or not.
+
+    Raises
+    ------
+    ValueError
+        If not exactly one of spool_dir and socket_path is provided.
+
+    """
+    if bool(spool_dir) == bool(socket_path):
+        raise ValueError("Exactly one of spool_dir or socket_path must be provided")
+
+    if stop_event is None:
+        stop_event = threading.Event()
+
+    num_jobs = 0
+
+    def _done():
+        return stop_event.is_set() or (max_jobs is not None and num_jobs >= max_jobs)
+
+    if spool_dir:
+        spool_dir = abspath(spool_dir)
+        os.makedirs(spool_dir, exist_ok=True)
+
+        while not _done():
+            idle = True
+
+            for claimed_job_file in _claim_spooled_jobs(spool_dir):
+                _run_spooled_job(claimed_job_file)
+                num_jobs += 1
+                idle = False
+
+                if _done():
+                    break
+
+            if idle:
+                stop_event.wait(poll_interval)
+    else:
+        socket_path = abspath(socket_path)
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(socket_path)
+            server.listen()
+            server.settimeout(poll_interval)
+
+            try:
+                while not _done():
+                    try:
+                        connection, _ = server.accept()
+                    except socket.timeout:
+                        continue
+
+                    with connection:
+                        connection.settimeout(None)
+                        _run_socket_job(connection)
+                        num_jobs += 1
+            finally:
+                os.remove(socket_path)
+
+    return num_jobs
+
+
 def pge_main():
     """
     The main entry point for OPERA PGEs.
 
     Reads the PGEName from the specified run config file to determine the
-    specific PGE, then runs that specific PGE.
+    specific PGE, then runs that specific PGE. If a spool directory or socket
+    is specified instead of a run config file, a worker is started that runs
+    PGE jobs as they are requested, until terminated.
 
     """
     parser = argparse.ArgumentParser(
@@ -178,11 +511,36 @@ def pge_main():
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
-    parser.add_argument('-f', '--file', required=True, type=str,
-                        help='Path to the run configuration yaml file.')
+    mode_group = parser.add_mutually_exclusive_group(required=True)
+
+    mode_group.add_argument('-f', '--file', type=str,
+                            help='Path to the run configuration yaml file.')
+    mode_group.add_argument('--spool-dir', type=str,
+                            help='Run as a worker, executing the job requests (*.job files '
+                                 'containing a RunConfig path) placed in this directory.')
+    mode_group.add_argument('--socket', type=str,
+                            help='Run as a worker, executing the job requests (RunConfig paths) '
+                                 'received on a UNIX domain socket bound to this path.')
+
+    parser.add_argument('--poll-interval', type=float, default=1.0,
+                        help='Worker polling interval in seconds (default: %(default)s).')
+    parser.add_argument('--max-jobs', type=int, default=None,
+                        help='Number of jobs after which a worker exits (default: unlimited).')
 
     args = parser.parse_args()
 
+    if not args.file:
+        stop_event = threading.Event()
+
+        # Finish the job in progress before stopping
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signal_number, lambda *_: stop_event.set())
+
+        pge_worker(spool_dir=args.spool_dir, socket_path=args.socket,
+                   poll_interval=args.poll_interval, max_jobs=args.max_jobs,
+                   stop_event=stop_event)
+        return
+
     run_config_filename = os.path.abspath(args.file)
 
     if not os.path.exists(run_config_filename):
@@ -18,6 +18,9 @@ from typing import Union, ContextManager
 Package = Union[types.ModuleType, str]
 Resource = Union[str, os.PathLike]
 
+BENCHMARKS_ENV_VAR = "OPERA_PGE_RUN_BENCHMARKS"
+"""Environment variable which must be set to run the (wall-clock) benchmark tests"""
+
 
 def normalize_path(path):
     """Normalize a path by ensuring it is a string.
@@ -10,11 +10,15 @@ Unit tests for the pge/base_pge.py module.
 import json
 import os
 import re
+import shutil
 import tempfile
+import threading
 import unittest
+from functools import partial
 from io import StringIO
-from os.path import abspath, exists, join
+from os.path import abspath, basename, exists, join, splitext
 from pathlib import Path
+from sys import platform
 from unittest.mock import patch
 
 from opera.test import path
@@ -24,6 +28,12 @@ import yaml
 import opera
 from opera.pge import PgeExecutor, RunConfig
 from opera.util import PgeLogger
+from opera.util.checksum_cache import ChecksumCache
+from opera.util.error_codes import ErrorCode
+from opera.util.logger import DeferredCriticalError
+from opera.util.logger import SpooledLogStream
+from opera.util.run_utils import ISO_RENDER_WORKERS_ENV_VAR
+from opera.util.run_utils import METADATA_WORKERS_ENV_VAR
 
 
 class BasePgeTestCase(unittest.TestCase):
@@ -119,6 +129,73 @@ class BasePgeTestCase(unittest.TestCase):
         # Make sure the run time metric was captured as well
         self.assertIn('sas.elapsed_seconds:', log_contents)
 
+        # Make sure the timings of each stage of the PGE were captured
+        for stage_path in ('preprocessor', 'preprocessor.validate_runconfig', 'sas',
+                           'postprocessor.stage_output_files.catalog_metadata.checksum'):
+            self.assertIn(f'stage.{stage_path}.elapsed_seconds:', log_contents)
+            self.assertIn(f'stage.{stage_path}.cpu_seconds:', log_contents)
+
+        expected_stage_timing_file = join(pge.runconfig.scratch_path, 'pge_stage_timing.json')
+        self.assertTrue(os.path.exists(expected_stage_timing_file))
+
+        with open(expected_stage_timing_file, 'r', encoding='utf-8') as infile:
+            stage_timings = {stage['stage']: stage for stage in json.load(infile)['stages']}
+
+        self.assertFalse(stage_timings['preprocessor']['in_progress'])
+        self.assertTrue(stage_timings['postprocessor']['in_progress'])
+        self.assertEqual(stage_timings['postprocessor.stage_output_files.stage_file']['count'], 1)
+
+    def test_base_pge_execution_w_spilled_log(self):
+        """
+        Test execution of the base PGE with its log spilled to disk within the
+        output directory, before the output products are staged.
+        """
+        runconfig_path = join(self.data_dir, 'test_base_pge_config.yaml')
+
+        pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=runconfig_path)
+
+        run_sas_executable = PgeExecutor.run_sas_executable
+        spill = SpooledLogStream._spill
+        spill_filenames = []
+
+        def run_sas_executable_w_spill(pge_self, **kwargs):
+            # The log has been moved to the output directory by the time the
+            # SAS is run, so imposing a tiny memory limit here spills it there
+            pge_self.logger.get_stream_object().max_memory_size = 1
+
+            return run_sas_executable(pge_self, **kwargs)
+
+        def spill_and_record(stream_self):
+            spill(stream_self)
+            spill_filenames.append(stream_self.spill_filename)
+
+        with patch.object(PgeExecutor, 'run_sas_executable', run_sas_executable_w_spill), \
+             patch.object(SpooledLogStream, '_spill', spill_and_record):
+            pge.run()
+
+        self.assertEqual(len(spill_filenames), 1)
+        self.assertEqual(os.path.dirname(spill_filenames[0]), abspath(pge.runconfig.output_product_path))
+
+        # The scratch file holding the spilled log should have been moved into place
+        output_files = os.listdir(pge.runconfig.output_product_path)
+
+        self.assertIn(basename(pge.logger.get_file_name()), output_files)
+        self.assertFalse(any(output_file.endswith('.partial') for output_file in output_files))
+
+        with open(pge.logger.get_file_name(), 'r', encoding='utf-8') as infile:
+            log_contents = infile.read()
+
+        self.assertIn('hello world', log_contents)
+        self.assertIn('overall.elapsed_seconds', log_contents)
+
+        expected_stage_timing_file = join(pge.runconfig.scratch_path, 'pge_stage_timing.json')
+
+        with open(expected_stage_timing_file, 'r', encoding='utf-8') as infile:
+            stage_timings = {stage['stage']: stage for stage in json.load(infile)['stages']}
+
+        # Only the output of the SAS should have been staged, not the scratch file
+        self.assertEqual(stage_timings['postprocessor.stage_output_files.stage_file']['count'], 1)
+
     def test_base_pge_w_invalid_runconfig(self):
         """
         Test execution of the PgeExecutor using a RunConfig that will fail
@@ -466,6 +543,531 @@ class BasePgeTestCase(unittest.TestCase):
             if exists(test_runconfig_path):
                 os.unlink(test_runconfig_path)
 
+    def test_checksum_cache(self):
+        """Test use of the persistent checksum cache when enabled by the RunConfig"""
+        runconfig_path = join(self.data_dir, 'test_base_pge_config.yaml')
+        test_runconfig_path = join(self.data_dir, 'checksum_cache_base_pge_config.yaml')
+
+        with open(runconfig_path, 'r', encoding='utf-8') as infile:
+            runconfig_dict = yaml.safe_load(infile)
+
+        runconfig_dict['RunConfig']['Groups']['PGE']['RuntimeGroup'] = {
+            'ChecksumWorkers': 2,
+            'ChecksumCacheEnabled': True
+        }
+
+        with open(test_runconfig_path, 'w', encoding='utf-8') as outfile:
+            yaml.safe_dump(runconfig_dict, outfile, sort_keys=False)
+
+        try:
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run()
+
+            expected_cache_file = join(pge.runconfig.scratch_path, 'checksum_cache.sqlite')
+            self.assertTrue(os.path.exists(expected_cache_file))
+
+            # The checksum of the renamed output product should have been cached
+            output_product = join(pge.runconfig.output_product_path, list(pge.renamed_files.values())[0])
+
+            with ChecksumCache(expected_cache_file) as checksum_cache:
+                self.assertEqual(checksum_cache.lookup(output_product),
+                                 pge._create_catalog_metadata().asdict()['Output_Product_Checksums'][
+                                     basename(output_product)])
+        finally:
+            if exists(test_runconfig_path):
+                os.unlink(test_runconfig_path)
+
+    def test_prefetch_product_metadata(self):
+        """Test concurrent collection of product metadata into a metadata cache"""
+        runconfig_path = join(self.data_dir, 'test_base_pge_config.yaml')
+
+        pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=runconfig_path)
+        pge.run_preprocessor()
+
+        thread_names = set()
+
+        def collect_metadata(metadata_product):
+            thread_names.add(threading.current_thread().name)
+            return {'product': metadata_product}
+
+        # Entries already cached should not be collected again, and the cache
+        # should be filled in the order of the provided sources
+        metadata_cache = {'T2': {'product': 'cached'}}
+        metadata_sources = {'T3': 'tile3.tif', 'T2': 'tile2.tif', 'T1': 'tile1.tif'}
+
+        with patch.dict(os.environ, {METADATA_WORKERS_ENV_VAR: '2'}):
+            pge._prefetch_product_metadata(metadata_sources, collect_metadata, metadata_cache)
+
+        self.assertListEqual(list(metadata_cache.keys()), ['T2', 'T3', 'T1'])
+        self.assertDictEqual(metadata_cache['T2'], {'product': 'cached'})
+        self.assertDictEqual(metadata_cache['T3'], {'product': 'tile3.tif'})
+        self.assertDictEqual(metadata_cache['T1'], {'product': 'tile1.tif'})
+        self.assertTrue(all(thread_name.startswith('metadata') for thread_name in thread_names))
+
+        # Failures within a worker should be raised to the caller
+        def fail_to_collect_metadata(metadata_product):
+            raise RuntimeError(f'Failed to extract metadata from {metadata_product}')
+
+        with self.assertRaises(RuntimeError):
+            pge._prefetch_product_metadata({'T4': 'tile4.tif'}, fail_to_collect_metadata, metadata_cache)
+
+        self.assertNotIn('T4', metadata_cache)
+
+        # Critical errors within workers should be logged once, by the calling thread
+        def critically_fail_to_collect_metadata(metadata_product):
+            pge.logger.critical(pge.name, ErrorCode.ISO_METADATA_COULD_NOT_EXTRACT_METADATA,
+                                f'Failed to extract metadata from {metadata_product}')
+
+        metadata_sources = {f'T{index}': f'tile{index}.tif' for index in range(5, 9)}
+
+        with patch.dict(os.environ, {METADATA_WORKERS_ENV_VAR: '2'}):
+            with self.assertRaises(RuntimeError) as context:
+                pge._prefetch_product_metadata(metadata_sources, critically_fail_to_collect_metadata,
+                                               metadata_cache)
+
+        self.assertNotIsInstance(context.exception, DeferredCriticalError)
+        self.assertEqual(str(context.exception), 'Failed to extract metadata from tile5.tif')
+
+        with open(pge.logger.get_file_name(), 'r', encoding='utf-8') as infile:
+            log_contents = infile.read()
+
+        self.assertEqual(log_contents.count('Failed to extract metadata from'), 1)
+        self.assertIn('Critical', log_contents)
+
+    def test_provided_runconfig(self):
+        """Test that a RunConfig already parsed from the same file is used without parsing it again"""
+        runconfig_path = join(self.data_dir, 'test_base_pge_config.yaml')
+
+        runconfig = RunConfig(runconfig_path)
+
+        pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=runconfig_path, runconfig=runconfig)
+
+        with patch.object(RunConfig, '_load_yaml_file', side_effect=AssertionError('RunConfig parsed again')):
+            pge.run_preprocessor()
+
+        self.assertIs(pge.runconfig, runconfig)
+
+    def test_write_iso_metadata_files(self):
+        """Test concurrent rendering of ISO metadata, when requested, with files written in the order provided"""
+        runconfig_path = join(self.data_dir, 'test_base_pge_config.yaml')
+
+        pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=runconfig_path)
+        pge.run_preprocessor()
+
+        os.makedirs(pge.runconfig.output_product_path, exist_ok=True)
+
+        render_events = {tile_id: threading.Event() for tile_id in ('T1', 'T2')}
+
+        def render_iso_metadata(tile_id):
+            # The first tile only completes rendering once the second has
+            # started, which requires both to be rendered concurrently
+            if tile_id == 'T1':
+                render_events['T2'].wait(timeout=10)
+
+            render_events[tile_id].set()
+
+            return f'<iso tile="{tile_id}"/>'
+
+        iso_metadata_renderers = {
+            f'{tile_id}.iso.xml': lambda tile_id=tile_id: render_iso_metadata(tile_id)
+            for tile_id in ('T1', 'T2')
+        }
+
+        with patch.dict(os.environ, {ISO_RENDER_WORKERS_ENV_VAR: '2'}):
+            pge._write_iso_metadata_files(iso_metadata_renderers)
+
+        self.assertTrue(all(render_event.is_set() for render_event in render_events.values()))
+
+        for tile_id in ('T1', 'T2'):
+            with open(join(pge.runconfig.output_product_path, f'{tile_id}.iso.xml'), 'r', encoding='utf-8') as infile:
+                self.assertEqual(infile.read(), f'<iso tile="{tile_id}"/>')
+
+        # A single, aggregate render time should be logged, regardless of the number of products
+        self.assertListEqual([name for name in pge.logger.metrics if name.startswith('iso_metadata.')],
+                             ['iso_metadata.render_seconds'])
+
+        log_contents = pge.logger.get_stream_object().getvalue()
+
+        self.assertLess(
+            log_contents.index(f"Writing ISO Metadata to {join(pge.runconfig.output_product_path, 'T1.iso.xml')}"),
+            log_contents.index(f"Writing ISO Metadata to {join(pge.runconfig.output_product_path, 'T2.iso.xml')}")
+        )
+
+        # The render time of each product should also be logged, in product order
+        self.assertLess(log_contents.index('Rendered ISO Metadata for T1.iso.xml in'),
+                        log_contents.index('Rendered ISO Metadata for T2.iso.xml in'))
+
+    def test_write_iso_metadata_files_streamed(self):
+        """Test rendering of ISO metadata directly to the output file for each product"""
+        runconfig_path = join(self.data_dir, 'test_base_pge_config.yaml')
+
+        pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=runconfig_path)
+        pge.run_preprocessor()
+
+        os.makedirs(pge.runconfig.output_product_path, exist_ok=True)
+
+        def render_iso_metadata_to_file(tile_id, output_filepath):
+            with open(output_filepath, 'w', encoding='utf-8') as outfile:
+                outfile.write(f'<iso tile="{tile_id}"/>')
+
+            return output_filepath
+
+        iso_metadata_renderers = {
+            f'{tile_id}.iso.xml': partial(render_iso_metadata_to_file, tile_id)
+            for tile_id in ('T1', 'T2')
+        }
+
+        pge._write_iso_metadata_files(iso_metadata_renderers, stream_to_file=True)
+
+        log_contents = pge.logger.get_stream_object().getvalue()
+
+        for tile_id in ('T1', 'T2'):
+            iso_meta_filepath = join(pge.runconfig.output_product_path, f'{tile_id}.iso.xml')
+
+            with open(iso_meta_filepath, 'r', encoding='utf-8') as infile:
+                self.assertEqual(infile.read(), f'<iso tile="{tile_id}"/>')
+
+            self.assertIn(f"Writing ISO Metadata to {iso_meta_filepath}", log_contents)
+            self.assertIn(f'Rendered ISO Metadata for {tile_id}.iso.xml in', log_contents)
+
+        self.assertIn('iso_metadata.render_seconds', pge.logger.metrics)
+
+    def test_resource_sampling(self):
+        """Test sampling of SAS resource usage when enabled by the RunConfig"""
+        runconfig_path = join(self.data_dir, 'test_base_pge_config.yaml')
+        test_runconfig_path = join(self.data_dir, 'resource_sampling_base_pge_config.yaml')
+
+        with open(runconfig_path, 'r', encoding='utf-8') as infile:
+            runconfig_dict = yaml.safe_load(infile)
+
+        # Use a SAS executable that runs long enough to be sampled several times
+        primary_executable_group = runconfig_dict['RunConfig']['Groups']['PGE']['PrimaryExecutable']
+        primary_executable_group['ProgramPath'] = 'python3'
+        primary_executable_group['ProgramOptions'] = ['-c', '"import time; time.sleep(0.5)"']
+
+        runconfig_dict['RunConfig']['Groups']['PGE']['RuntimeGroup'] = {
+            'ResourceSamplingEnabled': True,
+            'ResourceSamplingInterval': 0.05
+        }
+
+        with open(test_runconfig_path, 'w', encoding='utf-8') as outfile:
+            yaml.safe_dump(runconfig_dict, outfile, sort_keys=False)
+
+        try:
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run_preprocessor()
+            pge.run_sas_executable()
+
+            log_contents = pge.logger.get_stream_object().getvalue()
+
+            self.assertIn('sas.resources.num_samples', log_contents)
+
+            expected_resource_file = join(pge.runconfig.scratch_path, 'sas_resource_usage.json')
+            self.assertTrue(os.path.exists(expected_resource_file))
+
+            with open(expected_resource_file, 'r', encoding='utf-8') as infile:
+                resource_usage = json.load(infile)
+
+            self.assertEqual(resource_usage['interval_seconds'], 0.05)
+            self.assertEqual(resource_usage['summary']['num_samples'], len(resource_usage['samples']))
+
+            if platform == "linux":
+                self.assertGreater(len(resource_usage['samples']), 0)
+                self.assertIn('rss_kb.peak', resource_usage['summary'])
+                self.assertIn('sas.resources.rss_kb.peak', log_contents)
+        finally:
+            if exists(test_runconfig_path):
+                os.unlink(test_runconfig_path)
+
+    def test_metrics_export(self):
+        """Test export of PGE metrics when enabled by the RunConfig"""
+        runconfig_path = join(self.data_dir, 'test_base_pge_config.yaml')
+        test_runconfig_path = join(self.data_dir, 'metrics_export_base_pge_config.yaml')
+
+        with open(runconfig_path, 'r', encoding='utf-8') as infile:
+            runconfig_dict = yaml.safe_load(infile)
+
+        runconfig_dict['RunConfig']['Groups']['PGE']['RuntimeGroup'] = {
+            'MetricsExportFormats': ['openmetrics', 'json']
+        }
+
+        with open(test_runconfig_path, 'w', encoding='utf-8') as outfile:
+            yaml.safe_dump(runconfig_dict, outfile, sort_keys=False)
+
+        try:
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run()
+
+            log_basename = splitext(pge.logger.get_file_name())[0]
+
+            self.assertTrue(os.path.exists(f'{log_basename}.prom'))
+            self.assertTrue(os.path.exists(f'{log_basename}.metrics.json'))
+
+            with open(f'{log_basename}.prom', 'r', encoding='utf-8') as infile:
+                openmetrics_text = infile.read()
+
+            labels = f'pge_name="BASE_PGE",pge_version="{opera.__version__}",product_type="EXAMPLE"'
+
+            self.assertIn(f'opera_pge_sas_elapsed_seconds{{{labels}}}', openmetrics_text)
+            self.assertIn(f'opera_pge_stage_elapsed_seconds{{{labels},stage="preprocessor"}}', openmetrics_text)
+            self.assertIn(f'opera_pge_log_messages{{{labels},severity="critical"}} 0', openmetrics_text)
+        finally:
+            if exists(test_runconfig_path):
+                os.unlink(test_runconfig_path)
+
+    def test_sas_environment(self):
+        """Test configuration of the SAS environment from the RunConfig"""
+        runconfig_path = join(self.data_dir, 'test_base_pge_config.yaml')
+        test_runconfig_path = join(self.data_dir, 'sas_environment_base_pge_config.yaml')
+
+        with open(runconfig_path, 'r', encoding='utf-8') as infile:
+            runconfig_dict = yaml.safe_load(infile)
+
+        # Use a SAS executable that reports the environment it was run with
+        primary_executable_group = runconfig_dict['RunConfig']['Groups']['PGE']['PrimaryExecutable']
+        primary_executable_group['ProgramPath'] = 'python3'
+        primary_executable_group['ProgramOptions'] = [
+            '-c', '"import os; print(\'SAS threads:\', os.environ[\'OMP_NUM_THREADS\'], os.environ[\'GDAL_CACHEMAX\'])"'
+        ]
+
+        runconfig_dict['RunConfig']['Groups']['PGE']['RuntimeGroup'] = {
+            'SasNumThreads': 3,
+            'SasGdalCacheMax': 256
+        }
+
+        with open(test_runconfig_path, 'w', encoding='utf-8') as outfile:
+            yaml.safe_dump(runconfig_dict, outfile, sort_keys=False)
+
+        try:
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run_preprocessor()
+            pge.run_sas_executable()
+
+            log_contents = pge.logger.get_stream_object().getvalue()
+
+            self.assertIn('Configured SAS environment: OMP_NUM_THREADS=3', log_contents)
+            self.assertIn('GDAL_CACHEMAX=256', log_contents)
+            self.assertIn('SAS threads: 3 256', log_contents)
+
+            # By default (autotuning disabled), and with no overrides, the
+            # environment should be left as is
+            runconfig_dict['RunConfig']['Groups']['PGE']['RuntimeGroup'] = {}
+
+            with open(test_runconfig_path, 'w', encoding='utf-8') as outfile:
+                yaml.safe_dump(runconfig_dict, outfile, sort_keys=False)
+
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run_preprocessor()
+
+            with patch.dict(os.environ, {}, clear=True):
+                self.assertDictEqual(pge._get_sas_environment(), {})
+
+            # Once opted into, variables not set in the environment should be derived
+            runconfig_dict['RunConfig']['Groups']['PGE']['RuntimeGroup'] = {
+                'SasEnvironmentAutotuning': True
+            }
+
+            with open(test_runconfig_path, 'w', encoding='utf-8') as outfile:
+                yaml.safe_dump(runconfig_dict, outfile, sort_keys=False)
+
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run_preprocessor()
+
+            with patch.dict(os.environ, {'GDAL_CACHEMAX': '128'}, clear=True):
+                sas_environment = pge._get_sas_environment()
+
+            self.assertIn('OMP_NUM_THREADS', sas_environment)
+            self.assertNotIn('GDAL_CACHEMAX', sas_environment)
+        finally:
+            if exists(test_runconfig_path):
+                os.unlink(test_runconfig_path)
+
+    def test_resume_from_sas_manifest(self):
+        """Test resumption of post-processing from a previously completed SAS execution"""
+        runconfig_path = join(self.data_dir, 'test_base_pge_config.yaml')
+        test_runconfig_path = join(self.data_dir, 'resume_base_pge_config.yaml')
+
+        with open(runconfig_path, 'r', encoding='utf-8') as infile:
+            runconfig_dict = yaml.safe_load(infile)
+
+        runconfig_dict['RunConfig']['Groups']['PGE']['RuntimeGroup'] = {'ResumeEnabled': True}
+
+        with open(test_runconfig_path, 'w', encoding='utf-8') as outfile:
+            yaml.safe_dump(runconfig_dict, outfile, sort_keys=False)
+
+        try:
+            # Initial execution should run the SAS, and record its outputs
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run()
+
+            expected_manifest_file = join(pge.runconfig.scratch_path, 'sas_completion_manifest.json')
+            self.assertTrue(os.path.exists(expected_manifest_file))
+
+            with open(expected_manifest_file, 'r', encoding='utf-8') as infile:
+                manifest = json.load(infile)
+
+            self.assertEqual(manifest['sas_version'], PgeExecutor.SAS_VERSION)
+            self.assertEqual(len(manifest['outputs']), 1)
+            self.assertEqual(basename(manifest['outputs'][0]['path']), 'dswx_hls.tif')
+
+            with open(pge.logger.get_file_name(), 'r', encoding='utf-8') as infile:
+                self.assertIn('sas.elapsed_seconds:', infile.read())
+
+            # Second execution should skip the SAS, and restore the output renamed
+            # by the first execution before post-processing it again
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run()
+
+            with open(pge.logger.get_file_name(), 'r', encoding='utf-8') as infile:
+                log_contents = infile.read()
+
+            self.assertIn('Resuming from SAS completion manifest', log_contents)
+            self.assertNotIn('sas.elapsed_seconds:', log_contents)
+            self.assertEqual(len(pge.renamed_files), 1)
+
+            # Only the outputs of the latest post-processing should remain
+            output_products = os.listdir(pge.runconfig.output_product_path)
+
+            self.assertIn(list(pge.renamed_files.values())[0], output_products)
+            self.assertIn(basename(pge.logger.get_file_name()), output_products)
+            self.assertEqual(len([name for name in output_products if name.endswith('.log')]), 1)
+
+            # Files written by neither the SAS nor post-processing should be
+            # left in place on resumption, and PGE logs should not be recorded
+            # as SAS outputs
+            operator_file = join(pge.runconfig.output_product_path, 'operator_notes.txt')
+
+            with open(operator_file, 'w', encoding='utf-8') as outfile:
+                outfile.write('notes')
+
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run_preprocessor()
+
+            with open(join(pge.runconfig.output_product_path, 'pge_20200101T000000.log'), 'w',
+                      encoding='utf-8') as outfile:
+                outfile.write('stale log')
+
+            self.assertTrue(pge._resume_from_sas_manifest())
+            self.assertTrue(exists(operator_file))
+            self.assertFalse(exists(join(pge.runconfig.output_product_path, 'pge_20200101T000000.log')))
+            self.assertIn('Leaving', pge.logger.get_stream_object().getvalue())
+
+            self.assertListEqual(pge._get_sas_output_files(),
+                                 [abspath(join(pge.runconfig.output_product_path, 'dswx_hls.tif')),
+                                  abspath(operator_file)])
+
+            os.remove(operator_file)
+
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run()
+
+            # Modification of the SAS output should prevent resumption
+            with open(join(pge.runconfig.output_product_path, list(pge.renamed_files.values())[0]), 'a',
+                      encoding='utf-8') as outfile:
+                outfile.write('modified')
+
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run()
+
+            with open(pge.logger.get_file_name(), 'r', encoding='utf-8') as infile:
+                log_contents = infile.read()
+
+            self.assertIn('is missing or has been modified', log_contents)
+            self.assertIn('sas.elapsed_seconds:', log_contents)
+
+            # Changes to the RunConfig, outside the Runtime Group, should also prevent resumption
+            runconfig_dict['RunConfig']['Groups']['PGE']['PrimaryExecutable']['ProductIdentifier'] = 'CHANGED'
+
+            with open(test_runconfig_path, 'w', encoding='utf-8') as outfile:
+                yaml.safe_dump(runconfig_dict, outfile, sort_keys=False)
+
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run_preprocessor()
+
+            self.assertFalse(pge._resume_from_sas_manifest())
+            self.assertIn('runconfig_hash of', pge.logger.get_stream_object().getvalue())
+        finally:
+            if exists(test_runconfig_path):
+                os.unlink(test_runconfig_path)
+
+    def test_sas_result_cache(self):
+        """Test restoration of cached SAS outputs when enabled by the RunConfig"""
+        runconfig_path = join(self.data_dir, 'test_base_pge_config.yaml')
+        test_runconfig_path = join(self.data_dir, 'sas_result_cache_base_pge_config.yaml')
+
+        with open(runconfig_path, 'r', encoding='utf-8') as infile:
+            runconfig_dict = yaml.safe_load(infile)
+
+        runconfig_dict['RunConfig']['Groups']['PGE']['RuntimeGroup'] = {
+            'SasResultCacheEnabled': True,
+            'SasResultCachePath': 'sas_result_cache'
+        }
+
+        with open(test_runconfig_path, 'w', encoding='utf-8') as outfile:
+            yaml.safe_dump(runconfig_dict, outfile, sort_keys=False)
+
+        try:
+            # Log of a previous execution left within the output directory
+            output_dir = runconfig_dict['RunConfig']['Groups']['PGE']['ProductPathGroup']['OutputProductPath']
+            os.makedirs(output_dir)
+            Path(join(output_dir, 'pge_20200101T000000.log')).touch()
+
+            # Initial execution should run the SAS, and cache only its output
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run()
+
+            with open(pge.logger.get_file_name(), 'r', encoding='utf-8') as infile:
+                log_contents = infile.read()
+
+            self.assertIn('No cached SAS results found', log_contents)
+            self.assertIn('sas.elapsed_seconds:', log_contents)
+            self.assertEqual(len(os.listdir('sas_result_cache')), 1)
+
+            first_checksums = pge._create_catalog_metadata().asdict()['Output_Product_Checksums']
+
+            # Second execution should restore the cached output, and post-process it as usual
+            shutil.rmtree(pge.runconfig.output_product_path)
+
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run()
+
+            with open(pge.logger.get_file_name(), 'r', encoding='utf-8') as infile:
+                log_contents = infile.read()
+
+            self.assertIn('Restored 1 SAS output(s) from cache entry', log_contents)
+            self.assertNotIn('sas.elapsed_seconds:', log_contents)
+            self.assertEqual(len(pge.renamed_files), 1)
+            self.assertEqual(list(pge._create_catalog_metadata().asdict()['Output_Product_Checksums'].values()),
+                             list(first_checksums.values()))
+            self.assertFalse(exists(join(output_dir, 'pge_20200101T000000.log')))
+
+            # Results cached by a different version of the PGE should never be restored
+            shutil.rmtree(pge.runconfig.output_product_path)
+
+            with patch.object(PgeExecutor, 'PGE_VERSION', '0.0.0'):
+                pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+                pge.run()
+
+            with open(pge.logger.get_file_name(), 'r', encoding='utf-8') as infile:
+                self.assertIn('No cached SAS results found', infile.read())
+
+            self.assertEqual(len(os.listdir('sas_result_cache')), 2)
+
+            # Changing the contents of an input file should result in a cache miss
+            with open(join('input', 'input_file01.h5'), 'w', encoding='utf-8') as outfile:
+                outfile.write('modified')
+
+            pge = PgeExecutor(pge_name='BasePgeTest', runconfig_path=test_runconfig_path)
+            pge.run()
+
+            with open(pge.logger.get_file_name(), 'r', encoding='utf-8') as infile:
+                self.assertIn('No cached SAS results found', infile.read())
+
+            self.assertEqual(len(os.listdir('sas_result_cache')), 3)
+        finally:
+            if exists(test_runconfig_path):
+                os.unlink(test_runconfig_path)
+
     def test_bad_iso_metadata_template(self):
         """Test validation checks for missing ISO XML template"""
         runconfig_path = join(self.data_dir, 'test_base_pge_config.yaml')
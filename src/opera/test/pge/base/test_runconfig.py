@@ -11,6 +11,7 @@ import os
 import tempfile
 import unittest
 from os.path import join
+from unittest.mock import patch
 
 from opera.test import path
 from importlib.resources import files
@@ -18,6 +19,7 @@ from importlib.resources import files
 from yamale import YamaleError
 
 from opera.pge import RunConfig
+from opera.util.schema_cache import clear_schema_cache
 
 
 class RunconfigTestCase(unittest.TestCase):
@@ -71,9 +73,11 @@ class RunconfigTestCase(unittest.TestCase):
         # Create a RunConfig with the valid test data
         runconfig = RunConfig(self.valid_config_full)
 
-        # Run validation on the parsed RunConfig, it should succeed
+        # Run validation on the parsed RunConfig, it should succeed, and reuse
+        # the already parsed contents rather than reading the file again
         try:
-            runconfig.validate()
+            with patch('yamale.make_data', side_effect=AssertionError('RunConfig file parsed again')):
+                runconfig.validate()
         except YamaleError as err:
             self.fail(str(err))
 
@@ -81,6 +85,10 @@ class RunconfigTestCase(unittest.TestCase):
         self.assertEqual(runconfig.filename, self.valid_config_full)
         self._compare_runconfig_to_expected(runconfig)
 
+        # Check the optional runtime settings
+        self.assertEqual(runconfig.checksum_workers, 2)
+        self.assertEqual(runconfig.metadata_workers, 3)
+
         # Make sure something was parsed for SAS section, not concerned with
         # the internals though as it's just an example SAS schema being used for
         # this test
@@ -112,6 +120,11 @@ class RunconfigTestCase(unittest.TestCase):
         self.assertEqual(runconfig.filename, self.valid_config_no_sas)
         self._compare_runconfig_to_expected(runconfig)
 
+        # Runtime settings should not be required
+        self.assertDictEqual(runconfig.runtime_config, {})
+        self.assertIsNone(runconfig.checksum_workers)
+        self.assertIsNone(runconfig.metadata_workers)
+
         # Check that None was assigned for SAS config section
         self.assertIsNone(runconfig.sas_config)
 
@@ -122,6 +135,35 @@ class RunconfigTestCase(unittest.TestCase):
         self.assertIn("input/input_dem.vrt", ancillary_filenames)
         self.assertNotIn(None, ancillary_filenames)
 
+    def test_cached_schema_validation(self):
+        """
+        Test that validating again reuses the schemas compiled by the first
+        validation, with the same result.
+        """
+        clear_schema_cache()
+
+        runconfig = RunConfig(self.valid_config_full)
+        runconfig.validate()
+
+        # Once compiled, no schema should need to be compiled again
+        with patch('yamale.make_schema', side_effect=AssertionError('Schema compiled again')):
+            try:
+                RunConfig(self.valid_config_full).validate()
+            except YamaleError as err:
+                self.fail(str(err))
+
+        # An invalid RunConfig should fail validation the same way with cached schemas
+        runconfig = RunConfig(self.invalid_config)
+
+        with self.assertRaises(YamaleError) as cold_context:
+            runconfig.validate()
+
+        with patch('yamale.make_schema', side_effect=AssertionError('Schema compiled again')):
+            with self.assertRaises(YamaleError) as warm_context:
+                runconfig.validate()
+
+        self.assertEqual(str(warm_context.exception), str(cold_context.exception))
+
     def test_strict_mode_validation(self):
         """Test validation of a RunConfig with strict_mode both enabled and disabled"""
         # Parse a valid runconfig, but modify it with fields not in the base
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+"""
+=======================
+test_validation_time.py
+=======================
+
+Validation-time benchmark for the sample RunConfig of each PGE, as provided
+under the examples directory of the repository.
+
+Each sample RunConfig is validated against its PGE and SAS schemas, first
+with no compiled schemas cached ("cold"), then again with the schemas
+compiled by the first validation ("warm"), as for a long-lived worker
+running several jobs.
+
+The benchmark is skipped unless the OPERA_PGE_RUN_BENCHMARKS environment
+variable is set. The budget for a single cold validation may be overridden
+with the OPERA_PGE_VALIDATION_TIME_BUDGET environment variable, in seconds.
+Running this module directly prints the timings measured for each sample
+RunConfig.
+
+"""
+import os
+import re
+import tempfile
+import time
+import unittest
+from glob import glob
+from os.path import abspath, basename, dirname, isdir, join
+
+import opera
+from opera.pge import RunConfig
+from opera.test import BENCHMARKS_ENV_VAR
+from opera.util.schema_cache import clear_schema_cache
+
+VALIDATION_TIME_BUDGET_ENV_VAR = "OPERA_PGE_VALIDATION_TIME_BUDGET"
+"""Environment variable which may be used to override the validation time budget"""
+
+DEFAULT_VALIDATION_TIME_BUDGET = 0.5
+"""Default maximum time, in seconds, to validate a single sample RunConfig"""
+
+EXAMPLES_DIR = abspath(join(dirname(opera.__file__), os.pardir, os.pardir, 'examples'))
+"""Location of the sample RunConfigs within a checkout of the repository"""
+
+CONTAINER_OPERA_PATH_PATTERN = re.compile(r'/home/[^/\s]+/opera/')
+"""Matches the location of the opera package within a PGE container, as referenced by the sample RunConfigs"""
+
+
+def localize_sample_runconfig(runconfig_path, output_dir):
+    """
+    Writes a copy of a sample RunConfig, with any schema paths within a PGE
+    container replaced with the corresponding path in the local opera package.
+
+    Parameters
+    ----------
+    runconfig_path : str
+        Path to the sample RunConfig.
+    output_dir : str
+        Directory to write the localized copy to.
+
+    Returns
+    -------
+    localized_runconfig_path : str
+        Path to the localized copy of the RunConfig.
+
+    """
+    with open(runconfig_path, 'r', encoding='utf-8') as infile:
+        runconfig_contents = infile.read()
+
+    runconfig_contents = CONTAINER_OPERA_PATH_PATTERN.sub(dirname(opera.__file__) + '/', runconfig_contents)
+
+    localized_runconfig_path = join(output_dir, basename(runconfig_path))
+
+    with open(localized_runconfig_path, 'w', encoding='utf-8') as outfile:
+        outfile.write(runconfig_contents)
+
+    return localized_runconfig_path
+
+
+def get_validation_times(runconfig_path):
+    """
+    Validates a RunConfig without, then with, its compiled schemas cached.
+
+    Parameters
+    ----------
+    runconfig_path : str
+        Path to the RunConfig to validate.
+
+    Returns
+    -------
+    cold_time : float
+        Time, in seconds, to validate the RunConfig with no schemas cached.
+    warm_time : float
+        Time, in seconds, to validate the RunConfig once its schemas are cached.
+
+    """
+    runconfig = RunConfig(runconfig_path)
+
+    clear_schema_cache()
+
+    start_time = time.perf_counter()
+    runconfig.validate()
+    cold_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    runconfig.validate()
+    warm_time = time.perf_counter() - start_time
+
+    return cold_time, warm_time
+
+
+@unittest.skipUnless(os.environ.get(BENCHMARKS_ENV_VAR), f'Benchmarks only run when {BENCHMARKS_ENV_VAR} is set')
+@unittest.skipUnless(isdir(EXAMPLES_DIR), 'Sample RunConfigs are only available within a checkout of the repository')
+class ValidationTimeTestCase(unittest.TestCase):
+    """Base test class using unittest"""
+
+    working_dir = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Determine the budget, and localize each sample RunConfig"""
+        cls.budget = float(os.environ.get(VALIDATION_TIME_BUDGET_ENV_VAR, DEFAULT_VALIDATION_TIME_BUDGET))
+        cls.working_dir = tempfile.TemporaryDirectory(prefix="test_validation_time_", suffix='_temp')
+
+        cls.runconfig_paths = [localize_sample_runconfig(runconfig_path, cls.working_dir.name)
+                               for runconfig_path in sorted(glob(join(EXAMPLES_DIR, '*_runconfig-*.yaml')))]
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the localized sample RunConfigs"""
+        cls.working_dir.cleanup()
+        clear_schema_cache()
+
+    def test_sample_runconfig_validation_time(self):
+        """Check the time taken to validate each sample RunConfig against the budget"""
+        self.assertGreater(len(self.runconfig_paths), 0)
+
+        for runconfig_path in self.runconfig_paths:
+            with self.subTest(runconfig=basename(runconfig_path)):
+                cold_time, _ = get_validation_times(runconfig_path)
+
+                self.assertLessEqual(cold_time, self.budget,
+                                     f'Validation of {basename(runconfig_path)} exceeded budget of '
+                                     f'{self.budget} seconds')
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory(prefix="validation_time_") as temp_dir:
+        print(f"{'Sample RunConfig':<48} {'Cold (ms)':>10} {'Warm (ms)':>10}")
+
+        for sample_runconfig_path in sorted(glob(join(EXAMPLES_DIR, '*_runconfig-*.yaml'))):
+            sample_cold_time, sample_warm_time = get_validation_times(
+                localize_sample_runconfig(sample_runconfig_path, temp_dir)
+            )
+
+            print(f"{basename(sample_runconfig_path):<48} "
+                  f"{sample_cold_time * 1000:>10.2f} {sample_warm_time * 1000:>10.2f}")
@@ -380,6 +380,14 @@ class DispS1PgeTestCase(unittest.TestCase):
         # up directories
         pge.run_preprocessor()
 
+        # The pre-processor should have indexed the metadata of each input CSLC,
+        # which provides the polarization used to name the output products
+        cslc_file_list = pge.runconfig.sas_config['input_file_group']['cslc_file_list']
+
+        self.assertListEqual(sorted(pge._input_metadata_index.keys()),
+                             sorted(abspath(cslc_file) for cslc_file in cslc_file_list))
+        self.assertEqual(pge._input_polarization(), 'VV')
+
         # Create a sample metadata file within the output directory of the PGE
         output_dir = join(os.curdir, "disp_s1_pge_test/output_dir")
 
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+"""
+===================
+test_import_time.py
+===================
+
+Import-time benchmark for the PGE modules listed by scripts/pge_main.py.
+
+Each PGE module is imported within a fresh interpreter run with
+"python -X importtime". The import of each module should stay within a
+budget, and should not pull in any of the dependencies which the utility
+modules defer via opera.util.lazy_import.
+
+Since it starts two interpreters per PGE module, the benchmark is skipped
+unless the OPERA_PGE_RUN_BENCHMARKS environment variable is set. The budget
+may be overridden with the OPERA_PGE_IMPORT_TIME_BUDGET environment
+variable, in seconds.
+
+"""
+import os
+import subprocess
+import sys
+import unittest
+from os.path import dirname
+
+import opera
+from opera.scripts.pge_main import PGE_NAME_MAP
+from opera.test import BENCHMARKS_ENV_VAR
+
+IMPORT_TIME_BUDGET_ENV_VAR = "OPERA_PGE_IMPORT_TIME_BUDGET"
+"""Environment variable which may be used to override the import time budget"""
+
+DEFAULT_IMPORT_TIME_BUDGET = 1.0
+"""Default maximum time, in seconds, to import a single PGE module"""
+
+DEFERRED_MODULES = ('h5py', 'jinja2', 'jsonschema', 'lxml', 'mgrs', 'numpy',
+                    'opera_utils', 'osgeo', 'proteus', 'rtc')
+"""Heavy dependencies which should not be imported along with a PGE module"""
+
+
+def get_import_times(module_name):
+    """
+    Imports a module within a new interpreter, and returns the time taken
+    to import the module and each of its dependencies.
+
+    Parameters
+    ----------
+    module_name : str
+        Fully-qualified name of the module to import.
+
+    Returns
+    -------
+    import_times : dict
+        Mapping of each imported module name to the cumulative time, in
+        seconds, taken to import it.
+
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [dirname(dirname(opera.__file__)), os.environ.get('PYTHONPATH')])
+    ))
+
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+                            env=env, capture_output=True, text=True, check=True)
+
+    import_times = {}
+
+    # Each line is of the form "import time: <self us> | <cumulative us> | <module name>",
+    # preceded by a single header line
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        fields = line[len('import time:'):].split('|')
+
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+
+        import_times[fields[2].strip()] = int(fields[1]) / 1e6
+
+    return import_times
+
+
+@unittest.skipUnless(os.environ.get(BENCHMARKS_ENV_VAR), f'Benchmarks only run when {BENCHMARKS_ENV_VAR} is set')
+class ImportTimeTestCase(unittest.TestCase):
+    """Base test class using unittest"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Determine the budget, and import each PGE module once to make sure bytecode is cached"""
+        cls.budget = float(os.environ.get(IMPORT_TIME_BUDGET_ENV_VAR, DEFAULT_IMPORT_TIME_BUDGET))
+        cls.pge_modules = sorted({pge_module for pge_module, _ in PGE_NAME_MAP.values()})
+
+        for pge_module in cls.pge_modules:
+            get_import_times(pge_module)
+
+    def test_pge_import_time(self):
+        """Check the time taken to import each PGE module against the budget"""
+        for pge_module in self.pge_modules:
+            with self.subTest(pge_module=pge_module):
+                import_times = get_import_times(pge_module)
+
+                deferred_imports = sorted(module_name for module_name in import_times
+                                          if module_name.split('.')[0] in DEFERRED_MODULES)
+
+                self.assertListEqual(deferred_imports, [],
+                                     f'Deferred dependencies imported along with {pge_module}')
+
+                self.assertLessEqual(import_times[pge_module], self.budget,
+                                     f'Import of {pge_module} exceeded budget of {self.budget} seconds')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,21 +7,30 @@ test_main_pge.py
 
 Unit tests for the pge/base_pge.py module.
 """
+import functools
 import os
+import socket
 import subprocess
+import sys
 import tempfile
+import threading
+import types
 import unittest
 from os.path import abspath, join
 from pathlib import Path
+from unittest.mock import patch
 
 from opera.test import path
 
 from opera.pge import PgeExecutor, RunConfig
 from opera.scripts import pge_main
+from opera.scripts.pge_main import clear_job_state
 from opera.scripts.pge_main import get_pge_class
 from opera.scripts.pge_main import load_run_config_file
 from opera.scripts.pge_main import open_log_file
+from opera.scripts.pge_main import parse_job_request
 from opera.scripts.pge_main import pge_start
+from opera.scripts.pge_main import pge_worker
 from opera.util import PgeLogger
 
 
@@ -177,6 +186,134 @@ class PgeMainTestCase(unittest.TestCase):
         # Verify a zero is returned indicating it started
         self.assertEqual(run_result.returncode, 0)
 
+    def test_parse_job_request(self):
+        """Tests for pge_main.parse_job_request()"""
+        run_config_filename, working_dir = parse_job_request(f"{self.config_file}\n")
+
+        self.assertEqual(run_config_filename, abspath(self.config_file))
+        self.assertIsNone(working_dir)
+
+        run_config_filename, working_dir = parse_job_request("runconfig.yaml\n/tmp/job_dir\n")
+
+        self.assertEqual(run_config_filename, "/tmp/job_dir/runconfig.yaml")
+        self.assertEqual(working_dir, "/tmp/job_dir")
+
+        with self.assertRaises(ValueError):
+            parse_job_request("\n")
+
+    def test_pge_worker_spool_dir(self):
+        """Verifies jobs submitted via a spool directory are run by pge_worker()"""
+        spool_dir = abspath('spool')
+        os.mkdir(spool_dir)
+
+        with open(join(spool_dir, '001.job'), 'w', encoding='utf-8') as outfile:
+            outfile.write(f"{self.config_file}\n{os.getcwd()}\n")
+
+        with open(join(spool_dir, '002.job'), 'w', encoding='utf-8') as outfile:
+            outfile.write("missing_runconfig.yaml\n")
+
+        starting_dir = os.getcwd()
+
+        num_jobs = pge_worker(spool_dir=spool_dir, poll_interval=0.1, max_jobs=2)
+
+        self.assertEqual(num_jobs, 2)
+
+        # Working directory should be restored after each job
+        self.assertEqual(os.getcwd(), starting_dir)
+
+        # Each request should be renamed according to the job outcome
+        self.assertTrue(os.path.exists(join(spool_dir, '001.job.done')))
+        self.assertTrue(os.path.exists(join(spool_dir, '002.job.failed')))
+
+        with open(join(spool_dir, '002.job.failed'), 'r', encoding='utf-8') as infile:
+            self.assertIn('Could not find config file', infile.read())
+
+        # Check that the successful job produced its outputs, and logged its request
+        output_dir = join(starting_dir, 'base_pge_test', 'outputs')
+        log_files = [join(output_dir, filename) for filename in os.listdir(output_dir) if filename.endswith('.log')]
+
+        self.assertEqual(len(log_files), 1)
+        self.assertTrue(any(filename.endswith('.catalog.json') for filename in os.listdir(output_dir)))
+
+        with open(log_files[0], 'r', encoding='utf-8') as infile:
+            self.assertIn(f"Running spooled job {join(spool_dir, '001.job')} within PGE worker process", infile.read())
+
+    def test_pge_worker_socket(self):
+        """Verifies jobs submitted via a UNIX domain socket are run by pge_worker()"""
+        with tempfile.TemporaryDirectory(prefix="pge_worker_", dir='/tmp') as socket_dir:
+            socket_path = join(socket_dir, 'pge_worker.sock')
+
+            worker_thread = threading.Thread(
+                target=pge_worker,
+                kwargs={'socket_path': socket_path, 'poll_interval': 0.1, 'max_jobs': 1}
+            )
+            worker_thread.start()
+
+            while not os.path.exists(socket_path):
+                worker_thread.join(0.1)
+
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(socket_path)
+                client.sendall(f"{self.config_file}\n{os.getcwd()}\n".encode('utf-8'))
+                client.shutdown(socket.SHUT_WR)
+                reply = client.recv(4096).decode('utf-8')
+
+            worker_thread.join(timeout=30)
+
+            self.assertFalse(worker_thread.is_alive())
+            self.assertEqual(reply, 'OK\n')
+
+            # Socket should be cleaned up once the worker stops
+            self.assertFalse(os.path.exists(socket_path))
+
+        output_dir = join('base_pge_test', 'outputs')
+        self.assertTrue(any(filename.endswith('.catalog.json') for filename in os.listdir(output_dir)))
+
+    def test_clear_job_state(self):
+        """Verifies clear_job_state() clears cached job state without touching other module members"""
+        class Proxy:
+            """Stand-in for a proxy which performs a deferred import on attribute access"""
+
+            accessed_names = []
+
+            def __getattr__(self, name):
+                Proxy.accessed_names.append(name)
+                raise AttributeError(name)
+
+        @functools.lru_cache(maxsize=None)
+        def cached_function(value):
+            return value
+
+        class CachingMixin:
+            """Stand-in for a PGE mixin with class-level caches"""
+
+            metadata_cache = {}
+
+        CachingMixin.__module__ = 'opera.test_clear_job_state'
+
+        test_module = types.ModuleType('opera.test_clear_job_state')
+        test_module.proxy = Proxy()
+        test_module.cached_function = cached_function
+        test_module.CachingMixin = CachingMixin
+
+        cached_function(1)
+        CachingMixin.metadata_cache['key'] = 'value'
+
+        with patch.dict(sys.modules, {'opera.test_clear_job_state': test_module}):
+            clear_job_state()
+
+        self.assertEqual(cached_function.cache_info().currsize, 0)
+        self.assertDictEqual(CachingMixin.metadata_cache, {})
+        self.assertListEqual(Proxy.accessed_names, [])
+
+    def test_pge_worker_args(self):
+        """Verifies pge_worker() requires exactly one job source"""
+        with self.assertRaises(ValueError):
+            pge_worker()
+
+        with self.assertRaises(ValueError):
+            pge_worker(spool_dir='spool', socket_path='pge_worker.sock')
+
 
 if __name__ == "__main__":
     unittest.main()
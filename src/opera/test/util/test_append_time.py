@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+"""
+===================
+test_append_time.py
+===================
+
+Append-time benchmark for PgeLogger.append_lines(), using a synthetic SAS
+log of one million lines, both when appended in its entirety and when
+streamed from the output of a subprocess by run_utils.time_and_execute().
+
+The synthetic log repeats the lines of the sample SAS log provided with the
+test data, interspersed with lines which do not conform to the log
+formatting style for OPERA (such as those of a traceback), as written by
+a SAS to its standard output. The log is kept in memory while appending, so
+the benchmark measures the parsing and formatting of each line, rather than
+the speed of the disk. That appended lines match those formatted by
+parse_line() is checked on a small input by test_logger.py.
+
+The benchmark is skipped unless the OPERA_PGE_RUN_BENCHMARKS environment
+variable is set. The budget for appending (or streaming) the synthetic log may
+be overridden with the OPERA_PGE_APPEND_TIME_BUDGET environment variable, in
+seconds. Running this module directly prints the time taken to append and to
+stream the synthetic log.
+
+"""
+import os
+import tempfile
+import time
+import unittest
+from os.path import join
+from unittest.mock import patch
+
+from opera.test import BENCHMARKS_ENV_VAR
+from opera.test import path
+from opera.util.logger import LOG_MEMORY_LIMIT_ENV_VAR
+from opera.util.logger import PgeLogger
+from opera.util.run_utils import time_and_execute
+
+APPEND_TIME_BUDGET_ENV_VAR = "OPERA_PGE_APPEND_TIME_BUDGET"
+"""Environment variable which may be used to override the append time budget"""
+
+DEFAULT_APPEND_TIME_BUDGET = 10.0
+"""Default maximum time, in seconds, to append (or stream) the synthetic SAS log"""
+
+SYNTHETIC_LOG_LINE_COUNT = 1_000_000
+"""Number of lines in the synthetic SAS log"""
+
+NON_CONFORMING_LOG_LINES = [
+    'Traceback (most recent call last):',
+    '  File "/home/conda/proteus-0.1/src/proteus/dswx_hls.py", line 1595, in <module>',
+    '2022-04-04T22:55:01.406123Z, warn, DSWx-HLS, dswx_hls, 999999, dswx_hls.py:1595, "Zulu time tag"',
+    '2022-02-30 22:55:01.406, INFO, DSWx-HLS, dswx_hls, 999999, dswx_hls.py:1595, "Invalid date"'
+]
+"""Lines which require falling back to parse_line(), or are appended as-is"""
+
+
+def make_synthetic_log_lines(line_count=SYNTHETIC_LOG_LINE_COUNT):
+    """
+    Returns the lines of a synthetic SAS log, built from the sample SAS log
+    provided with the test data.
+
+    Parameters
+    ----------
+    line_count : int, optional
+        Number of lines to return.
+
+    Returns
+    -------
+    log_lines : list of str
+        The lines of the synthetic SAS log, without trailing newlines.
+
+    """
+    with path('opera.test', 'data') as data_dir:
+        with open(join(data_dir, 'test_sas_log.txt'), 'r', encoding='utf-8') as infile:
+            sample_log_lines = infile.read().strip().split('\n')
+
+    sample_log_lines.extend(NON_CONFORMING_LOG_LINES)
+
+    return [sample_log_lines[index % len(sample_log_lines)] for index in range(line_count)]
+
+
+def get_append_time(log_lines):
+    """
+    Appends the provided lines to a new PgeLogger, with its log kept in memory.
+
+    Parameters
+    ----------
+    log_lines : list of str
+        The lines to append.
+
+    Returns
+    -------
+    append_time : float
+        Time, in seconds, to append the provided lines.
+    logger : PgeLogger
+        The logger the lines were appended to.
+
+    """
+    with patch.dict(os.environ, {LOG_MEMORY_LIMIT_ENV_VAR: str(2 ** 40)}):
+        logger = PgeLogger(log_filename='test_append_time.log')
+
+    start_time = time.perf_counter()
+    logger.append_lines(log_lines)
+    append_time = time.perf_counter() - start_time
+
+    return append_time, logger
+
+
+def get_stream_time(log_lines):
+    """
+    Streams the provided lines to a new PgeLogger, with its log kept in
+    memory, from the output of a subprocess which writes them to its stdout.
+
+    Parameters
+    ----------
+    log_lines : list of str
+        The lines to stream.
+
+    Returns
+    -------
+    stream_time : float
+        Time, in seconds, to stream the provided lines.
+    logger : PgeLogger
+        The logger the lines were streamed to.
+
+    """
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt', delete=False) as outfile:
+        outfile.write('\n'.join(log_lines) + '\n')
+
+    try:
+        with patch.dict(os.environ, {LOG_MEMORY_LIMIT_ENV_VAR: str(2 ** 40)}):
+            logger = PgeLogger(log_filename='test_stream_time.log')
+
+        start_time = time.perf_counter()
+        time_and_execute(['cat', outfile.name], logger)
+        stream_time = time.perf_counter() - start_time
+    finally:
+        os.unlink(outfile.name)
+
+    return stream_time, logger
+
+
+@unittest.skipUnless(os.environ.get(BENCHMARKS_ENV_VAR), f'Benchmarks only run when {BENCHMARKS_ENV_VAR} is set')
+class AppendTimeTestCase(unittest.TestCase):
+    """Base test class using unittest"""
+
+    def test_synthetic_log_append_time(self):
+        """Check the time taken to append the synthetic SAS log against the budget"""
+        budget = float(os.environ.get(APPEND_TIME_BUDGET_ENV_VAR, DEFAULT_APPEND_TIME_BUDGET))
+
+        log_lines = make_synthetic_log_lines()
+
+        append_time, logger = get_append_time(log_lines)
+
+        self.assertLessEqual(append_time, budget,
+                             f'Appending {len(log_lines)} lines exceeded budget of {budget} seconds')
+
+        self.assertEqual(len(logger.get_stream_object().getvalue().splitlines()), len(log_lines))
+
+        logger.get_stream_object().close()
+
+    def test_synthetic_log_stream_time(self):
+        """Check the time taken to stream the synthetic SAS log from a subprocess against the budget"""
+        budget = float(os.environ.get(APPEND_TIME_BUDGET_ENV_VAR, DEFAULT_APPEND_TIME_BUDGET))
+
+        log_lines = make_synthetic_log_lines()
+
+        stream_time, logger = get_stream_time(log_lines)
+
+        self.assertLessEqual(stream_time, budget,
+                             f'Streaming {len(log_lines)} lines exceeded budget of {budget} seconds')
+
+        self.assertEqual(len(logger.get_stream_object().getvalue().splitlines()), len(log_lines))
+
+        logger.get_stream_object().close()
+
+
+if __name__ == "__main__":
+    synthetic_log_lines = make_synthetic_log_lines()
+    synthetic_log_append_time, synthetic_log_logger = get_append_time(synthetic_log_lines)
+    synthetic_log_logger.get_stream_object().close()
+
+    print(f"Appended {len(synthetic_log_lines)} lines in {synthetic_log_append_time:.2f} seconds")
+
+    synthetic_log_stream_time, synthetic_log_logger = get_stream_time(synthetic_log_lines)
+    synthetic_log_logger.get_stream_object().close()
+
+    print(f"Streamed {len(synthetic_log_lines)} lines in {synthetic_log_stream_time:.2f} seconds")
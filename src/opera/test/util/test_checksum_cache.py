@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+
+"""
+======================
+test_checksum_cache.py
+======================
+
+Unit tests for the util/checksum_cache.py module.
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+from os.path import abspath
+from unittest.mock import patch
+
+from opera.test import path
+
+from opera.util.checksum_cache import ChecksumCache
+from opera.util.run_utils import get_checksum
+from opera.util.run_utils import get_checksums
+from opera.util.run_utils import register_checksum
+
+
+class ChecksumCacheTestCase(unittest.TestCase):
+    """Base test class using unittest"""
+
+    starting_dir = None
+    working_dir = None
+    test_dir = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up directories for testing"""
+        cls.starting_dir = abspath(os.curdir)
+        with path('opera.test', 'util') as test_dir_path:
+            cls.test_dir = str(test_dir_path)
+
+        os.chdir(cls.test_dir)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """At completion re-establish starting directory"""
+        os.chdir(cls.starting_dir)
+
+    def setUp(self) -> None:
+        """Use the temporary directory as the working directory"""
+        self.working_dir = tempfile.TemporaryDirectory(
+            prefix="test_checksum_cache_", suffix='temp', dir=os.curdir
+        )
+        os.chdir(self.working_dir.name)
+
+    def tearDown(self) -> None:
+        """Return to starting directory"""
+        os.chdir(self.test_dir)
+        self.working_dir.cleanup()
+
+    @staticmethod
+    def _write_file(file_name, size=2 ** 16):
+        """Writes a file of random contents with the provided size"""
+        with open(file_name, 'wb') as outfile:
+            outfile.write(os.urandom(size))
+
+    def test_lookup_and_store(self):
+        """Tests for ChecksumCache.lookup() and ChecksumCache.store()"""
+        self._write_file('product.tif')
+
+        with ChecksumCache('cache/checksums.sqlite') as checksum_cache:
+            self.assertIsNone(checksum_cache.lookup('product.tif'))
+
+            checksum_cache.store('product.tif', 'abc123')
+
+            self.assertEqual(checksum_cache.lookup('product.tif'), 'abc123')
+
+            # Cache entries should follow the file through a rename
+            os.rename('product.tif', 'renamed_product.tif')
+
+            self.assertEqual(checksum_cache.lookup('renamed_product.tif'), 'abc123')
+
+            # Modifying the file should invalidate the entry
+            with open('renamed_product.tif', 'ab') as outfile:
+                outfile.write(b'modified')
+
+            self.assertIsNone(checksum_cache.lookup('renamed_product.tif'))
+
+        # Entries should persist once the cache is reopened
+        self._write_file('persisted.tif')
+
+        with ChecksumCache('cache/checksums.sqlite') as checksum_cache:
+            checksum_cache.store('persisted.tif', 'def456')
+
+        with ChecksumCache('cache/checksums.sqlite') as checksum_cache:
+            self.assertEqual(checksum_cache.lookup('persisted.tif'), 'def456')
+
+    def test_lru_eviction(self):
+        """Test eviction of the least recently used entries from a full cache"""
+        for index in range(4):
+            self._write_file(f'product_{index}.tif')
+
+        with ChecksumCache('checksums.sqlite', max_entries=3) as checksum_cache:
+            for index in range(3):
+                checksum_cache.store(f'product_{index}.tif', f'checksum_{index}')
+
+            # Use the first entry, so the second becomes least recently used
+            self.assertEqual(checksum_cache.lookup('product_0.tif'), 'checksum_0')
+
+            checksum_cache.store('product_3.tif', 'checksum_3')
+
+            self.assertEqual(len(checksum_cache), 3)
+            self.assertIsNone(checksum_cache.lookup('product_1.tif'))
+
+            for index in (0, 2, 3):
+                self.assertEqual(checksum_cache.lookup(f'product_{index}.tif'), f'checksum_{index}')
+
+    def test_invalid_cache_file(self):
+        """Test that an invalid cache file is replaced with a new cache"""
+        with open('checksums.sqlite', 'w', encoding='utf-8') as outfile:
+            outfile.write('this is not a database' * 100)
+
+        self._write_file('product.tif')
+
+        with ChecksumCache('checksums.sqlite') as checksum_cache:
+            self.assertEqual(len(checksum_cache), 0)
+
+            checksum_cache.store('product.tif', 'abc123')
+
+            self.assertEqual(checksum_cache.lookup('product.tif'), 'abc123')
+
+    def test_locked_cache_file(self):
+        """Test that a cache locked by another process is not discarded"""
+        self._write_file('product.tif')
+
+        with ChecksumCache('checksums.sqlite') as checksum_cache:
+            checksum_cache.store('product.tif', 'abc123')
+
+        locking_connection = sqlite3.connect('checksums.sqlite', isolation_level=None)
+
+        try:
+            locking_connection.execute("BEGIN EXCLUSIVE")
+
+            with self.assertRaises(sqlite3.OperationalError):
+                ChecksumCache('checksums.sqlite', timeout=0.1)
+        finally:
+            locking_connection.close()
+
+        with ChecksumCache('checksums.sqlite') as checksum_cache:
+            self.assertEqual(checksum_cache.lookup('product.tif'), 'abc123')
+
+    def test_get_checksum_with_cache(self):
+        """Test use of the cache by run_utils.get_checksum() and run_utils.get_checksums()"""
+        file_names = [f'product_{index}.tif' for index in range(4)]
+
+        for file_name in file_names:
+            self._write_file(file_name)
+
+        with ChecksumCache('checksums.sqlite') as checksum_cache:
+            checksums = get_checksums(file_names, max_workers=2, checksum_cache=checksum_cache)
+
+            for file_name in file_names:
+                self.assertEqual(checksum_cache.lookup(file_name), checksums[file_name])
+
+        # Simulate a new process, with nothing recorded in memory, by reopening
+        # the cache and patching out the in-memory registry
+        with ChecksumCache('checksums.sqlite') as checksum_cache, \
+                patch('opera.util.run_utils.lookup_checksum', return_value=None), \
+                patch('builtins.open', side_effect=AssertionError('File should not be read')):
+            for file_name in file_names:
+                self.assertEqual(get_checksum(file_name, checksum_cache), checksums[file_name])
+
+        # Checksums already recorded in memory should be persisted to the cache
+        self._write_file('registered.tif')
+        register_checksum('registered.tif', 'abc123')
+
+        with ChecksumCache('checksums.sqlite') as checksum_cache:
+            self.assertEqual(get_checksum('registered.tif', checksum_cache), 'abc123')
+
+        with ChecksumCache('checksums.sqlite') as checksum_cache:
+            self.assertEqual(checksum_cache.lookup('registered.tif'), 'abc123')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,15 +12,30 @@ Unit tests for the util/h5_utils.py module.
 import os
 import tempfile
 import unittest
+from unittest.mock import patch
+
+import h5py
 
 import numpy as np
 
+import opera.util.h5_utils
+from opera.util.h5_utils import HDF5DatasetSummary
+from opera.util.h5_utils import convert_h5py_dataset
 from opera.util.h5_utils import create_test_cslc_metadata_product
 from opera.util.h5_utils import create_test_disp_s1_metadata_product
 from opera.util.h5_utils import create_test_rtc_metadata_product
+from opera.util.h5_utils import get_coordinate_range
+from opera.util.h5_utils import get_cslc_s1_input_metadata
 from opera.util.h5_utils import get_cslc_s1_product_metadata
 from opera.util.h5_utils import get_disp_s1_product_metadata
+from opera.util.h5_utils import get_extent_from_coordinates
+from opera.util.h5_utils import get_extents_from_coordinates
+from opera.util.h5_utils import get_hdf5_attrs_as_dict
+from opera.util.h5_utils import get_hdf5_fields
+from opera.util.h5_utils import get_hdf5_group_as_dict
+from opera.util.h5_utils import get_hdf5_metadata
 from opera.util.h5_utils import get_rtc_s1_product_metadata
+from opera.util.h5_utils import materialize_hdf5_metadata
 
 
 def osr_is_available():
@@ -115,6 +130,155 @@ class H5UtilsTestCase(unittest.TestCase):
         finally:
             os.remove(file_name)
 
+    def test_get_cslc_s1_input_metadata(self):
+        """Test retrieval of the subset of CSLC-S1 metadata used by consumers of CSLC-S1 products"""
+        file_name = os.path.join(tempfile.gettempdir(), "test_cslc_input_metadata_file.hdf5")
+        create_test_cslc_metadata_product(file_name)
+
+        try:
+            input_metadata = get_cslc_s1_input_metadata(file_name)
+
+            self.assertEqual(input_metadata['burst_id'], 't064_135518_iw1')
+            self.assertEqual(input_metadata['polarization'], 'VV')
+            self.assertEqual(input_metadata['platform'], 'S1A')
+            self.assertIsNotNone(input_metadata['zero_doppler_start_time'])
+            self.assertIsNotNone(input_metadata['zero_doppler_end_time'])
+
+            # Missing datasets (and groups) are returned as None
+            field_values = get_hdf5_fields(file_name, {'burst_id': '/identification/burst_id',
+                                                       'missing': '/identification/missing',
+                                                       'group': '/identification'})
+
+            self.assertDictEqual(field_values, {'burst_id': 't064_135518_iw1', 'missing': None, 'group': None})
+        finally:
+            os.remove(file_name)
+
+    def test_get_hdf5_metadata(self):
+        """Test retrieval of multiple groups and attributes within a single open of an HDF5 file"""
+        file_name = os.path.join(tempfile.gettempdir(), "test_multi_group_metadata_file.hdf5")
+        create_test_cslc_metadata_product(file_name)
+
+        try:
+            with patch.object(h5py, "File", wraps=h5py.File) as mock_file:
+                metadata = get_hdf5_metadata(
+                    file_name,
+                    groups={
+                        'identification': '/identification',
+                        'data': ('/data', ['VV']),
+                        'projection': '/data/projection'
+                    },
+                    attributes={'root_attrs': '/'}
+                )
+
+            mock_file.assert_called_once()
+
+            self.assertListEqual(list(metadata.keys()), ['identification', 'data', 'projection', 'root_attrs'])
+            self.assertDictEqual(metadata['root_attrs'], get_hdf5_attrs_as_dict(file_name, '/'))
+            self.assertEqual(metadata['identification']['burst_id'], 't064_135518_iw1')
+            self.assertEqual(metadata['projection'], 32611)
+            self.assertNotIn('VV', metadata['data'])
+
+            expected_data = get_hdf5_group_as_dict(file_name, '/data', ['VV'])
+
+            self.assertListEqual(list(metadata['data'].keys()), list(expected_data.keys()))
+
+            with self.assertRaises(ValueError):
+                get_hdf5_metadata(file_name, groups={'identification': '/identification'},
+                                  attributes={'identification': '/identification'})
+
+            with self.assertRaises(RuntimeError):
+                get_hdf5_metadata(file_name, groups={'identification': '/identification', 'missing': '/missing'})
+        finally:
+            os.remove(file_name)
+
+    def test_convert_h5py_dataset_size_budget(self):
+        """Test summarization of datasets exceeding a size budget"""
+        file_name = os.path.join(tempfile.gettempdir(), "test_dataset_budget_file.hdf5")
+
+        raster = np.arange(10000, dtype='float32').reshape((100, 100))
+        raster[0, 0] = np.nan
+
+        try:
+            with h5py.File(file_name, 'w') as outfile:
+                outfile.create_dataset('chunked', data=raster, chunks=(16, 32))
+                outfile.create_dataset('contiguous', data=raster)
+                outfile.create_dataset('names', data=[b'VV', b'VH'])
+                outfile.create_dataset('name', data=b'VV')
+                outfile.create_dataset('spacing', data=10.0)
+
+            # Use a small block size to make sure contiguous datasets are read in more than one block
+            with patch.object(opera.util.h5_utils, "DATASET_BLOCK_BYTES", 4096), \
+                    h5py.File(file_name, 'r') as infile:
+                for dataset_name in ('chunked', 'contiguous'):
+                    summary = convert_h5py_dataset(infile[dataset_name], max_dataset_bytes=1024,
+                                                   dataset_statistics=True)
+
+                    self.assertIsInstance(summary, HDF5DatasetSummary)
+                    self.assertEqual(summary.shape, (100, 100))
+                    self.assertEqual(summary.dtype, 'float32')
+                    self.assertEqual(len(summary), 100)
+                    self.assertEqual(summary.size, 10000)
+                    self.assertDictEqual(summary.statistics, {'min': 1.0, 'max': 9999.0,
+                                                              'mean': float(np.nanmean(raster, dtype='float64'))})
+
+                # Statistics are optional, and datasets within the budget are read as usual
+                self.assertIsNone(convert_h5py_dataset(infile['chunked'], max_dataset_bytes=1024).statistics)
+                np.testing.assert_array_equal(convert_h5py_dataset(infile['chunked'], max_dataset_bytes=2 ** 20),
+                                              raster)
+
+                self.assertListEqual(list(convert_h5py_dataset(infile['names'])), ['VV', 'VH'])
+                self.assertEqual(convert_h5py_dataset(infile['name']), 'VV')
+                self.assertEqual(convert_h5py_dataset(infile['spacing']), 10.0)
+
+            # Summaries should be read in full once materialized
+            metadata = materialize_hdf5_metadata({'data': {'raster': summary, 'spacing': 10.0}})
+
+            np.testing.assert_array_equal(metadata['data']['raster'], raster)
+            self.assertEqual(metadata['data']['spacing'], 10.0)
+        finally:
+            os.remove(file_name)
+
+    def test_get_extents_from_coordinates(self):
+        """Test computation of spatial extents from coordinate datasets"""
+        file_name = os.path.join(tempfile.gettempdir(), "test_extent_file.hdf5")
+
+        increasing = np.linspace(-120.0, -110.0, 1000)
+        decreasing = np.linspace(40.0, 30.0, 500)
+        unordered = np.random.default_rng(0).uniform(-90, 90, size=(2560,))
+        grid = np.arange(200 * 300, dtype='float64').reshape((200, 300)) - 100.0
+
+        try:
+            with h5py.File(file_name, 'w') as outfile:
+                outfile.create_dataset('longitude', data=increasing)
+                outfile.create_dataset('latitude', data=decreasing)
+                outfile.create_dataset('unordered/longitude', data=unordered)
+                outfile.create_dataset('unordered/latitude', data=unordered[::-1], chunks=(100,))
+                outfile.create_dataset('grid/longitude', data=grid, chunks=(64, 64))
+                outfile.create_dataset('grid/latitude', data=grid.T)
+
+            self.assertTupleEqual(get_extent_from_coordinates(file_name, '/'), (-120.0, -110.0, 30.0, 40.0))
+
+            # Several groups may be requested with a single open of the file
+            with patch.object(h5py, "File", wraps=h5py.File) as mock_file:
+                extents = get_extents_from_coordinates(file_name, ['/', 'unordered', 'grid'])
+
+            mock_file.assert_called_once()
+
+            self.assertTupleEqual(extents['/'], (-120.0, -110.0, 30.0, 40.0))
+            self.assertTupleEqual(extents['unordered'], (unordered.min(), unordered.max(),
+                                                         unordered.min(), unordered.max()))
+            self.assertTupleEqual(extents['grid'], (-100.0, grid.max(), -100.0, grid.max()))
+
+            # Only the endpoints are used when the coordinates are assumed monotonic
+            with h5py.File(file_name, 'r') as infile:
+                self.assertTupleEqual(get_coordinate_range(infile['unordered/longitude'], assume_monotonic=True),
+                                      tuple(sorted((unordered[0], unordered[-1]))))
+
+            with self.assertRaises(RuntimeError):
+                get_extent_from_coordinates(file_name, 'grid', longitude='lon')
+        finally:
+            os.remove(file_name)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+"""
+===================
+test_lazy_import.py
+===================
+
+Unit tests for the util/lazy_import.py module.
+"""
+import unittest
+from unittest.mock import MagicMock, patch
+
+import opera.util.tiff_utils
+from opera.util.lazy_import import LazyImport
+from opera.util.mock_utils import MockGdal
+
+
+class LazyImportTestCase(unittest.TestCase):
+    """Base test class using unittest"""
+
+    def test_lazy_import(self):
+        """Test that the import is deferred until first use, and only performed once"""
+        import json  # pylint: disable=import-outside-toplevel
+
+        loader = MagicMock(return_value=json)
+
+        lazy_json = LazyImport(loader, 'json')
+
+        self.assertFalse(lazy_json.is_loaded)
+        self.assertEqual(repr(lazy_json), '<lazy import of json>')
+        loader.assert_not_called()
+
+        self.assertEqual(lazy_json.dumps([1, 2]), '[1, 2]')
+        self.assertIs(lazy_json.JSONDecodeError, json.JSONDecodeError)
+        self.assertTrue(lazy_json.is_loaded)
+        self.assertIn('loads', dir(lazy_json))
+
+        lazy_json.loads('{}')
+
+        loader.assert_called_once()
+
+    def test_lazy_import_callable(self):
+        """Test deferred import of a function"""
+        lazy_sum = LazyImport(lambda: sum)
+
+        self.assertEqual(lazy_sum([1, 2, 3]), 6)
+        self.assertEqual(repr(lazy_sum), repr(sum))
+
+    def test_lazy_import_patch(self):
+        """Test that a lazily imported dependency may still be patched"""
+        with patch.object(opera.util.tiff_utils, "gdal", MockGdal):
+            self.assertIs(opera.util.tiff_utils.gdal, MockGdal)
+
+        self.assertIsInstance(opera.util.tiff_utils.gdal, LazyImport)
+
+
+if __name__ == "__main__":
+    unittest.main()
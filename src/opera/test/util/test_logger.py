@@ -8,13 +8,17 @@ test_logger.py
 Unit tests for the util/logger.py module.
 
 """
+import json
 import os
 import re
 import tempfile
+import threading
 import unittest
+from glob import glob
 from io import StringIO
 from os.path import abspath, exists, join
 from random import randint
+from unittest.mock import patch
 
 from opera.test import path
 
@@ -24,8 +28,12 @@ from opera.util.error_codes import (CODES_PER_RANGE,
                                     ErrorCode,
                                     INFO_RANGE_START,
                                     WARNING_RANGE_START)
+from opera.util.logger import DeferredCriticalError
+from opera.util.logger import LOG_MEMORY_LIMIT_ENV_VAR
 from opera.util.logger import PgeLogger
+from opera.util.logger import SpooledLogStream
 from opera.util.logger import default_log_file_name
+from opera.util.logger import defer_critical
 from opera.util.logger import get_severity_from_error_code
 from opera.util.logger import standardize_severity_string
 from opera.util.logger import write
@@ -310,6 +318,146 @@ class LoggerTestCase(unittest.TestCase):
                 self.assertIn("test_pge_args", line)
                 self.assertIn("1717", line)
 
+    def test_pge_logger_threads(self):
+        """Test that messages logged from multiple threads are neither lost nor interleaved"""
+        logger = PgeLogger()
+
+        def log_messages(thread_index):
+            for message_index in range(200):
+                logger.info('test_pge_logger_threads', ErrorCode.LOGGED_INFO_LINE,
+                            f'thread {thread_index} message {message_index}\ncontinued')
+
+        threads = [threading.Thread(target=log_messages, args=(thread_index,)) for thread_index in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(logger.get_log_count_by_severity('Info'), 8 * 200)
+
+        log_lines = logger.get_stream_object().getvalue().splitlines()
+
+        self.assertEqual(len(log_lines), 8 * 200 * 2)
+
+        # Each continuation line should immediately follow the line it continues
+        for first_line, second_line in zip(log_lines[::2], log_lines[1::2]):
+            self.assertIn('message', first_line)
+            self.assertTrue(second_line.endswith('"continued"'))
+
+    def test_defer_critical(self):
+        """Test that critical errors within defer_critical() are raised without closing the log"""
+        logger = PgeLogger()
+
+        with defer_critical():
+            with self.assertRaises(DeferredCriticalError) as context:
+                logger.critical('test_defer_critical', ErrorCode.LOGGED_CRITICAL_LINE, 'deferred error')
+
+        self.assertEqual(context.exception.module, 'test_defer_critical')
+        self.assertEqual(context.exception.error_code_offset, ErrorCode.LOGGED_CRITICAL_LINE)
+        self.assertEqual(str(context.exception), 'deferred error')
+
+        # The log should remain open, with nothing written for the deferred error
+        self.assertFalse(logger.get_stream_object().closed)
+        self.assertNotIn('deferred error', logger.get_stream_object().getvalue())
+        self.assertEqual(logger.get_log_count_by_severity('Critical'), 0)
+
+        # Critical errors on other threads should not be deferred
+        def log_critical():
+            with self.assertRaises(RuntimeError) as thread_context:
+                logger.critical('test_defer_critical', ErrorCode.LOGGED_CRITICAL_LINE, 'thread error')
+
+            self.assertNotIsInstance(thread_context.exception, DeferredCriticalError)
+
+        with defer_critical():
+            thread = threading.Thread(target=log_critical)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(logger.get_log_count_by_severity('Critical'), 1)
+
+    def test_spooled_log_stream(self):
+        """Test that a log is spilled to a scratch file once it exceeds its memory limit"""
+        log_filename = abspath('test_spooled_log_stream.log')
+        spill_file_pattern = abspath('.test_spooled_log_stream.log.*.partial')
+        stream = SpooledLogStream(log_filename, max_memory_size=64)
+
+        self.assertTrue(isinstance(stream, StringIO))
+
+        stream.write('first line\n')
+
+        self.assertFalse(stream.spilled)
+        self.assertListEqual(glob(spill_file_pattern), [])
+
+        lines = [f'line {index}\n' for index in range(20)]
+
+        for line in lines:
+            stream.write(line)
+
+        # The scratch file should be hidden alongside the log file
+        self.assertTrue(stream.spilled)
+        self.assertListEqual(glob(spill_file_pattern), [stream.spill_filename])
+
+        expected_contents = 'first line\n' + ''.join(lines)
+
+        self.assertEqual(stream.getvalue(), expected_contents)
+
+        # Reads should not change where subsequent messages are written
+        stream.seek(0)
+        self.assertEqual(stream.readline(), 'first line\n')
+
+        stream.write('last line\n')
+        expected_contents += 'last line\n'
+
+        self.assertEqual(stream.getvalue(), expected_contents)
+
+        stream.seek(0)
+        self.assertListEqual(list(stream), expected_contents.splitlines(keepends=True))
+
+        # Saving the log should move the scratch file into place
+        stream.save()
+
+        self.assertFalse(stream.spilled)
+        self.assertListEqual(glob(spill_file_pattern), [])
+
+        with open(log_filename, 'r', encoding='utf-8') as infile:
+            self.assertEqual(infile.read(), expected_contents)
+
+        # Once saved, the log should be kept in memory again until it exceeds
+        # its memory limit anew
+        stream.write('first line\n')
+
+        self.assertFalse(stream.spilled)
+        self.assertEqual(stream.getvalue(), 'first line\n')
+
+        stream.close()
+
+    def test_pge_logger_spilled(self):
+        """Test closing and renaming of a PgeLogger whose log has been spilled to disk"""
+        with patch.dict(os.environ, {LOG_MEMORY_LIMIT_ENV_VAR: '256'}):
+            logger = PgeLogger(log_filename='test_pge_logger_spilled.log')
+
+        for index in range(20):
+            logger.info('test_pge_logger_spilled', ErrorCode.LOGGED_INFO_LINE, f'message {index}')
+
+        self.assertTrue(logger.get_stream_object().spilled)
+
+        logger.move('test_pge_logger_spilled_final.log')
+        logger.close_log_stream()
+
+        self.assertListEqual(glob('.*.partial'), [])
+        self.assertFalse(exists('test_pge_logger_spilled.log'))
+        self.assertTrue(exists('test_pge_logger_spilled_final.log'))
+
+        with open('test_pge_logger_spilled_final.log', 'r', encoding='utf-8') as infile:
+            log_contents = infile.read()
+
+        for index in range(20):
+            self.assertIn(f'message {index}', log_contents)
+
+        self.assertIn('overall.elapsed_seconds', log_contents)
+
     def test_append_sas_log(self):
         """
         Test appending of a SAS-formatted log file to ensure contents are parsed
@@ -375,6 +523,96 @@ class LoggerTestCase(unittest.TestCase):
             self.assertEqual(self.logger.error_code_base,
                              int(error_code) - error_code_map[severity])
 
+    def test_append_lines(self):
+        """
+        Test that lines appended via the fast path for conforming lines are
+        identical to those parsed by parse_line()
+        """
+        log_lines = [
+            '2022-04-04 22:55:01.406, INFO, DSWx-HLS, dswx_hls, 999999, dswx_hls.py:1595, "Message, with comma"',
+            ' 2022-04-04T22:55:01.408123 , warn , DSWx-HLS, dswx_hls, 1, dswx_hls.py:1598, \'Quoted "message"\' ',
+            '2022-04-04 22:55:01, Error, DSWx-HLS, dswx_hls, 1, dswx_hls.py:1613, Unquoted message',
+            '2022-04-04T22:55:01.408123Z, DEBUG, DSWx-HLS, dswx_hls, 1, dswx_hls.py:1617, "Zulu time tag"',
+            '2022-02-30 22:55:01.406, INFO, DSWx-HLS, dswx_hls, 1, dswx_hls.py:1620, "Invalid date"',
+            '2022-04-04 24:55:01.406, INFO, DSWx-HLS, dswx_hls, 1, dswx_hls.py:1625, "Invalid time"',
+            '2022-04-04 22:55:01.4061, INFO, DSWx-HLS, dswx_hls, 1, dswx_hls.py:1630, "Unusual precision"',
+            '2022-04-04 22:55:01.406, VERBOSE, DSWx-HLS, dswx_hls, 1, dswx_hls.py:1635, "Unknown severity"',
+            'Traceback (most recent call last):',
+            'plain, text, with, too, few, commas',
+            ''
+        ]
+
+        # Repeat the lines, so those appended again reuse the cached lookups
+        log_lines = log_lines * 2
+
+        expected_stream = StringIO()
+        expected_counts = {'Debug': 0, 'Info': 0, 'Warning': 0, 'Critical': 0}
+
+        for log_line in log_lines:
+            try:
+                parsed_line = self.logger.parse_line(log_line)
+                write(expected_stream, *parsed_line)
+                expected_counts[parsed_line[0]] += 1
+            except ValueError:
+                expected_stream.write(log_line + "\n")
+
+        self.logger.append_lines(log_lines)
+
+        self.assertEqual(self.logger.get_stream_object().getvalue(), expected_stream.getvalue())
+        self.assertEqual(self.logger.log_count_by_severity, expected_counts)
+
+    def test_export_metrics(self):
+        """Test export of logged metrics when the log is closed"""
+        logger = PgeLogger(log_filename='test_metrics.log')
+
+        logger.metrics_export_formats = ['openmetrics', 'json']
+        logger.metrics_labels = {'pge_name': 'TEST_PGE', 'pge_version': '1.0', 'product_type': 'TEST'}
+
+        logger.log_one_metric('test_logger.py', 'sas.elapsed_seconds', 12.5)
+        logger.log_one_metric('test_logger.py', 'stage.postprocessor.checksum.elapsed_seconds', 0.25)
+        logger.warning('test_logger.py', ErrorCode.LOGGED_WARNING_LINE, 'Test warning')
+
+        self.assertEqual(logger.metrics['sas.elapsed_seconds'], 12.5)
+
+        logger.close_log_stream()
+
+        self.assertTrue(exists('test_metrics.log'))
+        self.assertTrue(exists('test_metrics.prom'))
+        self.assertTrue(exists('test_metrics.metrics.json'))
+
+        with open('test_metrics.prom', 'r', encoding='utf-8') as infile:
+            openmetrics_text = infile.read()
+
+        labels = 'pge_name="TEST_PGE",pge_version="1.0",product_type="TEST"'
+
+        self.assertIn(f'opera_pge_sas_elapsed_seconds{{{labels}}} 12.5', openmetrics_text)
+        self.assertIn(f'opera_pge_stage_elapsed_seconds{{{labels},stage="postprocessor.checksum"}} 0.25',
+                      openmetrics_text)
+        self.assertIn(f'opera_pge_log_messages{{{labels},severity="warning"}} 1', openmetrics_text)
+        self.assertIn('opera_pge_overall_elapsed_seconds{', openmetrics_text)
+        self.assertIn('opera_pge_overall_os_max_rss_kb_largest_child_process{', openmetrics_text)
+        self.assertTrue(openmetrics_text.endswith('# EOF\n'))
+
+        with open('test_metrics.metrics.json', 'r', encoding='utf-8') as infile:
+            json_metrics = json.load(infile)
+
+        self.assertEqual(json_metrics['labels']['pge_name'], 'TEST_PGE')
+        self.assertEqual(json_metrics['metrics']['sas.elapsed_seconds'], 12.5)
+        self.assertEqual(json_metrics['metrics']['overall.log_messages.warning'], 1)
+
+        # Failure to export metrics should be logged, without preventing the
+        # log itself from being written
+        logger = PgeLogger(log_filename='test_bad_metrics.log')
+        logger.metrics_export_formats = ['openmetrics']
+        logger.metrics_export_dir = 'nonexistent_dir'
+
+        logger.close_log_stream()
+
+        self.assertFalse(exists(join('nonexistent_dir', 'test_bad_metrics.prom')))
+
+        with open('test_bad_metrics.log', 'r', encoding='utf-8') as infile:
+            self.assertIn('Failed to export metrics to', infile.read())
+
 
 if __name__ == "__main__":
     unittest.main()
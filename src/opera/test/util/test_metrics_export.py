@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+"""
+======================
+test_metrics_export.py
+======================
+
+Unit tests for the util/metrics_export.py module.
+"""
+import json
+import os
+import tempfile
+import unittest
+from os.path import abspath, exists, join
+
+from opera.test import path
+
+from opera.util.metrics_export import format_json
+from opera.util.metrics_export import format_openmetrics
+from opera.util.metrics_export import get_metrics_filename
+from opera.util.metrics_export import write_metrics
+
+
+class MetricsExportTestCase(unittest.TestCase):
+    """Base test class using unittest"""
+
+    starting_dir = None
+    working_dir = None
+    test_dir = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up directories for testing"""
+        cls.starting_dir = abspath(os.curdir)
+        with path('opera.test', 'util') as test_dir_path:
+            cls.test_dir = str(test_dir_path)
+
+        os.chdir(cls.test_dir)
+
+        cls.metrics = {
+            'sas.elapsed_seconds': 10.5,
+            'sas.resources.rss_kb.peak': 2048,
+            'stage.preprocessor.elapsed_seconds': 1.25,
+            'stage.preprocessor.cpu_seconds': 1.0,
+            'stage.postprocessor.checksum.elapsed_seconds': 0.5,
+            'overall.log_messages.info': 12,
+            'overall.log_messages.critical': 0,
+            'iso_metadata.render_seconds': 0.75,
+            'qa.enabled': True,
+            'sas.version': 'not a number'
+        }
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """At completion re-establish starting directory"""
+        os.chdir(cls.starting_dir)
+
+    def setUp(self) -> None:
+        """Use the temporary directory as the working directory"""
+        self.working_dir = tempfile.TemporaryDirectory(
+            prefix="test_metrics_export_", suffix='temp', dir=os.curdir
+        )
+        os.chdir(self.working_dir.name)
+
+    def tearDown(self) -> None:
+        """Return to starting directory"""
+        os.chdir(self.test_dir)
+        self.working_dir.cleanup()
+
+    def test_format_openmetrics(self):
+        """Tests for metrics_export.format_openmetrics()"""
+        labels = {'pge_name': 'TEST_PGE', 'product_type': 'quoted "type"\n'}
+
+        openmetrics_lines = format_openmetrics(self.metrics, labels).splitlines()
+
+        label_text = 'pge_name="TEST_PGE",product_type="quoted \\"type\\"\\n"'
+
+        self.assertEqual(
+            openmetrics_lines,
+            [
+                '# TYPE opera_pge_sas_elapsed_seconds gauge',
+                f'opera_pge_sas_elapsed_seconds{{{label_text}}} 10.5',
+                '# TYPE opera_pge_sas_resources_rss_kb_peak gauge',
+                f'opera_pge_sas_resources_rss_kb_peak{{{label_text}}} 2048',
+                '# TYPE opera_pge_stage_elapsed_seconds gauge',
+                f'opera_pge_stage_elapsed_seconds{{{label_text},stage="preprocessor"}} 1.25',
+                f'opera_pge_stage_elapsed_seconds{{{label_text},stage="postprocessor.checksum"}} 0.5',
+                '# TYPE opera_pge_stage_cpu_seconds gauge',
+                f'opera_pge_stage_cpu_seconds{{{label_text},stage="preprocessor"}} 1.0',
+                '# TYPE opera_pge_log_messages gauge',
+                f'opera_pge_log_messages{{{label_text},severity="info"}} 12',
+                f'opera_pge_log_messages{{{label_text},severity="critical"}} 0',
+                '# TYPE opera_pge_iso_metadata_render_seconds gauge',
+                f'opera_pge_iso_metadata_render_seconds{{{label_text}}} 0.75',
+                '# TYPE opera_pge_qa_enabled gauge',
+                f'opera_pge_qa_enabled{{{label_text}}} 1',
+                '# EOF'
+            ]
+        )
+
+        # Metrics without any labels should be written without braces
+        self.assertEqual(
+            format_openmetrics({'sas.elapsed_seconds': 1}),
+            '# TYPE opera_pge_sas_elapsed_seconds gauge\nopera_pge_sas_elapsed_seconds 1\n# EOF\n'
+        )
+
+    def test_format_json(self):
+        """Tests for metrics_export.format_json()"""
+        json_metrics = json.loads(format_json(self.metrics, {'pge_name': 'TEST_PGE'}))
+
+        self.assertEqual(json_metrics['labels'], {'pge_name': 'TEST_PGE'})
+        self.assertEqual(json_metrics['metrics']['sas.elapsed_seconds'], 10.5)
+        self.assertEqual(json_metrics['metrics']['qa.enabled'], 1)
+        self.assertEqual(json_metrics['metrics']['sas.version'], 'not a number')
+
+    def test_write_metrics(self):
+        """Tests for metrics_export.get_metrics_filename() and metrics_export.write_metrics()"""
+        log_filename = join('outputs', 'test_pge.log')
+
+        self.assertEqual(get_metrics_filename(log_filename, 'openmetrics'), join('outputs', 'test_pge.prom'))
+        self.assertEqual(get_metrics_filename(log_filename, 'json', 'metrics'),
+                         join('metrics', 'test_pge.metrics.json'))
+
+        os.mkdir('outputs')
+
+        for export_format in ('openmetrics', 'json'):
+            metrics_filename = get_metrics_filename(log_filename, export_format)
+
+            write_metrics(metrics_filename, export_format, self.metrics)
+
+            self.assertTrue(exists(metrics_filename))
+
+        # No temporary files should be left behind
+        self.assertEqual(sorted(os.listdir('outputs')), ['test_pge.metrics.json', 'test_pge.prom'])
+
+        with self.assertRaises(ValueError):
+            write_metrics('test_pge.xml', 'xml', self.metrics)
+
+        with self.assertRaises(OSError):
+            write_metrics(join('nonexistent_dir', 'test_pge.prom'), 'openmetrics', self.metrics)
+
+        self.assertFalse(exists('test_pge.xml'))
+
+
+if __name__ == "__main__":
+    unittest.main()
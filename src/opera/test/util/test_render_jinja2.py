@@ -13,11 +13,25 @@ import tempfile
 import unittest
 from glob import glob
 from os.path import abspath, join
+from unittest.mock import patch
 
 from opera.test import path
 
 from opera.util.logger import PgeLogger
-from opera.util.render_jinja2 import JSON_VALIDATOR, render_jinja2, UNDEFINED_ERROR, XML_VALIDATOR, YAML_VALIDATOR
+from opera.util.render_jinja2 import (JSON_VALIDATOR,
+                                      TEMPLATE_CACHE_DIR_ENV_VAR,
+                                      UNDEFINED_ERROR,
+                                      UNDEFINED_WARNING,
+                                      XML_VALIDATOR,
+                                      YAML_VALIDATOR,
+                                      _get_template_environment,
+                                      augment_hdf5_measured_parameters,
+                                      augment_measured_parameters,
+                                      clear_template_cache,
+                                      load_measured_parameters_config,
+                                      precompile_templates,
+                                      render_jinja2,
+                                      render_jinja2_to_file)
 
 
 class RenderJinja2TestCase(unittest.TestCase):
@@ -163,6 +177,67 @@ class RenderJinja2TestCase(unittest.TestCase):
         render_jinja2(template_file, new_data, validator=None)
         self.assertRaises(KeyError)
 
+    def testRenderJinja2TemplateCache(self):
+        """
+        Test that the jinja2 Environment for a template directory is reused
+        across renders, while undefined variables are still logged to the
+        logger provided with each render
+        """
+        clear_template_cache()
+
+        template_file = join(self.data_dir, 'render_jinja_test_template.html')
+
+        template_env = _get_template_environment(self.data_dir, log_undefined=True)
+
+        self.assertIs(_get_template_environment(self.data_dir, log_undefined=True), template_env)
+        self.assertIsNot(_get_template_environment(self.data_dir, log_undefined=False), template_env)
+
+        new_data = self.get_data()
+        self.remove_key(new_data, 'title')
+
+        first_logger = PgeLogger()
+        second_logger = PgeLogger()
+
+        render_jinja2(template_file, new_data, first_logger, validator=None)
+        render_jinja2(template_file, self.get_data(), second_logger, validator=None)
+
+        self.assertIs(_get_template_environment(self.data_dir, log_undefined=True), template_env)
+        self.assertIn('Missing/undefined ISO metadata template variable:',
+                      first_logger.get_stream_object().getvalue())
+        self.assertNotIn('Missing/undefined ISO metadata template variable:',
+                         second_logger.get_stream_object().getvalue())
+
+    def testRenderJinja2BytecodeCache(self):
+        """
+        Test compilation of templates into the on-disk bytecode cache, both
+        when precompiled and when rendered with the cache directory configured
+        """
+        clear_template_cache()
+
+        precompile_dir = join(os.getcwd(), 'precompiled')
+
+        template_paths = precompile_templates(precompile_dir, template_directories=[self.data_dir])
+
+        self.assertIn(join(self.data_dir, 'sample_iso_template.xml.jinja2'), template_paths)
+        self.assertNotIn(join(self.data_dir, 'render_jinja_test_template.html'), template_paths)
+        self.assertEqual(len(glob(join(precompile_dir, '*.cache'))), len(template_paths))
+
+        clear_template_cache()
+
+        cache_dir = join(os.getcwd(), 'template_cache')
+
+        with patch.dict(os.environ, {TEMPLATE_CACHE_DIR_ENV_VAR: cache_dir}):
+            rendered_text = render_jinja2(join(self.data_dir, 'render_jinja_test_template.html'),
+                                          self.get_data(), self.logger, validator=None)
+
+        self.assertIn('Terminator', rendered_text)
+        self.assertEqual(len(glob(join(cache_dir, '*.cache'))), 1)
+
+        # The default PGE templates should all compile without error
+        self.assertGreater(len(precompile_templates(join(os.getcwd(), 'pge_templates'))), 0)
+
+        clear_template_cache()
+
     def testRenderJinja2ValidateJSON(self):
         template_file = join(self.data_dir, 'render_jinja_json_test_template.json.jinja2')
         logger = PgeLogger()
@@ -276,3 +351,182 @@ class RenderJinja2TestCase(unittest.TestCase):
             len(glob(join(self.working_dir.name, 'bad_xml_*.xml'))),
             1
         )
+
+    def testRenderJinja2ToFile(self):
+        """
+        Test streaming of a rendered template to file, with incremental
+        validation of the XML as it is written
+        """
+        template_file = join(self.data_dir, 'render_jinja_xml_test_template.xml.jinja2')
+        logger = PgeLogger()
+
+        # Test for valid XML, written identically to the in-memory render
+        input_data = {'foo': {'bar': 'http://example.com?foo=foo&amp;bar=bar'}}
+        output_filepath = join(self.working_dir.name, 'valid.xml')
+
+        self.assertEqual(
+            render_jinja2_to_file(template_file, input_data, output_filepath, logger=logger,
+                                  output_directory=self.working_dir.name),
+            output_filepath
+        )
+
+        with open(output_filepath, 'r', encoding='utf-8') as infile:
+            self.assertEqual(infile.read(), render_jinja2(template_file, input_data, logger))
+
+        # Test a document spanning several chunks, with an error near the end
+        large_template_file = join(self.working_dir.name, 'large_test_template.xml.jinja2')
+
+        with open(large_template_file, 'w', encoding='utf-8') as outfile:
+            outfile.write("<?xml version='1.0' encoding='utf-8'?>\n<foo>\n"
+                          "{% for index in range(count) %}    <bar index=\"{{ index }}\">{{ text }}</bar>\n"
+                          "{% endfor %}    <baz>{{ last }}</baz>\n</foo>\n")
+
+        output_filepath = join(self.working_dir.name, 'large.xml')
+        input_data = {'count': 10000, 'text': 'x' * 64, 'last': 'foo=foo&amp;bar=bar'}
+
+        render_jinja2_to_file(large_template_file, input_data, output_filepath, logger=logger,
+                              output_directory=self.working_dir.name)
+
+        with open(output_filepath, 'r', encoding='utf-8') as infile:
+            self.assertEqual(infile.read(), render_jinja2(large_template_file, input_data, logger))
+
+        # Test for invalid XML
+        input_data['last'] = 'foo=foo&bar=bar'
+        output_filepath = join(self.working_dir.name, 'invalid.xml')
+
+        with self.assertRaises(RuntimeError):
+            render_jinja2_to_file(large_template_file, input_data, output_filepath, logger=logger,
+                                  output_directory=self.working_dir.name)
+
+        self.assertFalse(os.path.exists(output_filepath))
+
+        log_file = logger.get_file_name()
+
+        with open(log_file, 'r', encoding='utf-8') as infile:
+            log_contents = infile.read()
+
+        self.assertIn('Rendered XML not valid!', log_contents)
+        self.assertIn('    <baz>foo=foo&bar=bar</baz>', log_contents)
+        self.assertIn('@ 10003:', log_contents)
+
+        bad_xml_files = glob(join(self.working_dir.name, 'bad_xml_*.xml'))
+
+        self.assertEqual(len(bad_xml_files), 1)
+
+        with open(bad_xml_files[0], 'r', encoding='utf-8') as infile:
+            self.assertEqual(infile.read(), render_jinja2(large_template_file, input_data, validator=None))
+
+        # Test for invalid XML without a logger to report to
+        with self.assertRaises(RuntimeError) as context:
+            render_jinja2_to_file(large_template_file, input_data, output_filepath)
+
+        self.assertIn('Rendered XML not valid!', str(context.exception))
+        self.assertFalse(os.path.exists(output_filepath))
+
+        # An existing output file should be left as it was should rendering
+        # fail, and no partial output should be left behind
+        output_filepath = join(self.working_dir.name, 'large.xml')
+
+        with open(output_filepath, 'r', encoding='utf-8') as infile:
+            previous_contents = infile.read()
+
+        with self.assertRaises(RuntimeError):
+            render_jinja2_to_file(large_template_file, input_data, output_filepath, logger=PgeLogger(),
+                                  output_directory=self.working_dir.name)
+
+        class _UnrenderableText:
+            def __str__(self):
+                raise ValueError('Cannot render text')
+
+        input_data['text'] = _UnrenderableText()
+
+        with self.assertRaises(ValueError):
+            render_jinja2_to_file(large_template_file, input_data, output_filepath)
+
+        with open(output_filepath, 'r', encoding='utf-8') as infile:
+            self.assertEqual(infile.read(), previous_contents)
+
+        self.assertListEqual(glob(join(self.working_dir.name, '.*.partial')), [])
+
+        # Test a document with siblings preceding its root element
+        commented_template_file = join(self.working_dir.name, 'commented_test_template.xml.jinja2')
+
+        with open(commented_template_file, 'w', encoding='utf-8') as outfile:
+            outfile.write("<?xml version='1.0' encoding='utf-8'?>\n<!-- {{ comment }} -->\n"
+                          "<?processing instruction?>\n<foo><bar>{{ text }}</bar></foo>\n")
+
+        output_filepath = join(self.working_dir.name, 'commented.xml')
+        input_data = {'comment': 'generated for testing', 'text': 'foo'}
+
+        render_jinja2_to_file(commented_template_file, input_data, output_filepath, logger=logger,
+                              output_directory=self.working_dir.name)
+
+        with open(output_filepath, 'r', encoding='utf-8') as infile:
+            self.assertEqual(infile.read(), render_jinja2(commented_template_file, input_data, logger))
+
+    def testMeasuredParametersConfig(self):
+        """
+        Test that a Measured Parameters Configuration is parsed once and reused
+        until modified, and that it is applied to flat and nested metadata
+        """
+        mpc_path = join(self.working_dir.name, 'test_measured_parameters.yaml')
+
+        with open(mpc_path, 'w', encoding='utf-8') as outfile:
+            outfile.write(
+                "identification/track_number:\n"
+                "  description: Track number\n"
+                "  attribute_type: contentInformation\n"
+                "  display_name: TrackNumber\n"
+                "identification/look_direction:\n"
+                "  description: Look direction\n"
+                "  attribute_type: contentInformation\n"
+                "  escape_html: true\n"
+                "identification/missing_field:\n"
+                "  description: Optional field\n"
+                "  attribute_type: contentInformation\n"
+                "  optional: true\n"
+            )
+
+        mpc = load_measured_parameters_config(mpc_path)
+
+        self.assertIs(load_measured_parameters_config(mpc_path), mpc)
+
+        metadata = {'identification': {'track_number': 42, 'look_direction': '<Right>'}}
+
+        augmented_parameters = augment_hdf5_measured_parameters(metadata, mpc_path, self.logger)
+
+        self.assertListEqual(list(augmented_parameters.keys()),
+                             ['identification/track_number', 'identification/look_direction'])
+        self.assertDictEqual(
+            augmented_parameters['identification/track_number'],
+            {'name': 'TrackNumber', 'value': 42, 'attr_type': 'contentInformation',
+             'attr_description': 'Track number', 'data_type': 'int'}
+        )
+        self.assertEqual(augmented_parameters['identification/look_direction']['value'], '&lt;Right&gt;')
+        self.assertEqual(augmented_parameters['identification/look_direction']['name'],
+                         'Identification/LookDirection')
+        self.assertIn('Measured parameters configuration contains a path identification/missing_field',
+                      self.logger.get_stream_object().getvalue())
+
+        # Parameters absent from the configuration are flagged as such
+        augmented_parameters = augment_measured_parameters({'unknown_field': 1.5}, mpc_path, self.logger)
+
+        self.assertEqual(augmented_parameters['unknown_field']['attr_description'], UNDEFINED_ERROR)
+        self.assertEqual(augmented_parameters['unknown_field']['name'], 'UnknownField')
+        self.assertEqual(augmented_parameters['unknown_field']['data_type'], 'float')
+
+        augmented_parameters = augment_measured_parameters({'unknown_field': 1.5}, None, self.logger)
+
+        self.assertEqual(augmented_parameters['unknown_field']['attr_description'], UNDEFINED_WARNING)
+
+        # Modifying the configuration should cause it to be reloaded
+        with open(mpc_path, 'a', encoding='utf-8') as outfile:
+            outfile.write("unknown_field:\n"
+                          "  description: No longer unknown\n"
+                          "  attribute_type: contentInformation\n")
+
+        self.assertIsNot(load_measured_parameters_config(mpc_path), mpc)
+
+        augmented_parameters = augment_measured_parameters({'unknown_field': 1.5}, mpc_path, self.logger)
+
+        self.assertEqual(augmented_parameters['unknown_field']['attr_description'], 'No longer unknown')
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+"""
+=======================
+test_resource_limits.py
+=======================
+
+Unit tests for the util/resource_limits.py module.
+"""
+import os
+import tempfile
+import unittest
+from os.path import abspath, join
+
+from opera.test import path
+
+from opera.util.resource_limits import GDAL_CACHEMAX_ENV_VAR
+from opera.util.resource_limits import THREAD_COUNT_ENV_VARS
+from opera.util.resource_limits import get_available_cpus
+from opera.util.resource_limits import get_available_memory
+from opera.util.resource_limits import get_cgroup_cpu_limit
+from opera.util.resource_limits import get_cgroup_memory_limit
+from opera.util.resource_limits import get_sas_environment
+
+
+class ResourceLimitsTestCase(unittest.TestCase):
+    """Base test class using unittest"""
+
+    starting_dir = None
+    working_dir = None
+    test_dir = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up directories for testing"""
+        cls.starting_dir = abspath(os.curdir)
+        with path('opera.test', 'util') as test_dir_path:
+            cls.test_dir = str(test_dir_path)
+
+        os.chdir(cls.test_dir)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """At completion re-establish starting directory"""
+        os.chdir(cls.starting_dir)
+
+    def setUp(self) -> None:
+        """Use the temporary directory as the working directory"""
+        self.working_dir = tempfile.TemporaryDirectory(
+            prefix="test_resource_limits_", suffix='temp', dir=os.curdir
+        )
+        os.chdir(self.working_dir.name)
+
+    def tearDown(self) -> None:
+        """Return to starting directory"""
+        os.chdir(self.test_dir)
+        self.working_dir.cleanup()
+
+    @staticmethod
+    def _write_files(files):
+        """Creates the provided mapping of file paths to file contents"""
+        for file_path, contents in files.items():
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+            with open(file_path, 'w', encoding='utf-8') as outfile:
+                outfile.write(contents + '\n')
+
+    def test_cgroup_v2_limits(self):
+        """Test discovery of limits from a cgroup v2 hierarchy"""
+        self._write_files(
+            {
+                join('proc', 'cgroup'): '0::/job.slice/pge.scope',
+                join('cgroup', 'job.slice', 'pge.scope', 'cpu.max'): '250000 100000',
+                join('cgroup', 'job.slice', 'pge.scope', 'memory.max'): str(4 * 2 ** 30)
+            }
+        )
+
+        kwargs = {'cgroup_root': 'cgroup', 'proc_cgroup_file': join('proc', 'cgroup')}
+
+        self.assertEqual(get_cgroup_cpu_limit(**kwargs), 2.5)
+        self.assertEqual(get_cgroup_memory_limit(**kwargs), 4 * 2 ** 30)
+        self.assertLessEqual(get_available_cpus(**kwargs), 3)
+        self.assertLessEqual(get_available_memory(**kwargs), 4 * 2 ** 30)
+
+        # Unlimited resources are reported as such
+        self._write_files(
+            {
+                join('cgroup', 'job.slice', 'pge.scope', 'cpu.max'): 'max 100000',
+                join('cgroup', 'job.slice', 'pge.scope', 'memory.max'): 'max'
+            }
+        )
+
+        self.assertIsNone(get_cgroup_cpu_limit(**kwargs))
+        self.assertIsNone(get_cgroup_memory_limit(**kwargs))
+        self.assertGreaterEqual(get_available_cpus(**kwargs), 1)
+
+    def test_cgroup_v1_limits(self):
+        """Test discovery of limits from a cgroup v1 hierarchy within a cgroup namespace"""
+        # Within a cgroup namespace, the cgroup of the process is mounted at
+        # the root of each hierarchy, rather than at the path listed
+        self._write_files(
+            {
+                join('proc', 'cgroup'): '4:memory:/docker/abc123\n2:cpu,cpuacct:/docker/abc123\n1:name=systemd:/',
+                join('cgroup', 'cpu', 'cpu.cfs_quota_us'): '100000',
+                join('cgroup', 'cpu', 'cpu.cfs_period_us'): '100000',
+                join('cgroup', 'memory', 'memory.limit_in_bytes'): str(2 ** 30)
+            }
+        )
+
+        kwargs = {'cgroup_root': 'cgroup', 'proc_cgroup_file': join('proc', 'cgroup')}
+
+        self.assertEqual(get_cgroup_cpu_limit(**kwargs), 1.0)
+        self.assertEqual(get_cgroup_memory_limit(**kwargs), 2 ** 30)
+        self.assertEqual(get_available_cpus(**kwargs), 1)
+
+        # Unlimited resources are reported as such
+        self._write_files(
+            {
+                join('cgroup', 'cpu', 'cpu.cfs_quota_us'): '-1',
+                join('cgroup', 'memory', 'memory.limit_in_bytes'): str(2 ** 63 - 4096)
+            }
+        )
+
+        self.assertIsNone(get_cgroup_cpu_limit(**kwargs))
+        self.assertIsNone(get_cgroup_memory_limit(**kwargs))
+
+    def test_no_cgroup(self):
+        """Test discovery of limits when no cgroup filesystem is available"""
+        kwargs = {'cgroup_root': 'nonexistent', 'proc_cgroup_file': join('nonexistent', 'cgroup')}
+
+        self.assertIsNone(get_cgroup_cpu_limit(**kwargs))
+        self.assertIsNone(get_cgroup_memory_limit(**kwargs))
+        self.assertGreaterEqual(get_available_cpus(**kwargs), 1)
+
+    def test_get_sas_environment(self):
+        """Tests for resource_limits.get_sas_environment()"""
+        self._write_files(
+            {
+                join('proc', 'cgroup'): '0::/',
+                join('cgroup', 'cpu.max'): '100000 100000',
+                join('cgroup', 'memory.max'): str(2 * 2 ** 30)
+            }
+        )
+
+        kwargs = {'cgroup_root': 'cgroup', 'proc_cgroup_file': join('proc', 'cgroup')}
+
+        # All variables should be derived from the cgroup limits
+        sas_environment = get_sas_environment(environ={}, **kwargs)
+
+        for env_var in THREAD_COUNT_ENV_VARS:
+            self.assertEqual(sas_environment[env_var], '1')
+
+        self.assertEqual(sas_environment[GDAL_CACHEMAX_ENV_VAR], '512')
+
+        # Variables already set within the environment should be left as is
+        sas_environment = get_sas_environment(environ={'OMP_NUM_THREADS': '8', 'GDAL_CACHEMAX': '100'}, **kwargs)
+
+        self.assertNotIn('OMP_NUM_THREADS', sas_environment)
+        self.assertNotIn(GDAL_CACHEMAX_ENV_VAR, sas_environment)
+        self.assertEqual(sas_environment['GDAL_NUM_THREADS'], '1')
+
+        # Explicitly requested values should always take precedence
+        sas_environment = get_sas_environment(
+            num_threads=4, gdal_cachemax_mb=1024,
+            environ={'OMP_NUM_THREADS': '8', 'GDAL_CACHEMAX': '100'}, **kwargs
+        )
+
+        for env_var in THREAD_COUNT_ENV_VARS:
+            self.assertEqual(sas_environment[env_var], '4')
+
+        self.assertEqual(sas_environment[GDAL_CACHEMAX_ENV_VAR], '1024')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+"""
+=====================
+test_result_cache.py
+=====================
+
+Unit tests for the util/result_cache.py module.
+"""
+import os
+import tempfile
+import time
+import unittest
+from os.path import abspath, exists, join
+
+from opera.test import path
+
+from opera.util.result_cache import SasResultCache
+from opera.util.result_cache import compute_cache_key
+
+
+class ResultCacheTestCase(unittest.TestCase):
+    """Base test class using unittest"""
+
+    starting_dir = None
+    working_dir = None
+    test_dir = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up directories for testing"""
+        cls.starting_dir = abspath(os.curdir)
+        with path('opera.test', 'util') as test_dir_path:
+            cls.test_dir = str(test_dir_path)
+
+        os.chdir(cls.test_dir)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """At completion re-establish starting directory"""
+        os.chdir(cls.starting_dir)
+
+    def setUp(self) -> None:
+        """Use the temporary directory as the working directory"""
+        self.working_dir = tempfile.TemporaryDirectory(
+            prefix="test_result_cache_", suffix='temp', dir=os.curdir
+        )
+        os.chdir(self.working_dir.name)
+
+    def tearDown(self) -> None:
+        """Return to starting directory"""
+        os.chdir(self.test_dir)
+        self.working_dir.cleanup()
+
+    @staticmethod
+    def _write_outputs(output_dir, size=1024):
+        """Creates a set of SAS outputs, including one within a subdirectory"""
+        output_files = [join(output_dir, 'product.tif'), join(output_dir, 'browse', 'product.png')]
+
+        for output_file in output_files:
+            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+
+            with open(output_file, 'wb') as outfile:
+                outfile.write(os.urandom(size))
+
+        return output_files
+
+    def test_compute_cache_key(self):
+        """Tests for result_cache.compute_cache_key()"""
+        key = compute_cache_key(sas_version='1.0', inputs=['abc', 'def'], sas_config={'a': 1, 'b': 2})
+
+        # Keys should not depend on the ordering of dictionary contents
+        self.assertEqual(key, compute_cache_key(sas_config={'b': 2, 'a': 1}, inputs=['abc', 'def'],
+                                                sas_version='1.0'))
+        self.assertNotEqual(key, compute_cache_key(sas_version='1.1', inputs=['abc', 'def'],
+                                                   sas_config={'a': 1, 'b': 2}))
+        self.assertNotEqual(key, compute_cache_key(sas_version='1.0', inputs=['abc', 'xyz'],
+                                                   sas_config={'a': 1, 'b': 2}))
+
+    def test_store_and_restore(self):
+        """Tests for SasResultCache.store() and SasResultCache.restore()"""
+        output_files = self._write_outputs('outputs')
+
+        result_cache = SasResultCache('cache')
+
+        self.assertNotIn('key1', result_cache)
+        self.assertIsNone(result_cache.restore('key1', 'restored'))
+
+        result_cache.store('key1', 'outputs', output_files)
+
+        self.assertIn('key1', result_cache)
+
+        # Outputs should be restored as copies by default
+        restored_files = result_cache.restore('key1', 'restored')
+
+        self.assertEqual(restored_files, [join('restored', 'product.tif'), join('restored', 'browse', 'product.png')])
+
+        for output_file, restored_file in zip(output_files, restored_files):
+            with open(output_file, 'rb') as infile, open(restored_file, 'rb') as restored:
+                self.assertEqual(infile.read(), restored.read())
+
+            self.assertNotEqual(os.stat(output_file).st_ino, os.stat(restored_file).st_ino)
+            self.assertEqual(os.stat(restored_file).st_nlink, 1)
+
+        # Restoring as hard links should overwrite any existing files
+        restored_files = result_cache.restore('key1', 'restored', hardlink=True)
+
+        for restored_file in restored_files:
+            self.assertEqual(os.stat(restored_file).st_nlink, 2)
+
+        # Storing an existing entry again should have no effect
+        result_cache.store('key1', 'outputs', output_files[:1])
+
+        self.assertEqual(len(result_cache.restore('key1', 'restored')), 2)
+
+        # No temporary files should be left behind within the cache
+        self.assertEqual(os.listdir('cache'), ['key1'])
+
+    def test_evict(self):
+        """Test least-recently-used eviction from a full cache"""
+        result_cache = SasResultCache('cache', max_bytes=5000)
+
+        # Each entry is 2048 bytes, so at most two may be retained
+        for index in range(3):
+            output_files = self._write_outputs(f'outputs_{index}')
+            result_cache.store(f'key{index}', f'outputs_{index}', output_files)
+
+            # Make sure each entry is used at a distinct time
+            time.sleep(0.01)
+
+            if index == 1:
+                # Use the first entry, so the second becomes least recently used
+                result_cache.restore('key0', 'restored')
+                time.sleep(0.01)
+
+        self.assertIn('key0', result_cache)
+        self.assertNotIn('key1', result_cache)
+        self.assertIn('key2', result_cache)
+        self.assertFalse(exists(join('cache', 'key1')))
+
+        # The most recently stored entry should be retained, even if it exceeds the limit
+        result_cache = SasResultCache('cache', max_bytes=1)
+
+        output_files = self._write_outputs('outputs_3')
+        result_cache.store('key3', 'outputs_3', output_files)
+
+        self.assertEqual(os.listdir('cache'), ['key3'])
+
+
+if __name__ == "__main__":
+    unittest.main()
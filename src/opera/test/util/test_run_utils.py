@@ -8,8 +8,11 @@ test_run_utils.py
 Unit tests for the util/run_utils.py module.
 
 """
+import errno
+import hashlib
 import os
 import shutil
+import stat
 import tempfile
 import unittest
 from os.path import abspath
@@ -18,9 +21,23 @@ from unittest.mock import patch
 from opera.test import path
 
 from opera.util.logger import PgeLogger
+from opera.util.run_utils import CHECKSUM_WORKERS_ENV_VAR
+from opera.util.run_utils import DEFAULT_ISO_RENDER_WORKERS
+from opera.util.run_utils import DEFAULT_METADATA_WORKERS
+from opera.util.run_utils import ISO_RENDER_WORKERS_ENV_VAR
+from opera.util.run_utils import METADATA_WORKERS_ENV_VAR
+from opera.util.run_utils import TracebackMonitor
+from opera.util.run_utils import copy_and_hash
 from opera.util.run_utils import create_qa_command_line
 from opera.util.run_utils import create_sas_command_line
+from opera.util.run_utils import get_checksum
+from opera.util.run_utils import get_checksum_workers
+from opera.util.run_utils import get_checksums
+from opera.util.run_utils import get_iso_render_workers
+from opera.util.run_utils import get_metadata_workers
 from opera.util.run_utils import get_traceback_from_log
+from opera.util.run_utils import lookup_checksum
+from opera.util.run_utils import stage_file
 from opera.util.run_utils import time_and_execute
 
 
@@ -256,3 +273,224 @@ class RunUtilsTestCase(unittest.TestCase):
         self.assertTrue(traceback_string.startswith("Traceback (most recent call last)"))
         self.assertTrue(traceback_string.endswith("For further information visit "
                                                   "https://errors.pydantic.dev/2.12/v/value_error"))
+
+    def test_time_and_execute_env(self):
+        """Test execution with additional environment variables via run_utils.time_and_execute()"""
+        logger = PgeLogger()
+
+        command_line = ['bash', '-c', 'echo "OMP_NUM_THREADS=$OMP_NUM_THREADS"; echo "HOME=$HOME"']
+
+        time_and_execute(command_line, logger, execute_via_shell=False, env={'OMP_NUM_THREADS': '3'})
+
+        log_contents = logger.get_stream_object().getvalue()
+
+        # The provided variables should be added to the existing environment
+        self.assertIn('OMP_NUM_THREADS=3\n', log_contents)
+        self.assertIn(f'HOME={os.environ.get("HOME", "")}\n', log_contents)
+
+    def test_time_and_execute_streaming(self):
+        """Tests for run_utils.time_and_execute() with large, streamed output"""
+        logger = PgeLogger()
+        num_lines = 20000
+
+        command_line = ['bash', '-c', f'for i in $(seq 1 {num_lines}); do echo "streamed line $i"; done']
+
+        time_and_execute(command_line, logger, execute_via_shell=False)
+
+        log_contents = logger.get_stream_object().getvalue()
+
+        # Every line of output should have made it into the log, in order
+        self.assertIn('streamed line 1\n', log_contents)
+        self.assertIn(f'streamed line {num_lines}\n', log_contents)
+        self.assertLess(log_contents.index('streamed line 1\n'),
+                        log_contents.index(f'streamed line {num_lines}\n'))
+
+        # Output following a handled traceback should not mask the final traceback
+        command_line = [
+            'bash', '-c',
+            'echo "Traceback (most recent call last):"; echo "  File x.py"; echo "KeyError: handled"; '
+            'for i in $(seq 1 5000); do echo "filler $i"; done; '
+            'echo "Traceback (most recent call last):"; echo "  File y.py"; echo "ValueError: fatal" 1>&2; exit 3'
+        ]
+
+        with self.assertRaises(RuntimeError) as err:
+            time_and_execute(command_line, logger, execute_via_shell=False)
+
+        self.assertIn('failed with exit code 3', str(err.exception))
+        traceback_string = str(err.exception).split('Traceback from log:')[-1]
+
+        self.assertIn('ValueError: fatal', traceback_string)
+        self.assertNotIn('KeyError: handled', traceback_string)
+
+    def test_traceback_monitor(self):
+        """Tests for run_utils.TracebackMonitor"""
+        for log_name, expected_ending in (
+                ("test_sas_log_with_traceback.txt", "IndexError: list index out of range"),
+                ("test_sas_log_with_traceback_no_message.txt", "AssertionError")):
+            with open(os.path.join(self.data_dir, log_name), "r") as infile:
+                log_contents = infile.read()
+
+            traceback_monitor = TracebackMonitor()
+
+            for line in log_contents.splitlines():
+                traceback_monitor.feed(line)
+
+            # Results should be consistent with parsing the entire log at once
+            traceback_string = traceback_monitor.get_traceback()
+
+            self.assertEqual(traceback_string, get_traceback_from_log(log_contents))
+            self.assertTrue(traceback_string.endswith(expected_ending))
+
+        # Only a bounded number of lines should be retained after the header
+        traceback_monitor = TracebackMonitor(window_lines=10)
+
+        traceback_monitor.feed("Traceback (most recent call last):")
+
+        for index in range(100):
+            traceback_monitor.feed(f"  line {index}")
+
+        self.assertEqual(len(traceback_monitor._captured_lines), 10)
+
+        # No traceback should be reported for logs without one
+        traceback_monitor = TracebackMonitor()
+
+        with open(os.path.join(self.data_dir, "test_sas_log.txt"), "r") as infile:
+            for line in infile:
+                traceback_monitor.feed(line.rstrip("\n"))
+
+        self.assertFalse(traceback_monitor.get_traceback())
+
+    def test_get_checksums(self):
+        """Tests for run_utils.get_checksums()"""
+        file_names = []
+
+        # Write files of varying sizes, so hashing completes out of order
+        for index in range(8):
+            file_name = f'checksum_test_{index}.bin'
+
+            with open(file_name, 'wb') as outfile:
+                outfile.write(os.urandom((8 - index) * 2 ** 18))
+
+            file_names.append(file_name)
+
+        expected_checksums = {file_name: get_checksum(file_name) for file_name in file_names}
+
+        for max_workers in (1, 3, 16):
+            checksums = get_checksums(reversed(file_names), max_workers=max_workers)
+
+            # Results should be identical, and ordered by the provided file names
+            self.assertDictEqual(checksums, expected_checksums)
+            self.assertListEqual(list(checksums.keys()), list(reversed(file_names)))
+
+        self.assertDictEqual(get_checksums([]), {})
+
+    def test_get_checksum_workers(self):
+        """Tests for run_utils.get_checksum_workers()"""
+        with patch.dict(os.environ, {CHECKSUM_WORKERS_ENV_VAR: '6'}):
+            # Explicit requests take precedence over the environment
+            self.assertEqual(get_checksum_workers(2), 2)
+            self.assertEqual(get_checksum_workers(), 6)
+
+        with patch.dict(os.environ, {CHECKSUM_WORKERS_ENV_VAR: '0'}):
+            self.assertEqual(get_checksum_workers(), 1)
+
+        with patch.dict(os.environ, {CHECKSUM_WORKERS_ENV_VAR: 'many'}):
+            with self.assertRaises(ValueError):
+                get_checksum_workers()
+
+        with patch.dict(os.environ, clear=True):
+            self.assertGreaterEqual(get_checksum_workers(), 1)
+
+    def test_get_metadata_workers(self):
+        """Tests for run_utils.get_metadata_workers()"""
+        with patch.dict(os.environ, {METADATA_WORKERS_ENV_VAR: '5', CHECKSUM_WORKERS_ENV_VAR: '2'}):
+            self.assertEqual(get_metadata_workers(3), 3)
+            self.assertEqual(get_metadata_workers(), 5)
+
+        with patch.dict(os.environ, clear=True):
+            self.assertGreaterEqual(get_metadata_workers(), 1)
+            self.assertLessEqual(get_metadata_workers(), DEFAULT_METADATA_WORKERS)
+
+    def test_get_iso_render_workers(self):
+        """Tests for run_utils.get_iso_render_workers()"""
+        with patch.dict(os.environ, {ISO_RENDER_WORKERS_ENV_VAR: '4', METADATA_WORKERS_ENV_VAR: '2'}):
+            self.assertEqual(get_iso_render_workers(3), 3)
+            self.assertEqual(get_iso_render_workers(), 4)
+
+        with patch.dict(os.environ, {ISO_RENDER_WORKERS_ENV_VAR: 'many'}):
+            with self.assertRaises(ValueError):
+                get_iso_render_workers()
+
+        # Rendering holds the GIL, so a single thread is used by default
+        with patch.dict(os.environ, clear=True):
+            self.assertEqual(get_iso_render_workers(), DEFAULT_ISO_RENDER_WORKERS)
+            self.assertEqual(get_iso_render_workers(), 1)
+
+    def test_copy_and_hash(self):
+        """Tests for run_utils.copy_and_hash()"""
+        contents = os.urandom(3 * 2 ** 20 + 17)
+
+        with open('copy_src.bin', 'wb') as outfile:
+            outfile.write(contents)
+
+        os.chmod('copy_src.bin', 0o640)
+
+        checksum = copy_and_hash('copy_src.bin', 'copy_dst.bin')
+
+        self.assertEqual(checksum, hashlib.md5(contents).hexdigest())
+
+        with open('copy_dst.bin', 'rb') as infile:
+            self.assertEqual(infile.read(), contents)
+
+        # Permission bits should be carried over, as with shutil.copy
+        self.assertEqual(stat.S_IMODE(os.stat('copy_dst.bin').st_mode), 0o640)
+
+        # Checksums for both files should be available without rereading them
+        self.assertEqual(lookup_checksum('copy_src.bin'), checksum)
+        self.assertEqual(lookup_checksum('copy_dst.bin'), checksum)
+
+        with patch('builtins.open', side_effect=AssertionError('File should not be read')):
+            self.assertEqual(get_checksum('copy_dst.bin'), checksum)
+
+        # Copying into a directory should use the source file name
+        os.mkdir('copy_dir')
+        copy_and_hash('copy_src.bin', 'copy_dir')
+        self.assertTrue(os.path.exists(os.path.join('copy_dir', 'copy_src.bin')))
+
+    def test_stage_file(self):
+        """Tests for run_utils.stage_file()"""
+        with open('stage_src.bin', 'wb') as outfile:
+            outfile.write(os.urandom(2 ** 16))
+
+        checksum = get_checksum('stage_src.bin')
+
+        # A checksum recorded before a rename should still apply afterwards
+        stage_file('stage_src.bin', 'stage_dst.bin')
+
+        self.assertFalse(os.path.exists('stage_src.bin'))
+        self.assertEqual(lookup_checksum('stage_dst.bin'), checksum)
+
+        # Copies should leave the source in place
+        stage_file('stage_dst.bin', 'stage_copy.bin', copy=True)
+
+        self.assertTrue(os.path.exists('stage_dst.bin'))
+        self.assertEqual(lookup_checksum('stage_copy.bin'), checksum)
+
+        # Renames across filesystems should fall back to copy and remove
+        with patch.object(os, 'rename', side_effect=OSError(errno.EXDEV, 'Invalid cross-device link')):
+            stage_file('stage_copy.bin', 'stage_moved.bin')
+
+        self.assertFalse(os.path.exists('stage_copy.bin'))
+        self.assertEqual(get_checksum('stage_moved.bin'), checksum)
+
+        # Any other failure should propagate
+        with patch.object(os, 'rename', side_effect=OSError(errno.EACCES, 'Permission denied')):
+            with self.assertRaises(OSError):
+                stage_file('stage_moved.bin', 'stage_denied.bin')
+
+        # Modifying a file should invalidate its recorded checksum
+        with open('stage_moved.bin', 'ab') as outfile:
+            outfile.write(b'modified')
+
+        self.assertIsNone(lookup_checksum('stage_moved.bin'))
+        self.assertNotEqual(get_checksum('stage_moved.bin'), checksum)
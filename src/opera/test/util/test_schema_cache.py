@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+"""
+====================
+test_schema_cache.py
+====================
+
+Unit tests for the util/schema_cache.py module.
+"""
+import os
+import tempfile
+import unittest
+from glob import glob
+from os.path import abspath, join
+from unittest.mock import patch
+
+import yamale
+
+from opera.test import path
+
+from opera.util.schema_cache import SCHEMA_CACHE_DIR_ENV_VAR
+from opera.util.schema_cache import clear_schema_cache
+from opera.util.schema_cache import get_schema
+
+
+class SchemaCacheTestCase(unittest.TestCase):
+    """Base test class using unittest"""
+
+    starting_dir = None
+    working_dir = None
+    test_dir = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up directories for testing"""
+        cls.starting_dir = abspath(os.curdir)
+        with path('opera.test', 'util') as test_dir_path:
+            cls.test_dir = str(test_dir_path)
+
+        os.chdir(cls.test_dir)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """At completion re-establish starting directory"""
+        os.chdir(cls.starting_dir)
+
+    def setUp(self) -> None:
+        """Use the temporary directory as the working directory"""
+        self.working_dir = tempfile.TemporaryDirectory(
+            prefix="test_schema_cache_", suffix='temp', dir=os.curdir
+        )
+        os.chdir(self.working_dir.name)
+
+        clear_schema_cache()
+
+    def tearDown(self) -> None:
+        """Return to starting directory"""
+        os.chdir(self.test_dir)
+        self.working_dir.cleanup()
+
+        clear_schema_cache()
+
+    @staticmethod
+    def _write_schema(schema_path, field_type):
+        """Writes a simple Yamale schema with a single field of the provided type"""
+        with open(schema_path, 'w', encoding='utf-8') as outfile:
+            outfile.write(f"field: {field_type}\n")
+
+    def test_in_process_cache(self):
+        """Test that a schema is only compiled again once its contents change"""
+        schema_path = abspath('test_schema.yaml')
+
+        self._write_schema(schema_path, 'int()')
+
+        schema = get_schema(schema_path)
+
+        with patch.object(yamale, 'make_schema', side_effect=AssertionError('Schema compiled again')):
+            self.assertIs(get_schema(schema_path), schema)
+            self.assertIs(get_schema('test_schema.yaml'), schema)
+
+        yamale.validate(schema, [({'field': 1}, 'data')])
+
+        # Changing the contents of the schema should result in it being recompiled
+        self._write_schema(schema_path, 'str()')
+
+        updated_schema = get_schema(schema_path)
+
+        self.assertIsNot(updated_schema, schema)
+
+        with self.assertRaises(yamale.YamaleError):
+            yamale.validate(updated_schema, [({'field': 1}, 'data')])
+
+    def test_persistent_cache(self):
+        """Test that compiled schemas are persisted to, and loaded from, the cache directory"""
+        schema_path = abspath('test_schema.yaml')
+        cache_dir = abspath('schema_cache')
+
+        self._write_schema(schema_path, 'int()')
+
+        with patch.dict(os.environ, {SCHEMA_CACHE_DIR_ENV_VAR: cache_dir}):
+            get_schema(schema_path)
+
+            self.assertEqual(len(glob(join(cache_dir, '*.pickle'))), 1)
+
+            clear_schema_cache()
+
+            with patch.object(yamale, 'make_schema', side_effect=AssertionError('Schema compiled again')):
+                schema = get_schema(schema_path)
+
+        yamale.validate(schema, [({'field': 1}, 'data')])
+
+        # A corrupted persisted schema should be replaced
+        for pickled_schema_path in glob(join(cache_dir, '*.pickle')):
+            with open(pickled_schema_path, 'wb') as outfile:
+                outfile.write(b'not a pickle')
+
+        clear_schema_cache()
+
+        schema = get_schema(schema_path, cache_dir=cache_dir)
+
+        yamale.validate(schema, [({'field': 1}, 'data')])
+
+        clear_schema_cache()
+
+        with patch.object(yamale, 'make_schema', side_effect=AssertionError('Schema compiled again')):
+            get_schema(schema_path, cache_dir=cache_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+
+"""
+====================
+test_stage_timing.py
+====================
+
+Unit tests for the util/stage_timing.py module.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from os.path import abspath
+
+from opera.test import path
+
+from opera.util.stage_timing import StageTimer
+from opera.util.stage_timing import timed_stage
+
+
+class TimedObject:
+    """Test class with methods decorated as timed stages"""
+
+    def __init__(self, stage_timer=None):
+        if stage_timer is not None:
+            self.stage_timer = stage_timer
+
+    @timed_stage('outer')
+    def outer(self, num_calls):
+        """Calls the inner stage the requested number of times"""
+        return [self._inner() for _ in range(num_calls)]
+
+    @timed_stage()
+    def _inner(self):
+        """Sleeps briefly"""
+        time.sleep(0.01)
+        return 'inner'
+
+
+class OverridingObject(TimedObject):
+    """Test class which overrides a timed stage of its parent"""
+
+    @timed_stage('outer')
+    def outer(self, num_calls):
+        """Calls the parent implementation of the stage"""
+        return super().outer(num_calls)
+
+
+class StageTimingTestCase(unittest.TestCase):
+    """Base test class using unittest"""
+
+    starting_dir = None
+    working_dir = None
+    test_dir = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up directories for testing"""
+        cls.starting_dir = abspath(os.curdir)
+        with path('opera.test', 'util') as test_dir_path:
+            cls.test_dir = str(test_dir_path)
+
+        os.chdir(cls.test_dir)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """At completion re-establish starting directory"""
+        os.chdir(cls.starting_dir)
+
+    def setUp(self) -> None:
+        """Use the temporary directory as the working directory"""
+        self.working_dir = tempfile.TemporaryDirectory(
+            prefix="test_stage_timing_", suffix='temp', dir=os.curdir
+        )
+        os.chdir(self.working_dir.name)
+
+    def tearDown(self) -> None:
+        """Return to starting directory"""
+        os.chdir(self.test_dir)
+        self.working_dir.cleanup()
+
+    def test_span(self):
+        """Tests for StageTimer.span()"""
+        stage_timer = StageTimer()
+
+        with stage_timer.span('first') as stage_path:
+            self.assertEqual(stage_path, 'first')
+
+            with stage_timer.span('second') as nested_stage_path:
+                self.assertEqual(nested_stage_path, 'first.second')
+                time.sleep(0.05)
+
+            # Spans in progress should be reported up to the current time
+            summary = stage_timer.get_summary()
+
+            self.assertEqual([stage['stage'] for stage in summary], ['first', 'first.second'])
+            self.assertTrue(summary[0]['in_progress'])
+            self.assertFalse(summary[1]['in_progress'])
+            self.assertEqual(summary[0]['count'], 1)
+
+        with stage_timer.span('first'):
+            pass
+
+        summary = stage_timer.get_summary()
+
+        self.assertEqual(len(summary), 2)
+
+        first_stage, second_stage = summary
+
+        self.assertEqual(first_stage['count'], 2)
+        self.assertEqual(first_stage['depth'], 0)
+        self.assertEqual(second_stage['count'], 1)
+        self.assertEqual(second_stage['depth'], 1)
+        self.assertGreaterEqual(second_stage['elapsed_seconds'], 0.05)
+        self.assertGreaterEqual(first_stage['elapsed_seconds'], second_stage['elapsed_seconds'])
+
+        for stage in summary:
+            self.assertFalse(stage['in_progress'])
+            self.assertGreaterEqual(stage['cpu_seconds'], 0.0)
+            self.assertGreaterEqual(stage['child_cpu_seconds'], 0.0)
+
+        # Stage timings should be recorded even when a stage raises an exception
+        with self.assertRaises(ValueError):
+            with stage_timer.span('failing'):
+                raise ValueError()
+
+        self.assertEqual(stage_timer.get_summary()[-1]['stage'], 'failing')
+        self.assertEqual(stage_timer.get_summary()[-1]['count'], 1)
+
+    def test_span_threads(self):
+        """Test that spans entered on worker threads are recorded as top-level stages"""
+        stage_timer = StageTimer()
+
+        def worker():
+            with stage_timer.span('worker'):
+                time.sleep(0.01)
+
+        with stage_timer.span('main'):
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+        summary = {stage['stage']: stage for stage in stage_timer.get_summary()}
+
+        self.assertEqual(set(summary.keys()), {'main', 'worker'})
+        self.assertEqual(summary['worker']['count'], 4)
+        self.assertEqual(summary['worker']['depth'], 0)
+
+    def test_timed_stage(self):
+        """Tests for the timed_stage() decorator"""
+        stage_timer = StageTimer()
+
+        self.assertEqual(TimedObject(stage_timer).outer(3), ['inner'] * 3)
+
+        summary = stage_timer.get_summary()
+
+        self.assertEqual([stage['stage'] for stage in summary], ['outer', 'outer.inner'])
+        self.assertEqual(summary[1]['count'], 3)
+
+        # An overridden stage calling its parent should not create a nested stage
+        stage_timer = StageTimer()
+
+        OverridingObject(stage_timer).outer(1)
+
+        self.assertEqual([stage['stage'] for stage in stage_timer.get_summary()], ['outer', 'outer.inner'])
+
+        # Objects without a stage timer should run their methods untimed
+        self.assertEqual(TimedObject().outer(1), ['inner'])
+
+        # Decorated methods should retain their name and docstring
+        self.assertEqual(TimedObject.outer.__name__, 'outer')
+        self.assertEqual(TimedObject.outer.__doc__, 'Calls the inner stage the requested number of times')
+
+    def test_write_json(self):
+        """Test for StageTimer.write_json()"""
+        stage_timer = StageTimer()
+
+        with stage_timer.span('first'):
+            with stage_timer.span('second'):
+                pass
+
+        stage_timer.write_json('stage_timing.json')
+
+        with open('stage_timing.json', 'r', encoding='utf-8') as infile:
+            stage_timings = json.load(infile)
+
+        self.assertEqual(stage_timings['stages'], stage_timer.get_summary())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,15 +7,24 @@ test_usage_metrics.py
 
 Unit tests for the util/usage_metrics.py module.
 """
+import csv
+import json
 import os
 import re
+import signal
+import subprocess
+import sys
 import tempfile
+import time
 import unittest
 from os.path import abspath, join
 from sys import platform
 
 from opera.test import path
 
+from opera.util.usage_metrics import RESOURCE_SAMPLE_FIELDS
+from opera.util.usage_metrics import ResourceSampler
+from opera.util.usage_metrics import get_descendant_pids
 from opera.util.usage_metrics import get_os_metrics
 
 
@@ -111,6 +120,97 @@ class UsageMetricsTestCase(unittest.TestCase):
                 self.assertEqual(str(metrics['os.peak_vm_kb.main_process']), re.match(int_regex,
                                  str(metrics['os.peak_vm_kb.main_process'])).group())
 
+    def test_get_descendant_pids(self):
+        """Test discovery of the process tree beneath the current process"""
+        if platform != "linux":
+            self.skipTest('Process tree inspection requires Linux')
+
+        # Launch a child process, which itself launches a grandchild process
+        child = subprocess.Popen(
+            [sys.executable, '-c',
+             'import subprocess, sys; '
+             'subprocess.run([sys.executable, "-c", "import time; time.sleep(10)"])']
+        )
+
+        try:
+            # Wait for the grandchild process to be launched
+            for _ in range(100):
+                descendant_pids = get_descendant_pids(os.getpid())
+
+                if len(descendant_pids) >= 2:
+                    break
+
+                time.sleep(0.05)
+
+            self.assertIn(child.pid, descendant_pids)
+            self.assertEqual(len(get_descendant_pids(child.pid)), 1)
+            self.assertIn(get_descendant_pids(child.pid)[0], descendant_pids)
+        finally:
+            for pid in get_descendant_pids(child.pid):
+                os.kill(pid, signal.SIGTERM)
+
+            child.wait()
+
+    def test_resource_sampler(self):
+        """Test sampling of the resource usage of a running process tree"""
+        if platform != "linux":
+            self.skipTest('Resource sampling requires Linux')
+
+        # Child process allocates ~64 MB and busy-waits, so memory and CPU
+        # usage should both be visible to the sampler
+        with ResourceSampler(interval=0.05) as sampler:
+            subprocess.run(
+                [sys.executable, '-c',
+                 'import time\n'
+                 'buffer = bytearray(64 * 2 ** 20)\n'
+                 'start = time.time()\n'
+                 'while time.time() - start < 0.5: pass'],
+                check=True
+            )
+
+        self.assertGreater(len(sampler.samples), 2)
+
+        for sample in sampler.samples:
+            self.assertEqual(tuple(sample.keys()), RESOURCE_SAMPLE_FIELDS)
+
+        summary = sampler.get_summary()
+
+        self.assertEqual(summary['num_samples'], len(sampler.samples))
+        self.assertEqual(summary['num_processes.peak'], 1)
+        self.assertGreaterEqual(summary['rss_kb.peak'], 64 * 1024)
+        self.assertLessEqual(summary['rss_kb.p50'], summary['rss_kb.peak'])
+        self.assertGreater(summary['cpu_percent.peak'], 0.0)
+
+        # Make sure the sample timeline can be written in both supported formats
+        sampler.write_json('resource_usage.json')
+
+        with open('resource_usage.json', 'r', encoding='utf-8') as infile:
+            resource_usage = json.load(infile)
+
+        self.assertEqual(resource_usage['summary'], summary)
+        self.assertEqual(resource_usage['samples'], sampler.samples)
+
+        sampler.write_csv('resource_usage.csv')
+
+        with open('resource_usage.csv', 'r', encoding='utf-8', newline='') as infile:
+            rows = list(csv.DictReader(infile))
+
+        self.assertEqual(len(rows), len(sampler.samples))
+        self.assertEqual(int(rows[0]['rss_kb']), sampler.samples[0]['rss_kb'])
+
+    def test_resource_sampler_no_processes(self):
+        """Test the summary of a sampler that has no processes to monitor"""
+        sampler = ResourceSampler(interval=0.05)
+
+        self.assertEqual(sampler.get_summary(), {'num_samples': 0})
+
+        sampler.start()
+        sample = sampler.sample()
+        sampler.stop()
+
+        self.assertEqual(sample['num_processes'], 0)
+        self.assertEqual(sample['rss_kb'], 0)
+
 
 if __name__ == "__main__":
     unittest.main()
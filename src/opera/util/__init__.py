@@ -10,5 +10,13 @@ metrics gathering, for use with the OPERA PGE Subsystem.
 
 """
 
+try:
+    # The libyaml-based safe YAML loader, which produces identical results to
+    # the pure Python equivalent, but is considerably faster for large files
+    # (such as RunConfigs listing thousands of input files)
+    from yaml import CSafeLoader as YAML_SAFE_LOADER  # noqa: F401
+except ImportError:
+    from yaml import SafeLoader as YAML_SAFE_LOADER  # noqa: F401
+
 from .error_codes import ErrorCode  # noqa: F401
 from .logger import PgeLogger  # noqa: F401
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+"""
+=================
+checksum_cache.py
+=================
+
+Persistent, on-disk cache of file checksums for use with OPERA PGEs.
+
+Checksums are keyed by the identity of the file contents on disk (device,
+inode, size and modification time), so they remain valid when a file is
+renamed, and become invalid as soon as the file is modified. This allows
+re-runs of a PGE (for example, after a failure during post-processing) to
+avoid re-hashing large output products that have not changed.
+
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+from .run_utils import get_file_identity
+
+CHECKSUM_CACHE_FILENAME = "checksum_cache.sqlite"
+"""Default file name for a checksum cache created within a scratch directory"""
+
+DEFAULT_MAX_CACHE_ENTRIES = 10000
+"""Default maximum number of checksums retained by a checksum cache"""
+
+DEFAULT_CACHE_TIMEOUT = 30.0
+"""Default time, in seconds, to wait for a checksum cache locked by another process"""
+
+
+class ChecksumCache:
+    """
+    SQLite-backed store of file checksums keyed by file identity, with
+    least-recently-used eviction.
+
+    Instances may be shared by multiple threads. Each lookup or store is
+    committed immediately, so the contents of the cache survive a crash of
+    the process using it.
+
+    """
+
+    SCHEMA_VERSION = 1
+    """Version of the database layout, used to validate existing cache files"""
+
+    def __init__(self, cache_path, max_entries=DEFAULT_MAX_CACHE_ENTRIES, timeout=DEFAULT_CACHE_TIMEOUT):
+        """
+        Opens (or creates) the checksum cache at the provided path.
+
+        If an existing file at the path is not a valid checksum cache, or was
+        written with an incompatible layout, it is discarded and a new cache
+        is created in its place. A cache which is only locked by another
+        process (such as another PGE sharing the cache) is never discarded.
+
+        Parameters
+        ----------
+        cache_path : str
+            Path to the cache file on disk.
+        max_entries : int, optional
+            Maximum number of checksums to retain. Once exceeded, the least
+            recently used entries are evicted.
+        timeout : float, optional
+            Time, in seconds, to wait for the cache to be unlocked when it is
+            in use by another process.
+
+        Raises
+        ------
+        sqlite3.OperationalError
+            If the cache could not be opened, such as when it remains locked
+            by another process for longer than the timeout.
+
+        """
+        self.cache_path = cache_path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._lock = threading.Lock()
+
+        try:
+            self._connection = self._open_database()
+        except sqlite3.OperationalError:
+            # Errors such as "database is locked" do not indicate a corrupt
+            # cache, which may still be in use by another process
+            raise
+        except sqlite3.DatabaseError:
+            os.remove(self.cache_path)
+            self._connection = self._open_database()
+
+    def __enter__(self):
+        """Returns the cache, for use as a context manager"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the cache upon exiting the context"""
+        self.close()
+
+    def _open_database(self):
+        """
+        Connects to the cache database, validating the layout of any existing
+        database and (re)creating the cache table as necessary.
+
+        Returns
+        -------
+        connection : sqlite3.Connection
+            The connection to the validated cache database.
+
+        Raises
+        ------
+        sqlite3.DatabaseError
+            If the file at the cache path is not a valid SQLite database.
+        sqlite3.OperationalError
+            If the database could not be accessed, such as when it is locked.
+
+        """
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_path))
+        os.makedirs(cache_dir, exist_ok=True)
+
+        connection = sqlite3.connect(self.cache_path, timeout=self.timeout,
+                                     isolation_level=None, check_same_thread=False)
+
+        try:
+            (schema_version,) = connection.execute("PRAGMA user_version").fetchone()
+            (integrity,) = connection.execute("PRAGMA quick_check").fetchone()
+
+            if integrity != "ok":
+                raise sqlite3.DatabaseError(f"Checksum cache {self.cache_path} failed integrity check")
+
+            if schema_version != self.SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS checksums")
+                connection.execute(
+                    "CREATE TABLE checksums ("
+                    "device INTEGER NOT NULL, inode INTEGER NOT NULL, size INTEGER NOT NULL, "
+                    "mtime_ns INTEGER NOT NULL, checksum TEXT NOT NULL, last_used REAL NOT NULL, "
+                    "PRIMARY KEY (device, inode, size, mtime_ns))"
+                )
+                connection.execute("CREATE INDEX checksums_last_used ON checksums (last_used)")
+                connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+
+        return connection
+
+    def lookup(self, file_name):
+        """
+        Returns the checksum cached for the current contents of the provided
+        file, or None if no checksum is cached.
+
+        Parameters
+        ----------
+        file_name : str
+            Path to the file to look up.
+
+        Returns
+        -------
+        checksum : str or None
+            The cached checksum of the file, if available.
+
+        """
+        file_identity = get_file_identity(file_name)
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT checksum FROM checksums "
+                "WHERE device = ? AND inode = ? AND size = ? AND mtime_ns = ?",
+                file_identity
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            self._connection.execute(
+                "UPDATE checksums SET last_used = ? "
+                "WHERE device = ? AND inode = ? AND size = ? AND mtime_ns = ?",
+                (time.time(), *file_identity)
+            )
+
+        return row[0]
+
+    def store(self, file_name, checksum):
+        """
+        Caches the checksum of the current contents of the provided file,
+        evicting the least recently used entries if the cache is full.
+
+        Parameters
+        ----------
+        file_name : str
+            Path to the file the checksum was computed for.
+        checksum : str
+            The checksum of the file.
+
+        """
+        file_identity = get_file_identity(file_name)
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checksums "
+                "(device, inode, size, mtime_ns, checksum, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                (*file_identity, checksum, time.time())
+            )
+
+            (num_entries,) = self._connection.execute("SELECT COUNT(*) FROM checksums").fetchone()
+
+            if num_entries > self.max_entries:
+                self._connection.execute(
+                    "DELETE FROM checksums WHERE rowid IN "
+                    "(SELECT rowid FROM checksums ORDER BY last_used ASC LIMIT ?)",
+                    (num_entries - self.max_entries,)
+                )
+
+    def __len__(self):
+        """Returns the number of checksums currently cached"""
+        with self._lock:
+            (num_entries,) = self._connection.execute("SELECT COUNT(*) FROM checksums").fetchone()
+
+        return num_entries
+
+    def close(self):
+        """Closes the connection to the cache database"""
+        with self._lock:
+            self._connection.close()
@@ -70,6 +70,9 @@ class ErrorCode(IntEnum):
     LOGGED_INFO_LINE = auto()
     UPDATING_PRODUCT_METADATA = auto()
     NO_ALGO_PARAM_SCHEMA_PATH = auto()
+    SAS_ENVIRONMENT_CONFIGURED = auto()
+    RESUMING_FROM_SAS_MANIFEST = auto()
+    SAS_RESULT_CACHE_HIT = auto()
 
     # Debug - 1000 – 1999
     CONFIGURATION_DETAILS = DEBUG_RANGE_START
@@ -88,6 +91,14 @@ class ErrorCode(IntEnum):
     LOGGING_RESYNC_FAILED = auto()
     LOGGED_WARNING_LINE = auto()
     ISO_METADATA_NO_DESCRIPTIONS = auto()
+    CHECKSUM_CACHE_UNAVAILABLE = auto()
+    RESOURCE_USAGE_NOT_WRITTEN = auto()
+    STAGE_TIMING_NOT_WRITTEN = auto()
+    METRICS_EXPORT_FAILED = auto()
+    SAS_MANIFEST_NOT_WRITTEN = auto()
+    SAS_MANIFEST_INVALID = auto()
+    SAS_RESULT_CACHE_UNAVAILABLE = auto()
+    UNRECOGNIZED_OUTPUT_LEFT_IN_PLACE = auto()
 
     # Critical - 3000 to 3999
     RUN_CONFIG_VALIDATION_FAILED = CRITICAL_RANGE_START
@@ -9,38 +9,71 @@ Utilities used for working with geographic coordinates
 
 """
 
+from opera.util.lazy_import import LazyImport
+from opera.util.mock_utils import MockOsr
 
-import mgrs
-from mgrs.core import MGRSError
-from unittest.mock import MagicMock
 
-from opera.util.mock_utils import MockOsr
+def _import_mgrs():
+    """Deferred import of mgrs"""
+    import mgrs as _mgrs  # pylint: disable=import-outside-toplevel
+
+    return _mgrs
+
 
 # When running a PGE within a Docker image delivered from ADT, the gdal import
 # below should work. When running in a dev environment, the import will fail
 # resulting in the MockGdal class being substituted instead.
 
-# pylint: disable=invalid-name
-try:
-    from osgeo import osr
+# pylint: disable=import-error,import-outside-toplevel
+def _import_osr():
+    """Deferred import of osgeo.osr, falling back to MockOsr"""
+    try:
+        from osgeo import osr as _osr
+
+        _osr.UseExceptions()
+    except ImportError:  # pragma: no cover
+        _osr = MockOsr                          # pragma: no cover
+
+    return _osr
 
-    osr.UseExceptions()
-except ImportError:  # pragma: no cover
-    osr = MockOsr                           # pragma: no cover
-# pylint: enable=invalid-name
 
 # Not all PGEs require the opera_utils library. The imports
 # below should work for those that require it, but will fall back to
 # MagicMocks for those that don't.
 
-# pylint: disable=import-error,invalid-name
-try:
-    from opera_utils import get_frame_geodataframe
-    from opera.util.dataset_utils import parse_bounding_polygon_from_wkt
-except (ImportError, ModuleNotFoundError): # pragma: no cover
-    get_frame_geodataframe = MagicMock()  # pragma: no cover
-    parse_bounding_polygon_from_wkt = MagicMock(return_value="(1 1 2 2 3 3 4 4)")  # pragma: no cover
-# pylint: enable=import-error,invalid-name
+def _import_get_frame_geodataframe():
+    """Deferred import of opera_utils.get_frame_geodataframe, falling back to a MagicMock"""
+    try:
+        from opera_utils import get_frame_geodataframe as _get_frame_geodataframe
+    except (ImportError, ModuleNotFoundError):  # pragma: no cover
+        from unittest.mock import MagicMock  # pragma: no cover
+        _get_frame_geodataframe = MagicMock()  # pragma: no cover
+
+    return _get_frame_geodataframe
+
+
+def _import_parse_bounding_polygon_from_wkt():
+    """Deferred import of parse_bounding_polygon_from_wkt, falling back to a MagicMock if opera_utils is unavailable"""
+    try:
+        import opera_utils  # noqa: F401 pylint: disable=unused-import
+        from opera.util.dataset_utils import parse_bounding_polygon_from_wkt as _parse_bounding_polygon_from_wkt
+    except (ImportError, ModuleNotFoundError):  # pragma: no cover
+        from unittest.mock import MagicMock  # pragma: no cover
+        _parse_bounding_polygon_from_wkt = MagicMock(return_value="(1 1 2 2 3 3 4 4)")  # pragma: no cover
+
+    return _parse_bounding_polygon_from_wkt
+# pylint: enable=import-error,import-outside-toplevel
+
+
+# These dependencies are only imported once first used, since importing them
+# accounts for much of the start-up time of PGEs which do not use them.
+# pylint: disable=invalid-name
+mgrs = LazyImport(_import_mgrs, 'mgrs')
+osr = LazyImport(_import_osr, 'osgeo.osr')
+get_frame_geodataframe = LazyImport(_import_get_frame_geodataframe, 'opera_utils.get_frame_geodataframe')
+parse_bounding_polygon_from_wkt = LazyImport(_import_parse_bounding_polygon_from_wkt,
+                                             'opera.util.dataset_utils.parse_bounding_polygon_from_wkt')
+# pylint: enable=invalid-name
 
 
 def translate_utm_bbox_to_lat_lon(bbox, epsg_code):
@@ -146,7 +179,7 @@ def get_geographic_boundaries_from_mgrs_tile(mgrs_tile_name):
 
     try:
         lower_left_utm_coordinate = mgrs_obj.MGRSToUTM(mgrs_tile_name)
-    except MGRSError as err:
+    except mgrs.core.MGRSError as err:
         raise RuntimeError(
             f'Failed to convert MGRS tile name "{mgrs_tile_name}" to lat/lon, '
             f'reason: {str(err)}'
@@ -10,31 +10,274 @@ Utilities used for working with HD5F files
 """
 # flake8: noqa F841
 
-import h5py
-
-import numpy as np
-
+from opera.util.lazy_import import LazyImport
 from opera.util.mock_utils import MockOsr
 
 S1_SLC_HDF5_PREFIX = ""
 """Prefix used to index metadata within SLC-based HDF5 products"""
 
+
+def _import_h5py():
+    """Deferred import of h5py"""
+    import h5py as _h5py  # pylint: disable=import-outside-toplevel
+
+    return _h5py
+
+
+def _import_numpy():
+    """Deferred import of numpy"""
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    return numpy
+
+
 # When running a PGE within a Docker image delivered from ADT, the gdal import
 # below should work. When running in a dev environment, the import will fail
 # resulting in the MockGdal class being substituted instead.
 
-# pylint: disable=import-error,invalid-name
-try:
-    from osgeo import osr
+# pylint: disable=import-error,import-outside-toplevel
+def _import_osr():
+    """Deferred import of osgeo.osr, falling back to MockOsr"""
+    try:
+        from osgeo import osr as _osr
+
+        _osr.UseExceptions()
+    except ImportError:  # pragma: no cover
+        _osr = MockOsr                          # pragma: no cover
+
+    return _osr
+# pylint: enable=import-error,import-outside-toplevel
 
-    osr.UseExceptions()
-except ImportError:  # pragma: no cover
-    osr = MockOsr                           # pragma: no cover
-# pylint: enable=import-error,invalid-name
+
+# These dependencies are only imported once first used, since importing them
+# accounts for much of the start-up time of PGEs which do not use them.
+# pylint: disable=invalid-name
+h5py = LazyImport(_import_h5py, 'h5py')
+np = LazyImport(_import_numpy, 'numpy')
+osr = LazyImport(_import_osr, 'osgeo.osr')
+# pylint: enable=invalid-name
 
 MEASURED_PARAMETER_PATH_SEPARATOR = '/'
 """Character used to delimit HDF5 metadata subgroup "paths" in measured parameter config YAML files"""
 
+DEFAULT_MAX_DATASET_BYTES = 16 * 2 ** 20
+"""
+Default size, in bytes, above which datasets read as part of product metadata
+are summarized rather than read into memory
+"""
+
+DATASET_BLOCK_BYTES = 8 * 2 ** 20
+"""Approximate size, in bytes, of each block read when reducing a contiguous (unchunked) dataset"""
+
+
+class HDF5DatasetSummary:
+    """
+    Lightweight stand-in for an HDF5 dataset too large to read into memory
+    along with the rest of the product metadata.
+
+    The summary holds the shape and type of the dataset, and optionally its
+    minimum, maximum and mean. The full dataset is only read from the file
+    if the summary is materialized, such as when a Measured Parameters
+    configuration references it.
+
+    """
+
+    def __init__(self, file_name, dataset_path, shape, dtype, statistics=None):
+        """
+        Initializes the summary.
+
+        Parameters
+        ----------
+        file_name : str
+            Path to the HDF5 file containing the dataset.
+        dataset_path : str
+            Path to the dataset within the HDF5 file.
+        shape : tuple of int
+            Shape of the dataset.
+        dtype : str
+            String representation of the type of the dataset.
+        statistics : dict, optional
+            Minimum, maximum and mean of the dataset, under the keys "min",
+            "max" and "mean".
+
+        """
+        self.file_name = file_name
+        self.dataset_path = dataset_path
+        self.shape = tuple(shape)
+        self.dtype = dtype
+        self.statistics = statistics
+
+    @property
+    def ndim(self):
+        """Returns the number of dimensions of the dataset"""
+        return len(self.shape)
+
+    @property
+    def size(self):
+        """Returns the number of elements within the dataset"""
+        size = 1
+
+        for dimension in self.shape:
+            size *= dimension
+
+        return size
+
+    def __len__(self):
+        """Returns the length of the first dimension of the dataset"""
+        if not self.shape:
+            raise TypeError("len() of unsized object")
+
+        return self.shape[0]
+
+    def __repr__(self):
+        """Returns a description of the summarized dataset"""
+        return f'<HDF5 dataset "{self.dataset_path}": shape {self.shape}, type "{self.dtype}">'
+
+    def materialize(self):
+        """
+        Reads the full contents of the summarized dataset.
+
+        Returns
+        -------
+        result : object
+            The dataset converted to a native Python type, as returned by
+            convert_h5py_dataset().
+
+        """
+        with h5py.File(self.file_name, 'r') as h5file:
+            return convert_h5py_dataset(h5file[self.dataset_path])
+
+
+def materialize_hdf5_metadata(metadata):
+    """
+    Returns the provided metadata with any dataset summaries, at any depth
+    within nested dicts, replaced with the full contents of the dataset.
+
+    Parameters
+    ----------
+    metadata : object
+        Metadata returned by get_hdf5_metadata(), or any value within it.
+
+    Returns
+    -------
+    metadata : object
+        The metadata with all summarized datasets materialized.
+
+    """
+    if isinstance(metadata, HDF5DatasetSummary):
+        return metadata.materialize()
+
+    if isinstance(metadata, dict):
+        return {key: materialize_hdf5_metadata(value) for key, value in metadata.items()}
+
+    return metadata
+
+
+def _get_hdf5_object(h5file, group_path):
+    """
+    Returns the group or dataset at the provided path within an open HDF5 file.
+
+    Raises
+    ------
+    RuntimeError
+        If group_path is not able to be retrieved from the opened h5file
+    """
+    group_object = h5file.get(group_path)
+
+    if group_object is None:
+        raise RuntimeError(f"An error occurred retrieving object '{group_path}' "
+                           f"from file '{h5file.filename}'.")
+
+    return group_object
+
+
+def _parse_group_spec(group_spec):
+    """
+    Returns the group path and keys to ignore from a group specification
+    provided to get_hdf5_metadata(), which may be either a group path, or a
+    tuple of a group path and the keys to ignore within it.
+    """
+    if isinstance(group_spec, (tuple, list)):
+        group_path, ignore_keys = group_spec
+    else:
+        group_path, ignore_keys = group_spec, None
+
+    return group_path, ignore_keys
+
+
+def get_hdf5_metadata(file_name, groups=None, attributes=None, max_dataset_bytes=None, dataset_statistics=False):
+    """
+    Returns the variable data and/or attributes of any number of HDF5 groups
+    as python dicts, reading all of them within a single open of the file.
+
+    This avoids the overhead of repeatedly opening the same file (a superblock
+    read and several metadata round-trips each time on a network file system)
+    when more than one group is needed from the same product.
+
+    Parameters
+    ----------
+    file_name : str
+        File system path and filename for the HDF5 file to use.
+    groups : dict, optional
+        Mapping of keys within the returned dict to the group path to return
+        variable data for, as would be returned by get_hdf5_group_as_dict().
+        Each value may instead be a (group_path, ignore_keys) tuple, to
+        exclude keys within the group from the result.
+    attributes : dict, optional
+        Mapping of keys within the returned dict to the group path to return
+        attributes for, as would be returned by get_hdf5_attrs_as_dict().
+        Each value may instead be a (group_path, ignore_keys) tuple.
+    max_dataset_bytes : int, optional
+        Size, in bytes, above which datasets are returned as an
+        HDF5DatasetSummary rather than read into memory. If not provided,
+        all datasets are read regardless of size.
+    dataset_statistics : bool, optional
+        If True, the summary of each dataset over max_dataset_bytes includes
+        the minimum, maximum and mean of the dataset, which requires reading
+        the dataset once (in blocks) to compute.
+
+    Returns
+    -------
+    metadata : dict
+        Python dict containing the converted variable data or attributes of
+        each requested group, under the key it was requested with.
+
+    Raises
+    -------
+    ValueError
+        If the same key is requested within both groups and attributes.
+    RuntimeError
+        If any requested group path is not able to be retrieved from the opened h5file
+    """
+    groups = groups or {}
+    attributes = attributes or {}
+
+    repeated_keys = set(groups).intersection(attributes)
+
+    if repeated_keys:
+        raise ValueError(f"Keys requested for both groups and attributes: {', '.join(sorted(repeated_keys))}")
+
+    metadata = {}
+
+    with h5py.File(file_name, 'r') as h5file:
+        for key, group_spec in groups.items():
+            group_path, ignore_keys = _parse_group_spec(group_spec)
+            group_object = _get_hdf5_object(h5file, group_path)
+
+            if isinstance(group_object, h5py.Dataset):
+                metadata[key] = convert_h5py_dataset(group_object, max_dataset_bytes, dataset_statistics)
+            else:
+                metadata[key] = convert_h5py_group_to_dict(group_object, ignore_keys,
+                                                           max_dataset_bytes, dataset_statistics)
+
+        for key, group_spec in attributes.items():
+            group_path, ignore_keys = _parse_group_spec(group_spec)
+            group_object = _get_hdf5_object(h5file, group_path)
+
+            metadata[key] = convert_h5py_attrs_to_dict(group_object, ignore_keys)
+
+    return metadata
+
 
 def get_hdf5_group_as_dict(file_name, group_path, ignore_keys=None):
     """
@@ -62,20 +305,10 @@ def get_hdf5_group_as_dict(file_name, group_path, ignore_keys=None):
     RuntimeError
         If group_path is not able to be retrieved from the opened h5file
     """
-    with h5py.File(file_name, 'r') as h5file:
-        group_object = h5file.get(group_path)
+    return get_hdf5_metadata(file_name, groups={group_path: (group_path, ignore_keys)})[group_path]
 
-        if group_object is None:
-            raise RuntimeError(f"An error occurred retrieving object '{group_path}' "
-                               f"from file '{file_name}'.")
 
-        result = convert_h5py_dataset(group_object) if isinstance(group_object, h5py.Dataset) else \
-            convert_h5py_group_to_dict(group_object, ignore_keys)
-
-    return result
-
-
-def convert_h5py_group_to_dict(group_object, ignore_keys=None):
+def convert_h5py_group_to_dict(group_object, ignore_keys=None, max_dataset_bytes=None, dataset_statistics=False):
     """
     Returns HDF5 group variable data as a python dict for a given h5py group object.
     Recursively calls itself to process subgroups.
@@ -93,6 +326,11 @@ def convert_h5py_group_to_dict(group_object, ignore_keys=None):
         h5py Group object to be converted to a dict.
     ignore_keys : iterable, optional
         Keys within the group to not include in the returned dict.
+    max_dataset_bytes : int, optional
+        Size, in bytes, above which datasets are summarized rather than read.
+        See convert_h5py_dataset().
+    dataset_statistics : bool, optional
+        If True, summaries of datasets include their minimum, maximum and mean.
 
     Returns
     -------
@@ -108,35 +346,111 @@ def convert_h5py_group_to_dict(group_object, ignore_keys=None):
             continue
 
         if isinstance(val, h5py.Dataset):
-            converted_dict[key] = convert_h5py_dataset(val)
+            converted_dict[key] = convert_h5py_dataset(val, max_dataset_bytes, dataset_statistics)
         elif isinstance(val, h5py.Group):
-            converted_dict[key] = convert_h5py_group_to_dict(val)
+            converted_dict[key] = convert_h5py_group_to_dict(val, max_dataset_bytes=max_dataset_bytes,
+                                                             dataset_statistics=dataset_statistics)
 
     return converted_dict
 
 
-def convert_h5py_dataset(dataset_object):
+def _iter_dataset_blocks(dataset_object):
+    """
+    Yields the contents of an h5py dataset as a sequence of numpy arrays, each
+    aligned to the chunks of the dataset, or for contiguous datasets, spanning
+    a range of the first dimension of roughly DATASET_BLOCK_BYTES in size.
+    """
+    if dataset_object.ndim == 0:
+        yield np.asarray(dataset_object[()])
+    elif dataset_object.chunks is not None:
+        for chunk_slice in dataset_object.iter_chunks():
+            yield dataset_object[chunk_slice]
+    else:
+        row_bytes = max(dataset_object.dtype.itemsize * (dataset_object.size // max(dataset_object.shape[0], 1)), 1)
+        rows_per_block = max(DATASET_BLOCK_BYTES // row_bytes, 1)
+
+        for start in range(0, dataset_object.shape[0], rows_per_block):
+            yield dataset_object[start:start + rows_per_block]
+
+
+def get_dataset_statistics(dataset_object):
+    """
+    Computes the minimum, maximum and mean of a numeric h5py dataset, reading
+    the dataset in blocks rather than all at once. Non-finite values are
+    excluded.
+
+    Parameters
+    ----------
+    dataset_object : h5py.Dataset
+        The HDF5 Dataset object to compute statistics for.
+
+    Returns
+    -------
+    statistics : dict or None
+        The minimum, maximum and mean of the dataset, under the keys "min",
+        "max" and "mean" (each None if the dataset has no finite values), or
+        None if the dataset is not of a real numeric type.
+
+    """
+    if not (np.issubdtype(dataset_object.dtype, np.integer) or np.issubdtype(dataset_object.dtype, np.floating)):
+        return None
+
+    minimum = maximum = None
+    total = 0.0
+    count = 0
+
+    for block in _iter_dataset_blocks(dataset_object):
+        block = np.asarray(block).ravel()
+
+        if np.issubdtype(block.dtype, np.floating):
+            block = block[np.isfinite(block)]
+
+        if block.size == 0:
+            continue
+
+        block_min, block_max = block.min().item(), block.max().item()
+
+        minimum = block_min if minimum is None else min(minimum, block_min)
+        maximum = block_max if maximum is None else max(maximum, block_max)
+        total += float(block.sum(dtype=np.float64))
+        count += block.size
+
+    return {'min': minimum, 'max': maximum, 'mean': total / count if count else None}
+
+
+def convert_h5py_dataset(dataset_object, max_dataset_bytes=None, dataset_statistics=False):
     """
     Converts an instance of h5.Dataset to a native Python type.
 
+    The contents of the dataset are read at most once. Datasets larger than
+    max_dataset_bytes are not read at all, and are instead returned as an
+    HDF5DatasetSummary.
+
     Parameters
     ----------
     dataset_object : h5py.Dataset
         The HDF5 Dataset object to convert.
+    max_dataset_bytes : int, optional
+        Size, in bytes, above which the dataset is summarized rather than
+        read. If not provided, the dataset is always read.
+    dataset_statistics : bool, optional
+        If True, the summary of a dataset over max_dataset_bytes includes the
+        minimum, maximum and mean of the dataset, computed in blocks.
 
     Returns
     -------
     result : object
-        The result of the conversion to native Python type.
+        The result of the conversion to native Python type, or an
+        HDF5DatasetSummary if the dataset exceeds max_dataset_bytes.
 
     """
-    if type(dataset_object[()]) is np.ndarray:  # pylint: disable=C0123
-        if isinstance(dataset_object[0], (bytes, np.bytes_)):
-            # decode bytes to str
-            result = dataset_object.asstr()[()]
-        else:
-            result = dataset_object[()]
-    elif isinstance(dataset_object[()], (bytes, np.bytes_)):
+    if max_dataset_bytes is not None and dataset_object.nbytes > max_dataset_bytes:
+        return HDF5DatasetSummary(
+            dataset_object.file.filename, dataset_object.name, dataset_object.shape, str(dataset_object.dtype),
+            statistics=get_dataset_statistics(dataset_object) if dataset_statistics else None
+        )
+
+    if h5py.check_string_dtype(dataset_object.dtype) is not None:
         # decode bytes to str
         result = dataset_object.asstr()[()]
     else:
@@ -145,6 +459,41 @@ def convert_h5py_dataset(dataset_object):
     return result
 
 
+def convert_h5py_attrs_to_dict(group_object, ignore_keys=None):
+    """
+    Returns the string-valued attributes of an h5py group (or dataset) object
+    as a python dict.
+
+    Parameters
+    ----------
+    group_object : h5py._hl.group.Group
+        h5py Group object to return the attributes of.
+    ignore_keys : iterable, optional
+        Attribute names to not include in the returned dict.
+
+    Returns
+    -------
+    group_dict : dict
+        Python dict containing the attributes of the group object. Byte
+        sequences are decoded to python strings, and attributes of any other
+        type are not included.
+
+    """
+    if ignore_keys is None:
+        ignore_keys = []
+
+    group_dict = dict()
+    for k, v in group_object.attrs.items():
+        if k in ignore_keys:
+            continue
+        if isinstance(v, str):
+            group_dict[k] = v
+        elif isinstance(v, np.bytes_):
+            group_dict[k] = v.decode("UTF-8")
+
+    return group_dict
+
+
 def get_hdf5_attrs_as_dict(file_name, group_path, ignore_keys=None):
     """
     Returns HDF5 group attributes as a python dict for a given file and group
@@ -171,26 +520,141 @@ def get_hdf5_attrs_as_dict(file_name, group_path, ignore_keys=None):
     RuntimeError
         If group_path is not able to be retrieved from the opened h5file
     """
-    if ignore_keys is None:
-        ignore_keys = []
+    return get_hdf5_metadata(file_name, attributes={group_path: (group_path, ignore_keys)})[group_path]
 
-    with h5py.File(file_name, "r") as h5file:
-        group_object = h5file.get(group_path)
 
-        if group_object is None:
-            raise RuntimeError(f"An error occurred retrieving object '{group_path}' "
-                               f"from file '{file_name}'.")
+def get_hdf5_fields(file_name, fields):
+    """
+    Returns the values of individual datasets from an HDF5 file, reading all
+    of them within a single open of the file.
 
-        group_dict = dict()
-        for k, v in group_object.attrs.items():
-            if k in ignore_keys:
-                continue
-            if isinstance(v, str):
-                group_dict[k] = v
-            elif isinstance(v, np.bytes_):
-                group_dict[k] = v.decode("UTF-8")
+    Unlike get_hdf5_metadata(), only the requested datasets are read, and
+    datasets absent from the file do not result in an error.
 
-    return group_dict
+    Parameters
+    ----------
+    file_name : str
+        File system path and filename for the HDF5 file to use.
+    fields : dict
+        Mapping of keys within the returned dict to the path of the dataset
+        to read for each.
+
+    Returns
+    -------
+    field_values : dict
+        Python dict containing the converted value of each requested dataset,
+        or None for datasets which could not be found.
+
+    """
+    field_values = {}
+
+    with h5py.File(file_name, 'r') as h5file:
+        for key, dataset_path in fields.items():
+            dataset_object = h5file.get(dataset_path)
+
+            field_values[key] = convert_h5py_dataset(dataset_object) \
+                if isinstance(dataset_object, h5py.Dataset) else None
+
+    return field_values
+
+
+def get_coordinate_range(dataset_object, assume_monotonic=False):
+    """
+    Returns the minimum and maximum of an h5py coordinate dataset.
+
+    One-dimensional coordinate vectors are typically monotonic, in which case
+    the range is given by the endpoints of the vector. Vectors small enough to
+    read as a single block are checked for monotonicity (a vectorized check
+    over the already-read values) before relying on their endpoints, while
+    only the endpoints are read when assume_monotonic is True. All other
+    datasets are reduced block by block, with each block aligned to the chunks
+    of the dataset (see get_dataset_statistics()).
+
+    Parameters
+    ----------
+    dataset_object : h5py.Dataset
+        The coordinate dataset.
+    assume_monotonic : bool, optional
+        If True, one-dimensional datasets are assumed to be monotonic, so only
+        their first and last values are read.
+
+    Returns
+    -------
+    coordinate_range : (float, float)
+        Tuple containing the minimum and maximum coordinate values. Non-finite
+        values are excluded.
+
+    """
+    if dataset_object.ndim == 1 and dataset_object.shape[0] > 0:
+        if assume_monotonic:
+            endpoints = (dataset_object[0].item(), dataset_object[-1].item())
+            return min(endpoints), max(endpoints)
+
+        if dataset_object.nbytes <= DATASET_BLOCK_BYTES:
+            values = dataset_object[()]
+            differences = np.diff(values)
+
+            if np.all(differences >= 0) or np.all(differences <= 0):
+                endpoints = (values[0].item(), values[-1].item())
+                return min(endpoints), max(endpoints)
+
+    statistics = get_dataset_statistics(dataset_object)
+
+    if statistics is None:
+        raise RuntimeError(f"Coordinate dataset '{dataset_object.name}' is not of a numeric type.")
+
+    return statistics['min'], statistics['max']
+
+
+def get_extents_from_coordinates(file_name, group_paths, longitude='longitude', latitude='latitude'):
+    """
+    Returns the spatial extent of any number of groups within the same HDF5
+    file, reading all of them within a single open of the file.
+
+    Parameters
+    ----------
+    file_name : str
+        File system path and filename for the HDF5 file to use.
+    group_paths : iterable of str
+        Group paths within the HDF5 file.
+    longitude : str
+        Name of longitude coordinate found in each group path.
+    latitude : str
+        Name of latitude coordinate found in each group path.
+
+    Returns
+    -------
+    extents : dict
+        Mapping of each group path to a tuple containing
+        (min_lon, max_lon, min_lat, max_lat).
+
+    Raises
+    -------
+    RuntimeError
+        If a group path is not able to be retrieved from the opened h5file
+    RuntimeError
+        If longitude variable is not contained within a group object.
+    RuntimeError
+        If latitude variable is not contained within a group object.
+    """
+    extents = {}
+
+    with h5py.File(file_name, 'r') as h5file:
+        for group_path in group_paths:
+            group_object = _get_hdf5_object(h5file, group_path)
+
+            if longitude not in group_object:
+                raise RuntimeError(f"An error occured retrieving variable '{longitude}'"
+                                   f"from group path '{group_path}' in file '{file_name}'.")
+            if latitude not in group_object:
+                raise RuntimeError(f"An error occured retrieving variable '{latitude}'"
+                                   f"from group path '{group_path}' in file '{file_name}'.")
+
+            extents[group_path] = (
+                get_coordinate_range(group_object[longitude]) + get_coordinate_range(group_object[latitude])
+            )
+
+    return extents
 
 
 def get_extent_from_coordinates(file_name, group_path, longitude='longitude', latitude='latitude'):
@@ -224,30 +688,10 @@ def get_extent_from_coordinates(file_name, group_path, longitude='longitude', la
     RuntimeError
         If latitude variable is not contained within the group object.
     """
-    with h5py.File(file_name, 'r') as h5file:
-        group_object = h5file.get(group_path)
-
-        if group_object is None:
-            raise RuntimeError(f"An error occurred retrieving object '{group_path}' "
-                            f"from file '{file_name}'.")
-        if longitude not in group_object:
-            raise RuntimeError(f"An error occured retrieving variable '{longitude}'"
-                            f"from group path '{group_path}' in file '{file_name}'.")
-        if latitude not in group_object:
-            raise RuntimeError(f"An error occured retrieving variable '{latitude}'"
-                            f"from group path '{group_path}' in file '{file_name}'.")
-
-        extent = (
-            min(group_object[longitude]),
-            max(group_object[longitude]),
-            min(group_object[latitude]),
-            max(group_object[latitude])
-        )
-
-        return extent
+    return get_extents_from_coordinates(file_name, [group_path], longitude, latitude)[group_path]
 
 
-def get_rtc_s1_product_metadata(file_name):
+def get_rtc_s1_product_metadata(file_name, max_dataset_bytes=DEFAULT_MAX_DATASET_BYTES):
     """
     Returns a python dict containing the RTC-S1 product_output metadata
     which will be used with the ISO metadata template.
@@ -256,6 +700,10 @@ def get_rtc_s1_product_metadata(file_name):
     ----------
     file_name : str
         the RTC-S1 product file to obtain metadata from.
+    max_dataset_bytes : int, optional
+        Size, in bytes, above which datasets are returned as an
+        HDF5DatasetSummary rather than read into memory. Defaults to
+        DEFAULT_MAX_DATASET_BYTES.
 
     Returns
     -------
@@ -263,14 +711,15 @@ def get_rtc_s1_product_metadata(file_name):
         python dict containing the HDF5 file metadata which is used in the
         ISO template.
     """
-    product_output = {
-        'data': get_hdf5_group_as_dict(file_name, f"{S1_SLC_HDF5_PREFIX}/data"),
-        'processingInformation': get_hdf5_group_as_dict(file_name,
-                                                        f"{S1_SLC_HDF5_PREFIX}/metadata/processingInformation"),
-        'orbit': get_hdf5_group_as_dict(file_name, f"{S1_SLC_HDF5_PREFIX}/metadata/orbit"),
-        'identification': get_hdf5_group_as_dict(file_name, f"{S1_SLC_HDF5_PREFIX}/identification")
+    product_groups = {
+        'data': f"{S1_SLC_HDF5_PREFIX}/data",
+        'processingInformation': f"{S1_SLC_HDF5_PREFIX}/metadata/processingInformation",
+        'orbit': f"{S1_SLC_HDF5_PREFIX}/metadata/orbit",
+        'identification': f"{S1_SLC_HDF5_PREFIX}/identification"
     }
 
+    product_output = get_hdf5_metadata(file_name, groups=product_groups, max_dataset_bytes=max_dataset_bytes)
+
     return product_output
 
 
@@ -404,7 +853,7 @@ def create_test_rtc_metadata_product(file_path):
                                                                       data=b'2018-05-04T10:45:08.436445')
 
 
-def get_cslc_s1_product_metadata(file_name):
+def get_cslc_s1_product_metadata(file_name, max_dataset_bytes=DEFAULT_MAX_DATASET_BYTES):
     """
     Returns a python dict containing the CSLC S1 metadata
     which will be used with the ISO metadata template.
@@ -413,6 +862,10 @@ def get_cslc_s1_product_metadata(file_name):
     ----------
     file_name : str
         the CSLC S1 metadata file.
+    max_dataset_bytes : int, optional
+        Size, in bytes, above which datasets are returned as an
+        HDF5DatasetSummary rather than read into memory. Defaults to
+        DEFAULT_MAX_DATASET_BYTES.
 
     Returns
     -------
@@ -428,20 +881,49 @@ def get_cslc_s1_product_metadata(file_name):
         'los_east', 'los_north',
         'VV', 'VH', 'HH', 'HV'
     ]
-    cslc_metadata = {
-        'identification': get_hdf5_group_as_dict(file_name, f"{S1_SLC_HDF5_PREFIX}/identification"),
-        'data': get_hdf5_group_as_dict(file_name, f"{S1_SLC_HDF5_PREFIX}/data", cslc_ignore_list),
-        'processing_information': get_hdf5_group_as_dict(
-            file_name,
-            f"{S1_SLC_HDF5_PREFIX}/metadata/processing_information"
-        ),
-        'orbit': get_hdf5_group_as_dict(file_name, f"{S1_SLC_HDF5_PREFIX}/metadata/orbit"),
-        'quality_assurance': get_hdf5_group_as_dict(file_name, f"{S1_SLC_HDF5_PREFIX}/quality_assurance")
+    cslc_groups = {
+        'identification': f"{S1_SLC_HDF5_PREFIX}/identification",
+        'data': (f"{S1_SLC_HDF5_PREFIX}/data", cslc_ignore_list),
+        'processing_information': f"{S1_SLC_HDF5_PREFIX}/metadata/processing_information",
+        'orbit': f"{S1_SLC_HDF5_PREFIX}/metadata/orbit",
+        'quality_assurance': f"{S1_SLC_HDF5_PREFIX}/quality_assurance"
     }
 
+    cslc_metadata = get_hdf5_metadata(file_name, groups=cslc_groups, max_dataset_bytes=max_dataset_bytes)
+
     return cslc_metadata
 
 
+CSLC_S1_INPUT_METADATA_FIELDS = {
+    'burst_id': f"{S1_SLC_HDF5_PREFIX}/identification/burst_id",
+    'polarization': f"{S1_SLC_HDF5_PREFIX}/metadata/processing_information/input_burst_metadata/polarization",
+    'zero_doppler_start_time': f"{S1_SLC_HDF5_PREFIX}/identification/zero_doppler_start_time",
+    'zero_doppler_end_time': f"{S1_SLC_HDF5_PREFIX}/identification/zero_doppler_end_time",
+    'platform': f"{S1_SLC_HDF5_PREFIX}/identification/mission_id"
+}
+"""Datasets read from CSLC-S1 products consumed as inputs by other PGEs, such as DISP-S1"""
+
+
+def get_cslc_s1_input_metadata(file_name):
+    """
+    Returns a python dict containing the small subset of CSLC-S1 metadata
+    needed by PGEs which consume CSLC-S1 products as inputs: the burst ID,
+    polarization, sensing times and platform.
+
+    Parameters
+    ----------
+    file_name : str
+        the CSLC S1 product file.
+
+    Returns
+    -------
+    input_metadata : dict
+        python dict containing each of the fields of CSLC_S1_INPUT_METADATA_FIELDS,
+        with None for any field not found within the product.
+    """
+    return get_hdf5_fields(file_name, CSLC_S1_INPUT_METADATA_FIELDS)
+
+
 def create_test_cslc_metadata_product(file_path):
     # pylint: disable=unused-variable,invalid-name,too-many-locals,too-many-statements,too-many-boolean-expressions
     """
@@ -645,7 +1127,7 @@ def create_test_cslc_metadata_product(file_path):
         std_dest = local_incidence_angle_grp.create_dataset('std', data=3.5223963260650635, dtype='float64')
 
 
-def get_disp_s1_product_metadata(file_name, **extra_groups):
+def get_disp_s1_product_metadata(file_name, max_dataset_bytes=DEFAULT_MAX_DATASET_BYTES, **extra_groups):
     """
     Returns a python dict containing the DISP S1 metadata
     which will be used with the ISO metadata template.
@@ -654,6 +1136,10 @@ def get_disp_s1_product_metadata(file_name, **extra_groups):
     ----------
     file_name : str
         the DISP S1 metadata file.
+    max_dataset_bytes : int, optional
+        Size, in bytes, above which datasets are returned as an
+        HDF5DatasetSummary rather than read into memory. Defaults to
+        DEFAULT_MAX_DATASET_BYTES.
     extra_groups:
         kwargs for mapping additional HDF5 groups into the metadata dict.
         Should only be used in development versions of the PGE if SAS outputs
@@ -671,18 +1157,20 @@ def get_disp_s1_product_metadata(file_name, **extra_groups):
     ValueError
         If any of the kwargs keys are one of 'x', 'y', 'identification', or 'metadata'
     """
-    disp_metadata = {
-        'x': get_hdf5_group_as_dict(file_name, "/x"),
-        'y': get_hdf5_group_as_dict(file_name, "/y"),
-        'identification': get_hdf5_group_as_dict(file_name, "/identification"),
-        'metadata': get_hdf5_group_as_dict(file_name, "/metadata")
+    disp_groups = {
+        'x': "/x",
+        'y': "/y",
+        'identification': "/identification",
+        'metadata': "/metadata"
     }
 
     for extra_group in extra_groups:
-        if extra_group in disp_metadata:
+        if extra_group in disp_groups:
             raise ValueError("Repeated extra group")
 
-        disp_metadata[extra_group] = get_hdf5_group_as_dict(file_name, extra_groups[extra_group])
+        disp_groups[extra_group] = extra_groups[extra_group]
+
+    disp_metadata = get_hdf5_metadata(file_name, groups=disp_groups, max_dataset_bytes=max_dataset_bytes)
 
     return disp_metadata
 
@@ -1250,7 +1738,7 @@ def get_tropo_product_metadata(file_name):
         python dict containing the HDF5 file metadata which is used in the
         ISO template.
     """
-    tropo_metadata = get_hdf5_attrs_as_dict(file_name, "/")
+    tropo_metadata = get_hdf5_metadata(file_name, attributes={'global': "/"})['global']
     return tropo_metadata
 
 
@@ -1301,7 +1789,7 @@ def create_test_tropo_metadata_product(file_path):
         latitude_dset = outfile.create_dataset("latitude", data=lat_data, dtype='float64')
 
 
-def get_cal_disp_product_metadata(file_name, **extra_groups):
+def get_cal_disp_product_metadata(file_name, max_dataset_bytes=DEFAULT_MAX_DATASET_BYTES, **extra_groups):
     """
     Returns a python dict containing the CAL-DISP metadata
     which will be used with the ISO metadata template.
@@ -1313,6 +1801,10 @@ def get_cal_disp_product_metadata(file_name, **extra_groups):
     ----------
     file_name : str
         the CAL-DISP metadata file.
+    max_dataset_bytes : int, optional
+        Size, in bytes, above which datasets are returned as an
+        HDF5DatasetSummary rather than read into memory. Defaults to
+        DEFAULT_MAX_DATASET_BYTES.
     extra_groups:
         kwargs for mapping additional HDF5 groups into the metadata dict.
         Should only be used in development versions of the PGE if SAS outputs
@@ -1330,7 +1822,7 @@ def get_cal_disp_product_metadata(file_name, **extra_groups):
     ValueError
         If any of the kwargs keys are one of 'x', 'y', 'identification', or 'metadata'
     """
-    return get_disp_s1_product_metadata(file_name, **extra_groups)
+    return get_disp_s1_product_metadata(file_name, max_dataset_bytes=max_dataset_bytes, **extra_groups)
 
 
 def create_test_cal_disp_metadata_product(file_path):
@@ -15,6 +15,7 @@ from os.path import abspath, exists, getsize, isdir, isfile, join, splitext
 import yamale
 
 from opera.util.error_codes import ErrorCode
+from opera.util.schema_cache import get_schema
 
 
 def check_input(input_object, logger, name, valid_extensions=None,
@@ -594,7 +595,7 @@ def validate_algorithm_parameters_config(name, algorithm_parameters_schema_file_
 
     if isfile(algorithm_parameters_schema_file_path):
         # Load the 'algorithm parameters' schema
-        algorithm_parameters_schema = yamale.make_schema(algorithm_parameters_schema_file_path)
+        algorithm_parameters_schema = get_schema(algorithm_parameters_schema_file_path)
     else:
         raise RuntimeError(
             f'Schema error: Could not validate algorithm_parameters schema file.  '
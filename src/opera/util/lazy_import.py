@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+"""
+==============
+lazy_import.py
+==============
+
+Deferred import of the heavy dependencies used by OPERA PGE utilities.
+
+Libraries such as h5py, numpy, GDAL and jinja2 take a significant amount of
+time to import, yet many code paths of a PGE never use them. Modules may
+instead bind the name of such a dependency to a LazyImport, which performs
+the import (including any fallback to a mock implementation) the first time
+the dependency is actually used.
+
+"""
+
+import threading
+
+
+class LazyImport:
+    """
+    Proxy for a module, class or function which is only imported on first use.
+
+    Attribute access and calls on the proxy are forwarded to the imported
+    object. Since the proxy is bound as a module-level name, it may still be
+    replaced with unittest.mock.patch.object() as if it were the dependency
+    itself.
+
+    """
+
+    def __init__(self, loader, name=None):
+        """
+        Initializes the proxy without performing the import.
+
+        Parameters
+        ----------
+        loader : callable
+            Function taking no arguments, which performs the import and
+            returns the imported object (or a fallback implementation if the
+            import fails).
+        name : str, optional
+            Name of the deferred dependency, used when representing the proxy.
+            Defaults to the name of the loader function.
+
+        """
+        object.__setattr__(self, '_loader', loader)
+        object.__setattr__(self, '_name', name or loader.__name__)
+        object.__setattr__(self, '_target', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _load(self):
+        """Returns the imported object, performing the import on the first call"""
+        target = object.__getattribute__(self, '_target')
+
+        if target is None:
+            with object.__getattribute__(self, '_lock'):
+                target = object.__getattribute__(self, '_target')
+
+                if target is None:
+                    target = object.__getattribute__(self, '_loader')()
+                    object.__setattr__(self, '_target', target)
+
+        return target
+
+    @property
+    def is_loaded(self):
+        """Returns True if the deferred import has been performed"""
+        return object.__getattribute__(self, '_target') is not None
+
+    def __getattr__(self, name):
+        """Returns the named attribute of the imported object"""
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        """Sets the named attribute of the imported object"""
+        setattr(self._load(), name, value)
+
+    def __call__(self, *args, **kwargs):
+        """Calls the imported object with the provided arguments"""
+        return self._load()(*args, **kwargs)
+
+    def __dir__(self):
+        """Returns the attributes of the imported object"""
+        return dir(self._load())
+
+    def __repr__(self):
+        """Returns the representation of the imported object, or of the proxy if not yet imported"""
+        if self.is_loaded:
+            return repr(self._load())
+
+        return f'<lazy import of {object.__getattribute__(self, "_name")}>'
@@ -12,17 +12,25 @@ Original Authors: Alice Stanboli, David White
 Adapted By: Scott Collins, Jim Hofman
 
 """
+import contextlib
 import datetime
+import functools
 import inspect
+import io
+import os
+import re
 import shutil
+import tempfile
+import threading
 import time
 from io import StringIO
-from os.path import basename, isfile
+from os.path import abspath, basename, dirname, isfile
 
 import opera.util.time as time_util
 from opera.util import error_codes
 
 from .error_codes import ERROR_CODE_PGE_OFFSET, ErrorCode
+from .metrics_export import get_metrics_filename, write_metrics
 from .time import get_iso_time
 from .usage_metrics import get_os_metrics
 
@@ -32,6 +40,35 @@ WARNING = "Warning"
 CRITICAL = "Critical"
 """Constants for logging levels"""
 
+LOG_MEMORY_LIMIT_ENV_VAR = "OPERA_PGE_LOG_MEMORY_LIMIT"
+"""Environment variable which may be used to set the number of characters of a log kept in memory"""
+
+DEFAULT_LOG_MEMORY_LIMIT = 2 ** 23
+"""Default number of characters of a log kept in memory, before the log is written through to disk"""
+
+APPEND_BATCH_SIZE = 2 ** 12
+"""Number of appended lines formatted before they are written to the log stream as a single chunk"""
+
+LOGGED_LINE_ERROR_CODES = {
+    DEBUG: ErrorCode.LOGGED_DEBUG_LINE,
+    INFO: ErrorCode.LOGGED_INFO_LINE,
+    WARNING: ErrorCode.LOGGED_WARNING_LINE,
+    CRITICAL: ErrorCode.LOGGED_CRITICAL_LINE
+}
+"""Error code offsets assigned to lines appended from another log, by severity"""
+
+_CANONICAL_LOG_LINE_PATTERN = re.compile(
+    r'\s*(?P<date>[0-9]{4}-[0-9]{2}-[0-9]{2})[T ]'
+    r'(?P<time>(?:[01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9])(?:\.(?P<fraction>[0-9]{6}|[0-9]{3}))?\s*,'
+    r'(?P<severity>[^,]*),(?P<workflow>[^,]*),(?P<module>[^,]*),[^,]*,(?P<location>[^,]*),(?P<description>.*)',
+    re.DOTALL
+)
+"""
+Matches log lines in the formatting style for OPERA, with a naive time tag
+in one of the forms produced by datetime.isoformat(), which may be converted
+to the expected ISO format without parsing (see PgeLogger.append_lines())
+"""
+
 # pylint: disable=too-many-positional-arguments
 
 
@@ -42,7 +79,7 @@ def write(log_stream, severity, workflow, module, error_code, error_location,
 
     Parameters
     ----------
-    log_stream : io.StringIO
+    log_stream : io.StringIO or SpooledLogStream
         The log stream to write to.
     severity : str
         The severity level of the log message.
@@ -64,10 +101,40 @@ def write(log_stream, severity, workflow, module, error_code, error_location,
     if not time_tag:
         time_tag = time_util.get_current_iso_time()
 
-    message_str = f'{time_tag}, {severity}, {workflow}, {module}, ' \
-                  f'{str(error_code)}, {error_location}, "{description}"\n'
+    log_stream.write(format_message(severity, workflow, module, error_code,
+                                    error_location, description, time_tag))
 
-    log_stream.write(message_str)
+
+def format_message(severity, workflow, module, error_code, error_location,
+                   description, time_tag):
+    """
+    Formats a single log message, as written by write().
+
+    Parameters
+    ----------
+    severity : str
+        The severity level of the log message.
+    workflow : str
+        Name of the workflow where the logging took place.
+    module : str
+        Name of the module where the logging took place.
+    error_code : int or ErrorCode
+        The error code associated with the logged message.
+    error_location : str
+        File name and line number where the logging took place.
+    description : str
+        Description of the logged event.
+    time_tag : str
+        ISO format time tag to associate to the message.
+
+    Returns
+    -------
+    message_str : str
+        The formatted log message, including the trailing newline.
+
+    """
+    return f'{time_tag}, {severity}, {workflow}, {module}, ' \
+           f'{str(error_code)}, {error_location}, "{description}"\n'
 
 
 def default_log_file_name():
@@ -122,6 +189,56 @@ def get_severity_from_error_code(error_code):
     return CRITICAL
 
 
+_CRITICAL_DEFERRAL = threading.local()
+"""Per-thread state of defer_critical()"""
+
+
+class DeferredCriticalError(RuntimeError):
+    """
+    Raised by PgeLogger.critical() in place of logging a critical error, when
+    called from within defer_critical(). Retains the arguments provided to
+    critical(), so the error may be logged later from another thread.
+    """
+
+    def __init__(self, module, error_code_offset, description):
+        super().__init__(description)
+
+        self.module = module
+        self.error_code_offset = error_code_offset
+        self.description = description
+
+
+@contextlib.contextmanager
+def defer_critical():
+    """
+    Context manager within which calls to PgeLogger.critical() from the
+    current thread only raise a DeferredCriticalError, rather than logging
+    the error and closing the log.
+
+    Worker threads sharing a logger use this so that a failure in one worker
+    does not close the log while other workers are still writing to it. The
+    thread which owns the log is then responsible for reporting the error.
+    """
+    previously_deferred = getattr(_CRITICAL_DEFERRAL, 'deferred', False)
+    _CRITICAL_DEFERRAL.deferred = True
+
+    try:
+        yield
+    finally:
+        _CRITICAL_DEFERRAL.deferred = previously_deferred
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_valid_date(date_str):
+    """Returns True if the provided YYYY-MM-DD string refers to a valid calendar date"""
+    try:
+        datetime.date.fromisoformat(date_str)
+    except ValueError:
+        return False
+
+    return True
+
+
 def standardize_severity_string(severity):
     """
     Returns the severity string in a consistent way.
@@ -149,6 +266,216 @@ def standardize_severity_string(severity):
     return severity
 
 
+@functools.lru_cache(maxsize=64)
+def _standardize_logged_line_severity(severity):
+    """Returns the standardized form of the severity string of a line appended by PgeLogger.append_lines()"""
+    return standardize_severity_string(severity)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_logged_line_error_codes(error_code_base):
+    """
+    Returns the error codes (as strings) assigned by severity to lines appended
+    by PgeLogger.append_lines(), so they are formatted once per error code base,
+    rather than once per call.
+    """
+    return {severity: str(error_code_base + error_code_offset)
+            for severity, error_code_offset in LOGGED_LINE_ERROR_CODES.items()}
+
+
+class SpooledLogStream(StringIO):
+    """
+    Text stream used to accumulate the contents of a log.
+
+    The log is kept in memory until its size exceeds a limit, after which its
+    contents are written to a scratch file, alongside the log file, and all
+    subsequent messages are written through to that file. This bounds the
+    memory used by the log, and means a log spilled to disk survives a crash
+    of the PGE process (as a hidden ".partial" file, so it is not mistaken
+    for an output product). Once complete, the log is saved to its final
+    location by renaming the scratch file, rather than copying its contents.
+
+    While in memory, the log behaves exactly as an io.StringIO. Once spilled
+    to disk, reads (including getvalue()) are served from the scratch file.
+    Messages are always appended to the end of the log, regardless of any
+    reads performed in between.
+
+    """
+
+    def __init__(self, log_filename, max_memory_size=None):
+        """
+        Parameters
+        ----------
+        log_filename : str
+            Path to the log file on disk. The scratch file is created in the
+            same directory, at the time the log is spilled to disk.
+        max_memory_size : int, optional
+            Number of characters of the log to keep in memory. If not provided,
+            the value of the OPERA_PGE_LOG_MEMORY_LIMIT environment variable is
+            used, if set. Otherwise, defaults to DEFAULT_LOG_MEMORY_LIMIT.
+
+        """
+        super().__init__()
+
+        if max_memory_size is None:
+            max_memory_size = int(os.environ.get(LOG_MEMORY_LIMIT_ENV_VAR, DEFAULT_LOG_MEMORY_LIMIT))
+
+        self.log_filename = log_filename
+        self.max_memory_size = max_memory_size
+        self.spill_filename = None
+
+        self._spill_file = None
+        self._memory_size = 0
+        self._at_end = True
+
+    @property
+    def spilled(self):
+        """Returns True if the contents of the log have been written through to disk"""
+        return self._spill_file is not None
+
+    def _spill(self):
+        """Moves the contents of the log from memory to a scratch file on disk"""
+        spill_file_kwargs = {
+            'mode': 'w+',
+            'encoding': 'utf-8',
+            'prefix': f'.{basename(self.log_filename)}.',
+            'suffix': '.partial',
+            'delete': False
+        }
+
+        # The scratch file is owned by this stream, which closes it once
+        # saved or closed itself, so it cannot be opened within a "with"
+        # pylint: disable=consider-using-with
+        try:
+            spill_file = tempfile.NamedTemporaryFile(dir=dirname(abspath(self.log_filename)), **spill_file_kwargs)
+        except OSError:
+            # The directory for the log may not have been created yet
+            spill_file = tempfile.NamedTemporaryFile(**spill_file_kwargs)
+
+        spill_file.write(super().getvalue())
+
+        # Release the in-memory contents
+        super().seek(0)
+        super().truncate()
+
+        self._spill_file = spill_file
+        self.spill_filename = spill_file.name
+        self._at_end = True
+
+    def write(self, s):
+        """Appends the provided text to the log, returning the number of characters written"""
+        stream = self._spill_file if self.spilled else super()
+
+        if not self._at_end:
+            stream.seek(0, io.SEEK_END)
+            self._at_end = True
+
+        written = stream.write(s)
+
+        if not self.spilled:
+            self._memory_size += len(s)
+
+            if self._memory_size > self.max_memory_size:
+                self._spill()
+
+        return written
+
+    def flush(self):
+        """Flushes any buffered writes to the scratch file, if the log has been spilled to disk"""
+        if self.spilled:
+            self._spill_file.flush()
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        """Changes the position that the log is read from"""
+        self._at_end = False
+
+        return self._spill_file.seek(pos, whence) if self.spilled else super().seek(pos, whence)
+
+    def tell(self):
+        """Returns the position that the log is read from"""
+        return self._spill_file.tell() if self.spilled else super().tell()
+
+    def read(self, size=-1):
+        """Reads from the log at the current position"""
+        self._at_end = False
+
+        return self._spill_file.read(size) if self.spilled else super().read(size)
+
+    def readline(self, size=-1):
+        """Reads a single line from the log at the current position"""
+        self._at_end = False
+
+        return self._spill_file.readline(size) if self.spilled else super().readline(size)
+
+    def readlines(self, hint=-1):
+        """Reads the remaining lines from the log at the current position"""
+        self._at_end = False
+
+        return self._spill_file.readlines(hint) if self.spilled else super().readlines(hint)
+
+    def __iter__(self):
+        """Iterates over the remaining lines of the log from the current position"""
+        return iter(self.readline, '')
+
+    def __next__(self):
+        """Returns the next line of the log from the current position"""
+        line = self.readline()
+
+        if not line:
+            raise StopIteration
+
+        return line
+
+    def getvalue(self):
+        """Returns the entire contents of the log"""
+        if not self.spilled:
+            return super().getvalue()
+
+        position = self._spill_file.tell()
+
+        self._spill_file.seek(0)
+        value = self._spill_file.read()
+        self._spill_file.seek(position)
+
+        return value
+
+    def save(self, filename=None):
+        """
+        Writes the contents of the log to its file on disk. If the log has
+        been spilled to disk, the scratch file is closed, then renamed (or, if
+        necessary, moved) to the log file.
+
+        Parameters
+        ----------
+        filename : str, optional
+            Path to write the log to. Defaults to the log file name provided
+            to this stream.
+
+        """
+        filename = filename or self.log_filename
+
+        if self.spilled:
+            self._spill_file.close()
+            shutil.move(self.spill_filename, filename)
+
+            self._spill_file = None
+            self.spill_filename = None
+
+            # The in-memory buffer was emptied when spilled, so account for
+            # it as such, lest the next write spill to disk again at once
+            self._memory_size = 0
+        else:
+            with open(filename, 'w', encoding='utf-8') as outfile:
+                outfile.write(super().getvalue())
+
+    def close(self):
+        """Closes the stream. Any scratch file not yet saved is left in place."""
+        if self.spilled:
+            self._spill_file.close()
+
+        super().close()
+
+
 class PgeLogger:
     """
     Class to help with the PGE logging.
@@ -186,9 +513,13 @@ class PgeLogger:
         if not log_filename:
             self.log_filename = default_log_file_name()
 
-        # open as an empty stream that will be kept in memory
-        self.log_stream = StringIO()
-        self.log_stream.seek(0)
+        # open as an empty stream that will be kept in memory, until it grows
+        # large enough to be written through to disk
+        self.log_stream = SpooledLogStream(self.log_filename)
+
+        # Serializes messages written from multiple threads, such as the
+        # workers used to collect product metadata concurrently
+        self._write_lock = threading.RLock()
 
         self._workflow = (workflow
                           if workflow else f"pge_init::{basename(__file__)}")
@@ -196,6 +527,16 @@ class PgeLogger:
         self._error_code_base = (error_code_base
                                  if error_code_base else PgeLogger.LOGGER_CODE_BASE)
 
+        # Values of each metric logged via log_one_metric(), keyed by metric name
+        self.metrics = {}
+
+        # Formats to export logged metrics in when the log is closed, the
+        # labels to apply to exported metrics, and the directory to write them
+        # to (defaults to the directory containing the log file)
+        self.metrics_export_formats = []
+        self.metrics_labels = {}
+        self.metrics_export_dir = None
+
     @property
     def workflow(self):
         """Return specific workflow"""
@@ -223,12 +564,9 @@ class PgeLogger:
         """
         if self.log_stream and not self.log_stream.closed:
             self.write_log_summary()
+            self.export_metrics()
 
-            self.log_stream.seek(0)
-
-            with open(self.log_filename, 'w', encoding='utf-8') as outfile:
-                shutil.copyfileobj(self.log_stream, outfile)
-
+            self.log_stream.save(self.log_filename)
             self.log_stream.close()
 
     def get_log_count_by_severity(self, severity):
@@ -312,7 +650,6 @@ class PgeLogger:
 
         """
         severity = standardize_severity_string(severity)
-        self.increment_log_count_by_severity(severity)
 
         caller = inspect.currentframe().f_back
 
@@ -329,10 +666,13 @@ class PgeLogger:
             for string in description:
                 log_lines.extend(string.splitlines())
 
-        for log_line in log_lines:
-            write(self.log_stream, severity, self.workflow, module,
-                  self.error_code_base + error_code_offset,
-                  location, log_line)
+        with self._write_lock:
+            self.increment_log_count_by_severity(severity)
+
+            for log_line in log_lines:
+                write(self.log_stream, severity, self.workflow, module,
+                      self.error_code_base + error_code_offset,
+                      location, log_line)
 
     def info(self, module, error_code_offset, description):
         """
@@ -416,8 +756,14 @@ class PgeLogger:
         RuntimeError
             Raised when this method is called. The contents of the description
             parameter is provided as the exception string.
+        DeferredCriticalError
+            Raised in place of a RuntimeError, without writing to the log, when
+            called from within defer_critical().
 
         """
+        if getattr(_CRITICAL_DEFERRAL, 'deferred', False):
+            raise DeferredCriticalError(module, error_code_offset, description)
+
         self.write(CRITICAL, module, error_code_offset, description,
                    additional_back_frames=1)
 
@@ -470,9 +816,10 @@ class PgeLogger:
 
         """
         self.log_filename = new_filename
+        self.log_stream.log_filename = new_filename
 
     def get_stream_object(self):
-        """Return the stingIO object for the current log."""
+        """Return the stream object (see SpooledLogStream) for the current log."""
         return self.log_stream
 
     def get_file_name(self):
@@ -497,17 +844,88 @@ class PgeLogger:
         else:
             source_contents = source.strip()
 
-        # Parse the contents to append to see if they conform to the expected log
-        # formatting for OPERA
-        for log_line in source_contents.split('\n'):
-            try:
-                parsed_line = self.parse_line(log_line)
-                write(self.log_stream, *parsed_line)
-                severity = parsed_line[0]
-                self.increment_log_count_by_severity(severity)
-            # If the line does not conform to the expected formatting, just append as-is
-            except ValueError:
-                self.log_stream.write(log_line + "\n")
+        self.append_lines(source_contents.split('\n'))
+
+    def append_lines(self, log_lines):
+        """
+        Appends individual lines of text to this log file.
+
+        Unlike append(), the provided lines are never interpreted as a file
+        name, making this method suitable for appending output as it is
+        streamed from another process.
+
+        Parameters
+        ----------
+        log_lines : Iterable[str]
+            The lines to append, without trailing newlines. Lines conforming
+            to the expected log formatting for OPERA are standardized, all
+            others are appended as is.
+
+        """
+        error_code_strs = _get_logged_line_error_codes(self.error_code_base)
+
+        formatted_lines = []
+        log_counts = dict.fromkeys(error_code_strs, 0)
+
+        for log_line in log_lines:
+            match = _CANONICAL_LOG_LINE_PATTERN.fullmatch(log_line)
+
+            # Fast path for lines in the formatting style for OPERA with a
+            # naive time tag, which can be converted to the expected ISO format
+            # as-is. This is equivalent to, but much faster than, parse_line().
+            if match is not None and _is_valid_date(match['date']):
+                (date, time_of_day, fraction, severity,
+                 workflow, module, error_location, description) = match.groups()
+
+                severity = _standardize_logged_line_severity(severity)
+
+                if severity in error_code_strs:
+                    formatted_lines.append(format_message(
+                        severity, workflow.strip(), module.strip(),
+                        error_code_strs[severity], error_location.strip(),
+                        description.strip().strip('"').strip("'").replace('"', "'"),
+                        f"{date}T{time_of_day}.{fraction or '':0<6}Z"
+                    ))
+                    log_counts[severity] += 1
+                else:
+                    # Unrecognized severity levels are appended as-is
+                    formatted_lines.append(log_line + "\n")
+            # Lines with fewer than the expected number of fields can never be
+            # parsed, so are appended as-is without attempting to do so
+            elif log_line.count(',') >= 6:
+                try:
+                    parsed_line = self.parse_line(log_line)
+                    formatted_lines.append(format_message(*parsed_line))
+                    log_counts[parsed_line[0]] += 1
+                # If the line does not conform to the expected formatting, just append as-is
+                except ValueError:
+                    formatted_lines.append(log_line + "\n")
+            else:
+                formatted_lines.append(log_line + "\n")
+
+            if len(formatted_lines) >= APPEND_BATCH_SIZE:
+                self._write_appended_lines(formatted_lines, log_counts)
+
+        self._write_appended_lines(formatted_lines, log_counts)
+
+    def _write_appended_lines(self, formatted_lines, log_counts):
+        """
+        Writes a batch of lines formatted by append_lines() to the log stream
+        as a single chunk, then clears the batch and its log counts.
+        """
+        if not formatted_lines:
+            return
+
+        with self._write_lock:
+            self.log_stream.write(''.join(formatted_lines))
+
+            for severity, log_count in log_counts.items():
+                self.log_count_by_severity[severity] += log_count
+
+        formatted_lines.clear()
+
+        for severity in log_counts:
+            log_counts[severity] = 0
 
     def parse_line(self, line):
         """
@@ -560,12 +978,7 @@ class PgeLogger:
             description = description.replace('"', "'")
 
             # Map the error code based on message severity
-            error_code = {
-                DEBUG: ErrorCode.LOGGED_DEBUG_LINE,
-                INFO: ErrorCode.LOGGED_INFO_LINE,
-                WARNING: ErrorCode.LOGGED_WARNING_LINE,
-                CRITICAL: ErrorCode.LOGGED_CRITICAL_LINE
-            }[severity]
+            error_code = LOGGED_LINE_ERROR_CODES[severity]
 
             # Add the error code base
             error_code += self.error_code_base
@@ -600,6 +1013,29 @@ class PgeLogger:
         self.log(module, ErrorCode.SUMMARY_STATS_MESSAGE, msg,
                  additional_back_frames=additional_back_frames + 1)
 
+        self.metrics[metric_name] = metric_value
+
+    def export_metrics(self):
+        """
+        Writes all metrics logged thus far to disk, in each of the formats
+        requested by metrics_export_formats, alongside the log file (or within
+        metrics_export_dir, if set).
+
+        Failure to write a metrics file is logged as a warning, rather than
+        preventing the log itself from being written.
+
+        """
+        for export_format in self.metrics_export_formats:
+            metrics_filename = get_metrics_filename(
+                self.log_filename, export_format, self.metrics_export_dir
+            )
+
+            try:
+                write_metrics(metrics_filename, export_format, self.metrics, self.metrics_labels)
+            except (OSError, ValueError) as err:
+                self.warning("PgeLogger", ErrorCode.METRICS_EXPORT_FAILED,
+                             f"Failed to export metrics to {metrics_filename}, reason: {str(err)}")
+
     def write_log_summary(self):
         """
         Writes a summary at the end of the log file, which includes totals
@@ -15,10 +15,20 @@ Adapted By: Jim Hofman
 
 import json
 import os
+from importlib.resources import files
 
-import jsonschema
+from opera.util.lazy_import import LazyImport
 
-from importlib.resources import files
+
+def _import_jsonschema():
+    """Deferred import of jsonschema"""
+    import jsonschema as _jsonschema  # pylint: disable=import-outside-toplevel
+
+    return _jsonschema
+
+
+# jsonschema is only imported once catalog metadata is first validated
+jsonschema = LazyImport(_import_jsonschema, 'jsonschema')  # pylint: disable=invalid-name
 
 
 class MetFile:
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+
+"""
+=================
+metrics_export.py
+=================
+
+Export of the metrics logged by OPERA PGEs to machine-readable files.
+
+Metrics may be exported in the OpenMetrics text format, suitable for
+collection by the Prometheus node exporter textfile collector, or as JSON.
+
+"""
+
+import json
+import math
+import os
+import re
+from numbers import Number
+
+OPENMETRICS_FORMAT = "openmetrics"
+JSON_FORMAT = "json"
+"""Constants for the supported metrics export formats"""
+
+METRICS_EXPORT_FORMATS = (OPENMETRICS_FORMAT, JSON_FORMAT)
+"""All supported metrics export formats"""
+
+METRIC_NAME_PREFIX = "opera_pge_"
+"""Prefix applied to the name of each metric exported in OpenMetrics format"""
+
+LABELLED_METRIC_PATTERNS = (
+    (re.compile(r'^stage\.(?P<stage>.+)\.(?P<metric>elapsed_seconds|cpu_seconds)$'), 'stage_{metric}'),
+    (re.compile(r'^overall\.log_messages\.(?P<severity>\w+)$'), 'log_messages'),
+)
+"""
+Patterns matching logged metric names which embed a label value, and the
+template of the metric family name each is exported under. Named groups
+other than "metric" are exported as labels.
+"""
+
+
+def _sanitize_metric_name(metric_name):
+    """Converts a logged metric name to a valid OpenMetrics metric name"""
+    return METRIC_NAME_PREFIX + re.sub(r'[^a-zA-Z0-9_:]', '_', metric_name)
+
+
+def _escape_label_value(label_value):
+    """Escapes a label value for use within the OpenMetrics text format"""
+    return str(label_value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _to_number(metric_value):
+    """Returns the provided metric value as a number, or None if it is not numeric"""
+    if isinstance(metric_value, bool):
+        return int(metric_value)
+
+    if isinstance(metric_value, Number):
+        return metric_value
+
+    try:
+        return float(metric_value)
+    except (TypeError, ValueError):
+        return None
+
+
+def format_openmetrics(metrics, labels=None):
+    """
+    Formats logged metrics in the OpenMetrics text exposition format.
+
+    Each metric is exported as a gauge, with the provided labels applied to
+    every sample. Metrics whose logged names embed a label value, such as
+    per-stage timings and per-severity log message counts, are exported as
+    a single family with an additional label. Non-numeric metrics are omitted.
+
+    Parameters
+    ----------
+    metrics : dict
+        Mapping of logged metric names to values.
+    labels : dict, optional
+        Labels to apply to every exported sample.
+
+    Returns
+    -------
+    openmetrics_text : str
+        The formatted metrics, terminated by the required "# EOF" line.
+
+    """
+    families = {}
+
+    for metric_name, metric_value in metrics.items():
+        value = _to_number(metric_value)
+
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            continue
+
+        sample_labels = dict(labels or {})
+        family_name = metric_name
+
+        for pattern, family_template in LABELLED_METRIC_PATTERNS:
+            match = pattern.match(metric_name)
+
+            if match:
+                groups = match.groupdict()
+                family_name = family_template.format(**groups)
+                sample_labels.update({key: group for key, group in groups.items() if key != 'metric'})
+                break
+
+        families.setdefault(_sanitize_metric_name(family_name), []).append((sample_labels, value))
+
+    lines = []
+
+    for family_name, samples in families.items():
+        lines.append(f'# TYPE {family_name} gauge')
+
+        for sample_labels, value in samples:
+            label_text = ','.join(f'{key}="{_escape_label_value(label_value)}"'
+                                  for key, label_value in sample_labels.items())
+            lines.append(f'{family_name}{{{label_text}}} {value}' if label_text else f'{family_name} {value}')
+
+    lines.append('# EOF')
+
+    return '\n'.join(lines) + '\n'
+
+
+def format_json(metrics, labels=None):
+    """
+    Formats logged metrics as a JSON document.
+
+    Parameters
+    ----------
+    metrics : dict
+        Mapping of logged metric names to values.
+    labels : dict, optional
+        Labels identifying the run of the PGE the metrics belong to.
+
+    Returns
+    -------
+    json_text : str
+        JSON document containing the labels and the metrics under the keys
+        "labels" and "metrics", respectively. Non-numeric metrics are
+        included as strings.
+
+    """
+    json_metrics = {}
+
+    for metric_name, metric_value in metrics.items():
+        value = _to_number(metric_value)
+        json_metrics[metric_name] = value if value is not None else str(metric_value)
+
+    return json.dumps({'labels': dict(labels or {}), 'metrics': json_metrics}, indent=2)
+
+
+def get_metrics_filename(log_filename, export_format, output_dir=None):
+    """
+    Returns the path to write exported metrics to, derived from the path
+    of the log file the metrics were logged to.
+
+    Parameters
+    ----------
+    log_filename : str
+        Path to the log file.
+    export_format : str
+        One of the formats defined by METRICS_EXPORT_FORMATS.
+    output_dir : str, optional
+        Directory to write the metrics to. Defaults to the directory containing
+        the log file.
+
+    Returns
+    -------
+    metrics_filename : str
+        Path to the metrics file. OpenMetrics files are given the ".prom"
+        extension expected by the node exporter textfile collector.
+
+    """
+    if output_dir is None:
+        output_dir = os.path.dirname(log_filename)
+
+    log_basename = os.path.splitext(os.path.basename(log_filename))[0]
+    extension = '.prom' if export_format == OPENMETRICS_FORMAT else '.metrics.json'
+
+    return os.path.join(output_dir, log_basename + extension)
+
+
+def write_metrics(output_path, export_format, metrics, labels=None):
+    """
+    Writes logged metrics to disk in the requested format.
+
+    The file is first written under a temporary name, then renamed into
+    place, so that a collector never observes a partially written file.
+
+    Parameters
+    ----------
+    output_path : str
+        Path to write the metrics to.
+    export_format : str
+        One of the formats defined by METRICS_EXPORT_FORMATS.
+    metrics : dict
+        Mapping of logged metric names to values.
+    labels : dict, optional
+        Labels to apply to the exported metrics.
+
+    Raises
+    ------
+    ValueError
+        If the requested format is not supported.
+
+    """
+    if export_format == OPENMETRICS_FORMAT:
+        contents = format_openmetrics(metrics, labels)
+    elif export_format == JSON_FORMAT:
+        contents = format_json(metrics, labels)
+    else:
+        raise ValueError(f'Unsupported metrics export format "{export_format}", '
+                         f'must be one of {", ".join(METRICS_EXPORT_FORMATS)}')
+
+    temp_path = f'{output_path}.{os.getpid()}.tmp'
+
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as outfile:
+            outfile.write(contents)
+
+        os.replace(temp_path, output_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
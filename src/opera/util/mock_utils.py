@@ -13,8 +13,6 @@ Abstraction Library (GDAL), which may not be present in all environments
 from copy import deepcopy
 from os.path import exists
 
-import mgrs
-
 
 class MockGdal:  # pragma: no cover
     """
@@ -517,6 +515,8 @@ class MockOsr:  # pragma: no cover
             """Mock implementation for CoordinateTransformation.TransformPoint"""
             # Use mgrs to convert UTM back to a tile ID, then covert to rough
             # lat/lon, this should be accurate enough for development testing
+            import mgrs  # pylint: disable=import-outside-toplevel
+
             mgrs_obj = mgrs.MGRS()
             try:
                 mgrs_tile = mgrs_obj.UTMToMGRS(self.src.zone, self.src.hemi, x, y)
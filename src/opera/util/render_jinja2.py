@@ -11,29 +11,59 @@ Original Author: David White
 Adapted by: Jim Hofman
 """
 
+import functools
 import html
 import json
 import os
 import re
+import threading
 from collections.abc import Callable
+from contextvars import ContextVar
 from datetime import datetime
+from importlib.resources import files
 from typing import Any, Optional
 
-import jinja2
-
-from lxml import etree
-
-import numpy as np
-
 import yaml
 
 from yaml.scanner import ScannerError
 
+from opera.util import YAML_SAFE_LOADER
 from opera.util.error_codes import ErrorCode
-from opera.util.h5_utils import MEASURED_PARAMETER_PATH_SEPARATOR
+from opera.util.h5_utils import MEASURED_PARAMETER_PATH_SEPARATOR, materialize_hdf5_metadata
+from opera.util.lazy_import import LazyImport
 from opera.util.logger import PgeLogger
 import opera.util.time as time_util
 
+
+def _import_jinja2():
+    """Deferred import of jinja2"""
+    import jinja2 as _jinja2  # pylint: disable=import-outside-toplevel
+
+    return _jinja2
+
+
+def _import_etree():
+    """Deferred import of lxml.etree"""
+    from lxml import etree as _etree  # pylint: disable=import-outside-toplevel
+
+    return _etree
+
+
+def _import_numpy():
+    """Deferred import of numpy"""
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    return numpy
+
+
+# These dependencies are only imported once a template is rendered, since
+# importing them accounts for much of the start-up time of a PGE.
+# pylint: disable=invalid-name
+jinja2 = LazyImport(_import_jinja2, 'jinja2')
+etree = LazyImport(_import_etree, 'lxml.etree')
+np = LazyImport(_import_numpy, 'numpy')
+# pylint: enable=invalid-name
+
 XML_TYPES = {
     str: 'string',
     int: 'int',
@@ -59,8 +89,38 @@ does not indicate a configuration error, rather an incomplete or missing Measure
 Parameters config file.
 """
 
+TEMPLATE_CACHE_DIR_ENV_VAR = "OPERA_PGE_TEMPLATE_CACHE_DIR"
+"""
+Environment variable which may be used to set a directory in which compiled
+jinja2 templates are cached on disk, so they may be reused across PGE runs.
+"""
 
-def _make_undefined_handler_class(logger: PgeLogger):
+RENDER_STREAM_CHUNK_SIZE = 2 ** 16
+"""Number of characters of a streamed template buffered before each write to the output file"""
+
+TEMPLATE_FILE_EXTENSION = '.jinja2'
+"""File extension of the jinja2 template files shipped with each PGE"""
+
+_template_environments = {}
+"""
+Cache of the jinja2 Environment created for each combination of template
+directory, undefined variable handling and bytecode cache directory. Each
+Environment retains the templates compiled from its directory.
+"""
+
+_template_environments_lock = threading.Lock()
+
+_render_logger: ContextVar = ContextVar('render_logger', default=None)
+"""The PgeLogger of the template currently being rendered within this context"""
+
+_measured_parameters_configs = {}
+"""Cache of parsed Measured Parameters Configurations, keyed by file path"""
+
+_measured_parameters_configs_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _make_undefined_handler_class():
     """
     Factory function, returns a child class of the jinja2.Undefined class for
     use when rendering templates.
@@ -71,10 +131,9 @@ def _make_undefined_handler_class(logger: PgeLogger):
         put UNDEFINED_ERROR constant in the rendered text
         let the template rendering continue, try to render the rest of the template.
 
-    Parameters
-    ----------
-    logger : PgeLogger
-        logger of the current pge instance
+    The class is only created once, and logs to the PgeLogger assigned to
+    the render_jinja2 call currently in progress, so that Environments using
+    it may be shared between renders (and PGE instances).
 
     Returns
     -------
@@ -84,7 +143,6 @@ def _make_undefined_handler_class(logger: PgeLogger):
 
 
     """
-
     def _log_message(undef):
         """Notes missing/undefined ISO metadate template variable in logger.
 
@@ -93,6 +151,11 @@ def _make_undefined_handler_class(logger: PgeLogger):
         undef : object
 
         """
+        logger = _render_logger.get()
+
+        if logger is None:  # pragma no cover
+            return
+
         # pylint: disable=protected-access
         msg = f"Missing/undefined ISO metadata template variable: {undef._undefined_message}"
         logger.log("render_jinja2", ErrorCode.ISO_METADATA_CANT_RENDER_ONE_VARIABLE, msg)
@@ -122,6 +185,110 @@ def _make_undefined_handler_class(logger: PgeLogger):
     return LoggingUndefined
 
 
+def _get_template_environment(template_directory: str, log_undefined: bool, cache_dir: Optional[str] = None):
+    """
+    Returns the jinja2 Environment used to load templates from the provided
+    directory, creating it on first use. Since the Environment caches each
+    template it compiles, subsequent renders of the same template skip
+    compilation entirely.
+
+    Parameters
+    ----------
+    template_directory : str
+        Directory to load templates from.
+    log_undefined : bool
+        If True, undefined template variables are logged to the PgeLogger of
+        the current render, rather than handled by jinja2's defaults.
+    cache_dir : str, optional
+        Directory in which to cache compiled templates on disk. If not
+        provided, the value of the OPERA_PGE_TEMPLATE_CACHE_DIR environment
+        variable is used, if set. Otherwise, compiled templates are only
+        cached in memory.
+
+    Returns
+    -------
+    template_env : jinja2.Environment
+        The Environment for the provided directory.
+
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get(TEMPLATE_CACHE_DIR_ENV_VAR) or None
+
+    env_key = (os.path.abspath(template_directory), log_undefined, cache_dir)
+
+    with _template_environments_lock:
+        template_env = _template_environments.get(env_key)
+
+        if template_env is None:
+            bytecode_cache = None
+
+            if cache_dir is not None:
+                os.makedirs(cache_dir, exist_ok=True)
+                bytecode_cache = jinja2.FileSystemBytecodeCache(directory=cache_dir)
+
+            undefined_handler_class = (_make_undefined_handler_class()
+                                       if log_undefined
+                                       else jinja2.Undefined)
+
+            template_env = jinja2.Environment(loader=jinja2.FileSystemLoader(searchpath=template_directory),
+                                              autoescape=jinja2.select_autoescape(),
+                                              undefined=undefined_handler_class,
+                                              bytecode_cache=bytecode_cache)
+
+            template_env.filters['basename'] = lambda x: os.path.basename(str(x))
+
+            _template_environments[env_key] = template_env
+
+    return template_env
+
+
+def clear_template_cache():
+    """Discards all cached jinja2 Environments, along with their compiled templates."""
+    with _template_environments_lock:
+        _template_environments.clear()
+
+
+def precompile_templates(cache_dir: str, template_directories=None):
+    """
+    Compiles each jinja2 template into the on-disk bytecode cache, so that
+    PGE runs configured with the same cache directory (for example, within
+    a freshly started container) may skip template compilation.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory to write the compiled templates to.
+    template_directories : iterable of str, optional
+        Directories containing the templates to compile. Defaults to the
+        templates directory of each PGE within the opera.pge package.
+
+    Returns
+    -------
+    template_paths : list of str
+        Paths to each template which was compiled.
+
+    """
+    if template_directories is None:
+        template_directories = [str(pge_dir.joinpath('templates'))
+                                for pge_dir in files('opera').joinpath('pge').iterdir()
+                                if pge_dir.joinpath('templates').is_dir()]
+
+    template_paths = []
+
+    for template_directory in sorted(template_directories):
+        # The bytecode cached for a template does not depend on how undefined
+        # variables are handled, so one Environment suffices for either mode
+        template_env = _get_template_environment(template_directory, log_undefined=True, cache_dir=cache_dir)
+
+        template_names = template_env.list_templates(filter_func=lambda name: name.endswith(TEMPLATE_FILE_EXTENSION))
+
+        for template_name in sorted(template_names):
+            template_env.get_template(template_name)
+            template_paths.append(os.path.join(template_directory, template_name))
+
+    return template_paths
+
+
 def _validate_rendered_json_string(string: str, output_directory: str, logger: PgeLogger):
     try:
         _ = json.loads(string)
@@ -190,38 +357,88 @@ def _validate_rendered_yaml_string(string: str, output_directory: str, logger: P
         )
 
 
+def _report_invalid_xml_string(string: str, err, output_directory: str, logger: PgeLogger):
+    msg_lines = ['Rendered XML not valid!']
+
+    rendered_lines = string.splitlines()
+
+    err_line, err_col = err.position
+    err_line_index = err_line - 1
+
+    msg_lines.extend(rendered_lines[max(err_line_index - 2, 0):err_line_index + 1])
+    msg_lines.append(f'{" " * (err_col - 1)}^')
+    msg_lines.extend(rendered_lines[err_line_index + 1:min(err_line_index + 2, len(rendered_lines))])
+
+    if output_directory is not None:
+        dumpfile_name = f'bad_xml_{time_util.get_time_for_filename(datetime.now())}.xml'
+        dumpfile_path = os.path.join(output_directory, dumpfile_name)
+
+        with open(dumpfile_path, 'w', encoding='utf-8') as f:
+            f.write(string)
+
+        msg_lines.append(f'Failed to render jinja2 template. Err: "{err.msg}" @ {err_line}:{err_col}. Rendered'
+                         f' text dumped to {dumpfile_path}')
+    else:
+        msg_lines.append(f'Failed to render jinja2 template. Err: "{err.msg}" @ {err_line}:{err_col}.')
+
+    # Without a logger to report to, fall back to raising the error directly
+    if logger is None:
+        raise RuntimeError('\n'.join(msg_lines)) from err
+
+    logger.critical(
+        "render_jinja2",
+        ErrorCode.LOGGED_CRITICAL_LINE,
+        msg_lines,
+    )
+
+
 def _validate_rendered_xml_string(string: str, output_directory: str, logger: PgeLogger):
     try:
         _ = etree.fromstring(string.encode('utf-8'))
     except etree.XMLSyntaxError as err:
-        msg_lines = ['Rendered XML not valid!']
-
-        rendered_lines = string.splitlines()
-
-        err_line, err_col = err.position
-        err_line_index = err_line - 1
+        _report_invalid_xml_string(string, err, output_directory, logger)
 
-        msg_lines.extend(rendered_lines[max(err_line_index - 2, 0):err_line_index+1])
-        msg_lines.append(f'{" " * (err_col-1)}^')
-        msg_lines.extend(rendered_lines[err_line_index+1:min(err_line_index+2, len(rendered_lines))])
 
-        if output_directory is not None:
-            dumpfile_name = f'bad_xml_{time_util.get_time_for_filename(datetime.now())}.xml'
-            dumpfile_path = os.path.join(output_directory, dumpfile_name)
-
-            with open(dumpfile_path, 'w', encoding='utf-8') as f:
-                f.write(string)
+class _IncrementalXMLValidator:
+    """
+    Checks that a document is well-formed XML as it is fed to an lxml
+    XMLPullParser in chunks. Elements are discarded once parsed, so the
+    memory used does not grow with the size of the document.
+    """
 
-            msg_lines.append(f'Failed to render jinja2 template. Err: "{err.msg}" @ {err_line}:{err_col}. Rendered'
-                             f' text dumped to {dumpfile_path}')
-        else:
-            msg_lines.append(f'Failed to render jinja2 template. Err: "{err.msg}" @ {err_line}:{err_col}.')
+    def __init__(self):
+        self._parser = etree.XMLPullParser(events=('end',))
+        self.error = None
+
+    def _discard_parsed_elements(self):
+        for _, element in self._parser.read_events():
+            element.clear(keep_tail=True)
+
+            # Siblings of the root element (such as comments or processing
+            # instructions preceding it) have no parent to be removed from
+            while element.getprevious() is not None and element.getparent() is not None:
+                del element.getparent()[0]
+
+    def feed(self, chunk: str):
+        """Parses the next chunk of the document, unless an error has already been encountered"""
+        if self.error is not None:
+            return
+
+        try:
+            self._parser.feed(chunk.encode('utf-8'))
+            self._discard_parsed_elements()
+        except etree.XMLSyntaxError as err:
+            self.error = err
+
+    def close(self):
+        """Completes parsing of the document, returning the first error encountered (if any)"""
+        if self.error is None:
+            try:
+                self._parser.close()
+            except etree.XMLSyntaxError as err:
+                self.error = err
 
-        logger.critical(
-            "render_jinja2",
-            ErrorCode.LOGGED_CRITICAL_LINE,
-            msg_lines,
-        )
+        return self.error
 
 
 JSON_VALIDATOR = _validate_rendered_json_string
@@ -229,6 +446,22 @@ YAML_VALIDATOR = _validate_rendered_yaml_string
 XML_VALIDATOR = _validate_rendered_xml_string
 
 
+def _get_template(template_filename: str, logger: PgeLogger = None):
+    """
+    Loads the jinja2 template at the provided path, using the cached
+    Environment for its directory. Relative paths without a directory are
+    loaded from the current working directory.
+    """
+    template_directory = os.path.dirname(template_filename)
+
+    if not template_directory:
+        template_directory = os.getcwd()
+
+    template_env = _get_template_environment(template_directory, log_undefined=logger is not None)
+
+    return template_env.get_template(os.path.basename(template_filename))
+
+
 def render_jinja2(
         template_filename: str,
         input_data: dict,
@@ -240,6 +473,10 @@ def render_jinja2(
     Renders from a jinja2 template using the specified input data.
     Writes the rendered output to the specified output file.
 
+    Compiled templates are cached in memory for reuse by subsequent calls,
+    and on disk within the directory assigned to the
+    OPERA_PGE_TEMPLATE_CACHE_DIR environment variable, if set.
+
     Parameters
     ----------
     template_filename: str
@@ -266,33 +503,131 @@ def render_jinja2(
         input data.
 
     """
-    template_directory = os.path.dirname(template_filename)
+    template = _get_template(template_filename, logger)
 
-    if not template_directory:
-        template_directory = os.getcwd()
+    render_logger_token = _render_logger.set(logger)
 
-    template_filename = os.path.basename(template_filename)
+    try:
+        rendered_text = template.render(input_data)
+    finally:
+        _render_logger.reset(render_logger_token)
 
-    template_loader = jinja2.FileSystemLoader(searchpath=template_directory)
+    if validator is not None:
+        validator(rendered_text, output_directory, logger)
 
-    undefined_handler_class = (_make_undefined_handler_class(logger)
-                               if logger is not None
-                               else jinja2.Undefined)
+    return rendered_text
 
-    template_env = jinja2.Environment(loader=template_loader,
-                                      autoescape=jinja2.select_autoescape(),
-                                      undefined=undefined_handler_class)
 
-    template_env.filters['basename'] = lambda x: os.path.basename(str(x))
+def render_jinja2_to_file(
+        template_filename: str,
+        input_data: dict,
+        output_filepath: str,
+        *,
+        logger: PgeLogger = None,
+        output_directory: str = None,
+        validate_xml: bool = True
+):
+    """
+    Renders from a jinja2 template using the specified input data, streaming
+    the rendered output directly to the specified output file.
 
-    template = template_env.get_template(template_filename)
+    Unlike render_jinja2, the rendered text is never held in memory in its
+    entirety. When validation is requested, each chunk of rendered output is
+    also fed to an incremental XML parser as it is written.
 
-    rendered_text = template.render(input_data)
+    The output is first written to a hidden ".partial" file alongside the
+    output file, which is only renamed to the output file once rendered (and
+    validated) successfully. Should rendering fail, the partial file is
+    removed, and any existing output file is left as it was.
 
-    if validator is not None:
-        validator(rendered_text, output_directory, logger)
+    Parameters
+    ----------
+    template_filename: str
+        Jinja2 template file
+    input_data: dict
+        The input data dictionary passed to the Jinja2 template render function.
+    output_filepath: str
+        Path to the file to write the rendered output to.
+    logger:
+        PgeLogger (optional, suggested). See render_jinja2. If provided,
+        invalid XML is logged as a critical error, otherwise a RuntimeError
+        is raised.
+    output_directory: str
+        Optional directory which, if validation fails, the rendered text will
+        be dumped to.
+    validate_xml: bool
+        If True, the rendered output is checked to be well-formed XML. If it
+        is not, no output file is written, and the error is logged as a
+        critical error, in the same manner as XML_VALIDATOR.
 
-    return rendered_text
+    Returns
+    -------
+    output_filepath : str
+        Path to the rendered output file.
+
+    Raises
+    ------
+    RuntimeError
+        If the rendered output is not well-formed XML, and no logger was
+        provided to report the error to.
+
+    """
+    template = _get_template(template_filename, logger)
+
+    validator = _IncrementalXMLValidator() if validate_xml else None
+
+    def _write_chunk(outfile, chunk):
+        outfile.write(chunk)
+
+        if validator is not None:
+            validator.feed(chunk)
+
+    # Named for the process and thread rendering it, so concurrent renders do
+    # not collide, and created with open() (rather than by tempfile), so the
+    # output file is given the usual permissions once renamed into place
+    partial_filepath = os.path.join(
+        os.path.dirname(os.path.abspath(output_filepath)),
+        f'.{os.path.basename(output_filepath)}.{os.getpid()}.{threading.get_ident()}.partial'
+    )
+
+    try:
+        render_logger_token = _render_logger.set(logger)
+
+        try:
+            with open(partial_filepath, 'w', encoding='utf-8') as outfile:
+                buffered_chunks = []
+                buffered_size = 0
+
+                for chunk in template.generate(input_data):
+                    buffered_chunks.append(chunk)
+                    buffered_size += len(chunk)
+
+                    if buffered_size >= RENDER_STREAM_CHUNK_SIZE:
+                        _write_chunk(outfile, ''.join(buffered_chunks))
+                        buffered_chunks = []
+                        buffered_size = 0
+
+                _write_chunk(outfile, ''.join(buffered_chunks))
+        finally:
+            _render_logger.reset(render_logger_token)
+
+        err = validator.close() if validator is not None else None
+
+        if err is not None:
+            # Rendering continues past the first error, so the complete rendered
+            # text may be reported (and dumped) the same as for XML_VALIDATOR
+            with open(partial_filepath, 'r', encoding='utf-8') as infile:
+                rendered_text = infile.read()
+
+            _report_invalid_xml_string(rendered_text, err, output_directory, logger)
+        else:
+            os.replace(partial_filepath, output_filepath)
+    finally:
+        # Only left in place should rendering (or validation) have failed
+        if os.path.exists(partial_filepath):
+            os.remove(partial_filepath)
+
+    return output_filepath
 
 
 def python_type_to_xml_type(obj) -> str:
@@ -311,6 +646,152 @@ def python_type_to_xml_type(obj) -> str:
     return XML_TYPES[obj]
 
 
+class MeasuredParametersConfig:
+    """
+    Parsed form of a Measured Parameters Configuration (MPC) file, as used to
+    augment the metadata of an output product for the MeasuredParameters
+    section of an ISO XML file.
+
+    The key path, display name and data type of each configured parameter
+    are determined once when the configuration is loaded, so that the same
+    configuration may be applied to the metadata of many output products
+    (bursts, tiles, etc.) without repeating that work.
+    """
+
+    def __init__(self, descriptions: dict, missing_description_value: str = UNDEFINED_ERROR):
+        """
+        Parameters
+        ----------
+        descriptions : dict
+            The contents of the MPC file, mapping each parameter name to its
+            configured description fields.
+        missing_description_value : str, optional
+            Description assigned to parameters absent from the configuration.
+
+        """
+        self.missing_description_value = missing_description_value
+        self.parameters = {}
+
+        for name, description in (descriptions or {}).items():
+            description = description or {}
+
+            self.parameters[name] = {
+                'key_path': tuple(name.split(MEASURED_PARAMETER_PATH_SEPARATOR)),
+                'name': description.get('display_name', guess_attribute_display_name(name)),
+                'attr_type': description.get('attribute_type', UNDEFINED_ERROR),
+                'attr_description': description.get('description', missing_description_value),
+                'data_type': description.get('attribute_data_type'),
+                'escape_html': description.get('escape_html', False),
+                'optional': description.get('optional', False)
+            }
+
+    def _augment_parameter(self, name, value):
+        """Returns the augmented form of a single measured parameter value"""
+        parameter = self.parameters.get(name)
+
+        if isinstance(value, np.generic):
+            value = value.item()
+
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+
+        if isinstance(value, (list, dict)):
+            value = json.dumps(value, cls=NumpyEncoder)
+
+        if parameter is None:
+            return {
+                'name': guess_attribute_display_name(name),
+                'value': value,
+                'attr_type': UNDEFINED_ERROR,
+                'attr_description': self.missing_description_value,
+                'data_type': python_type_to_xml_type(value)
+            }
+
+        if parameter['escape_html']:
+            value = html.escape(value)
+
+        return {
+            'name': parameter['name'],
+            'value': value,
+            'attr_type': parameter['attr_type'],
+            'attr_description': parameter['attr_description'],
+            'data_type': parameter['data_type'] or python_type_to_xml_type(value)
+        }
+
+    def augment(self, measured_parameters: dict) -> dict:
+        """
+        Augments each entry of a flat dictionary of measured parameters (such
+        as GeoTIFF metadata). See augment_measured_parameters().
+        """
+        return {name: self._augment_parameter(name, value)
+                for name, value in measured_parameters.items()}
+
+    def augment_hdf5(self, measured_parameters: dict, logger: PgeLogger) -> dict:
+        """
+        Locates and augments each configured parameter within a nested
+        dictionary of measured parameters (such as HDF5 metadata). See
+        augment_hdf5_measured_parameters().
+        """
+        augmented_parameters = {}
+
+        for name, parameter in self.parameters.items():
+            mp_item = measured_parameters
+
+            try:
+                for key in parameter['key_path']:
+                    mp_item = mp_item[key]
+            except KeyError:
+                msg = (f'Measured parameters configuration contains a path {name} that is missing '
+                       f'from the output product')
+                if parameter['optional']:
+                    logger.warning("render_jinja2", ErrorCode.ISO_METADATA_NO_ENTRY_FOR_DESCRIPTION, msg)
+                    continue
+
+                logger.critical("render_jinja2", ErrorCode.ISO_METADATA_DESCRIPTIONS_CONFIG_INVALID, msg)
+
+            # Datasets summarized when the metadata was read are only read in full
+            # once referenced by the MPC
+            augmented_parameters[name] = self._augment_parameter(name, materialize_hdf5_metadata(mp_item))
+
+        return augmented_parameters
+
+
+def load_measured_parameters_config(mpc_path: str) -> MeasuredParametersConfig:
+    """
+    Loads the Measured Parameters Configuration file at the provided path.
+    Parsed configurations are cached, and only reloaded once the file is
+    modified, so repeated calls for each output product of a PGE do not
+    re-parse the YAML. The libyaml-based loader is used when available.
+
+    Parameters
+    ----------
+    mpc_path : str
+        Path to the Measured Parameters Descriptions YAML file.
+
+    Returns
+    -------
+    mpc : MeasuredParametersConfig
+        The parsed configuration. Should not be modified by the caller, since
+        it may be shared with other callers.
+
+    """
+    mpc_path = os.path.abspath(mpc_path)
+    mpc_stat = os.stat(mpc_path)
+    mpc_version = (mpc_stat.st_mtime_ns, mpc_stat.st_size)
+
+    with _measured_parameters_configs_lock:
+        cached_version, mpc = _measured_parameters_configs.get(mpc_path, (None, None))
+
+        if cached_version != mpc_version:
+            with open(mpc_path, 'r', encoding='utf-8') as data:
+                descriptions = yaml.load(data, Loader=YAML_SAFE_LOADER)
+
+            mpc = MeasuredParametersConfig(descriptions)
+            _measured_parameters_configs[mpc_path] = (mpc_version, mpc)
+
+    return mpc
+
+
 # pylint: disable=unused-argument,consider-alternative-union-syntax
 def augment_measured_parameters(measured_parameters: dict, mpc_path: Optional[str], logger: PgeLogger) -> dict:
     """
@@ -342,52 +823,12 @@ def augment_measured_parameters(measured_parameters: dict, mpc_path: Optional[st
     augmented_parameters : dict
        The metadata fields converted to a list with name, value, types, etc
     """
-    augmented_parameters = {}
-
     if mpc_path is not None:
-        with open(mpc_path, 'r', encoding='utf-8') as data:
-            descriptions = yaml.safe_load(data)
-
-        missing_description_value = UNDEFINED_ERROR
+        mpc = load_measured_parameters_config(mpc_path)
     else:
-        descriptions = {}
-        missing_description_value = UNDEFINED_WARNING
-
-    for name in measured_parameters:
-        value = measured_parameters[name]
-
-        if isinstance(value, np.generic):
-            value = value.item()
-
-        if isinstance(value, np.ndarray):
-            value = value.tolist()
-
-        if isinstance(value, (list, dict)):
-            value = json.dumps(value, cls=NumpyEncoder)
-
-        guessed_data_type = python_type_to_xml_type(value)
-        guessed_attr_name = guess_attribute_display_name(name)
-
-        descriptions.setdefault(name, {})
-
-        attr_description = descriptions[name].get('description', missing_description_value)
-        data_type = descriptions[name].get('attribute_data_type', guessed_data_type)
-        attr_type = descriptions[name].get('attribute_type', UNDEFINED_ERROR)
-        attr_name = descriptions[name].get('display_name', guessed_attr_name)
-        escape_html = descriptions[name].get('escape_html', False)
-
-        if escape_html:
-            value = html.escape(value)
-
-        augmented_parameters[name] = {
-            'name': attr_name,
-            'value': value,
-            'attr_type': attr_type,
-            'attr_description': attr_description,
-            'data_type': data_type
-        }
+        mpc = MeasuredParametersConfig({}, missing_description_value=UNDEFINED_WARNING)
 
-    return augmented_parameters
+    return mpc.augment(measured_parameters)
 
 
 def augment_hdf5_measured_parameters(measured_parameters: dict, mpc_path: str, logger: PgeLogger) -> dict:
@@ -413,6 +854,9 @@ def augment_hdf5_measured_parameters(measured_parameters: dict, mpc_path: str, l
     dictionary are raised as a critical error by default, unless that entry in the
     MPC is marked optional, in which case a warning is logged.
 
+    Any HDF5DatasetSummary referenced by the MPC (see get_hdf5_metadata()) is
+    materialized, so its full contents are included in the measured parameters.
+
     Parameters
     ----------
     measured_parameters : dict
@@ -427,39 +871,12 @@ def augment_hdf5_measured_parameters(measured_parameters: dict, mpc_path: str, l
     augmented_parameters : dict
         The metadata fields converted to a list with name, value, types, etc
     """
-    new_measured_parameters = {}
-    descriptions = {}
-
-    if mpc_path:
-        with open(mpc_path, 'r', encoding='utf-8') as data:
-            descriptions = yaml.safe_load(data)
-    else:
+    if not mpc_path:
         msg = ('Measured parameters configuration is needed to extract the measured parameters attributes from the '
                'metadata')
         logger.critical("render_jinja2", ErrorCode.ISO_METADATA_DESCRIPTIONS_CONFIG_NOT_FOUND, msg)
 
-    for parameter_var_name in descriptions:
-        key_path = parameter_var_name.split(MEASURED_PARAMETER_PATH_SEPARATOR)
-
-        mp_item = measured_parameters
-        missing = False
-
-        while len(key_path) > 0:  # pylint: disable=while-used
-            try:
-                mp_item = mp_item[key_path.pop(0)]
-            except KeyError:
-                msg = (f'Measured parameters configuration contains a path {parameter_var_name} that is missing '
-                       f'from the output product')
-                if descriptions[parameter_var_name].get('optional', False):
-                    logger.warning("render_jinja2", ErrorCode.ISO_METADATA_NO_ENTRY_FOR_DESCRIPTION, msg)
-                    missing = True
-                else:
-                    logger.critical("render_jinja2", ErrorCode.ISO_METADATA_DESCRIPTIONS_CONFIG_INVALID, msg)
-
-        if not missing:
-            new_measured_parameters[parameter_var_name] = mp_item
-
-    return augment_measured_parameters(new_measured_parameters, mpc_path, logger)
+    return load_measured_parameters_config(mpc_path).augment_hdf5(measured_parameters, logger)
 
 
 class NumpyEncoder(json.JSONEncoder):
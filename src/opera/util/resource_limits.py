@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+
+"""
+==================
+resource_limits.py
+==================
+
+Discovery of the CPU and memory resources available to OPERA PGEs.
+
+Within containers, the number of processors and the amount of memory visible
+to a process typically reflect the host machine, rather than the limits
+imposed on the container through its control group (cgroup). The functions
+within this module take cgroup (v1 or v2) limits into account, and derive
+from them a consistent set of environment variables used to size the thread
+pools and caches of the libraries commonly used by SAS executables.
+
+"""
+
+import math
+import os
+
+CGROUP_ROOT = os.path.join(os.sep, 'sys', 'fs', 'cgroup')
+"""Default mount point of the cgroup filesystem"""
+
+PROC_CGROUP_FILE = os.path.join(os.sep, 'proc', 'self', 'cgroup')
+"""File listing the cgroup membership of the current process"""
+
+UNLIMITED_CGROUP_MEMORY = 2 ** 60
+"""cgroup v1 memory limits at or above this value are treated as unlimited"""
+
+THREAD_COUNT_ENV_VARS = (
+    'OMP_NUM_THREADS',
+    'OPENBLAS_NUM_THREADS',
+    'MKL_NUM_THREADS',
+    'NUMEXPR_MAX_THREADS',
+    'NUMEXPR_NUM_THREADS',
+    'GDAL_NUM_THREADS'
+)
+"""Environment variables used to size the thread pools of SAS libraries"""
+
+GDAL_CACHEMAX_ENV_VAR = 'GDAL_CACHEMAX'
+"""Environment variable used to size the GDAL block cache, in megabytes"""
+
+DEFAULT_GDAL_CACHE_FRACTION = 0.25
+"""Default fraction of the available memory to allocate to the GDAL block cache"""
+
+MIN_GDAL_CACHEMAX_MB = 64
+"""Minimum size, in megabytes, of an automatically sized GDAL block cache"""
+
+
+def _read_first_line(file_path):
+    """Returns the first line of the provided file, or None if it cannot be read"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as infile:
+            return infile.readline().strip()
+    except OSError:
+        return None
+
+
+def _get_cgroup_paths(proc_cgroup_file=PROC_CGROUP_FILE):
+    """
+    Parses the cgroup membership of the current process.
+
+    Returns
+    -------
+    cgroup_paths : dict
+        Mapping of each cgroup v1 controller name to the path of the cgroup
+        the process belongs to. The path of the cgroup v2 (unified) hierarchy
+        is mapped to the empty string.
+
+    """
+    cgroup_paths = {}
+
+    try:
+        with open(proc_cgroup_file, 'r', encoding='utf-8') as infile:
+            lines = infile.read().splitlines()
+    except OSError:
+        return cgroup_paths
+
+    for line in lines:
+        fields = line.split(':', 2)
+
+        if len(fields) != 3:
+            continue
+
+        for controller in fields[1].split(','):
+            cgroup_paths[controller] = fields[2]
+
+    return cgroup_paths
+
+
+def _read_cgroup_file(file_name, controller, cgroup_root, cgroup_paths):
+    """
+    Reads the first line of a cgroup interface file.
+
+    The file is first looked for within the cgroup of the current process,
+    then at the root of the hierarchy, which is where it is found when
+    the container has its own cgroup namespace.
+
+    Parameters
+    ----------
+    file_name : str
+        Name of the cgroup interface file to read.
+    controller : str
+        Name of the cgroup v1 controller the file belongs to, or the empty
+        string for the cgroup v2 hierarchy.
+    cgroup_root : str
+        Mount point of the cgroup filesystem.
+    cgroup_paths : dict
+        Cgroup membership of the current process, as returned by
+        _get_cgroup_paths().
+
+    Returns
+    -------
+    contents : str or None
+        First line of the file, or None if it could not be found.
+
+    """
+    if controller:
+        hierarchy_roots = [os.path.join(cgroup_root, controller)]
+    else:
+        # The unified hierarchy is mounted beneath the cgroup root in "hybrid" mode
+        hierarchy_roots = [cgroup_root, os.path.join(cgroup_root, 'unified')]
+
+    cgroup_path = cgroup_paths.get(controller, '/').lstrip('/')
+
+    for hierarchy_root in hierarchy_roots:
+        for directory in (os.path.join(hierarchy_root, cgroup_path), hierarchy_root):
+            contents = _read_first_line(os.path.join(directory, file_name))
+
+            if contents is not None:
+                return contents
+
+    return None
+
+
+def get_cgroup_cpu_limit(cgroup_root=CGROUP_ROOT, proc_cgroup_file=PROC_CGROUP_FILE):
+    """
+    Returns the CPU quota imposed on the current process by its cgroup.
+
+    Parameters
+    ----------
+    cgroup_root : str, optional
+        Mount point of the cgroup filesystem.
+    proc_cgroup_file : str, optional
+        File listing the cgroup membership of the current process.
+
+    Returns
+    -------
+    cpu_limit : float or None
+        Number of CPUs the quota equates to, or None if no quota is imposed.
+
+    """
+    cgroup_paths = _get_cgroup_paths(proc_cgroup_file)
+
+    # cgroup v2: "<quota> <period>", with a quota of "max" when unlimited
+    cpu_max = _read_cgroup_file('cpu.max', '', cgroup_root, cgroup_paths)
+
+    if cpu_max:
+        quota, _, period = cpu_max.partition(' ')
+
+        if quota == 'max':
+            return None
+
+        try:
+            return int(quota) / int(period or 100000)
+        except ValueError:
+            return None
+
+    # cgroup v1: quota and period in separate files, with a quota of -1 when unlimited
+    quota = _read_cgroup_file('cpu.cfs_quota_us', 'cpu', cgroup_root, cgroup_paths)
+    period = _read_cgroup_file('cpu.cfs_period_us', 'cpu', cgroup_root, cgroup_paths)
+
+    try:
+        quota, period = int(quota), int(period)
+    except (TypeError, ValueError):
+        return None
+
+    if quota <= 0 or period <= 0:
+        return None
+
+    return quota / period
+
+
+def get_cgroup_memory_limit(cgroup_root=CGROUP_ROOT, proc_cgroup_file=PROC_CGROUP_FILE):
+    """
+    Returns the memory limit imposed on the current process by its cgroup.
+
+    Parameters
+    ----------
+    cgroup_root : str, optional
+        Mount point of the cgroup filesystem.
+    proc_cgroup_file : str, optional
+        File listing the cgroup membership of the current process.
+
+    Returns
+    -------
+    memory_limit : int or None
+        The memory limit, in bytes, or None if no limit is imposed.
+
+    """
+    cgroup_paths = _get_cgroup_paths(proc_cgroup_file)
+
+    # cgroup v2, with a limit of "max" when unlimited
+    memory_limit = _read_cgroup_file('memory.max', '', cgroup_root, cgroup_paths)
+
+    if memory_limit is None:
+        memory_limit = _read_cgroup_file('memory.limit_in_bytes', 'memory', cgroup_root, cgroup_paths)
+
+    try:
+        memory_limit = int(memory_limit)
+    except (TypeError, ValueError):
+        return None
+
+    if memory_limit <= 0 or memory_limit >= UNLIMITED_CGROUP_MEMORY:
+        return None
+
+    return memory_limit
+
+
+def get_available_cpus(cgroup_root=CGROUP_ROOT, proc_cgroup_file=PROC_CGROUP_FILE):
+    """
+    Returns the number of CPUs available to the current process, accounting
+    for both its CPU affinity and any cgroup CPU quota.
+
+    Parameters
+    ----------
+    cgroup_root : str, optional
+        Mount point of the cgroup filesystem.
+    proc_cgroup_file : str, optional
+        File listing the cgroup membership of the current process.
+
+    Returns
+    -------
+    num_cpus : int
+        Number of available CPUs, always at least 1. Fractional quotas are
+        rounded up.
+
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        num_cpus = len(os.sched_getaffinity(0))
+    else:  # pragma no cover
+        num_cpus = os.cpu_count() or 1
+
+    cpu_limit = get_cgroup_cpu_limit(cgroup_root, proc_cgroup_file)
+
+    if cpu_limit is not None:
+        num_cpus = min(num_cpus, math.ceil(cpu_limit))
+
+    return max(num_cpus, 1)
+
+
+def get_available_memory(cgroup_root=CGROUP_ROOT, proc_cgroup_file=PROC_CGROUP_FILE):
+    """
+    Returns the amount of memory available to the current process, accounting
+    for both the physical memory of the machine and any cgroup memory limit.
+
+    Parameters
+    ----------
+    cgroup_root : str, optional
+        Mount point of the cgroup filesystem.
+    proc_cgroup_file : str, optional
+        File listing the cgroup membership of the current process.
+
+    Returns
+    -------
+    available_memory : int or None
+        The available memory, in bytes, or None if it could not be determined.
+
+    """
+    try:
+        physical_memory = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (AttributeError, ValueError, OSError):  # pragma no cover
+        physical_memory = None
+
+    memory_limit = get_cgroup_memory_limit(cgroup_root, proc_cgroup_file)
+
+    available_memory = [memory for memory in (physical_memory, memory_limit) if memory]
+
+    return min(available_memory) if available_memory else None
+
+
+def get_sas_environment(num_threads=None, gdal_cachemax_mb=None,
+                        gdal_cache_fraction=DEFAULT_GDAL_CACHE_FRACTION,
+                        environ=None, **kwargs):
+    """
+    Determines the thread count and cache size environment variables to
+    execute a SAS with.
+
+    Explicitly requested values always take precedence. Otherwise, any value
+    already set within the environment is left as is, and the remaining
+    variables are derived from the CPU and memory resources available to the
+    current process.
+
+    Parameters
+    ----------
+    num_threads : int, optional
+        Number of threads to assign to each of THREAD_COUNT_ENV_VARS.
+    gdal_cachemax_mb : int, optional
+        Size, in megabytes, to assign to GDAL_CACHEMAX.
+    gdal_cache_fraction : float, optional
+        Fraction of the available memory to assign to GDAL_CACHEMAX when it
+        is not explicitly requested.
+    environ : dict, optional
+        The environment the SAS would otherwise be executed with. Defaults to
+        the environment of the current process.
+    **kwargs : dict
+        Additional keyword arguments (cgroup_root, proc_cgroup_file) passed
+        through to the resource discovery functions.
+
+    Returns
+    -------
+    sas_environment : dict
+        Mapping of environment variable names to the values to set for the SAS.
+        Variables already set within the environment, and not explicitly
+        requested, are omitted.
+
+    """
+    environ = os.environ if environ is None else environ
+    sas_environment = {}
+
+    if num_threads is None:
+        num_threads = get_available_cpus(**kwargs)
+        requested_thread_vars = [var for var in THREAD_COUNT_ENV_VARS if var not in environ]
+    else:
+        requested_thread_vars = THREAD_COUNT_ENV_VARS
+
+    for env_var in requested_thread_vars:
+        sas_environment[env_var] = str(num_threads)
+
+    if gdal_cachemax_mb is None and GDAL_CACHEMAX_ENV_VAR not in environ:
+        available_memory = get_available_memory(**kwargs)
+
+        if available_memory is not None:
+            gdal_cachemax_mb = max(int(available_memory * gdal_cache_fraction) // 2 ** 20,
+                                   MIN_GDAL_CACHEMAX_MB)
+
+    if gdal_cachemax_mb is not None:
+        sas_environment[GDAL_CACHEMAX_ENV_VAR] = str(gdal_cachemax_mb)
+
+    return sas_environment
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+
+"""
+===============
+result_cache.py
+===============
+
+Content-addressed cache of SAS outputs for use with OPERA PGEs.
+
+Outputs are stored under a key derived from everything which determines
+them: the checksums of the input files, the SAS configuration, and the SAS
+version. When a PGE is re-run with byte-identical inputs and configuration
+(as is common during reprocessing campaigns), the cached outputs may be
+restored in place of executing the SAS again.
+
+"""
+
+import errno
+import hashlib
+import json
+import os
+import shutil
+import time
+
+from .run_utils import copy_and_hash
+
+DEFAULT_MAX_CACHE_BYTES = 100 * 2 ** 30
+"""Default maximum total size, in bytes, of the outputs retained by a SAS result cache"""
+
+ENTRY_FILENAME = "entry.json"
+"""Name of the file describing the contents of each cache entry"""
+
+FILES_DIRNAME = "files"
+"""Name of the directory containing the cached outputs of each cache entry"""
+
+
+def compute_cache_key(**key_components):
+    """
+    Derives a cache key from the provided components.
+
+    Parameters
+    ----------
+    **key_components : dict
+        JSON-serializable values which together determine the outputs of a
+        SAS execution.
+
+    Returns
+    -------
+    cache_key : str
+        Hex digest uniquely identifying the provided components.
+
+    """
+    key_json = json.dumps(key_components, sort_keys=True, default=str)
+
+    return hashlib.sha256(key_json.encode('utf-8')).hexdigest()
+
+
+class SasResultCache:
+    """
+    Directory-based store of SAS outputs, keyed by the hash of the SAS inputs
+    and configuration, with least-recently-used eviction once the total size
+    of the stored outputs exceeds a limit.
+
+    Each entry is a directory named by its key, containing the cached outputs
+    and a description of them. Entries are written to a temporary directory
+    and renamed into place, so concurrent PGEs sharing a cache never observe
+    a partially written entry.
+
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_CACHE_BYTES):
+        """
+        Opens (or creates) the cache within the provided directory.
+
+        Parameters
+        ----------
+        cache_dir : str
+            Path to the directory containing the cache.
+        max_bytes : int, optional
+            Maximum total size, in bytes, of the outputs retained by the cache.
+
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _entry_dir(self, cache_key):
+        """Returns the path to the directory of the entry for the provided key"""
+        return os.path.join(self.cache_dir, cache_key)
+
+    def _read_entry(self, cache_key):
+        """Returns the description of the entry for the provided key, or None if there is no such entry"""
+        try:
+            with open(os.path.join(self._entry_dir(cache_key), ENTRY_FILENAME), 'r', encoding='utf-8') as infile:
+                return json.load(infile)
+        except (OSError, ValueError):
+            return None
+
+    def __contains__(self, cache_key):
+        """Returns True if an entry exists for the provided key"""
+        return self._read_entry(cache_key) is not None
+
+    def restore(self, cache_key, output_dir, hardlink=False):
+        """
+        Restores the outputs cached for the provided key into the output directory.
+
+        Parameters
+        ----------
+        cache_key : str
+            Key of the entry to restore.
+        output_dir : str
+            Directory to restore the cached outputs into, using the same
+            relative paths the outputs were stored with.
+        hardlink : bool, optional
+            If True, restored outputs are hard links to the cached files where
+            possible, rather than copies. This avoids copying large outputs,
+            but must only be used if the restored outputs are never modified
+            in place, since doing so would also modify the cached files.
+
+        Returns
+        -------
+        restored_files : list of str or None
+            Paths to the restored outputs, or None if no entry exists for the key.
+
+        """
+        entry = self._read_entry(cache_key)
+
+        if entry is None:
+            return None
+
+        entry_files_dir = os.path.join(self._entry_dir(cache_key), FILES_DIRNAME)
+        restored_files = []
+
+        for relative_path in entry['files']:
+            cached_path = os.path.join(entry_files_dir, relative_path)
+            output_path = os.path.join(output_dir, relative_path)
+
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+            if os.path.lexists(output_path):
+                os.remove(output_path)
+
+            if hardlink:
+                try:
+                    os.link(cached_path, output_path)
+                except OSError as err:
+                    if err.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                        raise
+
+                    copy_and_hash(cached_path, output_path)
+            else:
+                copy_and_hash(cached_path, output_path)
+
+            restored_files.append(output_path)
+
+        # Mark the entry as most recently used
+        os.utime(os.path.join(self._entry_dir(cache_key), ENTRY_FILENAME))
+
+        return restored_files
+
+    def store(self, cache_key, output_dir, file_paths):
+        """
+        Stores copies of the provided outputs under the provided key, then
+        evicts the least recently used entries if the cache has exceeded its
+        maximum size.
+
+        Parameters
+        ----------
+        cache_key : str
+            Key to store the outputs under.
+        output_dir : str
+            Directory containing the outputs. Outputs are stored relative to
+            this directory.
+        file_paths : Iterable[str]
+            Paths to the outputs to store.
+
+        """
+        if cache_key in self:
+            return
+
+        temp_dir = os.path.join(self.cache_dir, f'.{cache_key}.{os.getpid()}.tmp')
+        relative_paths = []
+        total_size = 0
+
+        try:
+            for file_path in file_paths:
+                relative_path = os.path.relpath(file_path, output_dir)
+                cached_path = os.path.join(temp_dir, FILES_DIRNAME, relative_path)
+
+                os.makedirs(os.path.dirname(cached_path), exist_ok=True)
+                copy_and_hash(file_path, cached_path)
+
+                relative_paths.append(relative_path)
+                total_size += os.path.getsize(cached_path)
+
+            entry = {
+                'files': relative_paths,
+                'size': total_size,
+                'created': time.time()
+            }
+
+            os.makedirs(temp_dir, exist_ok=True)
+
+            with open(os.path.join(temp_dir, ENTRY_FILENAME), 'w', encoding='utf-8') as outfile:
+                json.dump(entry, outfile, indent=2)
+
+            try:
+                os.rename(temp_dir, self._entry_dir(cache_key))
+            except OSError as err:
+                # Another process stored the same entry first
+                if err.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                    raise
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the total size of the
+        cached outputs no longer exceeds the maximum size of the cache.
+        The most recently used entry is always retained.
+        """
+        entries = []
+
+        for cache_key in os.listdir(self.cache_dir):
+            entry = self._read_entry(cache_key)
+
+            if entry is None:
+                continue
+
+            last_used = os.path.getmtime(os.path.join(self._entry_dir(cache_key), ENTRY_FILENAME))
+            entries.append((last_used, cache_key, entry['size']))
+
+        entries.sort()
+        total_size = sum(size for _, _, size in entries)
+
+        for _, cache_key, size in entries[:-1]:
+            if total_size <= self.max_bytes:
+                break
+
+            shutil.rmtree(self._entry_dir(cache_key), ignore_errors=True)
+            total_size -= size
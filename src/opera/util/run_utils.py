@@ -10,27 +10,155 @@ subsystem.
 
 """
 
+import errno
 import hashlib
 import os
+import queue
 import re
 import shutil
 import subprocess
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from os.path import abspath
 
 from .error_codes import ErrorCode
 
+CHECKSUM_CHUNK_SIZE = 2 ** 20
+"""Size in bytes of each chunk read from a file when computing its checksum"""
 
-def get_checksum(file_name):
+MAX_CACHED_DIGESTS = 10000
+"""Maximum number of file digests retained in memory by the digest registry"""
+
+CHECKSUM_WORKERS_ENV_VAR = "OPERA_PGE_CHECKSUM_WORKERS"
+"""Environment variable which may be used to set the number of threads used to compute checksums"""
+
+DEFAULT_CHECKSUM_WORKERS = 4
+"""Default (maximum) number of threads used to compute checksums"""
+
+METADATA_WORKERS_ENV_VAR = "OPERA_PGE_METADATA_WORKERS"
+"""Environment variable which may be used to set the number of threads used to read product metadata"""
+
+DEFAULT_METADATA_WORKERS = 8
+"""Default (maximum) number of threads used to read product metadata"""
+
+ISO_RENDER_WORKERS_ENV_VAR = "OPERA_PGE_ISO_RENDER_WORKERS"
+"""Environment variable which may be used to set the number of threads used to render ISO metadata"""
+
+DEFAULT_ISO_RENDER_WORKERS = 1
+"""Default (maximum) number of threads used to render ISO metadata"""
+
+TRACEBACK_HEADER = "Traceback (most recent call last):"
+"""Line which marks the start of a Python traceback stack within a log"""
+
+TRACEBACK_WINDOW_LINES = 1000
+"""Maximum number of log lines retained for a traceback captured from streamed output"""
+
+STREAM_BATCH_SIZE = 2 ** 12
+"""Maximum number of lines of streamed output appended to a log at once"""
+
+
+_digest_registry = OrderedDict()
+_digest_registry_lock = threading.Lock()
+
+
+def get_file_identity(file_name):
+    """
+    Returns a key identifying the current contents of a file on disk,
+    consisting of the device and inode numbers, size and modification time
+    (in nanoseconds) of the file.
+
+    Since the key is based on the inode rather than the path of the file, it
+    remains valid when the file is renamed in place, but changes if the file
+    is modified.
+
+    Parameters
+    ----------
+    file_name : str
+        Path to the file on disk to identify.
+
+    Returns
+    -------
+    file_identity : tuple
+        The (st_dev, st_ino, st_size, st_mtime_ns) of the file.
+
+    """
+    file_stat = os.stat(file_name)
+
+    return file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns
+
+
+def register_checksum(file_name, checksum):
+    """
+    Records the MD5 checksum of the current contents of a file within the
+    in-memory digest registry, so it may be reused by get_checksum() without
+    reading the file again.
+
+    Parameters
+    ----------
+    file_name : str
+        Path to the file on disk the checksum was computed for.
+    checksum : str
+        MD5 checksum of the file.
+
+    """
+    file_identity = get_file_identity(file_name)
+
+    with _digest_registry_lock:
+        _digest_registry[file_identity] = checksum
+        _digest_registry.move_to_end(file_identity)
+
+        while len(_digest_registry) > MAX_CACHED_DIGESTS:
+            _digest_registry.popitem(last=False)
+
+
+def lookup_checksum(file_name):
+    """
+    Returns the MD5 checksum recorded for the current contents of a file within
+    the in-memory digest registry, or None if no checksum has been recorded.
+
+    Parameters
+    ----------
+    file_name : str
+        Path to the file on disk to look up.
+
+    Returns
+    -------
+    checksum : str or None
+        The recorded MD5 checksum of the file, if available.
+
+    """
+    file_identity = get_file_identity(file_name)
+
+    with _digest_registry_lock:
+        checksum = _digest_registry.get(file_identity)
+
+        if checksum is not None:
+            _digest_registry.move_to_end(file_identity)
+
+    return checksum
+
+
+def get_checksum(file_name, checksum_cache=None):
     """
     Generate the MD5 checksum of the provided file.
 
+    If the checksum for the current contents of the file has already been
+    recorded in the in-memory digest registry (for example, by a prior call
+    to copy_and_hash()), or in the provided persistent checksum cache, the
+    recorded checksum is returned without reading the file.
+
     This function was adapted from swot_pge.util.BasePgeWrapper.get_checksum()
 
     Parameters
     ----------
     file_name : str
         Path the file on disk to generate the checksum for.
+    checksum_cache : ChecksumCache, optional
+        Persistent checksum cache to consult before reading the file.
+        Checksums not already within the cache, whether newly computed or
+        recorded in the in-memory digest registry, are stored to the cache.
 
     Returns
     -------
@@ -38,14 +166,261 @@ def get_checksum(file_name):
         MD5 checksum of the provided file.
 
     """
+    checksum = lookup_checksum(file_name)
+
+    if checksum is not None:
+        # Checksums recorded in memory (such as while staging the file) are
+        # persisted, so they are available to later runs
+        if checksum_cache is not None:
+            checksum_cache.store(file_name, checksum)
+
+        return checksum
+
+    if checksum_cache is not None:
+        checksum = checksum_cache.lookup(file_name)
+
+        if checksum is not None:
+            register_checksum(file_name, checksum)
+
+            return checksum
+
     hash_md5 = hashlib.md5()
 
     with open(file_name, "rb") as infile:
-        # chunk size is set to 1048576
-        for chunk in iter(lambda: infile.read(2 ** 20), b""):
+        for chunk in iter(lambda: infile.read(CHECKSUM_CHUNK_SIZE), b""):
+            hash_md5.update(chunk)
+
+    checksum = hash_md5.hexdigest()
+
+    register_checksum(file_name, checksum)
+
+    if checksum_cache is not None:
+        checksum_cache.store(file_name, checksum)
+
+    return checksum
+
+
+def copy_and_hash(src, dst):
+    """
+    Copies a file while computing the MD5 checksum of its contents, so the
+    file is only read once. The checksum is recorded for both the source and
+    destination files within the in-memory digest registry, and the permission
+    bits of the source are copied to the destination (as with shutil.copy).
+
+    Parameters
+    ----------
+    src : str
+        Path to the file to copy.
+    dst : str
+        Path to copy the file to. If this is a directory, the file is copied
+        into it using the base name of the source file.
+
+    Returns
+    -------
+    checksum : str
+        MD5 checksum of the copied file.
+
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+
+    hash_md5 = hashlib.md5()
+
+    with open(src, "rb") as infile, open(dst, "wb") as outfile:
+        for chunk in iter(lambda: infile.read(CHECKSUM_CHUNK_SIZE), b""):
             hash_md5.update(chunk)
+            outfile.write(chunk)
+
+    shutil.copymode(src, dst)
 
-    return hash_md5.hexdigest()
+    checksum = hash_md5.hexdigest()
+
+    register_checksum(src, checksum)
+    register_checksum(dst, checksum)
+
+    return checksum
+
+
+def stage_file(src, dst, copy=False):
+    """
+    Stages a file to its destination, either by renaming (the default) or by
+    copying it. Any checksum recorded for the file within the in-memory digest
+    registry remains valid after a rename, while copies are checksummed as they
+    are written via copy_and_hash(), so staged files do not need to be read
+    again to compute their checksums.
+
+    If the rename fails because the destination is on a different filesystem,
+    the file is copied and the source removed instead.
+
+    Parameters
+    ----------
+    src : str
+        Path to the file to stage.
+    dst : str
+        The destination path for the file.
+    copy : bool, optional
+        If True, the source file is copied rather than renamed.
+
+    Raises
+    ------
+    OSError
+        If the file could not be staged.
+
+    """
+    if not copy:
+        try:
+            os.rename(src, dst)
+            return
+        except OSError as err:
+            if err.errno != errno.EXDEV:
+                raise
+
+    copy_and_hash(src, dst)
+
+    if not copy:
+        os.remove(src)
+
+
+def get_checksum_workers(requested_workers=None):
+    """
+    Determines the number of threads to use when computing checksums.
+
+    Parameters
+    ----------
+    requested_workers : int, optional
+        Explicitly requested number of threads, typically as configured by the
+        RunConfig. If not provided, the value of the OPERA_PGE_CHECKSUM_WORKERS
+        environment variable is used, if set. Otherwise, the number of CPUs
+        available to the current process is used, up to DEFAULT_CHECKSUM_WORKERS.
+
+    Returns
+    -------
+    checksum_workers : int
+        The number of threads to use for computing checksums, always at least 1.
+
+    Raises
+    ------
+    ValueError
+        If the environment variable is set to a value that is not an integer.
+
+    """
+    return _get_worker_count(requested_workers, CHECKSUM_WORKERS_ENV_VAR, DEFAULT_CHECKSUM_WORKERS)
+
+
+def get_metadata_workers(requested_workers=None):
+    """
+    Determines the number of threads to use when reading metadata from
+    input or output products. Since h5py and GDAL release the GIL while
+    performing I/O, reads from multiple products may proceed in parallel.
+
+    Parameters
+    ----------
+    requested_workers : int, optional
+        Explicitly requested number of threads, typically as configured by the
+        RunConfig. If not provided, the value of the OPERA_PGE_METADATA_WORKERS
+        environment variable is used, if set. Otherwise, the number of CPUs
+        available to the current process is used, up to DEFAULT_METADATA_WORKERS.
+
+    Returns
+    -------
+    metadata_workers : int
+        The number of threads to use for reading metadata, always at least 1.
+
+    Raises
+    ------
+    ValueError
+        If the environment variable is set to a value that is not an integer.
+
+    """
+    return _get_worker_count(requested_workers, METADATA_WORKERS_ENV_VAR, DEFAULT_METADATA_WORKERS)
+
+
+def get_iso_render_workers(requested_workers=None):
+    """
+    Determines the number of threads to use when rendering the ISO metadata
+    of output products.
+
+    Rendering a Jinja2 template is pure Python, and holds the GIL throughout,
+    so multiple threads do not render templates any faster. A single thread
+    is used by default, but more may be requested for renderers which spend
+    time outside the GIL (such as by writing large files).
+
+    Parameters
+    ----------
+    requested_workers : int, optional
+        Explicitly requested number of threads. If not provided, the value of
+        the OPERA_PGE_ISO_RENDER_WORKERS environment variable is used, if set.
+        Otherwise, DEFAULT_ISO_RENDER_WORKERS is used.
+
+    Returns
+    -------
+    iso_render_workers : int
+        The number of threads to use for rendering ISO metadata, always at least 1.
+
+    Raises
+    ------
+    ValueError
+        If the environment variable is set to a value that is not an integer.
+
+    """
+    return _get_worker_count(requested_workers, ISO_RENDER_WORKERS_ENV_VAR, DEFAULT_ISO_RENDER_WORKERS)
+
+
+def _get_worker_count(requested_workers, env_var, default_workers):
+    """
+    Returns the requested number of worker threads, falling back to the
+    provided environment variable, then to the number of available CPUs
+    up to the provided default.
+    """
+    if requested_workers is None:
+        requested_workers = os.environ.get(env_var)
+
+    if requested_workers is None:
+        requested_workers = min(default_workers, len(os.sched_getaffinity(0))
+                                if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1)
+
+    return max(1, int(requested_workers))
+
+
+def get_checksums(file_names, max_workers=None, checksum_cache=None):
+    """
+    Generates the MD5 checksums of the provided files, using a pool of threads
+    to hash multiple files concurrently. Since hashlib releases the GIL while
+    digesting large buffers, this allows hashing to proceed in parallel.
+
+    Parameters
+    ----------
+    file_names : Iterable[str]
+        Paths to the files on disk to generate checksums for.
+    max_workers : int, optional
+        Maximum number of threads to use. Defaults to the value returned by
+        get_checksum_workers().
+    checksum_cache : ChecksumCache, optional
+        Persistent checksum cache to consult before reading each file, and
+        to store newly computed checksums to.
+
+    Returns
+    -------
+    checksums : dict
+        Mapping of each provided file name to the MD5 checksum of the file.
+        Entries are ordered according to the order of the provided file names,
+        regardless of the order in which hashing completes.
+
+    """
+    file_names = list(file_names)
+
+    if max_workers is None:
+        max_workers = get_checksum_workers()
+
+    max_workers = min(max_workers, len(file_names))
+
+    if max_workers <= 1:
+        return {file_name: get_checksum(file_name, checksum_cache) for file_name in file_names}
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='checksum') as executor:
+        checksums = executor.map(lambda file_name: get_checksum(file_name, checksum_cache), file_names)
+
+        return dict(zip(file_names, checksums))
 
 
 def get_extension(file_name):
@@ -93,6 +468,56 @@ def get_traceback_from_log(log_contents):
     return result
 
 
+class TracebackMonitor:
+    """
+    Incrementally scans lines of streamed log output for a Python traceback
+    stack, without retaining the full log contents in memory.
+
+    Capture begins at the most recent line containing the traceback header,
+    and is limited to a fixed-size window of lines from that point. The
+    captured window is parsed with get_traceback_from_log() on request.
+
+    """
+
+    def __init__(self, window_lines=TRACEBACK_WINDOW_LINES):
+        """
+        Creates a new TracebackMonitor
+
+        Parameters
+        ----------
+        window_lines : int, optional
+            Maximum number of lines, starting from the traceback header, to
+            retain for parsing of the traceback stack.
+
+        """
+        self.window_lines = window_lines
+        self._captured_lines = []
+
+    def feed(self, line):
+        """
+        Scans a single line of log output.
+
+        Parameters
+        ----------
+        line : str
+            The log line to scan, without a trailing newline.
+
+        """
+        if TRACEBACK_HEADER in line:
+            # Restart the capture, since the last traceback logged is
+            # typically the one responsible for a failure
+            self._captured_lines = [line]
+        elif self._captured_lines and len(self._captured_lines) < self.window_lines:
+            self._captured_lines.append(line)
+
+    def get_traceback(self):
+        """
+        Returns the traceback stack parsed from the captured lines, or an
+        empty string if no traceback has been encountered.
+        """
+        return get_traceback_from_log("\n".join(self._captured_lines))
+
+
 def create_sas_command_line(sas_program_path, sas_runconfig_path,
                             sas_program_options=None):
     """
@@ -208,11 +633,78 @@ def create_qa_command_line(qa_program_path, qa_program_options=None):
     return command_line
 
 
-def time_and_execute(command_line, logger, execute_via_shell=False):
+def _read_output(stream, line_queue):
+    """
+    Reads each line from the provided output stream of a subprocess onto a
+    queue as it arrives, followed by None once the stream is exhausted.
+
+    Parameters
+    ----------
+    stream : io.TextIOBase
+        The (text mode) output stream of the subprocess.
+    line_queue : queue.SimpleQueue
+        The queue to put each line of output on, without its trailing newline.
+
+    """
+    try:
+        for line in stream:
+            line_queue.put(line.rstrip("\n"))
+    finally:
+        line_queue.put(None)
+
+
+def _stream_output(line_queue, logger, traceback_monitor):
+    """
+    Forwards the lines of output of a subprocess from the provided queue to a
+    logger, while scanning them for a traceback stack, until the end of the
+    output is reached.
+
+    Once a line arrives, all lines pending on the queue (up to
+    STREAM_BATCH_SIZE) are appended to the log together, so output produced
+    faster than it can be logged is appended in batches, rather than one line
+    at a time.
+
+    Parameters
+    ----------
+    line_queue : queue.SimpleQueue
+        The queue the lines of output are read onto (see _read_output()).
+    logger : PgeLogger
+        The logger to append each line of output to.
+    traceback_monitor : TracebackMonitor
+        The monitor used to scan for a traceback stack within the output.
+
+    """
+    end_of_output = False
+
+    while not end_of_output:
+        lines = [line_queue.get()]
+
+        try:
+            while len(lines) < STREAM_BATCH_SIZE:
+                lines.append(line_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        # The end of the output is always the last line read
+        if lines[-1] is None:
+            lines.pop()
+            end_of_output = True
+
+        logger.append_lines(lines)
+
+        for line in lines:
+            traceback_monitor.feed(line)
+
+
+def time_and_execute(command_line, logger, execute_via_shell=False, env=None):
     """
     Executes the provided command line via subprocess while collecting the
     runtime of the execution.
 
+    The combined stdout/stderr of the subprocess is streamed into the provided
+    logger as it is produced, so the output of long-running processes is never
+    buffered in its entirety.
+
     Parameters
     ----------
     command_line : Iterable[str]
@@ -221,9 +713,12 @@ def time_and_execute(command_line, logger, execute_via_shell=False):
     logger : PgeLogger
         A logger object used to capture any error status returned from execution.
     execute_via_shell : bool, optional
-        If true, instruct subprocess.run to execute the command-line via system
+        If true, instruct subprocess.Popen to execute the command-line via system
         shell. Useful for running test commands but should generally not be used
         for production.
+    env : dict, optional
+        Environment variables to set for the subprocess, in addition to (or
+        overriding) those of the current process.
 
     Returns
     -------
@@ -240,20 +735,37 @@ def time_and_execute(command_line, logger, execute_via_shell=False):
     if execute_via_shell:
         command_line = " ".join(command_line)
 
-    run_result = subprocess.run(command_line, env=os.environ.copy(), check=False,
-                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                shell=execute_via_shell)
+    traceback_monitor = TracebackMonitor()
+
+    process_env = os.environ.copy()
+    process_env.update(env or {})
+
+    with subprocess.Popen(command_line, env=process_env,
+                          stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          shell=execute_via_shell, text=True, encoding='utf-8',
+                          errors='replace', bufsize=1) as process:
+        # Read the stdout/stderr of the subprocess as it arrives, and append
+        # it to our log until the subprocess closes its output
+        line_queue = queue.SimpleQueue()
+
+        reader_thread = threading.Thread(
+            target=_read_output, args=(process.stdout, line_queue),
+            name='time_and_execute_reader', daemon=True
+        )
+        reader_thread.start()
+
+        _stream_output(line_queue, logger, traceback_monitor)
 
-    # Append the full stdout/stderr captured by the subprocess to our log
-    logger.append(run_result.stdout.decode())
+        returncode = process.wait()
+        reader_thread.join()
 
-    if run_result.returncode:
+    if returncode:
         # Parse out the traceback stack from the SAS log to include with the error
         # message that's propagated back to an SDS operator
-        traceback_string = get_traceback_from_log(run_result.stdout.decode())
+        traceback_string = traceback_monitor.get_traceback()
 
         error_msg = (f'Command "{str(command_line)}" failed with exit '
-                     f'code {run_result.returncode}')
+                     f'code {returncode}')
 
         if traceback_string:
             error_msg += f', Traceback from log:\n{traceback_string}'
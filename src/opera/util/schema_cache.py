@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+"""
+===============
+schema_cache.py
+===============
+
+Cache of compiled Yamale schemas, used to validate RunConfigs and other
+configuration files for the OPERA PGE subsystem.
+
+Compiling a Yamale schema requires parsing its YAML and constructing a
+validator for each of its fields, which is repeated for the base PGE schema,
+the SAS schema and any algorithm parameters schema each time a RunConfig is
+validated. Compiled schemas are kept in-process, keyed by the path to and
+contents of the schema file, so that a long-lived worker running several
+jobs only compiles each schema once. Compiled schemas may also be persisted
+(pickled) to a cache directory, so that they may be reused by new processes.
+
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+
+import yamale
+
+SCHEMA_CACHE_DIR_ENV_VAR = "OPERA_PGE_SCHEMA_CACHE_DIR"
+"""Environment variable which may be used to set a directory in which compiled schemas are persisted"""
+
+_schemas = {}
+"""Compiled schemas, keyed by the digest of the path to, and contents of, each schema file"""
+
+_schemas_lock = threading.Lock()
+
+
+def _get_schema_digest(schema_path, schema_content):
+    """Returns a digest identifying both the path to, and contents of, a schema file"""
+    schema_hash = hashlib.sha256(schema_path.encode('utf-8'))
+    schema_hash.update(b'\0')
+    schema_hash.update(schema_content)
+
+    return schema_hash.hexdigest()
+
+
+def _get_pickled_schema_path(cache_dir, schema_digest):
+    """Returns the path to the persisted form of a compiled schema"""
+    # The version of Yamale is included since the compiled form of a schema
+    # is not guaranteed to be compatible between versions
+    return os.path.join(cache_dir, f'yamale-{yamale.__version__}-{schema_digest}.pickle')
+
+
+def _load_pickled_schema(pickled_schema_path):
+    """Loads a persisted schema, returning None if it does not exist or cannot be loaded"""
+    try:
+        with open(pickled_schema_path, 'rb') as infile:
+            return pickle.load(infile)
+    except (OSError, pickle.UnpicklingError, AttributeError, EOFError, ImportError):
+        return None
+
+
+def _write_pickled_schema(pickled_schema_path, schema):
+    """Persists a compiled schema, such that concurrent readers never see a partial file"""
+    cache_dir = os.path.dirname(pickled_schema_path)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile('wb', dir=cache_dir, suffix='.tmp', delete=False) as outfile:
+            pickle.dump(schema, outfile, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(outfile.name, pickled_schema_path)
+    except OSError:
+        # Persisting the schema is only an optimization, so failure to do so
+        # (such as for a read-only cache directory) is not an error
+        pass
+
+
+def get_schema(schema_path, cache_dir=None):
+    """
+    Returns the compiled Yamale schema for the provided schema file, compiling
+    it only if it has not already been compiled with its current contents.
+
+    The returned schema may be shared with other callers, and should not be
+    modified. Callers needing to add includes to a schema should do so on a
+    copy (see copy.copy), with its own includes dictionary.
+
+    Parameters
+    ----------
+    schema_path : str
+        Path to the Yamale schema file.
+    cache_dir : str, optional
+        Directory in which compiled schemas are persisted. If not provided,
+        the value of the OPERA_PGE_SCHEMA_CACHE_DIR environment variable is
+        used, if set. Otherwise, compiled schemas are only cached in-process.
+
+    Returns
+    -------
+    schema : yamale.schema.Schema
+        The compiled schema.
+
+    """
+    schema_path = os.path.abspath(schema_path)
+
+    with open(schema_path, 'rb') as infile:
+        schema_content = infile.read()
+
+    schema_digest = _get_schema_digest(schema_path, schema_content)
+
+    with _schemas_lock:
+        schema = _schemas.get(schema_digest)
+
+    if schema is not None:
+        return schema
+
+    if cache_dir is None:
+        cache_dir = os.environ.get(SCHEMA_CACHE_DIR_ENV_VAR) or None
+
+    pickled_schema_path = _get_pickled_schema_path(cache_dir, schema_digest) if cache_dir else None
+
+    if pickled_schema_path is not None:
+        schema = _load_pickled_schema(pickled_schema_path)
+
+    if schema is None:
+        # The contents already read are compiled, rather than reading the file
+        # again, so the schema is named for its path as make_schema() would
+        schema = yamale.make_schema(content=schema_content.decode('utf-8'))
+        schema.name = schema_path
+
+        if pickled_schema_path is not None:
+            _write_pickled_schema(pickled_schema_path, schema)
+
+    with _schemas_lock:
+        schema = _schemas.setdefault(schema_digest, schema)
+
+    return schema
+
+
+def clear_schema_cache():
+    """Discards all compiled schemas cached in-process"""
+    with _schemas_lock:
+        _schemas.clear()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+
+"""
+===============
+stage_timing.py
+===============
+
+Hierarchical timing of the processing stages of OPERA PGEs.
+
+Stages are timed with the StageTimer.span() context manager, or by decorating
+PGE methods with timed_stage(). Stages started while another stage is in
+progress are nested beneath it, so the resulting timings describe where the
+time spent by each step of the PGE, outside the SAS itself, is going.
+
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+STAGE_SEPARATOR = '.'
+"""Separator used between the names of nested stages"""
+
+
+def _get_child_cpu_seconds():
+    """Returns the CPU time consumed by all terminated and waited-for child processes"""
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+class StageTimer:
+    """
+    Records the wall-clock and CPU time spent within nested stages.
+
+    Each stage is identified by its path, the names of all enclosing stages
+    and its own name joined with STAGE_SEPARATOR. Stages entered more than
+    once under the same path (for example, a method called once per output
+    product) are accumulated into a single entry.
+
+    Nesting is tracked separately for each thread, so stages entered from
+    worker threads are recorded as top-level stages.
+
+    """
+
+    def __init__(self):
+        self._stages = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def _active_spans(self):
+        """Returns the stack of spans in progress on the calling thread"""
+        if not hasattr(self._local, 'active_spans'):
+            self._local.active_spans = []
+
+        return self._local.active_spans
+
+    @contextmanager
+    def span(self, name):
+        """
+        Context manager which times the enclosed block as a stage.
+
+        Entering a stage with the same name as the innermost stage already in
+        progress (such as when an overridden method decorated with
+        timed_stage() calls its decorated parent implementation) does not
+        create a new nested stage.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage.
+
+        Yields
+        ------
+        stage_path : str
+            Full path of the stage being timed.
+
+        """
+        active_spans = self._active_spans
+
+        if active_spans and active_spans[-1]['name'] == name:
+            yield active_spans[-1]['path']
+            return
+
+        stage_path = STAGE_SEPARATOR.join([span['path'] for span in active_spans[-1:]] + [name])
+
+        with self._lock:
+            if stage_path not in self._stages:
+                self._stages[stage_path] = {
+                    'stage': stage_path,
+                    'depth': len(active_spans),
+                    'count': 0,
+                    'elapsed_seconds': 0.0,
+                    'cpu_seconds': 0.0,
+                    'child_cpu_seconds': 0.0
+                }
+
+        span = {
+            'name': name,
+            'path': stage_path,
+            'start_time': time.monotonic(),
+            'start_cpu': time.process_time(),
+            'start_child_cpu': _get_child_cpu_seconds()
+        }
+
+        active_spans.append(span)
+
+        try:
+            yield stage_path
+        finally:
+            active_spans.pop()
+
+            with self._lock:
+                self._accumulate(self._stages[stage_path], span)
+
+    @staticmethod
+    def _accumulate(stage, span):
+        """Adds the time spent within the provided span to the totals for its stage"""
+        stage['count'] += 1
+        stage['elapsed_seconds'] += time.monotonic() - span['start_time']
+        stage['cpu_seconds'] += time.process_time() - span['start_cpu']
+        stage['child_cpu_seconds'] += _get_child_cpu_seconds() - span['start_child_cpu']
+
+    def get_summary(self):
+        """
+        Returns the timings recorded for each stage, in the order each stage
+        was first entered.
+
+        Stages still in progress on the calling thread are included, with
+        their timings measured up to the time of the call, and flagged as
+        in progress.
+
+        Returns
+        -------
+        summary : list of dict
+            One entry per stage, containing the stage path, nesting depth,
+            number of times the stage was entered, and the total elapsed,
+            CPU and child process CPU seconds spent within the stage.
+
+        """
+        with self._lock:
+            summary = {stage_path: dict(stage, in_progress=False)
+                       for stage_path, stage in self._stages.items()}
+
+        for span in self._active_spans:
+            self._accumulate(summary[span['path']], span)
+            summary[span['path']]['in_progress'] = True
+
+        for stage in summary.values():
+            for key in ('elapsed_seconds', 'cpu_seconds', 'child_cpu_seconds'):
+                stage[key] = round(stage[key], 6)
+
+        return list(summary.values())
+
+    def write_json(self, output_path):
+        """
+        Writes the summary of recorded stage timings to a JSON file.
+
+        Parameters
+        ----------
+        output_path : str
+            Path to the JSON file to write.
+
+        """
+        with open(output_path, 'w', encoding='utf-8') as outfile:
+            json.dump({'stages': self.get_summary()}, outfile, indent=2)
+
+
+def timed_stage(name=None):
+    """
+    Decorator which times each call to a PGE method as a stage.
+
+    The stage is recorded by the StageTimer assigned to the "stage_timer"
+    attribute of the instance the method is invoked on. If the instance has
+    no such attribute, the method is invoked without timing.
+
+    When combined with functools.lru_cache, this decorator should be applied
+    first (innermost), so that only calls which are not served from the
+    cache are timed.
+
+    Parameters
+    ----------
+    name : str, optional
+        Name of the stage. Defaults to the name of the decorated method,
+        with any leading underscores removed.
+
+    Returns
+    -------
+    decorator : callable
+        The decorator to apply to the method.
+
+    """
+    def decorator(method):
+        stage_name = name or method.__name__.lstrip('_')
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            stage_timer = getattr(self, 'stage_timer', None)
+
+            if stage_timer is None:
+                return method(self, *args, **kwargs)
+
+            with stage_timer.span(stage_name):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -14,33 +14,60 @@ import os
 from datetime import datetime
 from functools import lru_cache
 
+from opera.util.lazy_import import LazyImport
 from opera.util.mock_utils import MockGdal, mock_gdal_edit, mock_save_as_cog
 
+
 # When running a PGE within a Docker image delivered from ADT, the following imports
 # below should work. When running in a dev environment, the imports will fail,
 # resulting in the mock classes being substituted instead.
-# pylint: disable=import-error,invalid-name
-try:
-    from osgeo import gdal
-    from osgeo_utils.gdal_edit import main as gdal_edit
+# pylint: disable=import-error,import-outside-toplevel
+def _import_gdal():
+    """Deferred import of osgeo.gdal, falling back to MockGdal"""
+    try:
+        from osgeo import gdal as _gdal
 
-    gdal.UseExceptions()
-except ImportError:  # pragma: no cover
-    gdal = MockGdal  # pragma: no cover
-    gdal_edit = mock_gdal_edit  # pragma: no cover
+        _gdal.UseExceptions()
+    except ImportError:  # pragma: no cover
+        _gdal = MockGdal  # pragma: no cover
 
+    return _gdal
 
-# Search for an available implementation of save_as_cog from the underlying
-# SAS library. Fallback to the mock implementation if we cannot find any.
-# pylint: enable=invalid-name
-try:
-    from proteus.core import save_as_cog        # noinspection PyUnresolvedReferences,
-except ImportError:  # pragma: no cover
+
+def _import_gdal_edit():
+    """Deferred import of the gdal_edit utility, falling back to mock_gdal_edit"""
     try:
-        from rtc.core import save_as_cog        # noinspection PyUnresolvedReferences
+        from osgeo_utils.gdal_edit import main as _gdal_edit
     except ImportError:  # pragma: no cover
-        save_as_cog = mock_save_as_cog  # pragma: no cover
-# pylint: enable=import-error
+        _gdal_edit = mock_gdal_edit  # pragma: no cover
+
+    return _gdal_edit
+
+
+def _import_save_as_cog():
+    """
+    Search for an available implementation of save_as_cog from the underlying
+    SAS library. Fallback to the mock implementation if we cannot find any.
+    """
+    try:
+        from proteus.core import save_as_cog as _save_as_cog  # noinspection PyUnresolvedReferences,
+    except ImportError:  # pragma: no cover
+        try:
+            from rtc.core import save_as_cog as _save_as_cog  # noinspection PyUnresolvedReferences
+        except ImportError:  # pragma: no cover
+            _save_as_cog = mock_save_as_cog  # pragma: no cover
+
+    return _save_as_cog
+# pylint: enable=import-error,import-outside-toplevel
+
+
+# These dependencies are only imported once first used, since importing them
+# accounts for much of the start-up time of PGEs which do not use them.
+# pylint: disable=invalid-name
+gdal = LazyImport(_import_gdal, 'osgeo.gdal')
+gdal_edit = LazyImport(_import_gdal_edit, 'osgeo_utils.gdal_edit.main')
+save_as_cog = LazyImport(_import_save_as_cog, 'save_as_cog')
+# pylint: enable=invalid-name
 
 
 def set_geotiff_metadata(filename, scratch_dir=os.curdir, **kwargs):
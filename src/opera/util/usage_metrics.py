@@ -13,8 +13,12 @@ Adapted By: Scott Collins
 
 """
 
+import csv
+import json
 import os
 import resource
+import threading
+import time
 from sys import platform
 
 
@@ -103,3 +107,359 @@ def get_self_peak_vmm_kb():  # pylint: disable=missing-raises-doc
         vm_peak_kb = -1
 
     return vm_peak_kb
+
+
+RESOURCE_SAMPLE_FIELDS = (
+    'elapsed_seconds', 'num_processes', 'num_threads', 'rss_kb', 'pss_kb',
+    'cpu_percent', 'read_bytes', 'write_bytes'
+)
+"""Names of the fields recorded for each sample taken by a ResourceSampler, in output order"""
+
+RESOURCE_SAMPLE_PERCENTILES = (50, 90, 99)
+"""Percentiles of the sampled RSS and CPU utilization reported by ResourceSampler.get_summary()"""
+
+DEFAULT_SAMPLE_INTERVAL = 1.0
+"""Default interval, in seconds, between samples taken by a ResourceSampler"""
+
+
+def _read_proc_file(pid, *file_path):
+    """
+    Returns the contents of a file from the /proc entry of the provided
+    process, or None if the file could not be read (for example, because the
+    process has exited).
+    """
+    try:
+        with open(os.path.join(os.sep, 'proc', str(pid), *file_path), 'r', encoding='utf-8') as infile:
+            return infile.read()
+    except (OSError, ValueError):
+        return None
+
+
+def get_descendant_pids(root_pid):
+    """
+    Returns the process IDs of all descendants of the provided process.
+
+    The children of each process are read from /proc/<pid>/task/<tid>/children
+    where supported by the kernel, otherwise the parent of every process
+    listed in /proc is consulted.
+
+    Parameters
+    ----------
+    root_pid : int
+        ID of the process to find the descendants of.
+
+    Returns
+    -------
+    descendant_pids : list of int
+        IDs of the child processes of the root process, and of their children,
+        recursively. Empty if the process tree cannot be inspected.
+
+    """
+    children_by_pid = None
+
+    if not os.path.exists(os.path.join(os.sep, 'proc', str(root_pid), 'task', str(root_pid), 'children')):
+        children_by_pid = {}
+
+        try:
+            proc_entries = os.listdir(os.path.join(os.sep, 'proc'))
+        except OSError:
+            return []
+
+        for entry in filter(str.isdigit, proc_entries):
+            stat = _read_proc_file(entry, 'stat')
+
+            if stat:
+                # The process name is enclosed in parentheses and may itself
+                # contain spaces, so locate the fields following it
+                parent_pid = int(stat[stat.rfind(')') + 2:].split()[1])
+                children_by_pid.setdefault(parent_pid, []).append(int(entry))
+
+    descendant_pids = []
+    pending_pids = [root_pid]
+
+    while pending_pids:
+        pid = pending_pids.pop()
+
+        if children_by_pid is not None:
+            child_pids = children_by_pid.get(pid, [])
+        else:
+            child_pids = []
+
+            try:
+                task_ids = os.listdir(os.path.join(os.sep, 'proc', str(pid), 'task'))
+            except OSError:
+                task_ids = []
+
+            for task_id in task_ids:
+                children = _read_proc_file(pid, 'task', task_id, 'children')
+                child_pids.extend(int(child_pid) for child_pid in (children or '').split())
+
+        descendant_pids.extend(child_pids)
+        pending_pids.extend(child_pids)
+
+    return descendant_pids
+
+
+def get_process_usage(pid):
+    """
+    Reads the current resource usage of a single process from /proc.
+
+    Parameters
+    ----------
+    pid : int
+        ID of the process to inspect.
+
+    Returns
+    -------
+    usage : dict or None
+        Dictionary containing the following keys, or None if the process
+        could not be inspected:
+            num_threads - Number of threads in the process
+            rss_kb - Resident set size, in kilobytes
+            pss_kb - Proportional set size, in kilobytes, or the resident set
+                     size when the proportional set size is unavailable
+            cpu_ticks - User and system CPU time consumed by the process, in
+                        clock ticks
+            read_bytes - Bytes read from storage by the process
+            write_bytes - Bytes written to storage by the process
+
+    """
+    stat = _read_proc_file(pid, 'stat')
+    status = _read_proc_file(pid, 'status')
+
+    if not stat or not status:
+        return None
+
+    # Fields following the process name, starting with the process state (field 3)
+    stat_fields = stat[stat.rfind(')') + 2:].split()
+
+    usage = {
+        'num_threads': int(stat_fields[17]),
+        'rss_kb': 0,
+        'pss_kb': None,
+        'cpu_ticks': int(stat_fields[11]) + int(stat_fields[12]),
+        'read_bytes': 0,
+        'write_bytes': 0
+    }
+
+    for line in status.splitlines():
+        if line.startswith('VmRSS:'):
+            usage['rss_kb'] = int(line.split()[1])
+            break
+
+    for line in (_read_proc_file(pid, 'smaps_rollup') or '').splitlines():
+        if line.startswith('Pss:'):
+            usage['pss_kb'] = int(line.split()[1])
+            break
+
+    if usage['pss_kb'] is None:
+        usage['pss_kb'] = usage['rss_kb']
+
+    for line in (_read_proc_file(pid, 'io') or '').splitlines():
+        key, _, value = line.partition(':')
+
+        if key in ('read_bytes', 'write_bytes'):
+            usage[key] = int(value)
+
+    return usage
+
+
+def _percentile(values, percentile):
+    """Returns the nearest-rank percentile of a non-empty list of values"""
+    sorted_values = sorted(values)
+    rank = max(int(-(-percentile * len(sorted_values) // 100)), 1)
+
+    return sorted_values[rank - 1]
+
+
+class ResourceSampler:
+    """
+    Samples the resource usage of a process tree on a background thread.
+
+    Unlike get_os_metrics(), which only reports on child processes after they
+    have terminated, the sampler inspects /proc while the processes are
+    running, so memory usage is accounted for across all concurrently running
+    descendants, and a timeline of usage is recorded. Sampling is only
+    supported on Linux; elsewhere no samples are recorded.
+
+    """
+
+    def __init__(self, root_pid=None, interval=DEFAULT_SAMPLE_INTERVAL, include_root=False):
+        """
+        Initializes a sampler for the process tree rooted at the provided process.
+
+        Parameters
+        ----------
+        root_pid : int, optional
+            ID of the process at the root of the tree to sample. Defaults to the
+            current process.
+        interval : float, optional
+            Interval, in seconds, between samples.
+        include_root : bool, optional
+            If True, the root process itself is included in each sample,
+            otherwise only its descendants are sampled.
+
+        """
+        self.root_pid = root_pid if root_pid is not None else os.getpid()
+        self.interval = interval
+        self.include_root = include_root
+        self.samples = []
+
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._start_time = None
+        self._last_sample_time = None
+        self._cpu_ticks_by_pid = {}
+        self._io_bytes_by_pid = {}
+        self._clock_ticks = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+    def __enter__(self):
+        """Starts sampling on entry to a context"""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stops sampling on exit from a context"""
+        self.stop()
+
+    def start(self):
+        """Starts sampling on a background thread"""
+        self._start_time = self._last_sample_time = time.monotonic()
+        self._stop_event.clear()
+
+        if platform == "linux":
+            self._thread = threading.Thread(target=self._run, name='ResourceSampler', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stops sampling, waiting for any in-progress sample to complete"""
+        self._stop_event.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        """Takes samples until the sampler is stopped"""
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """
+        Records a single sample of the resource usage of the process tree.
+
+        Returns
+        -------
+        sample : dict
+            The recorded sample, with keys defined by RESOURCE_SAMPLE_FIELDS.
+            Byte counts are cumulative over all processes seen by the sampler,
+            including those that have since exited.
+
+        """
+        pids = get_descendant_pids(self.root_pid)
+
+        if self.include_root:
+            pids.insert(0, self.root_pid)
+
+        sample_time = time.monotonic()
+        cpu_ticks = 0
+        sample = dict.fromkeys(RESOURCE_SAMPLE_FIELDS, 0)
+
+        for pid in pids:
+            usage = get_process_usage(pid)
+
+            if usage is None:
+                continue
+
+            sample['num_processes'] += 1
+            sample['num_threads'] += usage['num_threads']
+            sample['rss_kb'] += usage['rss_kb']
+            sample['pss_kb'] += usage['pss_kb']
+
+            cpu_ticks += usage['cpu_ticks'] - self._cpu_ticks_by_pid.get(pid, 0)
+            self._cpu_ticks_by_pid[pid] = usage['cpu_ticks']
+            self._io_bytes_by_pid[pid] = (usage['read_bytes'], usage['write_bytes'])
+
+        elapsed = sample_time - self._last_sample_time
+        self._last_sample_time = sample_time
+
+        sample['elapsed_seconds'] = round(sample_time - self._start_time, 3)
+        sample['cpu_percent'] = round(100.0 * cpu_ticks / self._clock_ticks / elapsed, 1) if elapsed > 0 else 0.0
+        sample['read_bytes'] = sum(read_bytes for read_bytes, _ in self._io_bytes_by_pid.values())
+        sample['write_bytes'] = sum(write_bytes for _, write_bytes in self._io_bytes_by_pid.values())
+
+        self.samples.append(sample)
+
+        return sample
+
+    def get_summary(self):
+        """
+        Summarizes the samples recorded by the sampler.
+
+        Returns
+        -------
+        summary : dict
+            Dictionary mapping metric names to values. Contains the number of
+            samples taken, the peak number of processes and threads, the peak
+            and percentiles of RSS, PSS and CPU utilization, and the total bytes
+            read and written. Only the number of samples is reported if no
+            samples were recorded.
+
+        """
+        summary = {'num_samples': len(self.samples)}
+
+        if not self.samples:
+            return summary
+
+        summary['num_processes.peak'] = max(sample['num_processes'] for sample in self.samples)
+        summary['num_threads.peak'] = max(sample['num_threads'] for sample in self.samples)
+
+        for field in ('rss_kb', 'pss_kb', 'cpu_percent'):
+            values = [sample[field] for sample in self.samples]
+
+            summary[f'{field}.peak'] = max(values)
+
+            for percentile in RESOURCE_SAMPLE_PERCENTILES:
+                summary[f'{field}.p{percentile}'] = _percentile(values, percentile)
+
+        summary['cpu_percent.mean'] = round(
+            sum(sample['cpu_percent'] for sample in self.samples) / len(self.samples), 1
+        )
+        summary['read_bytes.total'] = self.samples[-1]['read_bytes']
+        summary['write_bytes.total'] = self.samples[-1]['write_bytes']
+
+        return summary
+
+    def write_json(self, output_path):
+        """
+        Writes the summary and timeline of samples to a JSON file.
+
+        Parameters
+        ----------
+        output_path : str
+            Path to the JSON file to write.
+
+        """
+        contents = {
+            'interval_seconds': self.interval,
+            'summary': self.get_summary(),
+            'samples': self.samples
+        }
+
+        with open(output_path, 'w', encoding='utf-8') as outfile:
+            json.dump(contents, outfile, indent=2)
+
+    def write_csv(self, output_path):
+        """
+        Writes the timeline of samples to a CSV file, one row per sample.
+
+        Parameters
+        ----------
+        output_path : str
+            Path to the CSV file to write.
+
+        """
+        with open(output_path, 'w', encoding='utf-8', newline='') as outfile:
+            writer = csv.DictWriter(outfile, fieldnames=RESOURCE_SAMPLE_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.samples)